@@ -645,12 +645,24 @@ class Settings(BaseSettings):
     SNOWFLAKE_SCHEMA: str 
     SNOWFLAKE_WAREHOUSE: str 
     SNOWFLAKE_ROLE: str 
+
+    # Snowflake connection pool
+    SNOWFLAKE_POOL_SIZE: int = Field(default=8, ge=1, le=64)
+    SNOWFLAKE_POOL_TIMEOUT: float = Field(default=30.0, ge=1.0, le=300.0)
+    SNOWFLAKE_POOL_MAX_IDLE_SECONDS: int = Field(default=600, ge=30, le=14400)
+    SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS: int = Field(default=3600, ge=60, le=14400)
+    SNOWFLAKE_POOL_VALIDATE_AFTER_SECONDS: int = Field(default=60, ge=0, le=3600)
     
     # AWS S3
     AWS_ACCESS_KEY_ID: SecretStr
     AWS_SECRET_ACCESS_KEY: SecretStr
     AWS_REGION: str = "us-east-2"
     S3_BUCKET: str
+    S3_MAX_CONCURRENCY: int = Field(default=16, ge=1, le=128)  # parallel GETs / connection pool
+    S3_CACHE_DIR: str = ".cache/s3"                           # local object cache ("" disables)
+    S3_CACHE_MAX_BYTES: int = Field(default=2 * 1024**3, ge=0)  # LRU-evicted above this size
+    SNAPSHOT_MANIFEST_TTL: float = Field(default=0.0, ge=0.0, le=3600.0)  # seconds a resolved "latest" pointer is reused in-process
+    CHUNK_STORE_FORMAT: Literal["parquet", "json"] = "parquet"  # format new chunk files are written in (readers accept both)
     
     # SEC EDGAR Configuration (NEW)
     SEC_USER_AGENT: str = Field(
@@ -673,6 +685,50 @@ class Settings(BaseSettings):
     REDIS_URL: str = "redis://localhost:6379/0"
     CACHE_TTL_SECTORS: int = 86400  # 24 hours
     CACHE_TTL_SCORES: int = 3600    # 1 hour
+    SCORING_STAGE_CACHE_SIZE: int = Field(default=256, ge=0, le=10000)  # in-process LRU entries
+    REDIS_SOCKET_TIMEOUT: float = Field(default=1.0, gt=0.0, le=30.0)  # connect + command timeout
+    CACHE_BREAKER_FAILURES: int = Field(default=3, ge=1, le=100)        # consecutive errors that open the circuit
+    CACHE_BREAKER_RESET_SECONDS: float = Field(default=15.0, ge=0.5, le=600.0)  # open → half-open probe
+    CACHE_L1_MAX_ENTRIES: int = Field(default=1024, ge=0, le=100000)    # in-process tier (0 disables)
+    CACHE_L1_TTL_SECONDS: int = Field(default=10, ge=0, le=3600)        # cap on L1 lifetime (other workers' invalidations)
+    CACHE_EARLY_EXPIRY_BETA: float = Field(default=1.0, ge=0.0, le=10.0)  # probabilistic early refresh (0 disables)
+    CACHE_CODEC: Literal["text", "orjson", "msgpack"] = "text"          # Redis value encoding (cache_codecs.py)
+    CACHE_COMPRESS_MIN_BYTES: int = Field(default=8192, ge=0)           # zstd above this size, binary codecs only (0 disables)
+
+    # Portfolio scoring (concurrent per-ticker execution)
+    PORTFOLIO_MAX_WORKERS: int = Field(default=5, ge=1, le=32)
+    PORTFOLIO_TICKER_TIMEOUT: float = Field(default=300.0, ge=5.0, le=3600.0)
+
+    # Background jobs (durable backfills: app/services/job_queue.py)
+    JOB_STORE: Literal["auto", "redis", "sqlite"] = "auto"              # auto = Redis if it answers, else SQLite
+    JOB_SQLITE_PATH: str = "data/jobs.sqlite3"
+    JOB_WORKER_ENABLED: bool = True                                     # run a worker inside the API process
+    JOB_WORKER_CONCURRENCY: int = Field(default=3, ge=1, le=32)         # items (companies) in flight per job
+    JOB_LEASE_SECONDS: float = Field(default=60.0, ge=5.0, le=3600.0)   # a dead worker's job is resumed after this
+    JOB_POLL_SECONDS: float = Field(default=2.0, ge=0.1, le=60.0)
+    JOB_RETENTION_SECONDS: int = Field(default=7 * 86400, ge=3600)      # finished jobs kept in Redis
+    # Per-host politeness (app/services/rate_limiter.py): concurrent companies per host
+    JOB_HOST_CONCURRENCY: Dict[str, int] = Field(default={"sec": 2, "jobspy": 1, "patentsview": 1})
+    PATENTSVIEW_RATE_LIMIT: float = Field(default=0.75, gt=0.0, le=10.0)  # requests/second (45/min)
+
+    # PatentsView fetcher (app/pipelines/patentsview_client.py)
+    PATENTSVIEW_PAGE_SIZE: int = Field(default=1000, ge=1, le=1000)         # records per cursor page
+    PATENTSVIEW_ALIAS_CONCURRENCY: int = Field(default=4, ge=1, le=16)     # assignee-name queries in flight
+    PATENTSVIEW_MAX_CONNECTIONS: int = Field(default=4, ge=1, le=32)       # pooled client connections
+    PATENTSVIEW_TIMEOUT: float = Field(default=30.0, ge=1.0, le=300.0)
+    PATENTSVIEW_MAX_RETRIES: int = Field(default=2, ge=0, le=5)            # retries of a 429 / 5xx page
+    PATENTSVIEW_CACHE_DIR: str = ".cache/patentsview"                      # response cache ("" disables)
+    PATENTSVIEW_CACHE_TTL_SECONDS: int = Field(default=86400, ge=0)        # cached pages older than this are refetched
+
+    # Blocking-work lanes (thread pools that keep the event loop free)
+    BLOCKING_IO_WORKERS: int = Field(default=32, ge=4, le=256)
+    SCORING_LANE_WORKERS: int = Field(default=4, ge=1, le=64)
+
+    # Sensitivity analysis (Monte Carlo over the scoring parameters)
+    SENSITIVITY_MAX_SAMPLES: int = Field(default=20000, ge=100, le=500000)
+
+    # SEC document parsing ("bs4" = BeautifulSoup tree, "lxml" = streaming pull parser)
+    HTML_PARSER_BACKEND: Literal["bs4", "lxml"] = "bs4"
     
     # LLM Providers (Multi-provider via LiteLLM)
     OPENAI_API_KEY: Optional[SecretStr] = None
@@ -704,11 +760,16 @@ class Settings(BaseSettings):
     HITL_EBITDA_PROJECTION_THRESHOLD: float = Field(default=10.0, ge=5, le=25)
     
     # Job Signals Pipeline Constants
-    JOBSPY_REQUEST_DELAY: float = Field(default=6.0, ge=1.0, le=30.0)
+    JOBSPY_REQUEST_DELAY: float = Field(default=6.0, ge=1.0, le=30.0)    # seconds between requests to one site
+    JOBSPY_SITE_REQUEST_DELAYS: Dict[str, float] = Field(default_factory=dict)  # per-site override, e.g. {"linkedin": 10}
+    JOBSPY_SITE_CONCURRENCY: int = Field(default=2, ge=1, le=8)         # requests in flight per site
+    JOBSPY_MAX_RETRIES: int = Field(default=2, ge=0, le=5)              # retries of a rate-limited request
+    JOBSPY_BACKOFF_SECONDS: float = Field(default=30.0, ge=1.0, le=600.0)  # first back-off, doubled per retry
     JOBSPY_DEFAULT_SITES: List[str] = Field(default=["linkedin", "indeed", "glassdoor"])
     JOBSPY_RESULTS_WANTED: int = Field(default=100, ge=10, le=1000)
     JOBSPY_HOURS_OLD: int = Field(default=72, ge=1, le=720)
     JOBSPY_FUZZY_MATCH_THRESHOLD: float = Field(default=75.0, ge=50.0, le=100.0)
+    JOBSPY_MATCH_WORKERS: int = Field(default=-1, ge=-1, le=64)        # rapidfuzz cdist threads (-1 = all cores)
     JOBSPY_AI_SCORE_MULTIPLIER: float = Field(default=15.0, ge=5.0, le=50.0)
     JOBSPY_RATIO_SCORE_WEIGHT: float = Field(default=50.0, ge=10.0, le=100.0)
     JOBSPY_VOLUME_BONUS_MAX: float = Field(default=30.0, ge=10.0, le=50.0)
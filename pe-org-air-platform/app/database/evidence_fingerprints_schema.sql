@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Evidence fingerprints (incremental re-scoring)
+-- One row per ticker × evidence source: the fingerprint the last stored
+-- scoring result was computed from, and the evidence that source produced.
+-- source = '_constants' versions the mapping table / stage schema.
+-- See app/services/evidence_fingerprints.py
+-- =============================================================================
+
+USE WAREHOUSE PE_ORGAIR_WH;
+USE DATABASE PE_ORGAIR_DB;
+USE SCHEMA PLATFORM;
+
+CREATE TABLE IF NOT EXISTS evidence_fingerprints (
+    id VARCHAR(36) DEFAULT UUID_STRING(),
+    ticker VARCHAR(10) NOT NULL,
+    source VARCHAR(50) NOT NULL,           -- SignalSource value or '_constants'
+    fingerprint VARCHAR(64) NOT NULL,      -- sha256 of the source's version inputs
+    evidence VARCHAR,                      -- JSON EvidenceScore; NULL = source had no evidence
+    updated_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
+    PRIMARY KEY (ticker, source)
+);
+
+COMMENT ON TABLE evidence_fingerprints IS
+    'Per-source fingerprints behind the stored evidence_dimension_scores; scoring re-reads only sources whose fingerprint changed.';
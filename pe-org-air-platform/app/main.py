@@ -16,6 +16,7 @@ from app.routers.documents import router as documents_router
 from app.routers.signals import router as signals_router
 from app.routers.evidence import router as evidence_router
 from app.routers.scoring import router as scoring_router
+from app.routers.sensitivity import router as sensitivity_router
 # from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.cors import CORSMiddleware
 from app.routers.board_governance import router as board_governance_router
@@ -94,6 +95,7 @@ app.include_router(signals_router)          # Signals / Reset(Demo) / Signal Sco
 app.include_router(evidence_router)         # Evidence
 app.include_router(board_governance_router) # Board Governance
 app.include_router(glassdoor_signals_router)# Glassdoor Culture Signals
+app.include_router(sensitivity_router)      # CS3 Sensitivity (before /scoring/{ticker})
 app.include_router(scoring_router)          # CS3 Scoring
 app.include_router(tc_vr_router)            # CS3 TC + V^R Scoring
 app.include_router(pf_router)               # CS3 Position Factor
@@ -137,6 +139,16 @@ async def startup_event():
         print("⚠️  Signal handlers not supported on Windows, using fallback...")
         _register_windows_signal_handlers()
 
+    # Durable background jobs (evidence backfills): resume anything left unfinished.
+    # The job handlers are registered by the routers that enqueue them.
+    from app.config import settings
+    if settings.JOB_WORKER_ENABLED:
+        from app.services.job_queue import get_job_worker
+        try:
+            get_job_worker().start()
+        except Exception as e:
+            print(f"⚠️  Job worker not started: {e}")
+
 
 # SHUTDOWN EVENT
 @app.on_event("shutdown")
@@ -144,6 +156,15 @@ async def shutdown_event():
     print("Shutting down PE Org-AI-R Platform Foundation API...")
     set_shutdown()  # Ensure flag is set even if signal handler didn't fire
 
+    from app.services.job_queue import reset_job_queue
+    reset_job_queue()
+
+    from app.services.blocking import shutdown_blocking_executors
+    shutdown_blocking_executors()
+
+    from app.services.snowflake_pool import reset_snowflake_pool
+    reset_snowflake_pool()
+
 
 def _register_windows_signal_handlers():
     """Fallback for Windows where loop.add_signal_handler is not supported."""
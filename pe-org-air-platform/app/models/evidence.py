@@ -96,6 +96,7 @@ class BackfillProgress(BaseModel):
     companies_completed: int = 0
     total_companies: int = 0
     current_company: Optional[str] = None
+    running_companies: List[str] = []
     skipped_companies: List[str] = []
 
 
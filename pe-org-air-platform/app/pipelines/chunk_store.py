@@ -0,0 +1,240 @@
+"""
+Chunk Store — columnar (Parquet) storage for document chunks
+app/pipelines/chunk_store.py
+
+Each filing's chunks are one Parquet file, in the order they were chunked,
+with a row group per run of same-section chunks (chunk_index restarts in
+every section):
+
+    document_id    string (dictionary)
+    chunk_index    int32
+    section        string (dictionary, null = no section)
+    start_char     int64
+    end_char       int64
+    word_count     int32
+    content        string
+
+The schema metadata maps every section name to its row groups, so a
+reader asking for ["risk_factors", "item_1a"] decodes only those row
+groups, and only the columns it names — typically section + content,
+never the other sections' text. Files are zstd-compressed; bytes are read
+zero-copy and local paths memory-mapped.
+
+The JSON chunk files written before this format (a list of chunk dicts,
+or a dict with a "chunks" list, or a single chunk dict) are still read
+through the same ChunkFile interface.
+"""
+
+import io
+import json
+import logging
+from dataclasses import asdict, is_dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+PARQUET_MAGIC = b"PAR1"
+PARQUET_SUFFIX = "_chunks.parquet"
+JSON_SUFFIX = "_chunks.json"
+PARQUET_CONTENT_TYPE = "application/vnd.apache.parquet"
+
+_META_SECTIONS = b"orgair.sections"     # {section or "": [row group, ...]}
+_META_FILE = b"orgair.file"             # file-level fields of a JSON wrapper dict
+
+CHUNK_SCHEMA = pa.schema([
+    pa.field("document_id", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("chunk_index", pa.int32()),
+    pa.field("section", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("start_char", pa.int64()),
+    pa.field("end_char", pa.int64()),
+    pa.field("word_count", pa.int32()),
+    pa.field("content", pa.string()),
+])
+CHUNK_COLUMNS = tuple(CHUNK_SCHEMA.names)
+
+ChunkLike = Union[Dict[str, Any], Any]   # chunk dict or DocumentChunk
+Source = Union[bytes, str]               # file contents or local path
+
+
+def _as_dict(chunk: ChunkLike) -> Dict[str, Any]:
+    return asdict(chunk) if is_dataclass(chunk) else chunk
+
+
+def chunks_key(key: str, fmt: str) -> str:
+    """The S3 key of a chunk file in `fmt` ("parquet" or "json"), from either suffix."""
+    base = key
+    for suffix in (PARQUET_SUFFIX, JSON_SUFFIX):
+        if base.endswith(suffix):
+            base = base[: -len(suffix)]
+            break
+    return base + (PARQUET_SUFFIX if fmt == "parquet" else JSON_SUFFIX)
+
+
+# ---------------------------------------------------------------------------
+# Writing
+# ---------------------------------------------------------------------------
+
+def chunks_to_parquet(chunks: Sequence[ChunkLike], file_meta: Optional[Dict[str, Any]] = None) -> bytes:
+    """Encode chunks as Parquet: one row group per run of same-section chunks, in file order."""
+    runs: List[List[Dict[str, Any]]] = []
+    for row in (_as_dict(c) for c in chunks):
+        if runs and runs[-1][0].get("section") == row.get("section"):
+            runs[-1].append(row)
+        else:
+            runs.append([row])
+
+    groups: Dict[str, List[int]] = {}
+    for i, run in enumerate(runs):
+        groups.setdefault(run[0].get("section") or "", []).append(i)
+    metadata = {_META_SECTIONS: json.dumps(groups).encode("utf-8")}
+    if file_meta:
+        metadata[_META_FILE] = json.dumps(file_meta, default=str).encode("utf-8")
+    schema = CHUNK_SCHEMA.with_metadata(metadata)
+
+    sink = io.BytesIO()
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for run in runs:
+            table = pa.Table.from_pydict({name: [r.get(name) for r in run] for name in CHUNK_COLUMNS}, schema=schema)
+            writer.write_table(table, row_group_size=len(run))
+        if not runs:
+            writer.write_table(schema.empty_table())
+    return sink.getvalue()
+
+
+def chunks_to_json(chunks: Sequence[ChunkLike]) -> bytes:
+    """The legacy JSON encoding (a list of chunk dicts)."""
+    return json.dumps([_as_dict(c) for c in chunks], indent=2, default=str).encode("utf-8")
+
+
+def encode_chunks(chunks: Sequence[ChunkLike], fmt: str) -> Tuple[bytes, str]:
+    """(body, content type) of a chunk file in `fmt`."""
+    if fmt == "parquet":
+        return chunks_to_parquet(chunks), PARQUET_CONTENT_TYPE
+    if fmt == "json":
+        return chunks_to_json(chunks), "application/json"
+    raise ValueError(f"Unknown chunk store format: {fmt!r}")
+
+
+def parse_json_chunks(parsed: Any) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """(chunks, file-level fields) of a decoded legacy JSON chunk file."""
+    if isinstance(parsed, list):
+        return parsed, {}
+    if isinstance(parsed, dict):
+        if "chunks" in parsed:
+            return parsed["chunks"], {k: v for k, v in parsed.items() if k != "chunks"}
+        if "content" in parsed:
+            return [parsed], {}
+    return [], {}
+
+
+def json_to_parquet(data: bytes) -> bytes:
+    """Convert a legacy JSON chunk file to Parquet (file-level fields kept in the metadata)."""
+    chunks, file_meta = parse_json_chunks(json.loads(data.decode("utf-8")))
+    return chunks_to_parquet(chunks, file_meta)
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class ChunkFile:
+    """One filing's chunks, read lazily from Parquet or held from a legacy JSON file."""
+
+    def __init__(
+        self,
+        parquet: Optional[pq.ParquetFile] = None,
+        rows: Optional[List[Dict[str, Any]]] = None,
+        file_meta: Optional[Dict[str, Any]] = None,
+    ):
+        self._parquet = parquet
+        self._rows = rows or []
+        self._groups: Dict[str, List[int]] = {}
+        self.file_meta = file_meta or {}
+        self._contents: Dict[int, List[Optional[str]]] = {}   # row group -> decoded content column
+        if parquet is not None:
+            meta = parquet.schema_arrow.metadata or {}
+            self._groups = json.loads(meta.get(_META_SECTIONS, b"{}"))
+            self.file_meta = json.loads(meta.get(_META_FILE, b"{}"))
+
+    @classmethod
+    def open(cls, source: Optional[Source]) -> "ChunkFile":
+        """Open chunk file contents (bytes) or a local path (memory-mapped); detects the format."""
+        if source is None:
+            return cls()
+        if isinstance(source, str):
+            with open(source, "rb") as f:
+                magic = f.read(4)
+            if magic == PARQUET_MAGIC:
+                return cls(parquet=pq.ParquetFile(pa.memory_map(source, "r")))
+            with open(source, "rb") as f:
+                source = f.read()
+        if source[:4] == PARQUET_MAGIC:
+            return cls(parquet=pq.ParquetFile(pa.BufferReader(source)))
+        text = source.decode("utf-8") if isinstance(source, bytes) else str(source)
+        rows, file_meta = parse_json_chunks(json.loads(text))
+        return cls(rows=rows, file_meta=file_meta)
+
+    @property
+    def format(self) -> str:
+        return "parquet" if self._parquet is not None else "json"
+
+    def __len__(self) -> int:
+        return self._parquet.metadata.num_rows if self._parquet is not None else len(self._rows)
+
+    def sections(self) -> List[Optional[str]]:
+        """Section names present (None for chunks without a section)."""
+        if self._parquet is not None:
+            return [s or None for s in self._groups]
+        return list(dict.fromkeys(r.get("section") for r in self._rows))
+
+    def read(
+        self,
+        sections: Optional[Iterable[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Chunks in file order, as dicts.
+
+        sections: keep only chunks whose section matches one of these
+                  (case-insensitive; "" matches chunks without a section)
+        columns:  fields to return (default: all)
+        """
+        wanted = {s.lower() for s in sections} if sections is not None else None
+        if self._parquet is None:
+            rows = [r for r in self._rows if wanted is None or (r.get("section") or "").lower() in wanted]
+            if columns is not None:
+                rows = [{c: r.get(c) for c in columns} for r in rows]
+            return rows
+
+        groups = self._row_groups(wanted)
+        if not groups:
+            return []
+        table = self._parquet.read_row_groups(groups, columns=list(columns or CHUNK_COLUMNS))
+        return table.to_pylist()
+
+    def _row_groups(self, wanted: Optional[set]) -> List[int]:
+        return sorted(i for name, ids in self._groups.items() if wanted is None or name.lower() in wanted for i in ids)
+
+    def contents(self, sections: Optional[Iterable[str]] = None) -> List[str]:
+        """
+        Chunk contents (in file order) for the given sections, skipping empty ones.
+
+        Each row group's content column is decoded at most once per ChunkFile,
+        so the section queries and the all-chunks fallback of a scoring run
+        share the work.
+        """
+        if self._parquet is None:
+            return [r["content"] for r in self.read(sections, ("content",)) if r["content"]]
+        groups = self._row_groups({s.lower() for s in sections} if sections is not None else None)
+        missing = [i for i in groups if i not in self._contents]
+        if missing:
+            column = self._parquet.read_row_groups(missing, columns=["content"]).column("content").to_pylist()
+            offset = 0
+            for i in missing:
+                n = self._parquet.metadata.row_group(i).num_rows
+                self._contents[i] = column[offset:offset + n]
+                offset += n
+        return [c for i in groups for c in self._contents[i] if c]
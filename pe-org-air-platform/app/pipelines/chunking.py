@@ -1,5 +1,7 @@
 import logging
-from typing import List, Optional
+import re
+from collections import deque
+from typing import Deque, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
 logging.basicConfig(
@@ -9,6 +11,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# A word is a maximal run of non-whitespace (same tokens as str.split())
+_WORD_RE = re.compile(r"\S+")
+
 
 @dataclass
 class DocumentChunk:
@@ -23,7 +28,19 @@ class DocumentChunk:
 
 
 class SemanticChunker:
-    """Chunk documents with section awareness"""
+    """
+    Chunk documents with section awareness.
+
+    Words are the `\\S+` runs of the text (the same tokens as str.split()),
+    found once with re.finditer. Each chunk is a slice of the original
+    string, so `content == text[start_char:end_char]` exactly, with the
+    source whitespace kept. Offsets are relative to the section text (or
+    to the full content when there are no sections).
+
+    Chunking is a single O(n) pass. iter_chunks() / iter_document_chunks()
+    stream chunks while holding only about chunk_size + min_chunk_size word
+    spans at a time.
+    """
     
     def __init__(
         self,
@@ -43,32 +60,39 @@ class SemanticChunker:
         sections: dict
     ) -> List[DocumentChunk]:
         """Split document into overlapping chunks"""
-        chunks = []
+        chunks = list(self.iter_document_chunks(document_id, content, sections))
+        logger.info(f"  ✅ Created {len(chunks)} chunks total")
+        return chunks
+    
+    def iter_document_chunks(
+        self,
+        document_id: str,
+        content: str,
+        sections: dict
+    ) -> Iterator[DocumentChunk]:
+        """Stream a document's chunks, indexed sequentially across sections"""
+        chunk_index = 0
         
         # Chunk each section separately to preserve context
         if sections:
             logger.info(f"  📑 Chunking {len(sections)} sections...")
             for section_name, section_content in sections.items():
                 if section_content and len(section_content.strip()) > 0:
-                    section_chunks = self._chunk_text(
-                        section_content,
-                        document_id,
-                        section_name
-                    )
-                    chunks.extend(section_chunks)
-                    logger.info(f"    • {section_name}: {len(section_chunks)} chunks")
+                    section_count = 0
+                    for chunk in self.iter_chunks(section_content, document_id, section_name):
+                        chunk.chunk_index = chunk_index
+                        chunk_index += 1
+                        section_count += 1
+                        yield chunk
+                    logger.info(f"    • {section_name}: {section_count} chunks")
         
         # If no sections or sections didn't cover much, chunk the full content
-        if not chunks:
+        if chunk_index == 0:
             logger.info(f"  📄 Chunking full document content...")
-            chunks = self._chunk_text(content, document_id, None)
-        
-        # Re-index chunks sequentially
-        for i, chunk in enumerate(chunks):
-            chunk.chunk_index = i
-        
-        logger.info(f"  ✅ Created {len(chunks)} chunks total")
-        return chunks
+            for chunk in self.iter_chunks(content, document_id, None):
+                chunk.chunk_index = chunk_index
+                chunk_index += 1
+                yield chunk
     
     def _chunk_text(
         self,
@@ -77,59 +101,82 @@ class SemanticChunker:
         section: Optional[str]
     ) -> List[DocumentChunk]:
         """Split text into overlapping chunks"""
+        return list(self.iter_chunks(text, doc_id, section))
+    
+    def iter_chunks(
+        self,
+        text: str,
+        doc_id: str,
+        section: Optional[str]
+    ) -> Iterator[DocumentChunk]:
+        """
+        Stream overlapping chunks of one text.
+
+        Word grouping is the same as before: chunk_size words per chunk,
+        chunk_overlap words shared with the next chunk, and a tail shorter
+        than min_chunk_size merged into the last chunk.
+        """
         if not text or not text.strip():
-            return []
+            return
+        
+        words = _WORD_RE.finditer(text)
+        # Spans of the words not yet consumed; refilled lazily
+        window: Deque[Tuple[int, int]] = deque()
+        exhausted = False
         
-        words = text.split()
-        chunks = []
+        def fill(upto: int) -> None:
+            nonlocal exhausted
+            while not exhausted and len(window) < upto:
+                match = next(words, None)
+                if match is None:
+                    exhausted = True
+                else:
+                    window.append(match.span())
         
-        if len(words) <= self.min_chunk_size:
+        fill(self.min_chunk_size + 1)
+        if exhausted and len(window) <= self.min_chunk_size:
             # Text too small to chunk, return as single chunk
-            return [DocumentChunk(
+            yield DocumentChunk(
                 document_id=doc_id,
                 chunk_index=0,
                 content=text,
                 section=section,
                 start_char=0,
                 end_char=len(text),
-                word_count=len(words)
-            )]
+                word_count=len(window)
+            )
+            return
         
-        start_idx = 0
         chunk_index = 0
-        
-        while start_idx < len(words):
-            end_idx = min(start_idx + self.chunk_size, len(words))
+        while window:
+            # Enough lookahead to know whether the tail would be tiny
+            fill(self.chunk_size + self.min_chunk_size)
+            size = min(self.chunk_size, len(window))
             
             # Don't create tiny final chunks
-            if len(words) - end_idx < self.min_chunk_size:
-                end_idx = len(words)
-            
-            chunk_words = words[start_idx:end_idx]
-            chunk_content = " ".join(chunk_words)
+            if exhausted and len(window) - size < self.min_chunk_size:
+                size = len(window)
             
-            # Calculate character positions (approximate)
-            start_char = len(" ".join(words[:start_idx])) if start_idx > 0 else 0
-            end_char = start_char + len(chunk_content)
-            
-            chunks.append(DocumentChunk(
+            start_char = window[0][0]
+            end_char = window[size - 1][1]
+            yield DocumentChunk(
                 document_id=doc_id,
                 chunk_index=chunk_index,
-                content=chunk_content,
+                content=text[start_char:end_char],
                 section=section,
                 start_char=start_char,
                 end_char=end_char,
-                word_count=len(chunk_words)
-            ))
-            
-            # Move forward with overlap
-            start_idx = end_idx - self.chunk_overlap
+                word_count=size
+            )
             chunk_index += 1
             
-            if end_idx >= len(words):
+            if exhausted and size == len(window):
                 break
-        
-        return chunks
+            
+            # Move forward with overlap (always by at least one word)
+            step = max(1, size - self.chunk_overlap)
+            for _ in range(step):
+                window.popleft()
 
 
 # Factory function to create chunker with custom settings
@@ -0,0 +1,106 @@
+"""
+Company Name Matcher — vectorized scraped-company filter
+app/pipelines/company_matcher.py
+
+Same accept/reject decisions as job_signals.is_company_match_fuzzy, made for
+a whole scrape result at once instead of once per DataFrame row:
+
+  - the valid names (target + ticker aliases, or aliases by official name)
+    are normalized once per (target, ticker) and cached with the matcher
+  - exact hits are a set lookup
+  - every distinct remaining company name is scored against the valid
+    names with rapidfuzz.process.cdist, one scorer at a time
+    (token_sort_ratio, partial_ratio, ratio), multi-threaded via
+    `workers=`; later scorers only see names not accepted yet
+  - decisions are memoized per matcher — scraped rows repeat the same
+    handful of employer names across searches and sites
+
+Scores are computed in float64 (cdist's default is float32), so a name
+sitting exactly on the threshold is decided as the scalar scorers decide it.
+
+Usage:
+    matcher = get_company_matcher("Caterpillar", ticker="CAT", threshold=75.0)
+    mask = matcher.match_mask(jobs_df["company"])
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from app.config import get_aliases_by_official, get_company_aliases, settings
+
+SCORERS = (fuzz.token_sort_ratio, fuzz.partial_ratio, fuzz.ratio)
+MAX_MEMOIZED = 50_000
+
+
+def normalize_company(value: Any) -> Optional[str]:
+    """Lowercased, stripped name; None for a missing (falsy) value."""
+    return str(value).strip().lower() if value else None
+
+
+class CompanyNameMatcher:
+    """Precompiled valid-name index for one (target company, ticker)."""
+
+    def __init__(self, target_company: str, ticker: Optional[str] = None,
+                 threshold: float = 75.0, workers: int = -1):
+        self.target_company = target_company
+        self.ticker = ticker
+        self.threshold = threshold
+        self.workers = workers
+
+        valid_names: List[str] = []
+        if target_company:
+            valid_names.append(target_company)
+            if ticker:
+                valid_names.extend(get_company_aliases(ticker))
+            else:
+                valid_names.extend(get_aliases_by_official(target_company) or [])
+        self.names: List[str] = sorted({n.strip().lower() for n in valid_names if n})
+        self.exact = frozenset(self.names)
+        self._decisions: Dict[str, bool] = {}
+
+    def _score(self, queries: List[str]) -> np.ndarray:
+        accepted = np.zeros(len(queries), dtype=bool)
+        if not queries or not self.names:
+            return accepted
+        pending = np.arange(len(queries))
+        for scorer in SCORERS:
+            scores = process.cdist(
+                [queries[i] for i in pending], self.names,
+                scorer=scorer, score_cutoff=self.threshold,
+                dtype=np.float64, workers=self.workers,
+            )
+            hit = (scores >= self.threshold).any(axis=1)
+            accepted[pending[hit]] = True
+            pending = pending[~hit]
+            if not len(pending):
+                break
+        return accepted
+
+    def match_mask(self, companies: Iterable[Any]) -> np.ndarray:
+        """Boolean mask over companies (a DataFrame column or any iterable)."""
+        cleaned = [normalize_company(c) for c in companies]
+        decisions = self._decisions
+        unknown = [
+            name for name in dict.fromkeys(cleaned)
+            if name is not None and name not in self.exact and name not in decisions
+        ]
+        if unknown:
+            if len(decisions) + len(unknown) > MAX_MEMOIZED:
+                decisions.clear()
+            decisions.update(zip(unknown, self._score(unknown).tolist()))
+        return np.fromiter(
+            (name is not None and (name in self.exact or decisions[name]) for name in cleaned),
+            dtype=bool, count=len(cleaned),
+        )
+
+    def matches(self, company: Any) -> bool:
+        return bool(self.match_mask([company])[0])
+
+
+@lru_cache(maxsize=256)
+def get_company_matcher(target_company: str, ticker: Optional[str] = None,
+                        threshold: float = 75.0) -> CompanyNameMatcher:
+    """Cached matcher per (target company, ticker, threshold)."""
+    return CompanyNameMatcher(target_company, ticker, threshold, workers=settings.JOBSPY_MATCH_WORKERS)
@@ -354,6 +354,9 @@ import pdfplumber
 import fitz  # PyMuPDF
 from io import BytesIO
 
+from app.config import settings
+from app.pipelines.section_scanner import SectionScan, scan_sections
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s | %(levelname)-8s | %(message)s',
@@ -366,6 +369,11 @@ logger = logging.getLogger(__name__)
 _TOC_DETECTION_THRESHOLD = 1000
 _MIN_DOC_WORDS_FOR_FALLBACK = 5000
 
+# _clean_text passes
+_SPACE_RUN_RE = re.compile(r'[ \t]+')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,;:!?\'\"()\-$%\n]')
+
 
 @dataclass
 class ParsedTable:
@@ -396,10 +404,20 @@ class ParsedDocument:
 
 
 class DocumentParser:
-    """Universal document parser for SEC filings (HTML & PDF)"""
+    """
+    Universal document parser for SEC filings (HTML & PDF)
+
+    HTML backends (HTML_PARSER_BACKEND):
+      - "bs4":  BeautifulSoup tree + get_text() (default)
+      - "lxml": streaming lxml pull parser (html_stream_parser.py) — no
+                full tree, tables and section starts found in the same pass
+    """
     
-    def __init__(self):
-        logger.info("📄 Document Parser initialized")
+    def __init__(self, html_backend: Optional[str] = None):
+        self.html_backend = html_backend or settings.HTML_PARSER_BACKEND
+        if self.html_backend not in ("bs4", "lxml"):
+            raise ValueError(f"Unknown HTML parser backend: {self.html_backend}")
+        logger.info(f"📄 Document Parser initialized (HTML backend: {self.html_backend})")
     
     def detect_format(self, content: bytes, filename: str = "") -> str:
         """Detect if content is HTML or PDF"""
@@ -431,60 +449,39 @@ class DocumentParser:
     def _parse_html(self, content: bytes, document_id: str, ticker: str,
                     filing_type: str, filing_date: str) -> ParsedDocument:
         """Parse HTML document"""
-        logger.info(f"  🌐 Parsing HTML document...")
+        logger.info(f"  🌐 Parsing HTML document ({self.html_backend})...")
         errors = []
         
         try:
-            html_text = content.decode('utf-8', errors='ignore')
-            soup = BeautifulSoup(html_text, 'html.parser')
-            
-            # Remove script and style elements
-            for element in soup(['script', 'style', 'meta', 'link']):
-                element.decompose()
-            
-            # Get text with newline separator
-            text = soup.get_text(separator='\n')
-            
-            # Clean up whitespace - line by line
-            lines = (line.strip() for line in text.splitlines())
-            text = '\n'.join(line for line in lines if line)
-            
-            # Final cleanup
-            text = self._clean_text(text)
+            if self.html_backend == "lxml":
+                from app.pipelines.html_stream_parser import parse_html_stream
+                text, tables, scan = parse_html_stream(content, filing_type)
+            else:
+                text, tables, scan = self._parse_html_soup(content, filing_type)
             word_count = len(text.split())
             
             # Generate content hash
             content_hash = hashlib.sha256(text.encode()).hexdigest()
             
             logger.info(f"  ✅ Extracted {word_count:,} words")
-            
-            # Extract tables
-            tables = self._extract_html_tables(soup)
             logger.info(f"  📊 Extracted {len(tables)} tables")
             
-            # Extract sections based on filing type
-            sections = self._extract_sections(text, filing_type)
+            sections, section_words = scan.sections(text), scan.word_counts()
             
             # ── TOC-only fallback ──
             # If the document has lots of content but section extraction
             # only captured tiny TOC entries, use proportional fallback
             if filing_type == "10-K" and word_count >= _MIN_DOC_WORDS_FOR_FALLBACK:
-                max_section_words = max(
-                    (len(s.split()) for s in sections.values()),
-                    default=0,
-                )
+                max_section_words = max(section_words.values(), default=0)
                 if max_section_words < _TOC_DETECTION_THRESHOLD:
                     logger.warning(
                         f"  ⚠️  Section extraction likely captured TOC only "
-                        f"(max section={max_section_words}w, doc={word_count}w). "
-                        f"Using proportional fallback..."
+                        f"(max section={max_section_words}w, doc={word_count}w"
+                        f"{self._toc_note(scan)}). Using proportional fallback..."
                     )
-                    sections = self._fallback_section_split(text, word_count)
+                    sections, section_words = self._fallback_section_split(text, word_count)
             
-            logger.info(f"  📑 Identified {len(sections)} sections")
-            for sec_name, sec_content in sections.items():
-                sec_words = len(sec_content.split())
-                logger.info(f"      • {sec_name}: {sec_words:,} words")
+            self._log_sections(section_words)
             
         except Exception as e:
             logger.error(f"  ❌ HTML parsing error: {e}")
@@ -510,6 +507,28 @@ class DocumentParser:
             parse_errors=errors
         )
     
+    def _parse_html_soup(self, content: bytes, filing_type: str) -> Tuple[str, List[ParsedTable], SectionScan]:
+        """Text, tables and section spans via a full BeautifulSoup tree"""
+        html_text = content.decode('utf-8', errors='ignore')
+        soup = BeautifulSoup(html_text, 'html.parser')
+        
+        # Remove script and style elements
+        for element in soup(['script', 'style', 'meta', 'link']):
+            element.decompose()
+        
+        # Get text with newline separator
+        text = soup.get_text(separator='\n')
+        
+        # Clean up whitespace - line by line
+        lines = (line.strip() for line in text.splitlines())
+        text = '\n'.join(line for line in lines if line)
+        
+        # Final cleanup
+        text = self._clean_text(text)
+        
+        tables = self._extract_html_tables(soup)
+        return text, tables, scan_sections(text, filing_type)
+    
     def _parse_pdf(self, content: bytes, document_id: str, ticker: str,
                    filing_type: str, filing_date: str) -> ParsedDocument:
         """Parse PDF document using pdfplumber and PyMuPDF"""
@@ -552,25 +571,20 @@ class DocumentParser:
             logger.info(f"  ✅ Extracted {word_count:,} words from PDF")
             logger.info(f"  📊 Extracted {len(tables)} tables")
             
-            sections = self._extract_sections(text, filing_type)
+            scan = scan_sections(text, filing_type)
+            sections, section_words = scan.sections(text), scan.word_counts()
             
             # TOC fallback for PDFs too
             if word_count >= _MIN_DOC_WORDS_FOR_FALLBACK:
-                max_section_words = max(
-                    (len(s.split()) for s in sections.values()),
-                    default=0,
-                )
+                max_section_words = max(section_words.values(), default=0)
                 if max_section_words < _TOC_DETECTION_THRESHOLD:
                     logger.warning(
-                        f"  ⚠️  PDF section extraction likely captured TOC only. "
-                        f"Using proportional fallback..."
+                        f"  ⚠️  PDF section extraction likely captured TOC only"
+                        f"{self._toc_note(scan)}. Using proportional fallback..."
                     )
-                    sections = self._fallback_section_split(text, word_count)
+                    sections, section_words = self._fallback_section_split(text, word_count)
             
-            logger.info(f"  📑 Identified {len(sections)} sections")
-            for sec_name, sec_content in sections.items():
-                sec_words = len(sec_content.split())
-                logger.info(f"      • {sec_name}: {sec_words:,} words")
+            self._log_sections(section_words)
             
         except Exception as e:
             logger.error(f"  ❌ PDF parsing error: {e}")
@@ -641,59 +655,19 @@ class DocumentParser:
     
     def _extract_sections(self, content: str, filing_type: str) -> Dict[str, str]:
         """Extract key sections from filing text based on filing type"""
-        sections = {}
-        content_upper = content.upper()
-        
-        if filing_type == "10-K":
-            section_patterns = [
-                ("business", r"ITEM\s*1\.?\s*BUSINESS", r"ITEM\s*1A|ITEM\s*1B"),
-                ("risk_factors", r"ITEM\s*1A\.?\s*RISK\s*FACTORS", r"ITEM\s*1B|ITEM\s*1C|ITEM\s*2"),
-                ("mda", r"ITEM\s*7\.?\s*MANAGEMENT", r"ITEM\s*7A|ITEM\s*8"),
-            ]
-        elif filing_type == "10-Q":
-            section_patterns = [
-                ("mda", r"ITEM\s*2\.?\s*MANAGEMENT", r"ITEM\s*3|ITEM\s*4"),
-                ("risk_factors", r"ITEM\s*1A\.?\s*RISK\s*FACTORS", r"ITEM\s*2|ITEM\s*3|ITEM\s*4"),
-            ]
-        elif filing_type == "8-K":
-            section_patterns = [
-                ("other_events", r"ITEM\s*8\.01\.?\s*OTHER\s*EVENTS", r"ITEM\s*9|SIGNATURE|EXHIBIT"),
-            ]
-        elif filing_type in ["DEF 14A", "DEF14A"]:
-            section_patterns = [
-                ("executive_compensation", r"EXECUTIVE\s*COMPENSATION", r"DIRECTOR\s*COMPENSATION|SECURITY\s*OWNERSHIP|CERTAIN\s*RELATIONSHIPS|EQUITY\s*COMPENSATION"),
-                ("director_compensation", r"DIRECTOR\s*COMPENSATION", r"SECURITY\s*OWNERSHIP|CERTAIN\s*RELATIONSHIPS|EQUITY\s*COMPENSATION|AUDIT"),
-            ]
-        else:
-            return sections
-        
-        for section_name, start_pattern, end_pattern in section_patterns:
-            try:
-                start_match = re.search(start_pattern, content_upper)
-                if not start_match:
-                    continue
-                
-                start_pos = start_match.start()
-                search_start = start_pos + 500
-                end_match = re.search(end_pattern, content_upper[search_start:])
-                
-                if end_match:
-                    end_pos = search_start + end_match.start()
-                else:
-                    end_pos = min(start_pos + 150000, len(content))
-                
-                section_text = content[start_pos:end_pos].strip()
-                word_count = len(section_text.split())
-                if word_count > 100:
-                    sections[section_name] = section_text
-                    
-            except Exception as e:
-                logger.error(f"Error extracting {section_name}: {e}")
-                continue
-        
-        return sections
+        return scan_sections(content, filing_type).sections(content)
+    
+    def _toc_note(self, scan: SectionScan) -> str:
+        """', starts at TOC entries: ...' for the TOC-only fallback warning"""
+        toc = [span.name for span in scan.spans if span.start_in_toc]
+        return f", starts at TOC entries: {', '.join(toc)}" if toc else ""
+    
+    def _log_sections(self, section_words: Dict[str, int]) -> None:
+        logger.info(f"  📑 Identified {len(section_words)} sections")
+        for sec_name, sec_words in section_words.items():
+            logger.info(f"      • {sec_name}: {sec_words:,} words")
     
-    def _fallback_section_split(self, text: str, word_count: int) -> Dict[str, str]:
+    def _fallback_section_split(self, text: str, word_count: int) -> Tuple[Dict[str, str], Dict[str, int]]:
         """
         Fallback for filings where section headers don't appear in plain text
         (e.g., GE Aerospace's 10-K where headers are in HTML formatting that
@@ -712,6 +686,8 @@ class DocumentParser:
         2. The full text DOES contain the real section content
         3. Section boundaries in 10-K filings follow a standard structure
         4. The rubric scorer uses keyword matching, not position-aware analysis
+        
+        Returns (sections, word counts); the text is split into words once.
         """
         logger.info(f"  📐 Proportional section split on {word_count} words")
         
@@ -730,30 +706,29 @@ class DocumentParser:
         risk_end = int(usable_end * 0.40)
         mda_end = int(usable_end * 0.70)
         
-        sections = {}
+        sections, section_words = {}, {}
         
-        biz_text = " ".join(words[:biz_end])
-        if len(biz_text.split()) > 200:
-            sections["business"] = biz_text
-            
-        risk_text = " ".join(words[biz_end:risk_end])
-        if len(risk_text.split()) > 200:
-            sections["risk_factors"] = risk_text
-            
-        mda_text = " ".join(words[risk_end:mda_end])
-        if len(mda_text.split()) > 200:
-            sections["mda"] = mda_text
+        # A slice of split() words re-joined with spaces has exactly
+        # end - start words, so nothing is re-split to count them
+        for name, start, end in (
+            ("business", 0, biz_end),
+            ("risk_factors", biz_end, risk_end),
+            ("mda", risk_end, mda_end),
+        ):
+            if end - start > 200:
+                sections[name] = " ".join(words[start:end])
+                section_words[name] = end - start
         
-        for name, content in sections.items():
-            logger.info(f"      📐 {name}: {len(content.split()):,} words (proportional)")
+        for name, count in section_words.items():
+            logger.info(f"      📐 {name}: {count:,} words (proportional)")
         
-        return sections
+        return sections, section_words
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[^\w\s.,;:!?\'\"()\-$%\n]', '', text)
+        text = _SPACE_RUN_RE.sub(' ', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
+        text = _SPECIAL_CHARS_RE.sub('', text)
         return text.strip()
 
 
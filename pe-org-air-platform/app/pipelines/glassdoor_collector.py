@@ -2974,6 +2974,12 @@ class CultureCollector:
     # -----------------------------------------------------------------
     # S3 upload
     # -----------------------------------------------------------------
+    @staticmethod
+    def _record_snapshot(s3_key: str, body: bytes, response: Dict[str, Any]) -> None:
+        """Point the prefix's latest-snapshot manifest at the object just uploaded."""
+        from app.services.snapshot_manifest import record_snapshot
+        record_snapshot(s3_key, body, response.get("ETag"))
+
     def _get_s3_service(self):
         if not hasattr(self, "_s3_client"):
             try:
@@ -3050,13 +3056,15 @@ class CultureCollector:
         }, indent=2, default=str)
 
         try:
-            client.put_object(
+            body = payload.encode("utf-8")
+            response = client.put_object(
                 Bucket=self._s3_bucket,
                 Key=s3_key,
-                Body=payload.encode("utf-8"),
+                Body=body,
                 ContentType="application/json",
             )
             logger.info(f"[{ticker}] Uploaded {len(raw_data)} raw reviews to S3: {s3_key}")
+            self._record_snapshot(s3_key, body, response)
             return s3_key
         except Exception as e:
             logger.error(f"[{ticker}] S3 raw upload failed: {e}")
@@ -3076,13 +3084,15 @@ class CultureCollector:
         payload = json.dumps(output_data, indent=2, default=str)
 
         try:
-            client.put_object(
+            body = payload.encode("utf-8")
+            response = client.put_object(
                 Bucket=self._s3_bucket,
                 Key=s3_key,
-                Body=payload.encode("utf-8"),
+                Body=body,
                 ContentType="application/json",
             )
             logger.info(f"[{ticker}] Uploaded culture signal to S3: {s3_key}")
+            self._record_snapshot(s3_key, body, response)
             return s3_key
         except Exception as e:
             logger.error(f"[{ticker}] S3 output upload failed: {e}")
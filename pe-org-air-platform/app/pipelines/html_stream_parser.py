@@ -0,0 +1,224 @@
+"""
+Streaming HTML Filing Parser (lxml)
+app/pipelines/html_stream_parser.py
+
+The "lxml" HTML backend of DocumentParser (HTML_PARSER_BACKEND=lxml).
+
+The BeautifulSoup backend decodes the whole filing, builds a complete tree,
+materialises get_text(), then splits / rejoins lines and cleans the result.
+Here the raw bytes are fed in FEED_BYTES slices to an lxml HTMLPullParser
+and everything happens on the parse events, in one pass:
+
+  - text:     each text node is emitted in document order (an element's
+              .text when its first child starts or when it ends, a
+              sibling's .tail when the next sibling starts), split into
+              stripped non-empty lines, as get_text(separator='\\n') does
+  - dropped:  <script>, <style> and <ix:header> subtrees (inline XBRL
+              contexts / hidden facts) contribute no text; inline
+              <ix:nonFraction> / <ix:nonNumeric> facts are visible filing
+              text and are kept
+  - tables:   extracted when </table> closes, with the same rows / cells /
+              table_index as DocumentParser._extract_html_tables
+  - memory:   every finished element outside a table is cleared and its
+              earlier siblings deleted, so the live tree stays a single
+              path from the root plus the table being read
+  - sections: cleaned text is flushed every _FLUSH_CHARS to a
+              SectionScanner (section_scanner.py), which collects the
+              section headings as the text arrives; only span bounds and
+              word counts are computed at the end
+
+Output text and sections match the BeautifulSoup backend except for the
+dropped <ix:header> content and rare malformed-markup recoveries where
+libxml2 and html.parser build different trees.
+"""
+
+import codecs
+from typing import Iterable, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from app.pipelines.document_parser import ParsedTable, _SPACE_RUN_RE, _SPECIAL_CHARS_RE
+from app.pipelines.section_scanner import SectionScan, SectionScanner
+
+DROP_TAGS = frozenset({"script", "style", "ix:header"})
+FEED_BYTES = 256 * 1024
+_FLUSH_CHARS = 64 * 1024
+
+
+class _StreamExtractor:
+    """Event handler state for one filing."""
+
+    def __init__(self, filing_type: str):
+        self.lines: List[str] = []
+        self.line_chars = 0
+        self.chunks: List[str] = []
+        self.tables: List[ParsedTable] = []
+        self.scanner = SectionScanner(filing_type)
+        self._skip = 0          # depth inside dropped elements
+        self._tables_open: List[int] = []
+        self._table_count = 0
+
+    # ---- text -----------------------------------------------------------
+
+    def _emit(self, piece: Optional[str]) -> None:
+        if not piece or self._skip:
+            return
+        for line in piece.splitlines():
+            line = line.strip()
+            if line:
+                self.lines.append(line)
+                self.line_chars += len(line) + 1
+        if self.line_chars >= _FLUSH_CHARS:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.lines:
+            chunk = _SPECIAL_CHARS_RE.sub('', _SPACE_RUN_RE.sub(' ', '\n'.join(self.lines)))
+            if self.chunks:
+                chunk = '\n' + chunk
+            self.chunks.append(chunk)
+            self.scanner.feed(chunk)
+            self.lines, self.line_chars = [], 0
+
+    def _text_before(self, el) -> None:
+        """Text between the previous node (or the parent's start tag) and `el`."""
+        prev = el.getprevious()
+        if prev is not None:
+            self._emit(prev.tail)
+        else:
+            parent = el.getparent()
+            if parent is not None:
+                self._emit(parent.text)
+
+    # ---- events ---------------------------------------------------------
+
+    def start(self, el) -> None:
+        self._text_before(el)
+        if el.tag in DROP_TAGS:
+            self._skip += 1
+        if el.tag == "table":
+            self._tables_open.append(self._table_count)
+            self._table_count += 1
+
+    def leaf(self, el) -> None:
+        """Comments and processing instructions: no text of their own."""
+        self._text_before(el)
+
+    def end(self, el) -> None:
+        if len(el):
+            self._emit(el[-1].tail)
+        else:
+            self._emit(el.text)
+        if el.tag in DROP_TAGS:
+            self._skip -= 1
+        if el.tag == "table":
+            index = self._tables_open.pop()
+            if not self._skip:
+                table = _table(el, index)
+                if table is not None:
+                    self.tables.append(table)
+        if not self._tables_open:
+            # Release everything already consumed
+            el.clear(keep_tail=True)
+            parent = el.getparent()
+            if parent is not None:
+                while el.getprevious() is not None:
+                    del parent[0]
+
+    def finish(self) -> Tuple[str, List[ParsedTable], SectionScan]:
+        self._flush()
+        text = "".join(self.chunks)
+        self.chunks = []
+        lead = len(text) - len(text.lstrip())
+        text = text.strip()
+        # Nested tables close before their parents; keep document order
+        self.tables.sort(key=lambda t: t.table_index)
+        return text, self.tables, self.scanner.finish(text, offset=lead)
+
+
+def _strings(el) -> Iterable[str]:
+    """Text nodes under `el`, skipping dropped subtrees, comments and PIs."""
+    if el.text:
+        yield el.text
+    for child in el:
+        if isinstance(child.tag, str) and child.tag not in DROP_TAGS:
+            yield from _strings(child)
+        if child.tail:
+            yield child.tail
+
+
+def _cell_text(cell) -> str:
+    """== BeautifulSoup cell.get_text(strip=True)"""
+    return "".join(s.strip() for s in _strings(cell) if s.strip())
+
+
+def _table(table, index: int) -> Optional[ParsedTable]:
+    """Same rule as DocumentParser._extract_html_tables: header row + ≥1 data row."""
+    rows_data = []
+    for row in table.iter("tr"):
+        row_data = [_cell_text(cell) for cell in row.iter("td", "th")]
+        if any(row_data):
+            rows_data.append(row_data)
+    if len(rows_data) <= 1:
+        return None
+    return ParsedTable(
+        table_index=index,
+        page_number=None,
+        headers=rows_data[0],
+        rows=rows_data[1:],
+        row_count=len(rows_data) - 1,
+        col_count=len(rows_data[0]),
+    )
+
+
+def _byte_chunks(source: Union[bytes, Iterable[bytes]]) -> Iterable[bytes]:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source)
+        for i in range(0, len(view), FEED_BYTES):
+            yield view[i:i + FEED_BYTES].tobytes()
+    else:
+        yield from source
+
+
+def parse_html_stream(
+    source: Union[bytes, Iterable[bytes]],
+    filing_type: str,
+) -> Tuple[str, List[ParsedTable], SectionScan]:
+    """
+    (text, tables, section scan) for an HTML filing, in one streaming pass.
+
+    `source` is the raw filing bytes or an iterable of byte chunks (e.g. a
+    file read in blocks). Bytes are decoded as UTF-8, dropping invalid
+    sequences, like the BeautifulSoup backend.
+    """
+    handler = _StreamExtractor(filing_type)
+    parser = etree.HTMLPullParser(
+        events=("start", "end", "comment", "pi"),
+        huge_tree=True,
+    )
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+
+    def drain():
+        for event, el in parser.read_events():
+            if event == "start":
+                handler.start(el)
+            elif event == "end":
+                handler.end(el)
+            else:
+                handler.leaf(el)
+
+    fed = False
+    for block in _byte_chunks(source):
+        data = decoder.decode(block)
+        if data:
+            parser.feed(data)
+            fed = True
+            drain()
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        parser.feed(tail)
+        fed = True
+    if fed:  # close() on an empty document raises "no element found"
+        parser.close()
+        drain()
+    return handler.finish()
@@ -1196,13 +1196,12 @@ Key changes:
 """
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import re
 from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.config import (
     settings,
@@ -1222,6 +1221,7 @@ from app.models.signal import JobPosting
 #     TECH_JOB_TITLE_KEYWORDS,
 # )
 
+from app.pipelines.company_matcher import get_company_matcher
 from app.pipelines.keywords import (
     AI_KEYWORDS,
     AI_KEYWORDS_STRONG,
@@ -1230,6 +1230,7 @@ from app.pipelines.keywords import (
     AI_TECHSTACK_KEYWORDS,
     TECH_JOB_TITLE_KEYWORDS,
 )
+from app.pipelines.scrape_scheduler import ScrapeRequest, ScrapeScheduler
 from app.pipelines.signal_pipeline_state import SignalPipelineState
 from app.pipelines.utils import clean_nan, safe_filename
 
@@ -1354,14 +1355,83 @@ def step1_init(state: SignalPipelineState) -> SignalPipelineState:
     logger.info("📁 [1/4] INITIALIZING JOB COLLECTION")
     return state
 
+def _postings_from_frame(
+    jobs_df: Any, company_id: str, search_name: str, ticker: str,
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """Matched JobPosting dicts of one scrape result, plus (raw rows, filtered rows)."""
+    postings: List[Dict[str, Any]] = []
+    filtered_count = 0
+    if jobs_df is None or jobs_df.empty:
+        return postings, 0, 0
+
+    # One vectorized match over the company column (same decisions as
+    # is_company_match_fuzzy per row)
+    companies = [
+        str(value) if clean_nan(value) else ""
+        for value in (jobs_df["company"] if "company" in jobs_df.columns else [None] * len(jobs_df))
+    ]
+    matcher = get_company_matcher(search_name, ticker, settings.JOBSPY_FUZZY_MATCH_THRESHOLD)
+    mask = matcher.match_mask(companies)
+
+    for (_, row), job_company, matched in zip(jobs_df.iterrows(), companies, mask):
+        source = str(row.get("site", "unknown"))
+
+        if not matched:
+            filtered_count += 1
+            continue
+
+        posting = JobPosting(
+            company_id=company_id,
+            company_name=job_company,
+            title=str(row.get("title", "")),
+            description=str(row.get("description", "")),
+            location=(
+                str(row.get("location", ""))
+                if clean_nan(row.get("location"))
+                else None
+            ),
+            posted_date=clean_nan(row.get("date_posted")),
+            source=source,
+            url=(
+                str(row.get("job_url", ""))
+                if clean_nan(row.get("job_url"))
+                else None
+            ),
+        )
+        postings.append(posting.model_dump())
+    return postings, len(jobs_df), filtered_count
+
+
+def _company_search_names(company: Dict[str, Any]) -> List[str]:
+    ticker = company.get("ticker", "").upper()
+    # Get ALL search names for this company (multi-name support)
+    search_names = get_job_search_names(ticker)
+    if not search_names:
+        # Fallback to single search name (backward compatible)
+        search_name = (
+            get_company_search_name(ticker)
+            or get_search_name_by_official(company.get("name", ""))
+            or company.get("name", "")
+        )
+        search_names = [search_name]
+    return search_names
+
+
 async def step2_fetch_job_postings(
     state: SignalPipelineState,
     *,
     sites: Optional[List[str]] = None,
     results_wanted: Optional[int] = None,
     hours_old: Optional[int] = None,
+    scrape_fn: Optional[Callable[..., Any]] = None,
 ) -> SignalPipelineState:
-    """Scrape job postings for all companies in state."""
+    """
+    Scrape job postings for all companies in state.
+
+    Every (company, search name, site) is one jobspy request; the
+    ScrapeScheduler runs them concurrently on worker threads under per-site
+    token buckets. Per-site counters land in state.summary["jobspy_sites"].
+    """
     logger.info("-" * 40)
     logger.info("[2/4] FETCHING JOB POSTINGS")
 
@@ -1373,98 +1443,63 @@ async def step2_fetch_job_postings(
     logger.info(f"   Max results: {results_wanted}")
     logger.info(f"   Hours old: {hours_old}")
 
-    try:
-        from jobspy import scrape_jobs
-    except ImportError as e:
-        msg = "python-jobspy not installed. Run: pip install python-jobspy"
-        logger.error(f"   {msg}")
-        state.add_error("job_fetch", msg)
-        raise ImportError(msg) from e
-
-    for company in state.companies:
+    if scrape_fn is None:
+        try:
+            from jobspy import scrape_jobs as scrape_fn
+        except ImportError as e:
+            msg = "python-jobspy not installed. Run: pip install python-jobspy"
+            logger.error(f"   {msg}")
+            state.add_error("job_fetch", msg)
+            raise ImportError(msg) from e
+
+    companies = [c for c in state.companies if c.get("name", "")]
+    searches = [_company_search_names(c) for c in companies]
+    requests = [
+        ScrapeRequest(company_id=c.get("id", ""), ticker=c.get("ticker", "").upper(), search_name=name, site=site)
+        for c, names in zip(companies, searches)
+        for name in names
+        for site in sites
+    ]
+
+    scheduler = ScrapeScheduler.from_settings(sites, state.request_delay)
+    logger.info(
+        f"   Scraping {len(requests)} requests ({len(companies)} companies, {len(sites)} sites), "
+        f"{scheduler.site_concurrency} concurrent per site"
+    )
+    results = iter(await scheduler.arun(
+        scrape_fn,
+        requests,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        country_indeed="USA",
+        linkedin_fetch_description=True,
+    ))
+
+    for company, search_names in zip(companies, searches):
         company_id = company.get("id", "")
         company_name = company.get("name", "")
         ticker = company.get("ticker", "").upper()
-        if not company_name:
-            continue
-
-        # Get ALL search names for this company (multi-name support)
-        search_names = get_job_search_names(ticker)
-        if not search_names:
-            # Fallback to single search name (backward compatible)
-            search_name = (
-                get_company_search_name(ticker)
-                or get_search_name_by_official(company_name)
-                or company_name
-            )
-            search_names = [search_name]
 
         company_postings: List[Dict[str, Any]] = []
 
         for search_name in search_names:
-            await asyncio.sleep(max(state.request_delay, settings.JOBSPY_REQUEST_DELAY))
-
-            try:
-                logger.info(f"   Scraping: {company_name} (search: '{search_name}')...")
-
-                jobs_df = scrape_jobs(
-                    site_name=sites,
-                    search_term=search_name,
-                    results_wanted=results_wanted,
-                    hours_old=hours_old,
-                    country_indeed="USA",
-                    linkedin_fetch_description=True,
-                )
-
-                filtered_count = 0
-                total_raw = 0
-
-                if jobs_df is not None and not jobs_df.empty:
-                    total_raw = len(jobs_df)
-                    for _, row in jobs_df.iterrows():
-                        job_company = (
-                            str(row.get("company", ""))
-                            if clean_nan(row.get("company"))
-                            else ""
-                        )
-                        source = str(row.get("site", "unknown"))
-
-                        if not is_company_match_fuzzy(
-                            job_company, search_name,
-                            threshold=settings.JOBSPY_FUZZY_MATCH_THRESHOLD,
-                            ticker=ticker,
-                        ):
-                            filtered_count += 1
-                            continue
-
-                        posting = JobPosting(
-                            company_id=company_id,
-                            company_name=job_company,
-                            title=str(row.get("title", "")),
-                            description=str(row.get("description", "")),
-                            location=(
-                                str(row.get("location", ""))
-                                if clean_nan(row.get("location"))
-                                else None
-                            ),
-                            posted_date=clean_nan(row.get("date_posted")),
-                            source=source,
-                            url=(
-                                str(row.get("job_url", ""))
-                                if clean_nan(row.get("job_url"))
-                                else None
-                            ),
-                        )
-                        company_postings.append(posting.model_dump())
-
-                logger.info(
-                    f"      Raw: {total_raw} | Matched: "
-                    f"{len(company_postings)} | Filtered: {filtered_count}"
-                )
-
-            except Exception as e:
-                state.add_error("job_fetch", str(e), company_id)
-                logger.error(f"      Error: {e}")
+            logger.info(f"   Scraped: {company_name} (search: '{search_name}')")
+            total_raw = filtered_count = 0
+            for _ in sites:
+                result = next(results)
+                if result.error is not None:
+                    state.add_error("job_fetch", f"{result.request.site}: {result.error}", company_id)
+                    logger.error(f"      Error ({result.request.site}): {result.error}")
+                    continue
+                postings, raw, filtered = _postings_from_frame(result.frame, company_id, search_name, ticker)
+                company_postings.extend(postings)
+                total_raw += raw
+                filtered_count += filtered
+
+            logger.info(
+                f"      Raw: {total_raw} | Matched: "
+                f"{len(company_postings)} | Filtered: {filtered_count}"
+            )
 
         # Log combined results for multi-name searches
         if len(search_names) > 1:
@@ -1476,6 +1511,14 @@ async def step2_fetch_job_postings(
         state.job_postings.extend(company_postings)
         state.summary["job_postings_collected"] += len(company_postings)
 
+    state.summary["jobspy_sites"] = scheduler.summary()
+    state.summary["jobspy_seconds"] = round(scheduler.elapsed, 2)
+    for site, stats in state.summary["jobspy_sites"].items():
+        logger.info(
+            f"   {site}: {stats['requests']} requests, {stats['rows']} rows, "
+            f"{stats['backoffs']} back-offs, {stats['errors']} errors"
+        )
+
     # --- Deduplicate job postings ---
     before_dedup = len(state.job_postings)
     state.job_postings = _deduplicate_postings(state.job_postings)
@@ -1510,10 +1553,15 @@ def step3_classify_ai_jobs(state: SignalPipelineState) -> SignalPipelineState:
         AI_KEYWORDS_STRONG, AI_KEYWORDS_CONTEXTUAL,
         AI_SKILLS, AI_TECHSTACK_KEYWORDS,
     )
+    from app.pipelines.keyword_matcher import get_keyword_matcher
 
     logger.info("-" * 40)
     logger.info("🤖 [3/4] CLASSIFYING AI-RELATED JOBS")
 
+    matcher = get_keyword_matcher(
+        AI_KEYWORDS_STRONG, AI_KEYWORDS_CONTEXTUAL, AI_SKILLS, AI_TECHSTACK_KEYWORDS,
+    )
+
     for posting in state.job_postings:
         title = posting.get("title", "")
         desc = posting.get("description", "") or ""
@@ -1521,25 +1569,31 @@ def step3_classify_ai_jobs(state: SignalPipelineState) -> SignalPipelineState:
         title_lower = title.lower()
         desc_lower = desc.lower()
         full_text = f"{title_lower} {desc_lower}"
+        desc_start = len(title_lower) + 1
+
+        # One pass over title + description for all four keyword tables
+        scan = matcher.scan(full_text)
 
         # --- Strong keywords: single match anywhere is enough ---
-        strong_matches = [kw for kw in AI_KEYWORDS_STRONG if kw in full_text]
+        strong_matches = scan.matched(AI_KEYWORDS_STRONG)
 
         # --- Contextual keywords: must be in title OR 2+ times in description ---
         contextual_matches = []
         for kw in AI_KEYWORDS_CONTEXTUAL:
-            in_title = kw in title_lower
-            desc_count = desc_lower.count(kw)
+            if kw not in scan:
+                continue
+            in_title = scan.contains(kw, end=len(title_lower))
+            desc_count = scan.count(kw, start=desc_start)
             if in_title or desc_count >= 2:
                 contextual_matches.append(kw)
 
         ai_kw = strong_matches + contextual_matches
 
         # Find AI skills (for diversity scoring)
-        skills = [sk for sk in AI_SKILLS if sk in full_text]
+        skills = scan.matched(AI_SKILLS)
 
         # Find techstack keywords (kept for metadata)
-        ts_kw = [kw for kw in AI_TECHSTACK_KEYWORDS if kw in full_text]
+        ts_kw = scan.matched(AI_TECHSTACK_KEYWORDS)
 
         posting["ai_keywords_found"] = ai_kw
         posting["ai_skills_found"] = skills
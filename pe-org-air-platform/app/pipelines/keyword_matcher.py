@@ -0,0 +1,192 @@
+"""
+Multi-Keyword Matcher (Aho–Corasick)
+app/pipelines/keyword_matcher.py
+
+One compiled automaton per keyword table, scanned once per text, replacing
+per-keyword `kw in text`, `text.count(kw)` and per-keyword `re.findall`
+loops in:
+
+  - RubricScorer.score_dimension          (rubric keyword tables)
+  - job_signals.step3_classify_ai_jobs    (keywords.py AI tables)
+  - SectionAnalyzer.count_keywords        (section AI / tech tables)
+
+A scan records every occurrence (including overlapping ones) with its start
+offset, so each consumer can reproduce its original semantics exactly:
+
+  - presence             == `kw in text`
+  - count()              == `text.count(kw)` (non-overlapping, left to right)
+  - word_boundary=True   == `re.findall(r"\\b" + re.escape(kw) + r"\\b", text)`
+
+Backends:
+  - pyahocorasick (C automaton) when installed
+  - otherwise a trie-shaped regex, `(?=(trie))`, run by the C regex engine;
+    the longest keyword starting at each offset is found, and every shorter
+    keyword starting there is necessarily a prefix of it, so all
+    occurrences are still recovered.
+
+Matching is case-sensitive; callers lowercase text as before.
+
+Usage:
+    matcher = get_keyword_matcher(AI_KEYWORDS_STRONG, AI_SKILLS)
+    scan = matcher.scan(text.lower())
+    strong = [kw for kw in AI_KEYWORDS_STRONG if kw in scan]
+    n = scan.count("machine learning")
+"""
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised via backend="regex"
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+
+def _is_word_char(ch: str) -> bool:
+    # Same class as `\w` for str patterns
+    return ch.isalnum() or ch == "_"
+
+
+def _at_boundary(text: str, pos: int) -> bool:
+    """`\\b` semantics at offset pos."""
+    before = pos > 0 and _is_word_char(text[pos - 1])
+    after = pos < len(text) and _is_word_char(text[pos])
+    return before != after
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """Regex whose greedy match at an offset is the longest keyword there."""
+    trie: Dict[str, dict] = {}
+    for kw in keywords:
+        node = trie
+        for ch in kw:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+@dataclass
+class KeywordScan:
+    """Occurrences of every keyword found in one text."""
+    positions: Dict[str, List[int]] = field(default_factory=dict)
+
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self.positions
+
+    def contains(self, keyword: str, start: int = 0, end: Optional[int] = None) -> bool:
+        """True if keyword occurs entirely within text[start:end]."""
+        return self.count(keyword, start, end, limit=1) > 0
+
+    def count(
+        self,
+        keyword: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> int:
+        """Non-overlapping occurrences within text[start:end] (str.count semantics)."""
+        positions = self.positions.get(keyword)
+        if not positions:
+            return 0
+        n = 0
+        next_free = start
+        size = len(keyword)
+        for pos in positions:
+            if pos < next_free:
+                continue
+            if end is not None and pos + size > end:
+                break
+            n += 1
+            if limit is not None and n >= limit:
+                break
+            next_free = pos + size
+        return n
+
+    def counts(self) -> Dict[str, int]:
+        """Non-overlapping count per matched keyword."""
+        return {kw: self.count(kw) for kw in self.positions}
+
+    def matched(self, keywords: Iterable[str]) -> List[str]:
+        """Keywords from an ordered table that occur, in table order."""
+        return [kw for kw in keywords if kw in self.positions]
+
+
+class KeywordMatcher:
+    """Compiled multi-keyword automaton."""
+
+    def __init__(self, keywords: Iterable[str], backend: Optional[str] = None):
+        self.keywords: Tuple[str, ...] = tuple(sorted({kw for kw in keywords if kw}))
+        if backend is None:
+            backend = "ahocorasick" if AHOCORASICK_AVAILABLE else "regex"
+        if backend == "ahocorasick" and not AHOCORASICK_AVAILABLE:
+            raise ImportError("pyahocorasick is not installed")
+        self.backend = backend
+
+        if backend == "ahocorasick":
+            self._automaton = ahocorasick.Automaton()
+            for kw in self.keywords:
+                self._automaton.add_word(kw, (len(kw), kw))
+            if self.keywords:
+                self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile("(?=(" + _trie_pattern(self.keywords) + "))")
+            # For each keyword, itself plus every keyword that is a prefix of it
+            keyword_set = set(self.keywords)
+            self._prefixes: Dict[str, Tuple[str, ...]] = {
+                kw: tuple(kw[:i] for i in range(len(kw), 0, -1) if kw[:i] in keyword_set)
+                for kw in self.keywords
+            }
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def _occurrences(self, text: str) -> Iterable[Tuple[int, str]]:
+        if not self.keywords or not text:
+            return
+        if self.backend == "ahocorasick":
+            for end, (size, kw) in self._automaton.iter(text):
+                yield end - size + 1, kw
+        else:
+            prefixes = self._prefixes
+            for m in self._pattern.finditer(text):
+                pos = m.start()
+                for kw in prefixes[m.group(1)]:
+                    yield pos, kw
+
+    def scan(self, text: str, word_boundary: bool = False) -> KeywordScan:
+        """
+        Find every keyword occurrence in a single pass.
+
+        Args:
+            text: Text to scan (already case-normalised by the caller).
+            word_boundary: Only keep occurrences with `\\b` at both ends.
+        """
+        positions: Dict[str, List[int]] = {}
+        for pos, kw in self._occurrences(text):
+            if word_boundary and not (_at_boundary(text, pos) and _at_boundary(text, pos + len(kw))):
+                continue
+            positions.setdefault(kw, []).append(pos)
+        for found in positions.values():
+            found.sort()
+        return KeywordScan(positions=positions)
+
+
+@lru_cache(maxsize=32)
+def _compile(keywords: FrozenSet[str]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_keyword_matcher(*keyword_tables: Iterable[str]) -> KeywordMatcher:
+    """Matcher over the union of keyword tables, compiled once per distinct set."""
+    return _compile(frozenset(kw for table in keyword_tables for kw in table))
@@ -0,0 +1,126 @@
+"""
+Patent Classifier — single-pass AI keyword / category classification
+app/pipelines/patent_classifier.py
+
+Same decisions as the per-patent logic PatentSignalCollector.classify_patent
+used to run (one `\\b kw \\b` IGNORECASE regex per AI keyword, then a series
+of substring checks per category):
+
+  text          = f"{title} {abstract}".lower()
+  is_ai         = any AI keyword occurs as a whole word
+  categories    = every category one of whose phrases occurs as a substring;
+                  if none and is_ai, the fallback categories the same way
+  is_ai_related = is_ai or categories
+  ai_categories = list(set(categories))
+
+Every keyword and phrase goes into one keyword_matcher automaton. A batch
+of texts is joined with NUL separators (no phrase contains NUL, and NUL is
+not a word character, so `\\b` at each text's ends is unchanged) and
+scanned in one pass; hits are mapped back to their text by offset.
+
+IGNORECASE also matches "ſ" (long s) and "K" (Kelvin) against s / k, which
+lower() leaves in place, so is_ai for a non-ASCII text comes from one
+combined `\\b(kw1|kw2|...)\\b` IGNORECASE regex instead.
+
+Usage:
+    classifier = PatentClassifier(keywords, category_rules, fallback_rules)
+    classifier.classify(patents)                     # sets is_ai_related / ai_categories
+    async for page in classifier.classify_stream(pages):
+        ...
+"""
+import re
+from bisect import bisect_right
+from itertools import accumulate
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Mapping, Sequence, Set, Tuple,
+)
+
+from app.pipelines.keyword_matcher import KeywordMatcher, _at_boundary
+
+SEPARATOR = "\x00"
+
+
+def patent_text(patent: Any) -> str:
+    return f"{patent.title} {patent.abstract}".lower()
+
+
+class PatentClassifier:
+    """Compiled keyword + category phrase table."""
+
+    def __init__(
+        self,
+        keywords: Iterable[str],
+        category_rules: Mapping[str, Sequence[str]],
+        fallback_rules: Mapping[str, Sequence[str]],
+    ):
+        self.keywords: Tuple[str, ...] = tuple(keywords)
+        self.category_rules = {cat: tuple(phrases) for cat, phrases in category_rules.items()}
+        self.fallback_rules = {cat: tuple(phrases) for cat, phrases in fallback_rules.items()}
+
+        phrases = set(self.keywords)
+        for rules in (self.category_rules, self.fallback_rules):
+            for cat_phrases in rules.values():
+                phrases.update(cat_phrases)
+        self._matcher = KeywordMatcher(phrases)
+        self._keyword_set = frozenset(self.keywords)
+        self._keyword_regex = re.compile(
+            r"\b(?:" + "|".join(re.escape(kw) for kw in self.keywords) + r")\b" if self.keywords else r"(?!)",
+            re.IGNORECASE,
+        )
+
+    # ------------------------------------------------------------------ #
+    # Scanning                                                           #
+    # ------------------------------------------------------------------ #
+
+    def _scan_batch(self, texts: Sequence[str]) -> List[Tuple[Set[str], bool]]:
+        """Per text: (phrases occurring as substrings, any keyword as a whole word)."""
+        joined = SEPARATOR.join(texts)
+        starts = list(accumulate((len(t) + 1 for t in texts[:-1]), initial=0))
+        found: List[Tuple[Set[str], bool]] = [(set(), False) for _ in texts]
+        keyword_hit = [False] * len(texts)
+
+        for phrase, positions in self._matcher.scan(joined).positions.items():
+            is_keyword = phrase in self._keyword_set
+            for pos in positions:
+                i = bisect_right(starts, pos) - 1
+                found[i][0].add(phrase)
+                if (is_keyword and not keyword_hit[i]
+                        and _at_boundary(joined, pos) and _at_boundary(joined, pos + len(phrase))):
+                    keyword_hit[i] = True
+
+        return [
+            (phrases, hit if text.isascii() else self._keyword_regex.search(text) is not None)
+            for (phrases, _), hit, text in zip(found, keyword_hit, texts)
+        ]
+
+    @staticmethod
+    def _categories(phrases: Set[str], rules: Dict[str, Tuple[str, ...]]) -> List[str]:
+        return [cat for cat, cat_phrases in rules.items() if any(p in phrases for p in cat_phrases)]
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+
+    def classify_texts(self, texts: Sequence[str]) -> List[Tuple[bool, List[str]]]:
+        """(is_ai_related, ai_categories) per lower-cased title + abstract."""
+        if not texts:
+            return []
+        results = []
+        for phrases, is_ai in self._scan_batch(texts):
+            categories = self._categories(phrases, self.category_rules)
+            if is_ai and not categories:
+                categories = self._categories(phrases, self.fallback_rules)
+            results.append((is_ai or len(categories) > 0, list(set(categories))))
+        return results
+
+    def classify(self, patents: Sequence[Any]) -> Sequence[Any]:
+        """Set is_ai_related / ai_categories on every patent, in one scan."""
+        for patent, (is_ai, categories) in zip(patents, self.classify_texts([patent_text(p) for p in patents])):
+            patent.is_ai_related = is_ai
+            patent.ai_categories = categories
+        return patents
+
+    async def classify_stream(self, pages: AsyncIterable[Sequence[Any]]) -> AsyncIterator[Sequence[Any]]:
+        """Classify pages of patents as they arrive."""
+        async for page in pages:
+            yield self.classify(page)
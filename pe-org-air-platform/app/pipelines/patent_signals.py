@@ -972,15 +972,17 @@ import asyncio
 import json
 import logging
 import os
-import re
 from collections import defaultdict
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import AsyncIterable, AsyncIterator, List, Optional
 from dataclasses import dataclass, asdict
 
-import httpx
 from dotenv import load_dotenv
 
+from app.config import settings
+from app.pipelines.patent_classifier import PatentClassifier
+from app.pipelines.patentsview_client import PatentsViewClient, get_patentsview_client
 from app.pipelines.signal_pipeline_state import SignalPipelineState as Pipeline2State
 from app.pipelines.utils import clean_nan, safe_filename
 from app.models.signal import SignalCategory, SignalSource, ExternalSignal
@@ -990,8 +992,13 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 PATENTSVIEW_API_URL = os.getenv("PATENTSVIEW_API_URL", "https://search.patentsview.org/api/v1/patent/")
-PATENTSVIEW_REQUEST_DELAY = 1.5
 PATENTSVIEW_API_KEY = os.getenv("PATENTSVIEW_API_KEY")
+PATENT_FIELDS = [
+    "patent_id", "patent_title", "patent_abstract", "patent_date",
+    "patent_type",
+    "assignees.assignee_organization",
+    "inventors.inventor_first_name", "inventors.inventor_last_name",
+]
 
 
 @dataclass
@@ -1056,100 +1063,107 @@ class PatentSignalCollector:
         "predictive_analytics": ["predictive"],
     }
 
+    # Substring rules classify_patent applies, in order: the categories
+    # above (predictive_analytics also on "classification algorithm"), then
+    # — only for a keyword hit with no category — the fallbacks.
+    AI_CATEGORY_RULES = {
+        **AI_PATENT_CATEGORIES,
+        "predictive_analytics": ["predictive", "classification algorithm"],
+    }
+    AI_CATEGORY_FALLBACK = {
+        "deep_learning": ["reinforcement learning"],
+        "predictive_analytics": ["machine learning", "artificial intelligence"],
+    }
+
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or PATENTSVIEW_API_KEY
-        self.headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            self.headers["X-Api-Key"] = self.api_key
 
-        self.keyword_patterns = {
-            kw: re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)
-            for kw in self.AI_PATENT_KEYWORDS
-        }
-        self.category_patterns = {}
-        for cat, keywords in self.AI_PATENT_CATEGORIES.items():
-            self.category_patterns[cat] = [
-                re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)
-                for kw in keywords
-            ]
+        # Shared pooled client, unless this collector has its own key
+        self.client = (
+            get_patentsview_client() if api_key is None
+            else PatentsViewClient.from_settings(PATENTSVIEW_API_URL, api_key)
+        )
+        self.classifier = get_patent_classifier()
 
     # ------------------------------------------------------------------
     # Fetch patents from PatentsView API (single assignee name)
     # ------------------------------------------------------------------
-    async def _fetch_patents_single(
-        self,
-        company_name: str,
-        years_back: int = 5,
-        max_results: int = 100,
-    ) -> List[Patent]:
-        """Fetch patents for a single assignee organization name."""
+    @staticmethod
+    def _assignee_query(company_name: str, years_back: int, since: Optional[datetime] = None) -> dict:
+        """
+        Patents of one assignee in the look-back window. With `since`, only
+        patents dated on or after it (the same day again: PatentsView may
+        add patents for a date after it was first fetched).
+        """
         end_date = datetime.now(timezone.utc)
         start_date = end_date - timedelta(days=years_back * 365)
-
-        query_obj = {
+        if since is not None:
+            start_date = max(start_date, since)
+        return {
             "_and": [
                 {"_text_phrase": {"assignees.assignee_organization": company_name}},
                 {"_gte": {"patent_date": start_date.strftime("%Y-%m-%d")}},
+                {"_lte": {"patent_date": end_date.strftime("%Y-%m-%d")}},
             ]
         }
-        fields = [
-            "patent_id", "patent_title", "patent_abstract", "patent_date",
-            "patent_type",
-            "assignees.assignee_organization",
-            "inventors.inventor_first_name", "inventors.inventor_last_name",
-        ]
-        params = {
-            "q": json.dumps(query_obj),
-            "f": json.dumps(fields),
-            "s": json.dumps([{"patent_date": "desc"}]),
-            "o": json.dumps({"size": min(max_results, 1000)}),
-        }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            await asyncio.sleep(PATENTSVIEW_REQUEST_DELAY)
-            try:
-                resp = await client.get(PATENTSVIEW_API_URL, params=params, headers=self.headers)
-                if resp.status_code != 200:
-                    logger.error(f"API Error {resp.status_code}: {resp.text[:300]}")
-                    return []
-
-                data = resp.json()
-                if data.get("error") is True:
-                    logger.error(f"API Error: {data}")
-                    return []
-
-                patents = []
-                for pd in data.get("patents", []) or []:
-                    assignees = pd.get("assignees") or []
-                    assignee_names = [a.get("assignee_organization", "") for a in assignees if a.get("assignee_organization")]
-                    inventors = pd.get("inventors") or []
-                    inv_names = [f"{i.get('inventor_first_name','')} {i.get('inventor_last_name','')}".strip() for i in inventors]
-
-                    date_str = clean_nan(pd.get("patent_date"))
-                    try:
-                        if date_str:
-                            parsed = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                            filing_date = parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
-                        else:
-                            filing_date = datetime.now(timezone.utc)
-                    except (ValueError, AttributeError):
-                        filing_date = datetime.now(timezone.utc)
-
-                    patents.append(Patent(
-                        patent_number=str(pd.get("patent_id", "")),
-                        title=str(pd.get("patent_title", "")),
-                        abstract=str(pd.get("patent_abstract", "") or ""),
-                        filing_date=filing_date,
-                        grant_date=None,
-                        inventors=inv_names,
-                        assignee=assignee_names[0] if assignee_names else company_name,
-                    ))
-
-                logger.info(f"Fetched {len(patents)} patents for {company_name}")
-                return patents
-            except Exception as e:
-                logger.error(f"Error fetching patents for {company_name}: {e}")
-                return []
+    @staticmethod
+    def _patent_from_record(pd: dict, company_name: str) -> Patent:
+        assignees = pd.get("assignees") or []
+        assignee_names = [a.get("assignee_organization", "") for a in assignees if a.get("assignee_organization")]
+        inventors = pd.get("inventors") or []
+        inv_names = [f"{i.get('inventor_first_name','')} {i.get('inventor_last_name','')}".strip() for i in inventors]
+
+        date_str = clean_nan(pd.get("patent_date"))
+        try:
+            if date_str:
+                parsed = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+                filing_date = parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+            else:
+                filing_date = datetime.now(timezone.utc)
+        except (ValueError, AttributeError):
+            filing_date = datetime.now(timezone.utc)
+
+        return Patent(
+            patent_number=str(pd.get("patent_id", "")),
+            title=str(pd.get("patent_title", "")),
+            abstract=str(pd.get("patent_abstract", "") or ""),
+            filing_date=filing_date,
+            grant_date=None,
+            inventors=inv_names,
+            assignee=assignee_names[0] if assignee_names else company_name,
+        )
+
+    async def _iter_patent_pages_single(
+        self,
+        company_name: str,
+        years_back: int = 5,
+        max_results: int = 100,
+        since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Patent]]:
+        """Patents of a single assignee organization name, one list per API page."""
+        query = self._assignee_query(company_name, years_back, since)
+        fetched = 0
+        try:
+            async for records in self.client.iter_pages(query, PATENT_FIELDS, max_results):
+                fetched += len(records)
+                yield [self._patent_from_record(pd, company_name) for pd in records]
+        except Exception as e:
+            logger.error(f"Error fetching patents for {company_name}: {e}")
+        logger.info(f"Fetched {fetched} patents for {company_name}")
+
+    async def _fetch_patents_single(
+        self,
+        company_name: str,
+        years_back: int = 5,
+        max_results: int = 100,
+        since: Optional[datetime] = None,
+    ) -> List[Patent]:
+        """Fetch patents for a single assignee organization name."""
+        patents: List[Patent] = []
+        async for page in self._iter_patent_pages_single(company_name, years_back, max_results, since):
+            patents.extend(page)
+        return patents
 
     # ------------------------------------------------------------------
     # Fetch patents across ALL known assignee names (with dedup)
@@ -1159,6 +1173,7 @@ class PatentSignalCollector:
         company_names: str | List[str],
         years_back: int = 5,
         max_results: int = 100,
+        since: Optional[datetime] = None,
     ) -> List[Patent]:
         """
         Fetch patents for one or more assignee organization names.
@@ -1174,78 +1189,96 @@ class PatentSignalCollector:
             company_names: Single name (str) or list of assignee names
             years_back: How many years to look back
             max_results: Max results per assignee name query
+            since: Incremental mode — only patents dated on or after this
 
         Returns:
             Deduplicated list of Patent objects
         """
+        all_patents: List[Patent] = []
+        async for page in self.iter_patent_pages(company_names, years_back, max_results, since):
+            all_patents.extend(page)
+        return all_patents
+
+    async def iter_patent_pages(
+        self,
+        company_names: str | List[str],
+        years_back: int = 5,
+        max_results: int = 100,
+        since: Optional[datetime] = None,
+    ) -> AsyncIterator[List[Patent]]:
+        """
+        Same patents as fetch_patents, yielded page by page as responses
+        arrive. The assignee names are queried concurrently
+        (PATENTSVIEW_ALIAS_CONCURRENCY at a time, all under the shared
+        PatentsView rate limit); patent_ids already seen under another
+        name are dropped.
+        """
         # Normalize to list
         if isinstance(company_names, str):
             names = [company_names]
         else:
             names = list(company_names)
-
         if not names:
-            return []
+            return
 
-        # Single name — no dedup needed
-        if len(names) == 1:
-            return await self._fetch_patents_single(names[0], years_back, max_results)
+        queue: asyncio.Queue = asyncio.Queue()
+        done = object()
+        slots = asyncio.Semaphore(settings.PATENTSVIEW_ALIAS_CONCURRENCY)
 
-        # Multiple names — fetch all and deduplicate by patent_id
-        all_patents: List[Patent] = []
+        async def produce(name: str) -> None:
+            try:
+                async with slots:
+                    async for page in self._iter_patent_pages_single(name, years_back, max_results, since):
+                        await queue.put(page)
+            finally:
+                await queue.put(done)
+
+        tasks = [asyncio.create_task(produce(name)) for name in names]
         seen_ids: set = set()
         total_before_dedup = 0
-
-        for name in names:
-            patents = await self._fetch_patents_single(name, years_back, max_results)
-            total_before_dedup += len(patents)
-            for p in patents:
-                if p.patent_number not in seen_ids:
-                    seen_ids.add(p.patent_number)
-                    all_patents.append(p)
-
-        dupes = total_before_dedup - len(all_patents)
-        logger.info(
-            f"  Combined {len(names)} assignee names → {len(all_patents)} unique patents"
-            + (f" ({dupes} duplicates removed)" if dupes > 0 else "")
-        )
-
-        return all_patents
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is done:
+                    remaining -= 1
+                    continue
+                total_before_dedup += len(item)
+                page = []
+                for p in item:
+                    if p.patent_number not in seen_ids:
+                        seen_ids.add(p.patent_number)
+                        page.append(p)
+                if page:
+                    yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Multiple names — report cross-name duplicates
+        if len(names) > 1:
+            dupes = total_before_dedup - len(seen_ids)
+            logger.info(
+                f"  Combined {len(names)} assignee names → {len(seen_ids)} unique patents"
+                + (f" ({dupes} duplicates removed)" if dupes > 0 else "")
+            )
 
     # ------------------------------------------------------------------
     # Classify patent (PDF page 19, lines 80-98)
     # ------------------------------------------------------------------
     def classify_patent(self, patent: Patent) -> Patent:
         """Classify a patent as AI-related. Checks title + abstract."""
-        text = f"{patent.title} {patent.abstract}".lower()
-
-        is_ai = any(p.search(text) for p in self.keyword_patterns.values())
-
-        categories = []
-        if "neural network" in text or "deep learning" in text:
-            categories.append("deep_learning")
-        if "natural language" in text:
-            categories.append("nlp")
-        # computer_vision: require specific AI-image phrases, not bare "image"
-        cv_phrases = [
-            "computer vision", "image recognition", "image classification",
-            "image segmentation", "image processing", "image analysis",
-            "object detection", "visual recognition", "convolutional neural",
-        ]
-        if any(phrase in text for phrase in cv_phrases):
-            categories.append("computer_vision")
-        if "predictive" in text or "classification algorithm" in text:
-            categories.append("predictive_analytics")
-
-        if is_ai and not categories:
-            if "reinforcement learning" in text:
-                categories.append("deep_learning")
-            if "machine learning" in text or "artificial intelligence" in text:
-                categories.append("predictive_analytics")
-
-        patent.is_ai_related = is_ai or len(categories) > 0
-        patent.ai_categories = list(set(categories))
-        return patent
+        return self.classify_patents([patent])[0]
+
+    def classify_patents(self, patents: List[Patent]) -> List[Patent]:
+        """Classify a batch of patents in one keyword scan (same result as classify_patent each)."""
+        return self.classifier.classify(patents)
+
+    async def classify_stream(self, pages: AsyncIterable[List[Patent]]) -> AsyncIterator[List[Patent]]:
+        """Classify pages of patents as they arrive from the API."""
+        async for page in self.classifier.classify_stream(pages):
+            yield page
 
     # ------------------------------------------------------------------
     # Scoring (PDF pages 18-19, lines 46-62)
@@ -1313,6 +1346,41 @@ class PatentSignalCollector:
         )
 
 
+def load_stored_patents(s3, ticker: str) -> List[Patent]:
+    """Patents of the latest signals/patents/{ticker}/ snapshot ([] if none or unreadable)."""
+    try:
+        _, body = s3.get_latest(f"signals/patents/{ticker}/")
+        if not body:
+            return []
+        records = json.loads(body).get("patents") or []
+        patents = []
+        for r in records:
+            filing_date = datetime.fromisoformat(str(r["filing_date"]))
+            patents.append(Patent(
+                patent_number=str(r.get("patent_number", "")),
+                title=str(r.get("title", "")),
+                abstract=str(r.get("abstract", "") or ""),
+                filing_date=filing_date if filing_date.tzinfo else filing_date.replace(tzinfo=timezone.utc),
+                grant_date=None,
+                inventors=list(r.get("inventors") or []),
+                assignee=str(r.get("assignee", "")),
+            ))
+        return patents
+    except Exception as e:
+        logger.warning(f"  ⚠️ Could not load stored patents for {ticker}: {e}")
+        return []
+
+
+@lru_cache(maxsize=1)
+def get_patent_classifier() -> PatentClassifier:
+    """Compiled PatentSignalCollector keyword / category table (shared by all collectors)."""
+    return PatentClassifier(
+        PatentSignalCollector.AI_PATENT_KEYWORDS,
+        PatentSignalCollector.AI_CATEGORY_RULES,
+        PatentSignalCollector.AI_CATEGORY_FALLBACK,
+    )
+
+
 # ------------------------------------------------------------------
 # Pipeline runner
 # ------------------------------------------------------------------
@@ -1322,7 +1390,14 @@ async def run_patent_signals(
     results_per_company: int = 100,
     api_key: Optional[str] = None,
     skip_storage: bool = False,
+    incremental: bool = False,
 ) -> Pipeline2State:
+    """
+    incremental=True: start from the company's latest stored patents
+    snapshot and only fetch patents dated on or after its newest
+    patent_date; the snapshot's patents still inside the look-back window
+    are re-classified and kept alongside the new ones.
+    """
     logger.info("-" * 60)
     logger.info("📊 PATENT SIGNALS PIPELINE")
     logger.info("-" * 60)
@@ -1348,12 +1423,28 @@ async def run_patent_signals(
             # Fallback: use company name directly
             patent_names = [name]
 
-        patents = await collector.fetch_patents(patent_names, years_back, results_per_company)
-        if not patents:
+        previous: List[Patent] = []
+        since = None
+        if incremental and ticker:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=years_back * 365)
+            previous = [p for p in load_stored_patents(s3, ticker) if p.filing_date > cutoff]
+            if previous:
+                since = max(p.filing_date for p in previous)
+                logger.info(f"  ↻ Incremental: {len(previous)} stored patents, fetching from {since:%Y-%m-%d}")
+
+        # Classify FIRST (page by page, as responses arrive), then store
+        classified = []
+        async for page in collector.classify_stream(
+            collector.iter_patent_pages(patent_names, years_back, results_per_company, since)
+        ):
+            classified.extend(page)
+        if previous:
+            new_ids = {p.patent_number for p in classified}
+            logger.info(f"  ↻ {len(new_ids)} new / updated patents since last snapshot")
+            classified.extend(collector.classify_patents([p for p in previous if p.patent_number not in new_ids]))
+        if not classified:
             logger.warning(f"No patents found for {name}")
 
-        # Classify FIRST, then store
-        classified = [collector.classify_patent(p) for p in patents]
         ai_count = len([p for p in classified if p.is_ai_related])
 
         # Store classified patents to S3
@@ -0,0 +1,285 @@
+"""
+PatentsView Client — pooled, paginated, cached PatentsView API access
+app/pipelines/patentsview_client.py
+
+PatentSignalCollector used to open a fresh httpx.AsyncClient per assignee
+name, sleep PATENTSVIEW_REQUEST_DELAY, and read a single page of at most
+1000 patents. This client instead:
+
+  - keeps one pooled httpx.AsyncClient per event loop
+    (PATENTSVIEW_MAX_CONNECTIONS keep-alive connections)
+  - pages through a query with the API's cursor: results are sorted by
+    (patent_date desc, patent_id desc) and each next page is requested
+    with `o.after` = the sort values of the last record seen, until
+    max_results records or a short page
+  - takes a token from the process-wide "patentsview" HostLimiter
+    (PATENTSVIEW_RATE_LIMIT requests/second) before every network request,
+    so concurrent assignee queries share one request rate
+  - retries a 429 / 5xx page after Retry-After (or exponential back-off),
+    up to PATENTSVIEW_MAX_RETRIES times
+  - keeps every page on disk under PATENTSVIEW_CACHE_DIR, keyed by the
+    query hash and its date window:
+
+        {root}/{window}/ab/abcdef....json    window = "2021-02-01_2026-01-31"
+
+    a page younger than PATENTSVIEW_CACHE_TTL_SECONDS is served from disk
+    with no request (and no rate-limit token). The window is part of the
+    query, so a new day's window is a new key; old windows simply age out.
+
+Usage:
+    client = get_patentsview_client()
+    async for records in client.iter_pages(query, fields, max_results=500):
+        ...
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.config import settings
+from app.services.rate_limiter import PATENTSVIEW_HOST, HostLimiter, get_host_limiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://search.patentsview.org/api/v1/patent/"
+SORT = [{"patent_date": "desc"}, {"patent_id": "desc"}]
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class PatentsViewError(Exception):
+    """A PatentsView request failed (non-200 answer or an `error: true` body)."""
+
+
+class PatentsViewResponseCache:
+    """On-disk PatentsView pages, keyed by query hash and date window."""
+
+    def __init__(self, root: str, ttl_seconds: int):
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        self.hits = self.misses = 0
+
+    def _path(self, params: Dict[str, str], window: str) -> Path:
+        digest = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+        return self.root / (window or "all") / digest[:2] / f"{digest}.json"
+
+    def get(self, params: Dict[str, str], window: str) -> Optional[Dict[str, Any]]:
+        path = self._path(params, window)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                self.misses += 1
+                return None
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, params: Dict[str, str], window: str, data: Dict[str, Any]) -> None:
+        path = self._path(params, window)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp, path)
+            except BaseException:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
+                raise
+        except OSError as e:
+            logger.warning(f"⚠️  PatentsView cache write failed: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def date_window(query: Dict[str, Any]) -> str:
+    """The query's patent_date bounds as "start_end" ("" if it has none)."""
+    bounds = {"_gte": "", "_gt": "", "_lte": "", "_lt": ""}
+
+    def walk(node: Any) -> None:
+        if isinstance(node, dict):
+            for op, value in node.items():
+                if op in bounds and isinstance(value, dict) and "patent_date" in value:
+                    bounds[op] = str(value["patent_date"])
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(query)
+    start, end = bounds["_gte"] or bounds["_gt"], bounds["_lte"] or bounds["_lt"]
+    return f"{start}_{end}" if start or end else ""
+
+
+class PatentsViewClient:
+    """Shared PatentsView API client; safe to use from concurrent tasks."""
+
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        api_key: Optional[str] = None,
+        page_size: int = 1000,
+        max_connections: int = 4,
+        timeout: float = 30.0,
+        max_retries: int = 2,
+        cache: Optional[PatentsViewResponseCache] = None,
+        limiter: Optional[HostLimiter] = None,
+    ):
+        self.api_url = api_url
+        self.api_key = api_key
+        self.page_size = page_size
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = cache
+        self.limiter = limiter
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.requests = self.retries = 0
+
+    @classmethod
+    def from_settings(cls, api_url: Optional[str] = None, api_key: Optional[str] = None) -> "PatentsViewClient":
+        cache = (
+            PatentsViewResponseCache(settings.PATENTSVIEW_CACHE_DIR, settings.PATENTSVIEW_CACHE_TTL_SECONDS)
+            if settings.PATENTSVIEW_CACHE_DIR and settings.PATENTSVIEW_CACHE_TTL_SECONDS > 0 else None
+        )
+        return cls(
+            api_url=api_url or os.getenv("PATENTSVIEW_API_URL", DEFAULT_API_URL),
+            api_key=api_key if api_key is not None else os.getenv("PATENTSVIEW_API_KEY"),
+            page_size=settings.PATENTSVIEW_PAGE_SIZE,
+            max_connections=settings.PATENTSVIEW_MAX_CONNECTIONS,
+            timeout=settings.PATENTSVIEW_TIMEOUT,
+            max_retries=settings.PATENTSVIEW_MAX_RETRIES,
+            cache=cache,
+        )
+
+    # ------------------------------------------------------------------ #
+    # HTTP                                                               #
+    # ------------------------------------------------------------------ #
+
+    def _http(self) -> httpx.AsyncClient:
+        """The pooled client of the running event loop (a client cannot outlive its loop)."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop or self._client.is_closed:
+            headers = {"Content-Type": "application/json"}
+            if self.api_key:
+                headers["X-Api-Key"] = self.api_key
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=headers,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+
+    async def _request(self, params: Dict[str, str]) -> Dict[str, Any]:
+        limiter = self.limiter or get_host_limiter(PATENTSVIEW_HOST)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire_async()
+            self.requests += 1
+            resp = await self._http().get(self.api_url, params=params)
+            if resp.status_code in _RETRY_STATUSES and attempt < self.max_retries:
+                self.retries += 1
+                delay = _retry_after(resp, attempt)
+                logger.warning(f"  ⏳ PatentsView {resp.status_code}, retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                continue
+            if resp.status_code != 200:
+                raise PatentsViewError(f"API Error {resp.status_code}: {resp.text[:300]}")
+            data = resp.json()
+            if data.get("error") is True:
+                raise PatentsViewError(f"API Error: {data}")
+            return data
+        raise PatentsViewError("unreachable")  # pragma: no cover
+
+    async def fetch_page(self, params: Dict[str, str], window: str = "") -> Dict[str, Any]:
+        """One API response, from the disk cache when fresh."""
+        if self.cache is not None:
+            cached = self.cache.get(params, window)
+            if cached is not None:
+                return cached
+        data = await self._request(params)
+        if self.cache is not None:
+            self.cache.put(params, window, data)
+        return data
+
+    # ------------------------------------------------------------------ #
+    # Pagination                                                         #
+    # ------------------------------------------------------------------ #
+
+    async def iter_pages(
+        self,
+        query: Dict[str, Any],
+        fields: List[str],
+        max_results: int,
+        key: str = "patents",
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Records matching `query`, newest first, one list per API page."""
+        window = date_window(query)
+        after: Optional[Tuple[str, str]] = None
+        remaining = max_results
+        while remaining > 0:
+            size = min(self.page_size, remaining)
+            options: Dict[str, Any] = {"size": size}
+            if after is not None:
+                options["after"] = list(after)
+            params = {
+                "q": json.dumps(query),
+                "f": json.dumps(fields),
+                "s": json.dumps(SORT),
+                "o": json.dumps(options),
+            }
+            records = (await self.fetch_page(params, window)).get(key) or []
+            if records:
+                yield records[:remaining]
+            remaining -= len(records)
+            if len(records) < size:
+                break
+            last = records[-1]
+            after = (str(last.get("patent_date", "")), str(last.get("patent_id", "")))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "cache": self.cache.stats() if self.cache is not None else None,
+        }
+
+
+def _retry_after(resp: httpx.Response, attempt: int) -> float:
+    try:
+        return max(0.0, float(resp.headers.get("Retry-After", "")))
+    except ValueError:
+        return float(2 ** attempt)
+
+
+_client: Optional[PatentsViewClient] = None
+
+
+def get_patentsview_client() -> PatentsViewClient:
+    """Process-wide PatentsView client (configured from settings on first use)."""
+    global _client
+    if _client is None:
+        _client = PatentsViewClient.from_settings()
+    return _client
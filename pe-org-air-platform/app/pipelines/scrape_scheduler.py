@@ -0,0 +1,185 @@
+"""
+Scrape Scheduler — concurrent jobspy searches with per-site politeness
+app/pipelines/scrape_scheduler.py
+
+step2_fetch_job_postings used to run one blocking scrape_jobs call per
+(company, search name) inline on the event loop, covering every site at
+once and sleeping JOBSPY_REQUEST_DELAY between calls. The scheduler instead
+issues one request per (company, search name, site) on worker threads:
+
+  (CAT, "Caterpillar", linkedin) ─┐
+  (DE,  "John Deere",  linkedin) ─┴─► linkedin bucket ──► linkedin threads
+  (CAT, "Caterpillar", indeed)   ───► indeed bucket   ──► indeed threads
+
+  - each site has its own token bucket (one request per
+    JOBSPY_SITE_REQUEST_DELAYS[site], default JOBSPY_REQUEST_DELAY) and
+    its own JOBSPY_SITE_CONCURRENCY threads, so every site sees the request
+    rate it saw before while the sites (and companies) run side by side,
+    and a slow site never holds threads another site could use
+  - a request that fails with a rate-limit error (HTTP 429, "too many
+    requests", blocked) is retried after exponential back-off
+  - per-site throughput and back-off counters go to the pipeline summary
+
+Results come back in request order, so postings are assembled exactly as
+the sequential loop assembled them.
+"""
+import asyncio
+import logging
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from app.config import settings
+from app.services.rate_limiter import HostLimiter
+
+logger = logging.getLogger(__name__)
+
+_RATE_LIMITED = re.compile(r"\b429\b|too many requests|rate.?limit|blocked", re.IGNORECASE)
+
+
+@dataclass
+class ScrapeRequest:
+    """One jobspy call: a search name on one site, for one company."""
+    company_id: str
+    ticker: str
+    search_name: str
+    site: str
+
+
+@dataclass
+class ScrapeResult:
+    request: ScrapeRequest
+    frame: Any = None                # pandas DataFrame, or None
+    error: Optional[str] = None
+    attempts: int = 0
+
+
+@dataclass
+class SiteStats:
+    requests: int = 0
+    rows: int = 0
+    errors: int = 0
+    backoffs: int = 0
+    wait_seconds: float = 0.0        # time spent waiting for the site's bucket / slot
+    busy_seconds: float = 0.0        # time inside scrape_jobs
+
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "rows": self.rows,
+            "errors": self.errors,
+            "backoffs": self.backoffs,
+            "wait_seconds": round(self.wait_seconds, 2),
+            "busy_seconds": round(self.busy_seconds, 2),
+            "rows_per_minute": round(self.rows / elapsed * 60, 1) if elapsed > 0 else 0.0,
+        }
+
+
+def is_rate_limited(error: BaseException) -> bool:
+    return bool(_RATE_LIMITED.search(str(error)))
+
+
+class ScrapeScheduler:
+    """Run scrape requests concurrently under per-site token buckets."""
+
+    def __init__(
+        self,
+        sites: List[str],
+        min_interval: float,
+        site_concurrency: int = 2,
+        max_retries: int = 2,
+        backoff_seconds: float = 30.0,
+        site_intervals: Optional[Dict[str, float]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        site_intervals = site_intervals or {}
+        self.site_concurrency = max(1, site_concurrency)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
+        self._sleep = sleep
+        self.limiters: Dict[str, HostLimiter] = {
+            site: HostLimiter(f"jobspy:{site}", rate=1.0 / max(min_interval, site_intervals.get(site, 0.0)),
+                              slots=self.site_concurrency)
+            for site in sites
+        }
+        self.stats: Dict[str, SiteStats] = {site: SiteStats() for site in sites}
+        self._lock = threading.Lock()
+        self.elapsed = 0.0
+
+    @classmethod
+    def from_settings(cls, sites: List[str], request_delay: float) -> "ScrapeScheduler":
+        return cls(
+            sites,
+            min_interval=max(request_delay, settings.JOBSPY_REQUEST_DELAY),
+            site_concurrency=settings.JOBSPY_SITE_CONCURRENCY,
+            max_retries=settings.JOBSPY_MAX_RETRIES,
+            backoff_seconds=settings.JOBSPY_BACKOFF_SECONDS,
+            site_intervals=settings.JOBSPY_SITE_REQUEST_DELAYS,
+        )
+
+    def _count(self, site: str, **deltas: float) -> None:
+        with self._lock:
+            stats = self.stats[site]
+            for name, delta in deltas.items():
+                setattr(stats, name, getattr(stats, name) + delta)
+
+    def _run_one(self, scrape_fn: Callable[..., Any], request: ScrapeRequest, kwargs: Dict[str, Any]) -> ScrapeResult:
+        limiter = self.limiters[request.site]
+        result = ScrapeResult(request)
+        while True:
+            result.attempts += 1
+            queued = time.perf_counter()
+            limiter.acquire()
+            started = time.perf_counter()
+            self._count(request.site, requests=1, wait_seconds=started - queued)
+            try:
+                frame = scrape_fn(site_name=[request.site], search_term=request.search_name, **kwargs)
+                error = None
+            except Exception as e:
+                frame, error = None, e
+            self._count(request.site, busy_seconds=time.perf_counter() - started)
+
+            if error is None:
+                result.frame = frame
+                self._count(request.site, rows=0 if frame is None else len(frame))
+                return result
+            if is_rate_limited(error) and result.attempts <= self.max_retries:
+                delay = self.backoff_seconds * 2 ** (result.attempts - 1)
+                self._count(request.site, backoffs=1)
+                logger.warning(f"      {request.site} rate limited ({error}); backing off {delay:.0f}s")
+                self._sleep(delay)
+                continue
+            self._count(request.site, errors=1)
+            result.error = str(error)
+            return result
+
+    def run(self, scrape_fn: Callable[..., Any], requests: List[ScrapeRequest], **kwargs: Any) -> List[ScrapeResult]:
+        """Run every request (blocking); results in request order."""
+        start = time.perf_counter()
+        pools = {
+            site: ThreadPoolExecutor(max_workers=self.site_concurrency, thread_name_prefix=f"jobspy-{site}")
+            for site in {r.site for r in requests}
+        }
+        try:
+            futures = [pools[r.site].submit(self._run_one, scrape_fn, r, kwargs) for r in requests]
+            results = [f.result() for f in futures]
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=True)
+        self.elapsed = time.perf_counter() - start
+        return results
+
+    async def arun(self, scrape_fn: Callable[..., Any], requests: List[ScrapeRequest], **kwargs: Any) -> List[ScrapeResult]:
+        """
+        Async wrapper: the event loop stays free while the threads scrape.
+
+        Not a blocking lane: the signal services usually run this on a
+        private loop inside a scoring-lane thread already.
+        """
+        return await asyncio.to_thread(self.run, scrape_fn, requests, **kwargs)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        return {site: stats.to_dict(self.elapsed) for site, stats in self.stats.items()}
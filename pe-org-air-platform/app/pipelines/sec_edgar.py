@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Generator
 from dataclasses import dataclass
 from app.config import settings
+from app.services.rate_limiter import SEC_HOST, get_host_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -62,13 +63,8 @@ class SECEdgarCollector:
         logger.info(f"SEC Edgar Collector initialized (Rate limit: {self.rate_limit}/sec)")
 
     def _rate_limit_wait(self):
-        """Enforce SEC rate limiting (10 requests per second)"""
-        elapsed = time.time() - self.last_request_time
-        min_interval = 1.0 / self.rate_limit
-        if elapsed < min_interval:
-            sleep_time = min_interval - elapsed
-            logger.debug(f"  ⏳ Rate limiting: sleeping {sleep_time:.3f}s")
-            time.sleep(sleep_time)
+        """Enforce SEC rate limiting (10 requests per second), shared by every collector in the process"""
+        get_host_limiter(SEC_HOST).acquire()
         self.last_request_time = time.time()
 
     def _make_request(self, url: str) -> Optional[requests.Response]:
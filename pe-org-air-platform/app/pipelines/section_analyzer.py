@@ -1,8 +1,9 @@
-import re
 import logging
 from typing import Dict, List, Optional
 from dataclasses import dataclass, asdict
 
+from app.pipelines.keyword_matcher import get_keyword_matcher
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s | %(levelname)-8s | %(message)s',
@@ -90,22 +91,17 @@ class SectionAnalyzer:
             "ai": self.AI_KEYWORDS,
             "tech": self.TECH_KEYWORDS
         }
+        self._matcher = get_keyword_matcher(self.AI_KEYWORDS, self.TECH_KEYWORDS)
         logger.info("📊 Section Analyzer initialized")
     
     def count_keywords(self, text: str) -> Dict[str, int]:
-        """Count occurrences of each keyword in text"""
-        text_lower = text.lower()
+        """Count whole-word occurrences of each keyword in text (single pass)"""
+        scan = self._matcher.scan(text.lower(), word_boundary=True)
         counts = {}
         
-        # Count AI keywords
-        for keyword in self.AI_KEYWORDS:
-            count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
-            if count > 0:
-                counts[keyword] = count
-        
-        # Count Tech keywords
-        for keyword in self.TECH_KEYWORDS:
-            count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
+        # AI keywords first, then Tech keywords (report order)
+        for keyword in self.AI_KEYWORDS + self.TECH_KEYWORDS:
+            count = scan.count(keyword)
             if count > 0:
                 counts[keyword] = count
         
@@ -0,0 +1,241 @@
+"""
+Section Scanner — single-pass section boundary detection for SEC filings
+app/pipelines/section_scanner.py
+
+Shared by every filing type (10-K, 10-Q, 8-K, DEF 14A) and by both HTML
+backends of DocumentParser.
+
+A section is defined by a start and an end pattern (SECTION_PATTERNS).
+Every pattern begins with a literal heading word — ITEM, SIGNATURE,
+EXHIBIT, EXECUTIVE, DIRECTOR, ... — so instead of upper-casing the whole
+document and running one re.search per pattern, the scanner:
+
+  1. finds every heading-word position in one pass (str.find per word;
+     the text is upper-cased in blocks, never as a whole)
+  2. tests the section patterns only at those positions (re.match)
+  3. derives each span exactly as _extract_sections always has:
+       start = first start-pattern heading
+       end   = first end-pattern heading at least 500 chars after start,
+               else start + 150,000 chars
+  4. counts the words of each span once, so callers (TOC detection,
+     logging) never re-split section text
+
+ITEM headings are labelled ("ITEM 1A") and classified: a run of at least
+_TOC_MIN_ENTRIES distinct items spaced at most _TOC_MAX_GAP characters
+apart (ended by a repeated label), starting in the first _TOC_MAX_POSITION of the document, is a table
+of contents; its entries get `in_toc=True` and a span that starts on one
+is flagged `start_in_toc`.
+
+Text can be scanned in one call (scan_sections) or fed in pieces as it is
+produced (SectionScanner.feed / finish, used by the streaming HTML parser).
+Offsets follow the old `content.upper()` positions, so results are
+identical even where upper-casing changes a character's length (ß → SS).
+"""
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+# Section patterns per filing type: (name, start_pattern, end_pattern),
+# matched against upper-cased text
+SECTION_PATTERNS: Dict[str, List[Tuple[str, str, str]]] = {
+    "10-K": [
+        ("business", r"ITEM\s*1\.?\s*BUSINESS", r"ITEM\s*1A|ITEM\s*1B"),
+        ("risk_factors", r"ITEM\s*1A\.?\s*RISK\s*FACTORS", r"ITEM\s*1B|ITEM\s*1C|ITEM\s*2"),
+        ("mda", r"ITEM\s*7\.?\s*MANAGEMENT", r"ITEM\s*7A|ITEM\s*8"),
+    ],
+    "10-Q": [
+        ("mda", r"ITEM\s*2\.?\s*MANAGEMENT", r"ITEM\s*3|ITEM\s*4"),
+        ("risk_factors", r"ITEM\s*1A\.?\s*RISK\s*FACTORS", r"ITEM\s*2|ITEM\s*3|ITEM\s*4"),
+    ],
+    "8-K": [
+        ("other_events", r"ITEM\s*8\.01\.?\s*OTHER\s*EVENTS", r"ITEM\s*9|SIGNATURE|EXHIBIT"),
+    ],
+    "DEF 14A": [
+        ("executive_compensation", r"EXECUTIVE\s*COMPENSATION", r"DIRECTOR\s*COMPENSATION|SECURITY\s*OWNERSHIP|CERTAIN\s*RELATIONSHIPS|EQUITY\s*COMPENSATION"),
+        ("director_compensation", r"DIRECTOR\s*COMPENSATION", r"SECURITY\s*OWNERSHIP|CERTAIN\s*RELATIONSHIPS|EQUITY\s*COMPENSATION|AUDIT"),
+    ],
+}
+SECTION_PATTERNS["DEF14A"] = SECTION_PATTERNS["DEF 14A"]
+
+# The end pattern is searched from this many characters after the start;
+# without one a section runs at most SECTION_MAX_CHARS
+SECTION_END_SEARCH_OFFSET = 500
+SECTION_MAX_CHARS = 150000
+SECTION_MIN_WORDS = 100
+
+# Longest text a heading pattern can span (lookahead kept between pieces)
+_MATCH_WINDOW = 1000
+_BLOCK_CHARS = 1 << 20
+
+_TOC_MIN_ENTRIES = 4
+_TOC_MAX_GAP = 300
+_TOC_MAX_POSITION = 0.3
+
+_ITEM_LABEL_RE = re.compile(r"ITEM\s*(\d+(?:\.\d+)?[A-Z]?)")
+
+
+@dataclass
+class Heading:
+    """A heading-word position that starts or ends a section, or an ITEM n label."""
+    pos: int
+    label: str                      # "ITEM 1A", or the heading word ("SIGNATURE")
+    starts: Tuple[str, ...] = ()    # sections whose start pattern matches here
+    ends: Tuple[str, ...] = ()      # sections whose end pattern matches here
+    in_toc: bool = False
+
+
+@dataclass
+class SectionSpan:
+    """A located section: stripped [start, end) bounds into the text."""
+    name: str
+    start: int
+    end: int
+    word_count: int
+    start_in_toc: bool = False
+
+
+@dataclass
+class SectionScan:
+    spans: List[SectionSpan] = field(default_factory=list)
+    headings: List[Heading] = field(default_factory=list)
+
+    def kept(self) -> List[SectionSpan]:
+        """Spans with enough words to be kept as sections."""
+        return [s for s in self.spans if s.word_count > SECTION_MIN_WORDS]
+
+    def sections(self, text: str) -> Dict[str, str]:
+        """{name: section text} — the _extract_sections result."""
+        return {s.name: text[s.start:s.end] for s in self.kept()}
+
+    def word_counts(self) -> Dict[str, int]:
+        return {s.name: s.word_count for s in self.kept()}
+
+
+@lru_cache(maxsize=None)
+def _compiled(filing_type: str):
+    """(names, start regexes, end regexes, heading words) for a filing type."""
+    patterns = SECTION_PATTERNS.get(filing_type, [])
+    words = set()
+    for _, start, end in patterns:
+        for alternative in (start + "|" + end).split("|"):
+            words.add(re.match(r"[A-Z]+", alternative).group(0))
+    return (
+        [name for name, _, _ in patterns],
+        [re.compile(start) for _, start, _ in patterns],
+        [re.compile(end) for _, _, end in patterns],
+        tuple(sorted(words)),
+    )
+
+
+class SectionScanner:
+    """Collects headings from text fed in pieces; finish() builds the spans."""
+
+    def __init__(self, filing_type: str):
+        self._names, self._starts, self._ends, self._words = _compiled(filing_type)
+        self.headings: List[Heading] = []
+        self._buf = ""      # upper-cased text not yet scanned
+        self._base = 0      # offset of _buf[0] in the upper-cased stream
+
+    def feed(self, text: str, final: bool = False) -> None:
+        if not self._words:
+            return
+        buf = self._buf + text.upper()
+        # Headings must start before `limit`, so their patterns can see
+        # _MATCH_WINDOW characters ahead; the rest waits for the next piece
+        limit = len(buf) if final else len(buf) - _MATCH_WINDOW
+        if limit <= 0:
+            self._buf = buf
+            return
+        hits = []
+        for word in self._words:
+            # str.find per heading word; occurrences may overlap ("AUDITEM")
+            end = limit + len(word) - 1
+            p = buf.find(word, 0, end)
+            while p != -1:
+                hits.append((p, word))
+                p = buf.find(word, p + 1, end)
+        hits.sort()
+        for p, word in hits:
+            starts = tuple(n for n, r in zip(self._names, self._starts) if r.match(buf, p))
+            ends = tuple(n for n, r in zip(self._names, self._ends) if r.match(buf, p))
+            item = _ITEM_LABEL_RE.match(buf, p) if word == "ITEM" else None
+            if item or starts or ends:
+                label = f"ITEM {item.group(1)}" if item else word
+                self.headings.append(Heading(self._base + p, label, starts, ends))
+        self._buf = buf[limit:]
+        self._base += limit
+
+    def finish(self, text: str, offset: int = 0) -> SectionScan:
+        """
+        Spans over `text`, the full document the pieces were cut from.
+        `offset` is subtracted from stream positions (e.g. stripped leading
+        whitespace that was fed but is not part of `text`).
+        """
+        self.feed("", final=True)
+        headings = self.headings
+        if offset:
+            for h in headings:
+                h.pos -= offset
+        _mark_toc(headings, len(text))
+
+        spans = []
+        for name in self._names:
+            start = next((h for h in headings if name in h.starts), None)
+            if start is None:
+                continue
+            search_from = start.pos + SECTION_END_SEARCH_OFFSET
+            end = next((h.pos for h in headings if h.pos >= search_from and name in h.ends), None)
+            if end is None:
+                end = min(start.pos + SECTION_MAX_CHARS, len(text))
+            s, e = _strip_bounds(text, start.pos, end)
+            spans.append(SectionSpan(name, s, e, _count_words(text, s, e), start.in_toc))
+        return SectionScan(spans=spans, headings=headings)
+
+
+def _mark_toc(headings: List[Heading], length: int) -> None:
+    """Flag dense runs of ITEM headings near the front as table-of-contents entries."""
+    items = [h for h in headings if h.label.startswith("ITEM ")]
+    run: List[Heading] = []
+    labels = set()
+    for h in items + [None]:
+        # A TOC lists each item once: a repeated label is the body starting
+        if h is not None and run and h.pos - run[-1].pos <= _TOC_MAX_GAP and h.label not in labels:
+            run.append(h)
+            labels.add(h.label)
+            continue
+        if (
+            len(labels) >= _TOC_MIN_ENTRIES
+            and run[0].pos <= _TOC_MAX_POSITION * length
+        ):
+            for r in run:
+                r.in_toc = True
+        run = [h] if h is not None else []
+        labels = {h.label} if h is not None else set()
+
+
+def _strip_bounds(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Bounds of text[start:end].strip() without slicing."""
+    n = len(text)
+    start, end = min(max(start, 0), n), min(end, n)
+    if end < start:
+        end = start
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def _count_words(text: str, start: int, end: int) -> int:
+    return len(text[start:end].split())
+
+
+def scan_sections(text: str, filing_type: str) -> SectionScan:
+    """Headings and section spans of a complete document."""
+    scanner = SectionScanner(filing_type)
+    if scanner._words:
+        for i in range(0, len(text), _BLOCK_CHARS):
+            scanner.feed(text[i:i + _BLOCK_CHARS])
+    return scanner.finish(text)
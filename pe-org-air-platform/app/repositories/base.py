@@ -21,23 +21,30 @@ from app.core.exceptions import (
     RepositoryException,
 )
 from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake_pool import PoolTimeoutError
 
 
 class BaseRepository:
-    """Base repository with Snowflake connection management."""
+    """Base repository with pooled Snowflake connection management."""
 
     @contextmanager
     def get_connection(self) -> Generator[snowflake.connector.SnowflakeConnection, None, None]:
-        """Context manager for Snowflake connections."""
-        conn = None
+        """Context manager that borrows a Snowflake connection from the shared pool."""
         try:
             conn = get_snowflake_connection()
+        except PoolTimeoutError as e:
+            raise DatabaseConnectionException(str(e))
+        except (InterfaceError, DatabaseError) as e:
+            raise DatabaseConnectionException(f"Failed to connect to Snowflake: {e}")
+
+        try:
             yield conn
         except InterfaceError as e:
+            # Broken session: drop it instead of returning it to the pool
+            conn.discard()
             raise DatabaseConnectionException(f"Failed to connect to Snowflake: {e}")
         finally:
-            if conn:
-                conn.close()
+            conn.close()
 
     @contextmanager
     def get_cursor(self, dict_cursor: bool = True) -> Generator[Any, None, None]:
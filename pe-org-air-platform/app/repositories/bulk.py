@@ -0,0 +1,182 @@
+"""
+Bulk Writer — set-based MERGE upserts for Snowflake
+app/repositories/bulk.py
+
+Stages rows for a ticker or a whole portfolio and writes them with one
+multi-row MERGE per table, all inside one transaction:
+
+    MERGE INTO t USING (SELECT column1 AS ticker, ... FROM VALUES (...), (...)) s
+    ON t.ticker = s.ticker
+    WHEN MATCHED THEN UPDATE SET ...
+    WHEN NOT MATCHED THEN INSERT ...
+
+Writing 9 mapping rows + 7 dimension rows + 1 SCORING row for 100
+companies is 3 statements (plus BEGIN/COMMIT) instead of ~1,700 round trips.
+
+Usage:
+    with BulkWriter() as writer:
+        writer.stage(MAPPING_SPEC, mapping_rows)
+        writer.stage(DIMENSION_SPEC, dimension_rows)
+    writer.result   # BulkWriteResult: rows per table, statements, seconds
+
+The transaction commits when the block exits cleanly and rolls back if it
+raises. Staged rows with the same key are collapsed (last one wins), since
+a MERGE source must not match a target row twice.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.services.snowflake import get_pooled_connection
+
+logger = logging.getLogger(__name__)
+
+# Rows per MERGE statement; larger batches are split (statement text stays well under 1 MB)
+MAX_ROWS_PER_STATEMENT = 1000
+
+
+@dataclass(frozen=True)
+class MergeSpec:
+    """How staged rows (dicts) are merged into one table."""
+    table: str
+    keys: Tuple[str, ...]                       # match columns
+    columns: Tuple[str, ...]                    # value columns taken from the rows
+    coalesce: bool = False                      # NULL in a row keeps the existing value
+    on_update: Dict[str, str] = field(default_factory=dict)   # extra SET column = SQL expr
+    on_insert: Dict[str, str] = field(default_factory=dict)   # extra INSERT column = SQL expr
+
+    @property
+    def source_columns(self) -> Tuple[str, ...]:
+        return self.keys + self.columns
+
+
+@dataclass
+class BulkWriteResult:
+    """What a flush wrote: rows per table, statements issued and time spent."""
+    rows: Dict[str, int] = field(default_factory=dict)        # staged rows per table
+    affected: Dict[str, int] = field(default_factory=dict)    # rows inserted + updated per table
+    statements: int = 0
+    seconds: float = 0.0                                      # wall time of the statements
+    query_ids: List[str] = field(default_factory=list)        # for QUERY_HISTORY server timings
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+
+def values_source(columns: Sequence[str], rows: Sequence[Sequence[Any]]) -> Tuple[str, List[Any]]:
+    """`SELECT column1 AS a, ... FROM VALUES (%s, ...), ...` and its flat params."""
+    select = ", ".join(f"column{i} AS {c}" for i, c in enumerate(columns, start=1))
+    row_sql = "(" + ", ".join(["%s"] * len(columns)) + ")"
+    params = [value for row in rows for value in row]
+    return f"SELECT {select} FROM VALUES {', '.join([row_sql] * len(rows))}", params
+
+
+def merge_sql(spec: MergeSpec, rows: Sequence[Dict[str, Any]]) -> Tuple[str, List[Any]]:
+    """One MERGE statement upserting `rows` according to `spec`."""
+    source, params = values_source(spec.source_columns, [[r.get(c) for c in spec.source_columns] for r in rows])
+    on = " AND ".join(f"t.{k} = s.{k}" for k in spec.keys)
+    updates = [
+        f"{c} = COALESCE(s.{c}, t.{c})" if spec.coalesce else f"{c} = s.{c}"
+        for c in spec.columns
+    ] + [f"{c} = {expr}" for c, expr in spec.on_update.items()]
+    insert_cols = list(spec.source_columns) + list(spec.on_insert)
+    insert_vals = [f"s.{c}" for c in spec.source_columns] + list(spec.on_insert.values())
+    sql = (
+        f"MERGE INTO {spec.table} AS t USING ({source}) AS s ON {on} "
+        f"WHEN MATCHED THEN UPDATE SET {', '.join(updates)} "
+        f"WHEN NOT MATCHED THEN INSERT ({', '.join(insert_cols)}) VALUES ({', '.join(insert_vals)})"
+    )
+    return sql, params
+
+
+def dedupe_rows(keys: Sequence[str], rows: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Collapse rows with the same key (last one wins), keeping first-seen order."""
+    by_key: Dict[Tuple, Dict[str, Any]] = {}
+    for row in rows:
+        by_key[tuple(row.get(k) for k in keys)] = row
+    return list(by_key.values())
+
+
+class BulkWriter:
+    """Stages MERGE rows (and raw statements) and writes them in one transaction."""
+
+    def __init__(self, conn=None, max_rows: int = MAX_ROWS_PER_STATEMENT):
+        self.conn = conn or get_pooled_connection()
+        self.max_rows = max_rows
+        self._staged: List[Tuple[MergeSpec, List[Dict[str, Any]]]] = []
+        self._raw: List[Tuple[str, str, List[Any], int]] = []
+        self.result: Optional[BulkWriteResult] = None
+
+    def stage(self, spec: MergeSpec, rows: Sequence[Dict[str, Any]]) -> None:
+        """Queue rows for `spec.table` (merged with rows already staged for it)."""
+        if not rows:
+            return
+        for staged_spec, staged_rows in self._staged:
+            if staged_spec == spec:
+                staged_rows.extend(rows)
+                return
+        self._staged.append((spec, list(rows)))
+
+    def stage_sql(self, table: str, sql: str, params: Sequence[Any], rows: int) -> None:
+        """Queue a prebuilt set-based statement (counted as `rows` staged rows for `table`)."""
+        self._raw.append((table, sql, list(params), rows))
+
+    def statements(self) -> List[Tuple[str, str, List[Any], int]]:
+        """(table, sql, params, staged rows) for everything staged, in order."""
+        out = []
+        for spec, rows in self._staged:
+            rows = dedupe_rows(spec.keys, rows)
+            for i in range(0, len(rows), self.max_rows):
+                batch = rows[i:i + self.max_rows]
+                sql, params = merge_sql(spec, batch)
+                out.append((spec.table, sql, params, len(batch)))
+        return out + list(self._raw)
+
+    def flush(self) -> BulkWriteResult:
+        """Write everything staged in one transaction; returns what was written."""
+        result = BulkWriteResult()
+        statements = self.statements()
+        self._staged, self._raw = [], []
+        if not statements:
+            self.result = result
+            return result
+
+        cur = self.conn.cursor()
+        try:
+            cur.execute("BEGIN")
+            for table, sql, params, rows in statements:
+                start = time.perf_counter()
+                cur.execute(sql, params)
+                result.seconds += time.perf_counter() - start
+                result.statements += 1
+                result.rows[table] = result.rows.get(table, 0) + rows
+                result.affected[table] = result.affected.get(table, 0) + max(cur.rowcount or 0, 0)
+                query_id = getattr(cur, "sfqid", None)
+                if isinstance(query_id, str):
+                    result.query_ids.append(query_id)
+            self.conn.commit()
+        except Exception as e:
+            logger.error(f"❌ Bulk write failed, rolling back: {e}")
+            self.conn.rollback()
+            raise
+        finally:
+            cur.close()
+
+        logger.info(
+            f"💾 Bulk write: {result.total_rows} rows into {len(result.rows)} tables "
+            f"in {result.statements} statements ({result.seconds * 1000:.0f} ms)"
+        )
+        self.result = result
+        return result
+
+    def __enter__(self) -> "BulkWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self._staged, self._raw = [], []
@@ -1,7 +1,7 @@
 from typing import List, Dict, Optional
 from uuid import uuid4
 import logging
-from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +10,7 @@ class ChunkRepository:
     """Repository for document chunk METADATA in Snowflake (content stored in S3)"""
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     def create(
         self,
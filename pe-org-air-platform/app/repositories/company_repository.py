@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import List, Dict, Optional
 from uuid import UUID, uuid4
 
-from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake import get_pooled_connection
 
 
 class CompanyRepository:
@@ -12,7 +12,7 @@ class CompanyRepository:
     """
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     def get_all(self) -> List[Dict]:
         """
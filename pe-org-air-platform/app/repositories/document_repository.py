@@ -2,7 +2,7 @@ from typing import List, Dict, Optional
 from uuid import uuid4
 from datetime import datetime
 import logging
-from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +10,7 @@ class DocumentRepository:
     """Repository for document metadata in Snowflake"""
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     def create(
         self,
@@ -5,23 +5,80 @@ app/repositories/scoring_repository.py
 Tables:
   - signal_dimension_mapping   (CS3 Table 1 matrix view per ticker)
   - evidence_dimension_scores  (7 aggregated dimension scores per ticker)
+  - evidence_fingerprints      (per-source fingerprints behind the stored scores)
 
-Follows existing repo pattern: singleton, get_snowflake_connection(), cursor-based.
+Follows existing repo pattern: singleton, get_pooled_connection(), cursor-based.
+Multi-row writes go through app.repositories.bulk: one MERGE per table
+for a ticker or a whole portfolio, in one transaction.
 """
 
+import json
 import logging
 from typing import Dict, List, Optional
 from uuid import uuid4
-from app.services.snowflake import get_snowflake_connection
+from app.repositories.bulk import BulkWriteResult, BulkWriter, MergeSpec
+from app.services.snowflake import get_pooled_connection
 
 logger = logging.getLogger(__name__)
 
+_DIMENSION_COLUMNS = (
+    "data_infrastructure", "ai_governance", "technology_stack",
+    "talent_skills", "leadership_vision", "use_case_portfolio", "culture_change",
+)
+
+MAPPING_SPEC = MergeSpec(
+    table="signal_dimension_mapping",
+    keys=("ticker", "source"),
+    columns=("raw_score", "confidence", "evidence_count") + _DIMENSION_COLUMNS,
+    on_update={"created_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"id": "UUID_STRING()", "created_at": "CURRENT_TIMESTAMP()"},
+)
+
+DIMENSION_SPEC = MergeSpec(
+    table="evidence_dimension_scores",
+    keys=("ticker", "dimension"),
+    columns=("score", "confidence", "source_count", "sources", "total_weight"),
+    on_update={"created_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"id": "UUID_STRING()", "created_at": "CURRENT_TIMESTAMP()"},
+)
+
+FINGERPRINT_SPEC = MergeSpec(
+    table="evidence_fingerprints",
+    keys=("ticker", "source"),
+    columns=("fingerprint", "evidence"),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"id": "UUID_STRING()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
+
+
+def _mapping_record(row: Dict) -> Dict:
+    record = {c: row.get(c) for c in MAPPING_SPEC.columns}
+    record.update(ticker=row["ticker"].upper(), source=row["source"],
+                  evidence_count=row.get("evidence_count", 0))
+    return record
+
+
+def _dimension_record(row: Dict) -> Dict:
+    record = {c: row[c] for c in DIMENSION_SPEC.columns}
+    record.update(ticker=row["ticker"].upper(), dimension=row["dimension"])
+    return record
+
+
+def _fingerprint_record(row: Dict) -> Dict:
+    evidence = row.get("evidence")
+    return {
+        "ticker": row["ticker"].upper(),
+        "source": row["source"],
+        "fingerprint": row["fingerprint"],
+        "evidence": json.dumps(evidence, default=str) if evidence is not None else None,
+    }
+
 
 class ScoringRepository:
     """Repository for CS3 scoring tables in Snowflake."""
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     # =====================================================================
     # signal_dimension_mapping — the mapping matrix (Table 1) per ticker
@@ -97,7 +154,7 @@ class ScoringRepository:
 
     def upsert_mapping_matrix(self, rows: List[Dict]) -> int:
         """
-        Upsert the full mapping matrix for a ticker.
+        Upsert the full mapping matrix for a ticker (or several) in one MERGE.
 
         Args:
             rows: Output of EvidenceMapper.build_mapping_matrix()
@@ -105,26 +162,26 @@ class ScoringRepository:
         Returns:
             Number of rows upserted
         """
-        count = 0
-        for row in rows:
-            self.upsert_mapping_row(
-                ticker=row["ticker"],
-                source=row["source"],
-                raw_score=row.get("raw_score"),
-                confidence=row.get("confidence"),
-                evidence_count=row.get("evidence_count", 0),
-                data_infrastructure=row.get("data_infrastructure"),
-                ai_governance=row.get("ai_governance"),
-                technology_stack=row.get("technology_stack"),
-                talent_skills=row.get("talent_skills"),
-                leadership_vision=row.get("leadership_vision"),
-                use_case_portfolio=row.get("use_case_portfolio"),
-                culture_change=row.get("culture_change"),
-            )
-            count += 1
+        with BulkWriter(self.conn) as writer:
+            writer.stage(MAPPING_SPEC, [_mapping_record(r) for r in rows])
+        count = writer.result.rows.get(MAPPING_SPEC.table, 0)
         logger.info(f"Upserted {count} mapping rows for {rows[0]['ticker'] if rows else '?'}")
         return count
 
+    def upsert_scoring_outputs(
+        self,
+        mapping_rows: List[Dict],
+        dimension_rows: List[Dict],
+    ) -> BulkWriteResult:
+        """
+        Upsert mapping matrices and dimension scores for any number of tickers
+        in one transaction (one MERGE per table).
+        """
+        with BulkWriter(self.conn) as writer:
+            writer.stage(MAPPING_SPEC, [_mapping_record(r) for r in mapping_rows])
+            writer.stage(DIMENSION_SPEC, [_dimension_record(r) for r in dimension_rows])
+        return writer.result
+
     def get_mapping_matrix(self, ticker: str) -> List[Dict]:
         """Get the full mapping matrix for a ticker (Table 1 view)."""
         sql = """
@@ -248,7 +305,7 @@ class ScoringRepository:
 
     def upsert_dimension_scores(self, rows: List[Dict]) -> int:
         """
-        Upsert all 7 dimension scores for a ticker.
+        Upsert all 7 dimension scores for a ticker (or several) in one MERGE.
 
         Args:
             rows: Output of EvidenceMapper.build_dimension_summary()
@@ -256,18 +313,9 @@ class ScoringRepository:
         Returns:
             Number of rows upserted
         """
-        count = 0
-        for row in rows:
-            self.upsert_dimension_score(
-                ticker=row["ticker"],
-                dimension=row["dimension"],
-                score=row["score"],
-                confidence=row["confidence"],
-                source_count=row["source_count"],
-                sources=row["sources"],
-                total_weight=row["total_weight"],
-            )
-            count += 1
+        with BulkWriter(self.conn) as writer:
+            writer.stage(DIMENSION_SPEC, [_dimension_record(r) for r in rows])
+        count = writer.result.rows.get(DIMENSION_SPEC.table, 0)
         logger.info(f"Upserted {count} dimension scores for {rows[0]['ticker'] if rows else '?'}")
         return count
 
@@ -331,6 +379,42 @@ class ScoringRepository:
         finally:
             cur.close()
 
+    # =====================================================================
+    # evidence_fingerprints — what the stored scores were computed from
+    # =====================================================================
+
+    def get_evidence_fingerprints(self, ticker: str) -> Dict[str, Dict]:
+        """{source: {"fingerprint", "evidence"}} stored for a ticker (evidence parsed from JSON)."""
+        sql = "SELECT source, fingerprint, evidence FROM evidence_fingerprints WHERE ticker = %s"
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, (ticker.upper(),))
+            return {
+                source: {"fingerprint": fp, "evidence": json.loads(evidence) if evidence else None}
+                for source, fp, evidence in cur.fetchall()
+            }
+        finally:
+            cur.close()
+
+    def upsert_evidence_fingerprints(self, rows: List[Dict]) -> int:
+        """Upsert fingerprint rows (ticker, source, fingerprint, evidence) for any number of tickers."""
+        if not rows:
+            return 0
+        with BulkWriter(self.conn) as writer:
+            writer.stage(FINGERPRINT_SPEC, [_fingerprint_record(r) for r in rows])
+        return writer.result.rows.get(FINGERPRINT_SPEC.table, 0)
+
+    def delete_evidence_fingerprints(self, ticker: str) -> int:
+        """Forget a ticker's fingerprints (its next scoring run is a full one)."""
+        sql = "DELETE FROM evidence_fingerprints WHERE ticker = %s"
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, (ticker.upper(),))
+            self.conn.commit()
+            return cur.rowcount
+        finally:
+            cur.close()
+
 
 # Singleton
 _repo: Optional[ScoringRepository] = None
@@ -4,16 +4,41 @@ import logging
 from typing import List, Dict, Optional
 from uuid import uuid4
 from datetime import datetime, timezone
-from app.services.snowflake import get_snowflake_connection
+from app.repositories.bulk import BulkWriteResult, BulkWriter, dedupe_rows, values_source
+from app.services.snowflake import get_pooled_connection
+from app.services.scoring_cache import invalidate_scoring_stages
 
 logger = logging.getLogger(__name__)
 
+# upsert_summaries row key → company_signal_summaries column
+_SUMMARY_SCORE_COLUMNS = {
+    "leadership_score": "leadership_signals_score",
+    "hiring_score": "technology_hiring_score",
+    "innovation_score": "innovation_activity_score",
+    "digital_score": "digital_presence_score",
+}
+
+# Composite weights (same as _update_composite)
+_COMPOSITE_WEIGHTS = {
+    "technology_hiring_score": "0.30",
+    "innovation_activity_score": "0.25",
+    "digital_presence_score": "0.25",
+    "leadership_signals_score": "0.20",
+}
+
+
+def _composite_sql(exprs: Dict[str, str]) -> str:
+    """Composite score over per-column SQL expressions; NULL unless all 4 are present."""
+    present = " AND ".join(f"{exprs[c]} IS NOT NULL" for c in _COMPOSITE_WEIGHTS)
+    weighted = " + ".join(f"{w} * {exprs[c]}" for c, w in _COMPOSITE_WEIGHTS.items())
+    return f"CASE WHEN {present} THEN {weighted} END"
+
 
 class SignalRepository:
     """Repository for external signals in Snowflake."""
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     
     # EXTERNAL SIGNALS CRUD
@@ -85,6 +110,24 @@ class SignalRepository:
         finally:
             cur.close()
 
+    def get_category_versions(self, company_id: str) -> Dict[str, Dict]:
+        """Per category: {"count", "latest"} (MAX created_at) — a cheap version of a company's signals."""
+        sql = """
+        SELECT category, COUNT(*), MAX(created_at)
+        FROM external_signals
+        WHERE company_id = %s
+        GROUP BY category
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, (company_id,))
+            return {
+                category: {"count": count, "latest": str(latest) if latest is not None else None}
+                for category, count, latest in cur.fetchall()
+            }
+        finally:
+            cur.close()
+
     def get_signals_by_ticker(self, ticker: str) -> List[Dict]:
         """Get all signals for a ticker."""
         sql = """
@@ -233,69 +276,71 @@ class SignalRepository:
         digital_score: Optional[float] = None
     ) -> Dict:
         """Insert or update company signal summary."""
-        
-        # Get actual signal count from external_signals table
-        signal_count = self._get_signal_count(company_id)
-        
-        # Check if exists
-        existing = self.get_summary(company_id)
-        
-        if existing:
-            # Update only the provided scores
-            updates = []
-            params = []
-            
-            if leadership_score is not None:
-                updates.append("leadership_signals_score = %s")
-                params.append(leadership_score)
-            if hiring_score is not None:
-                updates.append("technology_hiring_score = %s")
-                params.append(hiring_score)
-            if innovation_score is not None:
-                updates.append("innovation_activity_score = %s")
-                params.append(innovation_score)
-            if digital_score is not None:
-                updates.append("digital_presence_score = %s")
-                params.append(digital_score)
-            
-            if updates:
-                updates.append("last_updated = CURRENT_TIMESTAMP()")
-                updates.append("signal_count = %s")
-                params.append(signal_count)
-                params.append(company_id)
-                
-                sql = f"UPDATE company_signal_summaries SET {', '.join(updates)} WHERE company_id = %s"
-                
-                cur = self.conn.cursor()
-                try:
-                    cur.execute(sql, tuple(params))
-                    self.conn.commit()
-                finally:
-                    cur.close()
-        else:
-            # Insert new record
-            sql = """
-            INSERT INTO company_signal_summaries (
-                company_id, ticker, leadership_signals_score, technology_hiring_score,
-                innovation_activity_score, digital_presence_score, signal_count, last_updated
-            ) VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP())
-            """
-            
-            cur = self.conn.cursor()
-            try:
-                cur.execute(sql, (
-                    company_id, ticker, leadership_score, hiring_score,
-                    innovation_score, digital_score, signal_count
-                ))
-                self.conn.commit()
-            finally:
-                cur.close()
-        
-        # Recalculate composite if all scores present
-        self._update_composite(company_id)
-        
+        self.upsert_summaries([{
+            "company_id": company_id,
+            "ticker": ticker,
+            "leadership_score": leadership_score,
+            "hiring_score": hiring_score,
+            "innovation_score": innovation_score,
+            "digital_score": digital_score,
+        }])
         return self.get_summary(company_id)
 
+    def upsert_summaries(self, rows: List[Dict]) -> BulkWriteResult:
+        """
+        Insert or update signal summaries for many companies in one MERGE.
+
+        Each row has company_id, ticker and any of leadership_score,
+        hiring_score, innovation_score, digital_score. Missing / None scores
+        keep their stored value; signal_count is recounted from
+        external_signals and the composite is recalculated when all 4 scores
+        are present — all inside the same statement.
+        """
+        rows = dedupe_rows(("company_id",), rows)
+        if not rows:
+            return BulkWriteResult()
+        source, params = values_source(
+            ("company_id", "ticker") + tuple(_SUMMARY_SCORE_COLUMNS.values()),
+            [[r["company_id"], r["ticker"]] + [r.get(k) for k in _SUMMARY_SCORE_COLUMNS] for r in rows],
+        )
+        # Count signals only for the staged companies, not the whole table
+        ids_source, id_params = values_source(("company_id",), [[r["company_id"]] for r in rows])
+        params += id_params
+        merged = {c: f"COALESCE(s.{c}, t.{c})" for c in _SUMMARY_SCORE_COLUMNS.values()}
+        staged = {c: f"s.{c}" for c in _SUMMARY_SCORE_COLUMNS.values()}
+        sql = f"""
+        MERGE INTO company_signal_summaries t
+        USING (
+            SELECT v.*, COALESCE(c.n, 0) AS signal_count
+            FROM ({source}) v
+            LEFT JOIN (
+                SELECT company_id, COUNT(*) AS n FROM external_signals
+                WHERE company_id IN (SELECT company_id FROM ({ids_source}))
+                GROUP BY company_id
+            ) c ON c.company_id = v.company_id
+        ) s
+        ON t.company_id = s.company_id
+        WHEN MATCHED AND ({' OR '.join(f's.{c} IS NOT NULL' for c in staged)}) THEN UPDATE SET
+            {', '.join(f'{c} = {expr}' for c, expr in merged.items())},
+            signal_count = s.signal_count,
+            last_updated = CURRENT_TIMESTAMP(),
+            composite_score = COALESCE({_composite_sql(merged)}, t.composite_score)
+        WHEN NOT MATCHED THEN INSERT (
+            company_id, ticker, {', '.join(staged)}, signal_count, composite_score, last_updated
+        ) VALUES (
+            s.company_id, s.ticker, {', '.join(staged.values())}, s.signal_count,
+            {_composite_sql(staged)}, CURRENT_TIMESTAMP()
+        )
+        """
+        with BulkWriter(self.conn) as writer:
+            writer.stage_sql("company_signal_summaries", sql, params, len(rows))
+
+        # New signal scores change the CS3 evidence set for these tickers
+        for row in rows:
+            invalidate_scoring_stages(row["ticker"])
+
+        return writer.result
+
     def _get_signal_count(self, company_id: str) -> int:
         """Get actual count of signals for a company."""
         sql = "SELECT COUNT(*) FROM external_signals WHERE company_id = %s"
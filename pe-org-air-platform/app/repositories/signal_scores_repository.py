@@ -14,7 +14,7 @@ from uuid import UUID
 
 import snowflake.connector
 
-from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake import get_pooled_connection
 
 
 class SignalScoresRepository:
@@ -28,7 +28,7 @@ class SignalScoresRepository:
     TABLE_NAME = "SIGNAL_SCORES"
 
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     def upsert_signal_scores(
         self,
@@ -284,7 +284,7 @@ class SignalScoresRepository:
         }
 
     def close(self):
-        """Close the database connection."""
+        """Release any pooled connection still held by this repository."""
         try:
             self.conn.close()
         except Exception:
@@ -24,7 +24,8 @@ from app.models.assessment import (
 from app.models.enumerations import AssessmentStatus, AssessmentType
 from app.repositories.assessment_repository import AssessmentRepository
 from app.repositories.company_repository import CompanyRepository
-from app.services.cache import get_cache, TTL_ASSESSMENT
+from app.services.cache import get_cache, load_through_cache, cached_response, TTL_ASSESSMENT
+from app.services.blocking import offload
 
 router = APIRouter(prefix="/api/v1/assessments", tags=["Assessments"])
 
@@ -265,7 +266,8 @@ def invalidate_assessment_cache(assessment_id: UUID):
     summary="Create a new assessment",
     description="Creates a new assessment for a company. Validates that the company exists and sets initial status to 'draft'.",
 )
-async def create_assessment(
+@offload
+def create_assessment(
     payload: AssessmentCreate,
     assessment_repo: AssessmentRepository = Depends(get_assessment_repository),
     company_repo: CompanyRepository = Depends(get_company_repository),
@@ -322,7 +324,8 @@ async def create_assessment(
     summary="List assessments",
     description="Returns a paginated list of assessments with optional filtering by company_id, assessment_type, and status.",
 )
-async def list_assessments(
+@offload
+def list_assessments(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     company_id: Optional[UUID] = Query(default=None),
@@ -400,37 +403,23 @@ async def list_assessments(
     summary="Get assessment by ID",
     description="Retrieves a single assessment by its UUID, including associated dimension scores.",
 )
-async def get_assessment(
+@offload
+def get_assessment(
     assessment_id: UUID,
     assessment_repo: AssessmentRepository = Depends(get_assessment_repository),
 ) -> AssessmentResponse:
     cache_key = f"assessment:{assessment_id}"
-    cache = get_cache()
-
-    # Try cache first (with graceful failure)
-    if cache:
-        try:
-            cached = cache.get(cache_key, AssessmentResponse)
-            if cached:
-                return cached  # Cache hit!
-        except Exception:
-            pass  # Redis failed, continue to database
-
-    # Cache miss - query Snowflake
-    assessment_data = assessment_repo.get_by_id(assessment_id)
 
-    if not assessment_data:
-        raise_assessment_not_found()
-
-    assessment = AssessmentResponse(**assessment_data)
-
-    # Cache the result
-    if cache:
-        try:
-            cache.set(cache_key, assessment, TTL_ASSESSMENT)
-        except Exception:
-            pass  # Don't fail if cache write fails
+    def load() -> AssessmentResponse:
+        # Cache miss - query Snowflake
+        assessment_data = assessment_repo.get_by_id(assessment_id)
+        if not assessment_data:
+            raise_assessment_not_found()
+        return AssessmentResponse(**assessment_data)
 
+    assessment, tier = load_through_cache(cache_key, AssessmentResponse, TTL_ASSESSMENT, load, trusted=True)
+    if tier:
+        return cached_response(assessment)  # Cache hit: cached JSON is the response body
     return assessment
 
 
@@ -484,7 +473,8 @@ async def get_assessment(
     summary="Update assessment status",
     description="Updates the status of an existing assessment. Valid transitions depend on current status.",
 )
-async def update_assessment_status(
+@offload
+def update_assessment_status(
     assessment_id: UUID,
     payload: StatusUpdate,
     assessment_repo: AssessmentRepository = Depends(get_assessment_repository),
@@ -20,6 +20,7 @@ from app.pipelines.board_analyzer import (
 from app.services.s3_storage import get_s3_service
 from app.repositories.document_repository import get_document_repository
 from app.repositories.company_repository import CompanyRepository as get_company_repository
+from app.services.blocking import SCORING_LANE, offload
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/board-governance", tags=["Board Governance"])
@@ -148,7 +149,8 @@ def _analyze_one(analyzer: BoardCompositionAnalyzer, ticker: str) -> tuple[Gover
 # ────────────────────────────────────────────────────────────────
 
 @router.post("/analyze/{ticker}", response_model=GovernanceOut)
-async def analyze_ticker(ticker: str):
+@offload(lane=SCORING_LANE)
+def analyze_ticker(ticker: str):
     """Analyze board governance for a single company and persist results."""
     ticker = ticker.upper()
     try:
@@ -171,7 +173,8 @@ async def analyze_ticker(ticker: str):
 # ────────────────────────────────────────────────────────────────
 
 @router.post("/analyze", response_model=BatchOut)
-async def analyze_all():
+@offload(lane=SCORING_LANE)
+def analyze_all():
     """Analyze board governance for all 5 CS3 companies (NVDA, JPM, WMT, GE, DG)."""
     tickers = CompanyRegistry.all_tickers()
     analyzer = _get_analyzer()
@@ -201,7 +204,8 @@ async def analyze_all():
 # ────────────────────────────────────────────────────────────────
 
 @router.get("/score/{ticker}")
-async def get_governance_score(ticker: str):
+@offload
+def get_governance_score(ticker: str):
     """
     Get latest governance signal for a ticker.
 
@@ -216,13 +220,10 @@ async def get_governance_score(ticker: str):
     # Try S3 first
     try:
         s3 = get_s3_service()
-        keys = s3.list_files(f"signals/board_composition/{ticker}/")
-        if keys:
-            latest = sorted(keys)[-1]
-            data = s3.get_file(latest)
-            if data:
-                import json
-                return json.loads(data.decode("utf-8"))
+        _, data = s3.get_latest(f"signals/board_composition/{ticker}/")
+        if data:
+            import json
+            return json.loads(data.decode("utf-8"))
     except Exception as e:
         logger.warning(f"[{ticker}] S3 read failed, running live analysis: {e}")
 
@@ -241,7 +242,8 @@ async def get_governance_score(ticker: str):
 # ────────────────────────────────────────────────────────────────
 
 @router.get("/scores")
-async def get_all_governance_scores():
+@offload
+def get_all_governance_scores():
     """
     Get latest governance signals for all 5 CS3 companies.
 
@@ -263,14 +265,11 @@ async def get_all_governance_scores():
         # Try S3
         if s3:
             try:
-                keys = s3.list_files(f"signals/board_composition/{ticker}/")
-                if keys:
-                    latest = sorted(keys)[-1]
-                    data = s3.get_file(latest)
-                    if data:
-                        import json
-                        results.append(json.loads(data.decode("utf-8")))
-                        continue
+                _, data = s3.get_latest(f"signals/board_composition/{ticker}/")
+                if data:
+                    import json
+                    results.append(json.loads(data.decode("utf-8")))
+                    continue
             except Exception as e:
                 logger.warning(f"[{ticker}] S3 read failed: {e}")
 
@@ -18,7 +18,8 @@ from pydantic import BaseModel, Field, root_validator
 from app.core.dependencies import get_company_repository, get_industry_repository
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.industry_repository import IndustryRepository
-from app.services.cache import get_cache, TTL_COMPANY
+from app.services.cache import get_cache, load_through_cache, cached_response, TTL_COMPANY
+from app.services.blocking import offload
 
 router = APIRouter(prefix="/api/v1", tags=["Companies"])
 
@@ -229,6 +230,9 @@ CACHE_KEY_COMPANIES_LIST_PREFIX = "companies:list:"
 CACHE_KEY_COMPANIES_ALL = "companies:all"
 CACHE_KEY_COMPANIES_BY_INDUSTRY = "companies:industry:"
 
+# Paginated and per-industry lists: dropped together by one generation bump
+CACHE_NAMESPACE_COMPANY_LISTS = "companies:lists"
+
 
 def get_company_cache_key(company_id: UUID) -> str:
     return f"{CACHE_KEY_COMPANY_PREFIX}{company_id}"
@@ -242,16 +246,17 @@ def get_companies_by_industry_cache_key(industry_id: UUID) -> str:
     return f"{CACHE_KEY_COMPANIES_BY_INDUSTRY}{industry_id}"
 
 
-def create_cache_info(hit: bool, key: str, latency_ms: float, ttl: int) -> CacheInfo:
-    """Create CacheInfo object with human-readable message."""
+def create_cache_info(hit: bool, key: str, latency_ms: float, ttl: int, source: str = "redis") -> CacheInfo:
+    """Create CacheInfo object with human-readable message (source: "redis" or "l1")."""
     if hit:
+        tier = "Redis" if source == "redis" else "in-process cache"
         return CacheInfo(
             hit=True,
-            source="redis",
+            source=source,
             key=key,
             latency_ms=round(latency_ms, 3),
             ttl_seconds=ttl,
-            message=f"✅ Cache HIT - Data served from Redis in {latency_ms:.3f}ms",
+            message=f"✅ Cache HIT - Data served from {tier} in {latency_ms:.3f}ms",
         )
     else:
         return CacheInfo(
@@ -271,9 +276,8 @@ def invalidate_company_cache(company_id: Optional[UUID] = None) -> None:
         try:
             if company_id:
                 cache.delete(get_company_cache_key(company_id))
-            cache.delete_pattern(f"{CACHE_KEY_COMPANIES_LIST_PREFIX}*")
             cache.delete(CACHE_KEY_COMPANIES_ALL)
-            cache.delete_pattern(f"{CACHE_KEY_COMPANIES_BY_INDUSTRY}*")
+            cache.invalidate_namespace(CACHE_NAMESPACE_COMPANY_LISTS)
         except Exception:
             pass
 
@@ -306,7 +310,8 @@ def row_to_response(row: dict, cache_info: Optional[CacheInfo] = None) -> Compan
     summary="Create a new company",
     description="Creates a new company. Validates schema, checks industry existence, and enforces uniqueness.",
 )
-async def create_company(
+@offload
+def create_company(
     company: CompanyCreate,
     company_repo: CompanyRepository = Depends(get_company_repository),
     industry_repo: IndustryRepository = Depends(get_industry_repository),
@@ -335,43 +340,28 @@ async def create_company(
     summary="Get all companies",
     description="Returns all companies without pagination. Cached for 5 minutes.",
 )
-async def get_all_companies(
+@offload
+def get_all_companies(
     company_repo: CompanyRepository = Depends(get_company_repository),
 ) -> CompanyListResponse:
     cache_key = CACHE_KEY_COMPANIES_ALL
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(cache_key, CompanyListResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, cache_key, latency, TTL_COMPANY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from database
-    companies = company_repo.get_all()
-
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, cache_key, latency, TTL_COMPANY)
-
-    response = CompanyListResponse(
-        items=[row_to_response(c) for c in companies],
-        total=len(companies),
-        cache=cache_info,
-    )
-
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(cache_key, response, TTL_COMPANY)
-        except Exception:
-            pass
+    def load() -> CompanyListResponse:
+        companies = company_repo.get_all()
+        latency = (time.time() - start_time) * 1000
+        return CompanyListResponse(
+            items=[row_to_response(c) for c in companies],
+            total=len(companies),
+            cache=create_cache_info(False, cache_key, latency, TTL_COMPANY),
+        )
 
+    # L1 → Redis → database; concurrent misses share one database read
+    response, tier = load_through_cache(cache_key, CompanyListResponse, TTL_COMPANY, load, trusted=True)
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, cache_key, latency, TTL_COMPANY, source=tier)
+        return cached_response(response, cache=info)
     return response
 
 
@@ -381,7 +371,8 @@ async def get_all_companies(
     summary="Get companies by industry",
     description="Returns all companies for a specific industry. Cached for 5 minutes.",
 )
-async def get_companies_by_industry(
+@offload
+def get_companies_by_industry(
     industry_id: UUID,
     company_repo: CompanyRepository = Depends(get_company_repository),
     industry_repo: IndustryRepository = Depends(get_industry_repository),
@@ -391,39 +382,25 @@ async def get_companies_by_industry(
         raise_industry_not_found()
 
     cache_key = get_companies_by_industry_cache_key(industry_id)
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(cache_key, CompanyListResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, cache_key, latency, TTL_COMPANY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from database
-    companies = company_repo.get_by_industry(industry_id)
-
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, cache_key, latency, TTL_COMPANY)
+    def load() -> CompanyListResponse:
+        companies = company_repo.get_by_industry(industry_id)
+        latency = (time.time() - start_time) * 1000
+        return CompanyListResponse(
+            items=[row_to_response(c) for c in companies],
+            total=len(companies),
+            cache=create_cache_info(False, cache_key, latency, TTL_COMPANY),
+        )
 
-    response = CompanyListResponse(
-        items=[row_to_response(c) for c in companies],
-        total=len(companies),
-        cache=cache_info,
+    response, tier = load_through_cache(
+        cache_key, CompanyListResponse, TTL_COMPANY, load,
+        namespace=CACHE_NAMESPACE_COMPANY_LISTS, trusted=True,
     )
-
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(cache_key, response, TTL_COMPANY)
-        except Exception:
-            pass
-
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, cache_key, latency, TTL_COMPANY, source=tier)
+        return cached_response(response, cache=info)
     return response
 
 
@@ -433,61 +410,49 @@ async def get_companies_by_industry(
     summary="List companies (paginated)",
     description="Returns a paginated list of companies. Cached for 5 minutes.",
 )
-async def list_companies(
+@offload
+def list_companies(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     industry_id: Optional[UUID] = Query(default=None),
     company_repo: CompanyRepository = Depends(get_company_repository),
 ) -> PaginatedCompanyResponse:
     cache_key = get_companies_list_cache_key(page, page_size, industry_id)
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(cache_key, PaginatedCompanyResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, cache_key, latency, TTL_COMPANY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from database
-    # Get all companies and apply pagination in memory
-    if industry_id:
-        all_companies = company_repo.get_by_industry(industry_id)
-    else:
-        all_companies = company_repo.get_all()
-
-    total = len(all_companies)
-    total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-
-    # Apply pagination
-    start_idx = (page - 1) * page_size
-    end_idx = start_idx + page_size
-    companies = all_companies[start_idx:end_idx]
-
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, cache_key, latency, TTL_COMPANY)
+    def load() -> PaginatedCompanyResponse:
+        # Get all companies and apply pagination in memory
+        if industry_id:
+            all_companies = company_repo.get_by_industry(industry_id)
+        else:
+            all_companies = company_repo.get_all()
+
+        total = len(all_companies)
+        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
+
+        # Apply pagination
+        start_idx = (page - 1) * page_size
+        end_idx = start_idx + page_size
+        companies = all_companies[start_idx:end_idx]
+
+        latency = (time.time() - start_time) * 1000
+        return PaginatedCompanyResponse(
+            items=[row_to_response(c) for c in companies],
+            total=total,
+            page=page,
+            page_size=page_size,
+            total_pages=total_pages,
+            cache=create_cache_info(False, cache_key, latency, TTL_COMPANY),
+        )
 
-    response = PaginatedCompanyResponse(
-        items=[row_to_response(c) for c in companies],
-        total=total,
-        page=page,
-        page_size=page_size,
-        total_pages=total_pages,
-        cache=cache_info,
+    response, tier = load_through_cache(
+        cache_key, PaginatedCompanyResponse, TTL_COMPANY, load,
+        namespace=CACHE_NAMESPACE_COMPANY_LISTS, trusted=True,
     )
-
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(cache_key, response, TTL_COMPANY)
-        except Exception:
-            pass
-
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, cache_key, latency, TTL_COMPANY, source=tier)
+        return cached_response(response, cache=info)
     return response
 
 
@@ -497,44 +462,30 @@ async def list_companies(
     summary="Get company by ID",
     description="Retrieves a company by UUID. Cached for 5 minutes.",
 )
-async def get_company(
+@offload
+def get_company(
     id: UUID,
     company_repo: CompanyRepository = Depends(get_company_repository),
 ) -> CompanyResponse:
     cache_key = get_company_cache_key(id)
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(cache_key, CompanyResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, cache_key, latency, TTL_COMPANY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from Snowflake
-    if company_repo.is_deleted(id):
-        raise_company_deleted()
-
-    company = company_repo.get_by_id(id)
-    if not company:
-        raise_company_not_found()
+    def load() -> CompanyResponse:
+        if company_repo.is_deleted(id):
+            raise_company_deleted()
 
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, cache_key, latency, TTL_COMPANY)
-    response = row_to_response(company, cache_info)
+        company = company_repo.get_by_id(id)
+        if not company:
+            raise_company_not_found()
 
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(cache_key, response, TTL_COMPANY)
-        except Exception:
-            pass
+        latency = (time.time() - start_time) * 1000
+        return row_to_response(company, create_cache_info(False, cache_key, latency, TTL_COMPANY))
 
+    response, tier = load_through_cache(cache_key, CompanyResponse, TTL_COMPANY, load, trusted=True)
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, cache_key, latency, TTL_COMPANY, source=tier)
+        return cached_response(response, cache=info)
     return response
 
 
@@ -544,7 +495,8 @@ async def get_company(
     summary="Update company",
     description="Updates company data and invalidates cache.",
 )
-async def update_company(
+@offload
+def update_company(
     id: UUID,
     company: CompanyUpdate,
     company_repo: CompanyRepository = Depends(get_company_repository),
@@ -592,7 +544,8 @@ async def update_company(
     summary="Soft delete company",
     description="Marks a company as deleted and invalidates cache.",
 )
-async def delete_company(
+@offload
+def delete_company(
     id: UUID,
     company_repo: CompanyRepository = Depends(get_company_repository),
 ) -> None:
@@ -17,6 +17,7 @@ from app.models.dimension import (
 from app.models.enumerations import Dimension
 from app.repositories.dimension_score_repository import DimensionScoreRepository
 from app.services.cache import get_cache, TTL_ASSESSMENT, TTL_DIMENSION_WEIGHTS
+from app.services.blocking import offload
 
 
 # ROUTER CONFIGURATION
@@ -354,7 +355,8 @@ def invalidate_assessment_cache(assessment_id: UUID):
     description="Adds dimension scores to a specific assessment.",
     responses=POST_RESPONSES
 )
-async def add_dimension_score(
+@offload
+def add_dimension_score(
     id: UUID,
     score_data: DimensionScoreCreate,
     repo: DimensionScoreRepository = Depends(get_dimension_score_repository),
@@ -418,7 +420,8 @@ async def add_dimension_score(
     description="Retrieves all dimension scores for a specific assessment.",
     responses=GET_RESPONSES
 )
-async def get_dimension_scores(
+@offload
+def get_dimension_scores(
     id: UUID,
     repo: DimensionScoreRepository = Depends(get_dimension_score_repository),
 ) -> List[DimensionScoreResponse]:
@@ -459,7 +462,8 @@ async def get_dimension_scores(
     description="Updates an existing dimension score by its ID.",
     responses=PUT_RESPONSES
 )
-async def update_dimension_score(
+@offload
+def update_dimension_score(
     id: UUID,
     update_data: DimensionScoreUpdate,
     repo: DimensionScoreRepository = Depends(get_dimension_score_repository),
@@ -559,7 +563,8 @@ async def update_dimension_score(
         }
     }
 )
-async def get_dimension_weights() -> DimensionWeightsResponse:
+@offload
+def get_dimension_weights() -> DimensionWeightsResponse:
     """Get the current dimension weights configuration."""
     cache_key = "dimension:weights"
     cache = get_cache()
@@ -675,6 +675,7 @@ from app.services.section_analysis_service import get_section_analysis_service
 from app.services.s3_storage import get_s3_service
 import json
 from app.repositories.signal_repository import get_signal_repository
+from app.services.blocking import SCORING_LANE, offload
 
 logger = logging.getLogger(__name__)
 
@@ -705,7 +706,8 @@ router = APIRouter(
     **Filing Types:** 10-K, 10-Q, 8-K, DEF 14A
     """
 )
-async def collect_documents(request: DocumentCollectionRequest):
+@offload(lane=SCORING_LANE)
+def collect_documents(request: DocumentCollectionRequest):
     """Collect SEC filings for a company"""
     logger.info(f"📥 Collection request for: {request.ticker}")
     try:
@@ -724,7 +726,8 @@ async def collect_documents(request: DocumentCollectionRequest):
     tags=["1. Collection"],
     summary="Collect SEC filings for all 10 companies"
 )
-async def collect_all_documents(
+@offload(lane=SCORING_LANE)
+def collect_all_documents(
     filing_types: List[FilingType] = Query(
         default=[FilingType.FORM_10K, FilingType.FORM_10Q, FilingType.FORM_8K, FilingType.DEF_14A]
     ),
@@ -759,7 +762,8 @@ async def collect_all_documents(
     5. Updates word_count in Snowflake
     """
 )
-async def parse_documents_by_ticker(ticker: str):
+@offload(lane=SCORING_LANE)
+def parse_documents_by_ticker(ticker: str):
     """Parse all documents for a company"""
     logger.info(f"📄 Parse request for: {ticker}")
     try:
@@ -777,7 +781,8 @@ async def parse_documents_by_ticker(ticker: str):
     tags=["2. Parsing"],
     summary="Parse documents for all companies"
 )
-async def parse_all_documents():
+@offload(lane=SCORING_LANE)
+def parse_all_documents():
     """Parse documents for all 10 target companies"""
     logger.info("📄 Batch parsing for all companies")
     try:
@@ -793,7 +798,8 @@ async def parse_all_documents():
     summary="View parsed document content",
     description="Get the parsed content of a document from S3"
 )
-async def get_parsed_document(document_id: str):
+@offload
+def get_parsed_document(document_id: str):
     """Get parsed document content by ID"""
     logger.info(f"📄 Getting parsed document: {document_id}")
     
@@ -855,7 +861,8 @@ async def get_parsed_document(document_id: str):
     - chunk_overlap: Overlap between chunks (default: 50)
     """
 )
-async def chunk_documents_by_ticker(
+@offload(lane=SCORING_LANE)
+def chunk_documents_by_ticker(
     ticker: str,
     chunk_size: int = Query(default=750, ge=100, le=2000, description="Words per chunk"),
     chunk_overlap: int = Query(default=50, ge=0, le=200, description="Overlap between chunks")
@@ -876,7 +883,8 @@ async def chunk_documents_by_ticker(
     tags=["3. Chunking"],
     summary="Chunk documents for all companies"
 )
-async def chunk_all_documents(
+@offload(lane=SCORING_LANE)
+def chunk_all_documents(
     chunk_size: int = Query(default=750, ge=100, le=2000),
     chunk_overlap: int = Query(default=50, ge=0, le=200)
 ):
@@ -894,7 +902,8 @@ async def chunk_all_documents(
     tags=["3. Chunking"],
     summary="Get chunks for a document"
 )
-async def get_document_chunks(document_id: str):
+@offload
+def get_document_chunks(document_id: str):
     """Get all chunks for a specific document"""
     chunk_repo = get_chunk_repository()
     chunks = chunk_repo.get_by_document_id(document_id)
@@ -914,7 +923,8 @@ async def get_document_chunks(document_id: str):
     tags=["3. Chunking"],
     summary="Get chunk statistics for a company"
 )
-async def get_chunk_stats(ticker: str):
+@offload
+def get_chunk_stats(ticker: str):
     """Get chunk statistics for a company"""
     chunk_repo = get_chunk_repository()
     stats = chunk_repo.get_stats_by_ticker(ticker.upper())
@@ -937,7 +947,8 @@ async def get_chunk_stats(ticker: str):
     summary="Get Evidence Collection Report",
     description="Get comprehensive statistics in JSON format"
 )
-async def get_evidence_report():
+@offload
+def get_evidence_report():
     """Generate evidence collection report"""
     logger.info("📊 Generating report...")
     
@@ -976,7 +987,8 @@ async def get_evidence_report():
     summary="Get Evidence Collection Report (Table Format)",
     description="Get report formatted as tables for easy viewing"
 )
-async def get_evidence_report_table():
+@offload
+def get_evidence_report_table():
     """Generate report in table format"""
     logger.info("📊 Generating table report...")
     
@@ -1053,7 +1065,8 @@ async def get_evidence_report_table():
     summary="Export section analysis as Markdown",
     description="Download sec_analysis.md file with all tables"
 )
-async def export_section_analysis():
+@offload(lane=SCORING_LANE)
+def export_section_analysis():
     """Export section analysis as markdown file"""
     from fastapi.responses import PlainTextResponse
     logger.info("📊 Exporting analysis as markdown...")
@@ -1076,7 +1089,8 @@ async def export_section_analysis():
     summary="Analyze sections for all companies",
     description="Get section analysis tables for all 10 companies (JSON)"
 )
-async def analyze_all_sections():
+@offload(lane=SCORING_LANE)
+def analyze_all_sections():
     """Analyze sections for all companies - returns table format"""
     logger.info("📊 Analysis request for all companies")
     try:
@@ -1093,7 +1107,8 @@ async def analyze_all_sections():
     summary="Analyze sections for a company",
     description="Get section word counts and keyword mentions for a single company"
 )
-async def analyze_company_sections(ticker: str):
+@offload(lane=SCORING_LANE)
+def analyze_company_sections(ticker: str):
     """Analyze sections for a single company"""
     logger.info(f"📊 Analysis request for: {ticker}")
     try:
@@ -1112,7 +1127,8 @@ async def analyze_company_sections(ticker: str):
     tags=["5. Management"],
     summary="List all documents"
 )
-async def list_documents(
+@offload
+def list_documents(
     ticker: Optional[str] = Query(None),
     filing_type: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -1140,7 +1156,8 @@ async def list_documents(
     tags=["5. Management"],
     summary="Get document statistics for a company"
 )
-async def get_document_stats(ticker: str):
+@offload
+def get_document_stats(ticker: str):
     """Get document statistics for a company"""
     repo = get_document_repository()
     return repo.get_company_stats(ticker.upper())
@@ -1151,7 +1168,8 @@ async def get_document_stats(ticker: str):
     tags=["5. Management"],
     summary="Get document by ID"
 )
-async def get_document(document_id: str):
+@offload
+def get_document(document_id: str):
     """Get document metadata by ID"""
     repo = get_document_repository()
     doc = repo.get_by_id(document_id)
@@ -1180,7 +1198,8 @@ async def get_document(document_id: str):
     Use this to demonstrate the full pipeline from scratch.
     """
 )
-async def reset_company_data(ticker: str):
+@offload
+def reset_company_data(ticker: str):
     """Delete all data for a company (raw, parsed, chunks)"""
     ticker = ticker.upper()
     logger.info(f"🗑️ RESETTING ALL DATA FOR: {ticker}")
@@ -1243,7 +1262,8 @@ async def reset_company_data(ticker: str):
     tags=["6. Reset (Demo)"],
     summary="Delete only raw files for a company"
 )
-async def reset_raw_only(ticker: str):
+@offload
+def reset_raw_only(ticker: str):
     """Delete only raw files (keeps parsed and chunks)"""
     ticker = ticker.upper()
     logger.info(f"🗑️ Deleting RAW files for: {ticker}")
@@ -1278,7 +1298,8 @@ async def reset_raw_only(ticker: str):
     tags=["6. Reset (Demo)"],
     summary="Delete parsed files and reset status"
 )
-async def reset_parsed_only(ticker: str):
+@offload
+def reset_parsed_only(ticker: str):
     """Delete parsed files and reset document status to 'uploaded'"""
     ticker = ticker.upper()
     logger.info(f"🗑️ Deleting PARSED files for: {ticker}")
@@ -1318,7 +1339,8 @@ async def reset_parsed_only(ticker: str):
     tags=["6. Reset (Demo)"],
     summary="Delete chunks and reset status"
 )
-async def reset_chunks_only(ticker: str):
+@offload
+def reset_chunks_only(ticker: str):
     """Delete chunks and reset document status to 'parsed'"""
     ticker = ticker.upper()
     logger.info(f"🗑️ Deleting CHUNKS for: {ticker}")
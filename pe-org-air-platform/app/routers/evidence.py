@@ -7,13 +7,18 @@ Endpoints:
 - GET  /api/v1/evidence/stats                    - Get evidence collection statistics
 - POST /api/v1/evidence/backfill                 - Trigger full backfill for all 10 companies
 - GET  /api/v1/evidence/backfill/tasks/{task_id} - Check backfill progress
+- GET  /api/v1/evidence/backfill/tasks/{task_id}/events - Stream backfill progress (NDJSON)
 - POST /api/v1/evidence/backfill/tasks/{task_id}/cancel - Cancel a running backfill
+
+Backfills are durable jobs (app/services/job_queue.py): the task record,
+per-company checkpoints and progress events live in Redis (or SQLite), so
+a backfill survives restarts and can be polled from any API worker.
 """
 
 import asyncio
 import json
-from fastapi import APIRouter, BackgroundTasks, HTTPException, Query
-from uuid import uuid4
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Optional
 import logging
@@ -21,12 +26,6 @@ import logging
 from app.repositories.company_repository import CompanyRepository
 from app.repositories.document_repository import get_document_repository
 from app.repositories.signal_repository import get_signal_repository
-from app.services.document_collector import get_document_collector_service
-from app.services.job_signal_service import get_job_signal_service
-from app.services.patent_signal_service import get_patent_signal_service
-from app.services.tech_signal_service import get_tech_signal_service
-from app.services.leadership_service import get_leadership_service
-from app.models.document import DocumentCollectionRequest
 from app.shutdown import is_shutting_down
 from app.models.evidence import (
     DocumentSummary,
@@ -43,6 +42,9 @@ from app.models.evidence import (
     CompanySignalStat,
     SignalCategoryBreakdown,
 )
+from app.services.blocking import offload, run_blocking
+from app.services.evidence_backfill import BACKFILL_JOB
+from app.services.job_queue import TERMINAL_STATUSES, enqueue_job, get_job_store, job_results
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/v1", tags=["Evidence"])
@@ -52,8 +54,8 @@ TARGET_TICKERS = ["CAT", "DE", "UNH", "HCA", "ADP", "PAYX", "WMT", "TGT", "JPM",
 # Default skip threshold: skip companies collected within this many hours
 DEFAULT_SKIP_HOURS = 24
 
-# In-memory task store (in production, use Redis or database)
-_backfill_task_store: Dict[str, Dict[str, Any]] = {}
+# Poll interval of the progress stream
+EVENT_POLL_SECONDS = 1.0
 
 
 
@@ -70,7 +72,8 @@ _backfill_task_store: Dict[str, Dict[str, Any]] = {}
         "for the given ticker. No individual document rows are returned."
     ),
 )
-async def get_company_evidence(ticker: str):
+@offload
+def get_company_evidence(ticker: str):
     """Retrieve summary-level evidence (doc stats + signals) for a company."""
     ticker = ticker.upper()
 
@@ -198,7 +201,8 @@ def _build_signal_stat(ticker: str, summary: Optional[Dict]) -> CompanySignalSta
         "All 10 target companies appear in signals_by_company even if no scores exist yet."
     ),
 )
-async def get_evidence_stats():
+@offload
+def get_evidence_stats():
     """Get evidence collection statistics."""
     doc_repo = get_document_repository()
     signal_repo = get_signal_repository()
@@ -273,12 +277,16 @@ async def get_evidence_stats():
         "were last updated within this many hours. Set to 0 to force re-collection for all.\n"
         "- `force` (query param, default false): If true, ignores skip_recent_hours and "
         "re-collects everything.\n\n"
+        "The backfill runs as a durable job: several companies are collected at once "
+        "(within the SEC / jobspy / PatentsView rate limits), and a restart resumes it "
+        "from the last finished company.\n\n"
         "Use GET /api/v1/evidence/backfill/tasks/{task_id} to check progress.\n"
+        "Use GET /api/v1/evidence/backfill/tasks/{task_id}/events to stream progress.\n"
         "Use POST /api/v1/evidence/backfill/tasks/{task_id}/cancel to cancel."
     ),
 )
-async def trigger_backfill(
-    background_tasks: BackgroundTasks,
+@offload
+def trigger_backfill(
     skip_recent_hours: int = Query(default=DEFAULT_SKIP_HOURS, ge=0, description="Skip companies updated within this many hours. 0 = skip none."),
     force: bool = Query(default=False, description="Force re-collection for all companies, ignoring skip_recent_hours."),
 ):
@@ -308,44 +316,20 @@ async def trigger_backfill(
             else:
                 tickers_to_process.append(ticker)
 
-    task_id = str(uuid4())
-
-    _backfill_task_store[task_id] = {
-        "task_id": task_id,
-        "status": BackfillStatus.QUEUED,
-        "cancelled": False,
-        "progress": {
-            "companies_completed": 0,
-            "total_companies": len(tickers_to_process),
-            "current_company": None,
-            "skipped_companies": skipped_tickers,
-        },
-        "company_results": [],
-        "started_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": None,
-    }
-
-    # Add skipped companies as pre-filled results
-    for ticker in skipped_tickers:
-        _backfill_task_store[task_id]["company_results"].append({
-            "ticker": ticker,
-            "status": "skipped",
-            "sec_result": None,
-            "signal_result": None,
-            "error": f"Skipped: last updated within {skip_recent_hours}h window",
-        })
+    job = enqueue_job(
+        BACKFILL_JOB,
+        tickers_to_process,
+        params={"skipped": skipped_tickers, "skip_recent_hours": skip_recent_hours},
+    )
+    task_id = job["job_id"]
 
     if not tickers_to_process:
-        _backfill_task_store[task_id]["status"] = BackfillStatus.COMPLETED
-        _backfill_task_store[task_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
         return BackfillResponse(
             task_id=task_id,
             status=BackfillStatus.COMPLETED,
             message=f"All {len(TARGET_TICKERS)} companies were recently collected (within {skip_recent_hours}h).Use force=true to override and check above evidence stats to get full evidence for all companies",
         )
 
-    background_tasks.add_task(run_backfill, task_id, tickers_to_process)
-
     skip_msg = f" Skipped {len(skipped_tickers)} recently collected: {', '.join(skipped_tickers)}." if skipped_tickers else ""
     logger.info(f"Backfill queued: task_id={task_id}, processing={len(tickers_to_process)}, skipped={len(skipped_tickers)}")
 
@@ -359,6 +343,43 @@ async def trigger_backfill(
     )
 
 
+def _get_backfill_job(task_id: str) -> Dict[str, Any]:
+    job = get_job_store().get(task_id)
+    if job is None or job["kind"] != BACKFILL_JOB:
+        raise HTTPException(status_code=404, detail=f"Backfill task not found: {task_id}")
+    return job
+
+
+def _backfill_status(job: Dict[str, Any], checkpoints: Dict[str, Dict[str, Any]]) -> BackfillTaskStatus:
+    params = job["params"]
+    skipped = [
+        {
+            "ticker": ticker,
+            "status": "skipped",
+            "sec_result": None,
+            "signal_result": None,
+            "error": f"Skipped: last updated within {params.get('skip_recent_hours')}h window",
+        }
+        for ticker in params.get("skipped", [])
+    ]
+    progress = job["progress"]
+    running = progress.get("running", [])
+    return BackfillTaskStatus(
+        task_id=job["job_id"],
+        status=job["status"],
+        progress=BackfillProgress(
+            companies_completed=progress["completed"],
+            total_companies=progress["total"],
+            current_company=running[0] if running else None,
+            running_companies=running,
+            skipped_companies=params.get("skipped", []),
+        ),
+        company_results=[CompanyBackfillResult(**r) for r in skipped + job_results(job, checkpoints, key="ticker")],
+        started_at=job["started_at"] or job["created_at"],
+        completed_at=job["completed_at"],
+    )
+
+
 
 # GET /api/v1/evidence/backfill/tasks/{task_id}
 
@@ -367,22 +388,49 @@ async def trigger_backfill(
     "/evidence/backfill/tasks/{task_id}",
     response_model=BackfillTaskStatus,
     summary="Check backfill task progress",
-    description="Returns per-company status, the current company being processed, skipped companies, and overall progress.",
+    description="Returns per-company status, the companies being processed, skipped companies, and overall progress.",
 )
-async def get_backfill_status(task_id: str):
+@offload
+def get_backfill_status(task_id: str):
     """Check progress of a backfill task."""
-    if task_id not in _backfill_task_store:
-        raise HTTPException(status_code=404, detail=f"Backfill task not found: {task_id}")
+    job = _get_backfill_job(task_id)
+    return _backfill_status(job, get_job_store().checkpoints(task_id))
+
 
-    task = _backfill_task_store[task_id]
-    return BackfillTaskStatus(
-        task_id=task["task_id"],
-        status=task["status"],
-        progress=BackfillProgress(**task["progress"]),
-        company_results=[CompanyBackfillResult(**r) for r in task["company_results"]],
-        started_at=task["started_at"],
-        completed_at=task["completed_at"],
-    )
+
+# GET /api/v1/evidence/backfill/tasks/{task_id}/events
+
+
+@router.get(
+    "/evidence/backfill/tasks/{task_id}/events",
+    summary="Stream backfill progress",
+    description=(
+        "Newline-delimited JSON, one line per job event (queued, started, item_started, "
+        "item_finished, interrupted, finished), each with a `seq`. The stream ends when the "
+        "backfill finishes. Pass `after` (the last seq seen) to reconnect without repeats."
+    ),
+)
+async def stream_backfill_events(task_id: str, after: int = Query(default=0, ge=0)):
+    """Stream backfill progress events as newline-delimited JSON."""
+    await run_blocking(_get_backfill_job, task_id)
+    store = get_job_store()
+
+    async def _events():
+        seq = after
+        while not is_shutting_down():
+            events = await run_blocking(store.events, task_id, seq)
+            for event in events:
+                seq = event["seq"]
+                yield json.dumps(event) + "\n"
+                if event["type"] == "finished":
+                    return
+            if not events:
+                job = await run_blocking(store.get, task_id)
+                if job is None or job["status"] in TERMINAL_STATUSES:
+                    return
+            await asyncio.sleep(EVENT_POLL_SECONDS)
+
+    return StreamingResponse(_events(), media_type="application/x-ndjson")
 
 
 
@@ -393,166 +441,36 @@ async def get_backfill_status(task_id: str):
     "/evidence/backfill/tasks/{task_id}/cancel",
     summary="Cancel a running backfill task",
     description=(
-        "Signals a running backfill to stop after the current company finishes. "
-        "Companies already completed are kept. The task status changes to 'cancelled'."
+        "Signals a backfill to stop starting new companies. Companies in flight finish and, "
+        "like those already completed, are kept. The task status changes to 'cancelled'."
     ),
 )
-async def cancel_backfill(task_id: str):
+@offload
+def cancel_backfill(task_id: str):
     """Cancel a running backfill task."""
-    if task_id not in _backfill_task_store:
-        raise HTTPException(status_code=404, detail=f"Backfill task not found: {task_id}")
-
-    task = _backfill_task_store[task_id]
+    job = _get_backfill_job(task_id)
 
-    if task["status"] in (BackfillStatus.COMPLETED, BackfillStatus.COMPLETED_WITH_ERRORS, BackfillStatus.FAILED):
-        raise HTTPException(status_code=400, detail=f"Task already finished with status: {task['status']}")
+    if job["status"] in TERMINAL_STATUSES:
+        raise HTTPException(status_code=400, detail=f"Task already finished with status: {job['status']}")
 
-    if task.get("cancelled"):
+    if job.get("cancel_requested"):
         return {
             "task_id": task_id,
             "status": "cancelling",
-            "message": "Cancel already requested. Task will stop after current company finishes.",
+            "message": "Cancel already requested. Task will stop after the companies in flight finish.",
         }
 
-    task["cancelled"] = True
+    store = get_job_store()
+    store.request_cancel(task_id)
+    store.append_event(task_id, {"type": "cancel_requested", "at": datetime.now(timezone.utc).isoformat()})
     logger.info(f"Backfill cancel requested: task_id={task_id}")
 
+    running = job["progress"].get("running", [])
     return {
         "task_id": task_id,
         "status": "cancelling",
-        "message": "Cancel requested. Task will stop after the current company finishes processing.",
-        "current_company": task["progress"].get("current_company"),
-        "companies_completed": task["progress"]["companies_completed"],
-    }
-
-
-
-# Background Task: run_backfill
-
-
-async def _collect_signals_for_company(ticker: str) -> Dict[str, Any]:
-    """Run all 4 signal categories for a company."""
-    signal_results = {}
-    errors = []
-
-    categories = [
-        ("technology_hiring", lambda: get_job_signal_service().analyze_company(ticker, force_refresh=True)),
-        ("innovation_activity", lambda: get_patent_signal_service().analyze_company(ticker, years_back=5)),
-        ("digital_presence", lambda: get_tech_signal_service().analyze_company(ticker, force_refresh=True)),
-        ("leadership_signals", lambda: get_leadership_service().analyze_company(ticker)),
-    ]
-
-    for category, service_call in categories:
-        try:
-            result = await service_call()
-            signal_results[category] = {
-                "status": "success",
-                "score": result.get("normalized_score") if isinstance(result, dict) else None,
-            }
-        except Exception as e:
-            logger.error(f"Signal error for {ticker}/{category}: {e}")
-            signal_results[category] = {"status": "failed", "error": str(e)}
-            errors.append(f"{category}: {str(e)}")
-
-    return {"signals": signal_results, "errors": errors}
-
-
-async def _collect_sec_for_company(ticker: str) -> Dict[str, Any]:
-    """Run SEC document collection for a company."""
-    service = get_document_collector_service()
-    request = DocumentCollectionRequest(ticker=ticker)
-    result = await asyncio.to_thread(service.collect_for_company, request)
-    return {
-        "documents_found": result.documents_found,
-        "documents_uploaded": result.documents_uploaded,
-        "documents_skipped": result.documents_skipped,
-        "documents_failed": result.documents_failed,
-        "summary": result.summary,
+        "message": "Cancel requested. Task will stop after the companies in flight finish processing.",
+        "current_company": running[0] if running else None,
+        "running_companies": running,
+        "companies_completed": job["progress"]["completed"],
     }
-
-
-async def run_backfill(task_id: str, tickers: list[str]):
-    """Background task: process companies sequentially, SEC + signals in parallel per company."""
-    logger.info(f"Backfill started: task_id={task_id}, companies={tickers}")
-    _backfill_task_store[task_id]["status"] = BackfillStatus.RUNNING
-
-    has_errors = False
-    start_time = datetime.now(timezone.utc)
-
-    for i, ticker in enumerate(tickers):
-
-        # --- Check for cancellation OR app shutdown before starting next company ---
-        if _backfill_task_store[task_id].get("cancelled") or is_shutting_down():
-            cancel_reason = "App shutdown (Ctrl+C)" if is_shutting_down() else "Backfill cancelled by user"
-            logger.info(f"Backfill stopped at company {i+1}/{len(tickers)}: {ticker} — reason: {cancel_reason}")
-
-            # Mark remaining companies as cancelled
-            for remaining_ticker in tickers[i:]:
-                _backfill_task_store[task_id]["company_results"].append({
-                    "ticker": remaining_ticker,
-                    "status": "cancelled",
-                    "sec_result": None,
-                    "signal_result": None,
-                    "error": cancel_reason,
-                })
-
-            _backfill_task_store[task_id]["status"] = BackfillStatus.CANCELLED
-            _backfill_task_store[task_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
-            elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
-            logger.info(f"Backfill cancelled: task_id={task_id}, completed={i}/{len(tickers)}, elapsed={elapsed:.1f}s")
-            return
-
-        _backfill_task_store[task_id]["progress"]["current_company"] = ticker
-        company_start = datetime.now(timezone.utc)
-        logger.info(f"Backfill [{i+1}/{len(tickers)}]: Processing {ticker}")
-
-        company_result = {
-            "ticker": ticker, "status": "success",
-            "sec_result": None, "signal_result": None, "error": None,
-            "duration_seconds": None,
-        }
-
-        try:
-            sec_task = asyncio.create_task(_collect_sec_for_company(ticker))
-            signal_task = asyncio.create_task(_collect_signals_for_company(ticker))
-            sec_result, signal_result = await asyncio.gather(sec_task, signal_task, return_exceptions=True)
-
-            if isinstance(sec_result, Exception):
-                logger.error(f"SEC collection failed for {ticker}: {sec_result}")
-                company_result["sec_result"] = {"status": "failed", "error": str(sec_result)}
-                has_errors = True
-            else:
-                company_result["sec_result"] = sec_result
-
-            if isinstance(signal_result, Exception):
-                logger.error(f"Signal collection failed for {ticker}: {signal_result}")
-                company_result["signal_result"] = {"status": "failed", "error": str(signal_result)}
-                has_errors = True
-            else:
-                company_result["signal_result"] = signal_result
-                if signal_result.get("errors"):
-                    has_errors = True
-
-        except Exception as e:
-            logger.error(f"Backfill failed for {ticker}: {e}")
-            company_result["status"] = "failed"
-            company_result["error"] = str(e)
-            has_errors = True
-
-        company_result["duration_seconds"] = round((datetime.now(timezone.utc) - company_start).total_seconds(), 1)
-        _backfill_task_store[task_id]["company_results"].append(company_result)
-        _backfill_task_store[task_id]["progress"]["companies_completed"] = i + 1
-
-    # --- Finalize ---
-    _backfill_task_store[task_id]["progress"]["current_company"] = None
-    _backfill_task_store[task_id]["status"] = (
-        BackfillStatus.COMPLETED_WITH_ERRORS if has_errors else BackfillStatus.COMPLETED
-    )
-    _backfill_task_store[task_id]["completed_at"] = datetime.now(timezone.utc).isoformat()
-
-    elapsed = (datetime.now(timezone.utc) - start_time).total_seconds()
-    logger.info(
-        f"Backfill finished: task_id={task_id}, "
-        f"status={_backfill_task_store[task_id]['status']}, "
-        f"companies={len(tickers)}, elapsed={elapsed:.1f}s"
-    )
\ No newline at end of file
@@ -25,6 +25,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
 from app.services.s3_storage import get_s3_service
+from app.services.blocking import SCORING_LANE, offload
 
 logger = logging.getLogger(__name__)
 
@@ -118,13 +119,10 @@ def _load_latest_culture_json(ticker: str) -> tuple[Optional[Dict], Optional[str
 
     # Attempt 1: timestamped subfolder (latest file)
     prefix = f"glassdoor_signals/output/{ticker_upper}/"
-    keys = s3.list_files(prefix)
-    if keys:
-        latest_key = sorted(keys)[-1]
-        raw = s3.get_file(latest_key)
-        if raw is not None:
-            data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
-            return data, latest_key
+    latest_key, raw = s3.get_latest(prefix)
+    if raw is not None:
+        data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
+        return data, latest_key
 
     # Attempt 2: flat file
     flat_key = f"glassdoor_signals/output/{ticker_upper}_culture.json"
@@ -142,13 +140,10 @@ def _load_latest_raw_json(ticker: str) -> tuple[Optional[Dict], Optional[str]]:
     ticker_upper = ticker.upper()
 
     prefix = f"glassdoor_signals/raw/{ticker_upper}/"
-    keys = s3.list_files(prefix)
-    if keys:
-        latest_key = sorted(keys)[-1]
-        raw = s3.get_file(latest_key)
-        if raw is not None:
-            data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
-            return data, latest_key
+    latest_key, raw = s3.get_latest(prefix)
+    if raw is not None:
+        data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
+        return data, latest_key
 
     return None, None
 
@@ -209,7 +204,8 @@ def _upsert_culture_to_snowflake(ticker: str, signal_data: Dict) -> bool:
     Valid tickers: NVDA, JPM, WMT, GE, DG
     """,
 )
-async def collect_culture_signal(ticker: str):
+@offload(lane=SCORING_LANE)
+def collect_culture_signal(ticker: str):
     """Collect and analyze culture reviews for one company."""
     start = time.time()
     ticker = ticker.upper()
@@ -317,7 +313,8 @@ async def collect_culture_signal(ticker: str):
     ai_awareness_score, keyword analysis, source breakdown, and more.
     """,
 )
-async def get_culture_signal(ticker: str):
+@offload
+def get_culture_signal(ticker: str):
     """Return the full Glassdoor culture signal breakdown for a single ticker."""
     ticker = ticker.upper()
     data, s3_key = _load_latest_culture_json(ticker)
@@ -359,7 +356,8 @@ async def get_culture_signal(ticker: str):
     summary="Fetch culture score breakdowns for all 5 CS3 portfolio companies",
     description="Returns the full culture signal breakdown for each of: NVDA, JPM, WMT, GE, DG.",
 )
-async def get_all_culture_signals():
+@offload
+def get_all_culture_signals():
     """Return culture signal breakdowns for the entire CS3 portfolio."""
     results: List[CultureSignalDetailOut] = []
     summary: List[Dict[str, Any]] = []
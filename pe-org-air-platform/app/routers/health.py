@@ -4,6 +4,8 @@ app/routers/health.py
 
 - /healthz: lightweight health check for platform (always 200) -> use for Render
 - /health: deep dependency checks (Snowflake, Redis, S3) -> returns 200 or 503
+- /health/snowflake/pool: Snowflake connection pool metrics for sizing under load
+- /health/cache/stats: Redis info + L1/Redis hit, miss and stale rates and circuit breaker state
 """
 
 from __future__ import annotations
@@ -11,13 +13,15 @@ from __future__ import annotations
 from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List
+import asyncio
 from datetime import datetime, timezone
 import os
 import time
 from pathlib import Path
 
 from dotenv import load_dotenv
+from app.services.blocking import offload, run_blocking
 
 # Load .env only in local dev (Render will use Environment Variables)
 project_root = Path(__file__).resolve().parent.parent.parent
@@ -37,6 +41,7 @@ class HealthResponse(BaseModel):
     timestamp: datetime
     version: str
     dependencies: Dict[str, str]
+    snowflake_pool: Optional[Dict[str, Any]] = None
 
 
 class CacheStatsResponse(BaseModel):
@@ -46,6 +51,11 @@ class CacheStatsResponse(BaseModel):
     keys_count: Optional[int] = None
     memory_used: Optional[str] = None
     uptime_seconds: Optional[int] = None
+    codec: Optional[str] = None                 # Redis value encoding (CACHE_CODEC)
+    tiers: Optional[Dict[str, Any]] = None      # per-tier (l1, redis) hit / miss / stale counts and rates
+    loads: Optional[Dict[str, Any]] = None      # loader runs, coalesced waiters, loader errors
+    invalidations: Optional[Dict[str, Any]] = None  # namespace bumps, background pattern deletes
+    circuit: Optional[Dict[str, Any]] = None    # Redis circuit breaker state
     error: Optional[str] = None
 
 
@@ -67,9 +77,10 @@ class CacheKeysResponse(BaseModel):
 
 # -------------------------
 # Dependency Health Checks
+# (blocking — routes run them on the io lane via run_blocking)
 # -------------------------
 
-async def check_snowflake() -> str:
+def check_snowflake() -> str:
     """Check Snowflake connection health."""
     try:
         import snowflake.connector
@@ -77,10 +88,6 @@ async def check_snowflake() -> str:
         account = os.getenv("SNOWFLAKE_ACCOUNT")
         user = os.getenv("SNOWFLAKE_USER")
         password = os.getenv("SNOWFLAKE_PASSWORD")
-        warehouse = os.getenv("SNOWFLAKE_WAREHOUSE")
-        database = os.getenv("SNOWFLAKE_DATABASE")
-        schema = os.getenv("SNOWFLAKE_SCHEMA")
-        role = os.getenv("SNOWFLAKE_ROLE")
 
         missing = [k for k, v in {
             "SNOWFLAKE_ACCOUNT": account,
@@ -91,21 +98,13 @@ async def check_snowflake() -> str:
         if missing:
             return f"unhealthy: Missing env vars: {', '.join(missing)}"
 
-        conn = snowflake.connector.connect(
-            account=account,
-            user=user,
-            password=password,
-            warehouse=warehouse,
-            database=database,
-            schema=schema,
-            role=role,
-        )
+        from app.services.snowflake_pool import get_snowflake_pool
 
-        cursor = conn.cursor()
-        cursor.execute("SELECT CURRENT_USER(), CURRENT_ROLE()")
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with get_snowflake_pool().connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT CURRENT_USER(), CURRENT_ROLE()")
+            result = cursor.fetchone()
+            cursor.close()
 
         return f"healthy (User: {result[0]}, Role: {result[1]})"
 
@@ -117,7 +116,17 @@ async def check_snowflake() -> str:
         return f"unhealthy: {msg}"
 
 
-async def check_redis() -> str:
+def snowflake_pool_stats() -> Optional[Dict[str, Any]]:
+    """Current Snowflake pool metrics (in-use, idle, wait time, connects/sec)."""
+    try:
+        from app.services.snowflake_pool import get_snowflake_pool
+
+        return get_snowflake_pool().stats()
+    except Exception:
+        return None
+
+
+def check_redis() -> str:
     """Check Redis connection health."""
     try:
         import redis
@@ -143,7 +152,7 @@ async def check_redis() -> str:
         return f"unhealthy: {msg}"
 
 
-async def check_s3() -> str:
+def check_s3() -> str:
     """Check AWS S3 connection health."""
     try:
         import boto3
@@ -202,10 +211,15 @@ def healthz():
     description="Checks Snowflake, Redis, and S3 connectivity.",
 )
 async def health_check():
+    snowflake, redis_status, s3 = await asyncio.gather(
+        run_blocking(check_snowflake),
+        run_blocking(check_redis),
+        run_blocking(check_s3),
+    )
     dependencies = {
-        "snowflake": await check_snowflake(),
-        "redis": await check_redis(),
-        "s3": await check_s3(),
+        "snowflake": snowflake,
+        "redis": redis_status,
+        "s3": s3,
     }
 
     all_healthy = all(v.startswith("healthy") for v in dependencies.values())
@@ -215,6 +229,7 @@ async def health_check():
         timestamp=datetime.now(timezone.utc),
         version="1.0.0",
         dependencies=dependencies,
+        snowflake_pool=snowflake_pool_stats(),
     )
 
     if all_healthy:
@@ -228,7 +243,7 @@ async def health_check():
 
 @router.get("/health/snowflake", summary="Check Snowflake connection")
 async def health_snowflake():
-    result = await check_snowflake()
+    result = await run_blocking(check_snowflake)
     return {
         "service": "snowflake",
         "status": result,
@@ -237,9 +252,20 @@ async def health_snowflake():
     }
 
 
+@router.get("/health/snowflake/pool", summary="Snowflake connection pool metrics")
+async def health_snowflake_pool():
+    stats = snowflake_pool_stats()
+    return {
+        "service": "snowflake_pool",
+        "available": stats is not None,
+        "pool": stats,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
 @router.get("/health/redis", summary="Check Redis connection")
 async def health_redis():
-    result = await check_redis()
+    result = await run_blocking(check_redis)
     return {
         "service": "redis",
         "status": result,
@@ -250,7 +276,7 @@ async def health_redis():
 
 @router.get("/health/s3", summary="Check S3 connection")
 async def health_s3():
-    result = await check_s3()
+    result = await run_blocking(check_s3)
     return {
         "service": "s3",
         "status": result,
@@ -267,9 +293,12 @@ async def health_s3():
     "/health/cache/stats",
     response_model=CacheStatsResponse,
     summary="Redis cache statistics",
-    description="Returns detailed Redis cache statistics and connection info.",
+    description="Returns Redis connection info plus per-tier (L1 / Redis) hit, miss and stale rates "
+                "and the circuit breaker state.",
 )
-async def cache_stats() -> CacheStatsResponse:
+@offload
+def cache_stats() -> CacheStatsResponse:
+    tier_stats: Dict[str, Any] = {}
     try:
         from app.services.cache import get_cache
 
@@ -277,22 +306,28 @@ async def cache_stats() -> CacheStatsResponse:
         if not cache:
             return CacheStatsResponse(redis_connected=False, error="Redis not configured or unreachable")
 
-        cache.client.ping()
-        info = cache.client.info()
-        db_info = cache.client.info("keyspace")
+        tier_stats = cache.stats()
+        client = cache.client
+        if client is None:
+            return CacheStatsResponse(redis_connected=False, error="Redis circuit open", **tier_stats)
+
+        client.ping()
+        info = client.info()
+        db_info = client.info("keyspace")
 
         keys_count = db_info.get("db0", {}).get("keys", 0) if "db0" in db_info else 0
 
         return CacheStatsResponse(
             redis_connected=True,
-            redis_host=cache.client.connection_pool.connection_kwargs.get("host"),
-            redis_port=cache.client.connection_pool.connection_kwargs.get("port"),
+            redis_host=client.connection_pool.connection_kwargs.get("host"),
+            redis_port=client.connection_pool.connection_kwargs.get("port"),
             keys_count=keys_count,
             memory_used=info.get("used_memory_human"),
             uptime_seconds=info.get("uptime_in_seconds"),
+            **tier_stats,
         )
     except Exception as e:
-        return CacheStatsResponse(redis_connected=False, error=str(e))
+        return CacheStatsResponse(redis_connected=False, error=str(e), **tier_stats)
 
 
 @router.get(
@@ -301,7 +336,8 @@ async def cache_stats() -> CacheStatsResponse:
     summary="Test Redis cache operations",
     description="Performs write/read/delete test to verify caching works.",
 )
-async def cache_test() -> CacheTestResponse:
+@offload
+def cache_test() -> CacheTestResponse:
     try:
         from app.services.cache import get_cache
         from pydantic import BaseModel as _BaseModel
@@ -359,7 +395,8 @@ async def cache_test() -> CacheTestResponse:
     summary="Flush all cache",
     description="Clears all cached data. Use with caution!",
 )
-async def cache_flush() -> dict:
+@offload
+def cache_flush() -> dict:
     try:
         from app.services.cache import get_cache
 
@@ -367,7 +404,8 @@ async def cache_flush() -> dict:
         if not cache:
             return {"success": False, "error": "Redis not available"}
 
-        cache.client.flushdb()
+        if not cache.flush():
+            return {"success": False, "error": "Redis not available (in-process tier cleared)"}
         return {"success": True, "message": "Cache flushed successfully"}
     except Exception as e:
         return {"success": False, "error": str(e)}
@@ -21,6 +21,10 @@ import time
 from fastapi.responses import StreamingResponse
 import io
 
+from app.repositories.bulk import BulkWriter, MergeSpec
+from app.services.portfolio_executor import TickerOutcome, get_portfolio_executor
+from app.services.blocking import SCORING_LANE, offload
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/scoring", tags=["CS3 H^R (Human Readiness)"])
@@ -94,6 +98,7 @@ class PortfolioHRResponse(BaseModel):
     results: List[HRResponse]
     summary_table: List[Dict[str, Any]]
     duration_seconds: float
+    stage_timings: Optional[Dict[str, Dict[str, float]]] = None
 
 
 # =====================================================================
@@ -199,6 +204,24 @@ def _compute_hr(ticker: str) -> HRResponse:
         )
 
 
+def _score_and_save_hr(ticker: str) -> HRResponse:
+    """Portfolio worker: compute H^R for one ticker and persist it on success."""
+    result = _compute_hr(ticker)
+    if result.status == "success":
+        _save_hr_result(result)
+    return result
+
+
+def _failed_hr(outcome: TickerOutcome) -> HRResponse:
+    """Map a crashed or timed-out portfolio ticker to a failed response."""
+    return HRResponse(
+        ticker=outcome.ticker,
+        status="failed",
+        error=outcome.error,
+        duration_seconds=outcome.duration_seconds,
+    )
+
+
 # =====================================================================
 # POST /api/v1/scoring/hr/portfolio — Calculate H^R for all 5 companies
 # =====================================================================
@@ -227,18 +250,10 @@ async def score_portfolio_hr():
     logger.info("🚀 H^R PORTFOLIO SCORING — 5 COMPANIES")
     logger.info("=" * 70)
     
-    results = []
-    scored = 0
-    failed = 0
-    
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_hr(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-            _save_hr_result(result)
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _score_and_save_hr)
+    results = run.results(_failed_hr)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
 
     # Build summary table
     summary = []
@@ -293,6 +308,7 @@ async def score_portfolio_hr():
         results=results,
         summary_table=summary,
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
 
 
@@ -320,7 +336,8 @@ async def score_portfolio_hr():
     - 0-45: Not Ready
     """,
 )
-async def score_hr(ticker: str):
+@offload(lane=SCORING_LANE)
+def score_hr(ticker: str):
     """Calculate H^R for one company. Saves to S3 + Snowflake SCORING table."""
     result = _compute_hr(ticker.upper())
     if result.status == "success":
@@ -440,17 +457,10 @@ async def download_hr_report():
     logger.info("📝 Generating downloadable H^R Portfolio Report")
     
     # Run portfolio scoring
-    results = []
-    scored = 0
-    failed = 0
-    
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_hr(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _compute_hr)
+    results = run.results(_failed_hr)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
     
     portfolio = PortfolioHRResponse(
         status="success" if failed == 0 else "partial",
@@ -459,6 +469,7 @@ async def download_hr_report():
         results=results,
         summary_table=[],
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
     
     # Generate markdown content
@@ -501,101 +512,52 @@ def _save_hr_result(result: HRResponse) -> None:
     except Exception as e:
         logger.warning(f"[{ticker}] S3 save failed (non-fatal): {e}")
 
+    # SCORING + HR_SCORING — one transaction
     try:
-        _upsert_scoring_hr(ticker, hr=result.hr_score)
-        logger.info(f"[{ticker}] SCORING table upserted: HR={result.hr_score}")
+        with BulkWriter() as writer:
+            writer.stage(SCORING_HR_SPEC, [{"ticker": ticker, "hr": result.hr_score}])
+            writer.stage(HR_SCORING_SPEC, [_hr_scoring_row(result)])
+        logger.info(f"[{ticker}] SCORING, HR_SCORING tables upserted: HR={result.hr_score}")
     except Exception as e:
         logger.warning(f"[{ticker}] Snowflake SCORING upsert failed (non-fatal): {e}")
 
-    # HR_SCORING — breakdown detail table
-    try:
-        _upsert_hr_scoring(result)
-        logger.info(f"[{ticker}] HR_SCORING table upserted")
-    except Exception as e:
-        logger.warning(f"[{ticker}] HR_SCORING upsert failed (non-fatal): {e}")
 
+# SCORING — updates only the hr column, preserving existing tc/vr/pf
+SCORING_HR_SPEC = MergeSpec(
+    table="SCORING",
+    keys=("ticker",),
+    columns=("hr",),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
-def _upsert_hr_scoring(result: HRResponse) -> None:
-    """MERGE all H^R sub-components into HR_SCORING."""
-    from app.services.snowflake import get_snowflake_connection
-    ticker = result.ticker
-    bd  = result.hr_breakdown
-    val = result.validation
-
-    hr_score             = result.hr_score
-    hr_base              = bd.hr_base            if bd else None
-    position_factor_used = bd.position_factor    if bd else None
-    position_adjustment  = bd.position_adjustment if bd else None
-    sector               = bd.sector             if bd else None
-    interpretation       = bd.interpretation     if bd else None
-    hr_in_range          = val.hr_in_range       if val else None
-    hr_expected          = val.hr_expected       if val else None
-
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO HR_SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                hr_score             = %s,
-                hr_base              = %s,
-                position_factor_used = %s,
-                position_adjustment  = %s,
-                sector               = %s,
-                interpretation       = %s,
-                hr_in_range          = %s,
-                hr_expected          = %s,
-                updated_at           = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT (
-                ticker, hr_score, hr_base, position_factor_used, position_adjustment,
-                sector, interpretation, hr_in_range, hr_expected, scored_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP()
-            )
-        """
-        params = [
-            # USING clause
-            ticker,
-            # UPDATE SET
-            hr_score, hr_base, position_factor_used, position_adjustment,
-            sector, interpretation, hr_in_range, hr_expected,
-            # INSERT VALUES
-            ticker, hr_score, hr_base, position_factor_used, position_adjustment,
-            sector, interpretation, hr_in_range, hr_expected,
-        ]
-        cursor.execute(sql, params)
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+HR_SCORING_SPEC = MergeSpec(
+    table="HR_SCORING",
+    keys=("ticker",),
+    columns=(
+        "hr_score", "hr_base", "position_factor_used", "position_adjustment",
+        "sector", "interpretation", "hr_in_range", "hr_expected",
+    ),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
 
-def _upsert_scoring_hr(ticker: str, hr: Optional[float]) -> None:
-    """MERGE INTO SCORING — updates only the hr column, preserving existing tc/vr/pf."""
-    from app.services.snowflake import get_snowflake_connection
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                hr         = %s,
-                updated_at = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT
-                (ticker, hr, scored_at, updated_at)
-            VALUES
-                (%s, %s, CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP())
-        """
-        cursor.execute(sql, [ticker, hr, ticker, hr])
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+def _hr_scoring_row(result: HRResponse) -> Dict[str, Any]:
+    """All H^R sub-components for HR_SCORING."""
+    bd  = result.hr_breakdown
+    val = result.validation
+    return {
+        "ticker":               result.ticker,
+        "hr_score":             result.hr_score,
+        "hr_base":              bd.hr_base             if bd else None,
+        "position_factor_used": bd.position_factor     if bd else None,
+        "position_adjustment":  bd.position_adjustment if bd else None,
+        "sector":               bd.sector              if bd else None,
+        "interpretation":       bd.interpretation      if bd else None,
+        "hr_in_range":          val.hr_in_range        if val else None,
+        "hr_expected":          val.hr_expected        if val else None,
+    }
 
 
 # =====================================================================
@@ -657,7 +619,8 @@ def _fetch_hr_row(ticker: str) -> Optional[HRScoringRecord]:
     Use POST /hr/portfolio to (re)compute and refresh the stored scores.
     """,
 )
-async def get_portfolio_hr():
+@offload
+def get_portfolio_hr():
     """Return last stored H^R for all 5 portfolio companies."""
     results = []
     for ticker in CS3_PORTFOLIO:
@@ -691,7 +654,8 @@ async def get_portfolio_hr():
     Use POST /hr/{ticker} to (re)compute and refresh the stored score.
     """,
 )
-async def get_hr(ticker: str):
+@offload
+def get_hr(ticker: str):
     """Return last stored H^R for one company."""
     from fastapi import HTTPException
     row = _fetch_hr_row(ticker.upper())
@@ -16,7 +16,8 @@ from pydantic import BaseModel, Field
 
 from app.core.dependencies import get_industry_repository
 from app.repositories.industry_repository import IndustryRepository
-from app.services.cache import get_cache, TTL_INDUSTRY
+from app.services.cache import get_cache, load_through_cache, cached_response, TTL_INDUSTRY
+from app.services.blocking import offload
 
 router = APIRouter(prefix="/api/v1", tags=["Industries"])
 
@@ -37,7 +38,7 @@ class ErrorResponse(BaseModel):
 class CacheInfo(BaseModel):
     """Cache metadata for debugging - shows if Redis is working."""
     hit: bool                          # True = data from cache, False = data from database
-    source: str                        # "redis" or "database"
+    source: str                        # "redis", "l1" (in-process) or "database"
     key: str                           # Redis key used
     latency_ms: float                  # Time taken in milliseconds
     ttl_seconds: int                   # Cache TTL setting
@@ -93,16 +94,17 @@ def get_industry_cache_key(industry_id: UUID) -> str:
     return f"{CACHE_KEY_INDUSTRY_PREFIX}{industry_id}"
 
 
-def create_cache_info(hit: bool, key: str, latency_ms: float, ttl: int) -> CacheInfo:
-    """Create CacheInfo object with human-readable message."""
+def create_cache_info(hit: bool, key: str, latency_ms: float, ttl: int, source: str = "redis") -> CacheInfo:
+    """Create CacheInfo object with human-readable message (source: "redis" or "l1")."""
     if hit:
+        tier = "Redis" if source == "redis" else "in-process cache"
         return CacheInfo(
             hit=True,
-            source="redis",
+            source=source,
             key=key,
             latency_ms=round(latency_ms, 3),
             ttl_seconds=ttl,
-            message=f"✅ Cache HIT - Data served from Redis in {latency_ms:.3f}ms",
+            message=f"✅ Cache HIT - Data served from {tier} in {latency_ms:.3f}ms",
         )
     else:
         return CacheInfo(
@@ -168,7 +170,8 @@ def row_to_response(row: dict, cache_info: Optional[CacheInfo] = None) -> Indust
     summary="List industries",
     description="Returns all available industries. Cached for 1 hour.",
 )
-async def list_industries(
+@offload
+def list_industries(
     repo: IndustryRepository = Depends(get_industry_repository),
 ) -> IndustryListResponse:
     """
@@ -179,40 +182,26 @@ async def list_industries(
     - TTL: 1 hour (3600 seconds)
     - Invalidation: When any industry is modified
     """
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(CACHE_KEY_INDUSTRY_LIST, IndustryListResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, CACHE_KEY_INDUSTRY_LIST, latency, TTL_INDUSTRY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from Snowflake
-    industry_rows = repo.get_all()
-    industries = [row_to_response(ind) for ind in industry_rows]
-
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, CACHE_KEY_INDUSTRY_LIST, latency, TTL_INDUSTRY)
+    def load() -> IndustryListResponse:
+        industry_rows = repo.get_all()
+        industries = [row_to_response(ind) for ind in industry_rows]
+        latency = (time.time() - start_time) * 1000
+        return IndustryListResponse(
+            items=industries,
+            total=len(industries),
+            cache=create_cache_info(False, CACHE_KEY_INDUSTRY_LIST, latency, TTL_INDUSTRY),
+        )
 
-    response = IndustryListResponse(
-        items=industries,
-        total=len(industries),
-        cache=cache_info,
+    # L1 → Redis → Snowflake; concurrent misses share one Snowflake read
+    response, tier = load_through_cache(
+        CACHE_KEY_INDUSTRY_LIST, IndustryListResponse, TTL_INDUSTRY, load, trusted=True,
     )
-
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(CACHE_KEY_INDUSTRY_LIST, response, TTL_INDUSTRY)
-        except Exception:
-            pass
-
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, CACHE_KEY_INDUSTRY_LIST, latency, TTL_INDUSTRY, source=tier)
+        return cached_response(response, cache=info)
     return response
 
 
@@ -266,7 +255,8 @@ async def list_industries(
     summary="Get industry by ID",
     description="Retrieves a single industry by UUID. Cached for 1 hour.",
 )
-async def get_industry(
+@offload
+def get_industry(
     id: UUID,
     repo: IndustryRepository = Depends(get_industry_repository),
 ) -> IndustryResponse:
@@ -278,34 +268,18 @@ async def get_industry(
     - TTL: 1 hour (3600 seconds)
     """
     cache_key = get_industry_cache_key(id)
-    cache = get_cache()
     start_time = time.time()
 
-    # 1. Try cache first
-    if cache:
-        try:
-            cached = cache.get(cache_key, IndustryResponse)
-            if cached:
-                latency = (time.time() - start_time) * 1000
-                cached.cache = create_cache_info(True, cache_key, latency, TTL_INDUSTRY)
-                return cached
-        except Exception:
-            pass
-
-    # 2. Cache miss - fetch from Snowflake
-    industry = repo.get_by_id(id)
-    if not industry:
-        raise_industry_not_found()
-
-    latency = (time.time() - start_time) * 1000
-    cache_info = create_cache_info(False, cache_key, latency, TTL_INDUSTRY)
-    response = row_to_response(industry, cache_info)
-
-    # 3. Store in cache
-    if cache:
-        try:
-            cache.set(cache_key, response, TTL_INDUSTRY)
-        except Exception:
-            pass
-
+    def load() -> IndustryResponse:
+        industry = repo.get_by_id(id)
+        if not industry:
+            raise_industry_not_found()
+        latency = (time.time() - start_time) * 1000
+        return row_to_response(industry, create_cache_info(False, cache_key, latency, TTL_INDUSTRY))
+
+    response, tier = load_through_cache(cache_key, IndustryResponse, TTL_INDUSTRY, load, trusted=True)
+    if tier:
+        latency = (time.time() - start_time) * 1000
+        info = create_cache_info(True, cache_key, latency, TTL_INDUSTRY, source=tier)
+        return cached_response(response, cache=info)
     return response
\ No newline at end of file
@@ -4,12 +4,14 @@ routers/orgair_scoring.py — CS3 Task 6.4 Endpoints
 Endpoints:
   POST /api/v1/scoring/orgair/{ticker}        — Compute Org-AI-R for one company
   POST /api/v1/scoring/orgair/portfolio       — Compute Org-AI-R for all 5 CS3 companies
+  POST /api/v1/scoring/orgair/portfolio/stream — Same, streaming NDJSON progress per ticker
   POST /api/v1/scoring/orgair/results         — Generate results/*.json for submission
   GET  /api/v1/scoring/orgair/portfolio       — Read portfolio from Snowflake
   GET  /api/v1/scoring/orgair/{ticker}        — Read one from Snowflake
 """
 
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone
@@ -19,6 +21,10 @@ import json
 import logging
 import time
 
+from app.repositories.bulk import BulkWriter, MergeSpec
+from app.services.portfolio_executor import TickerOutcome, get_portfolio_executor
+from app.services.blocking import SCORING_LANE, offload, run_blocking
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/scoring", tags=["CS3 Org-AI-R"])
@@ -136,6 +142,7 @@ class PortfolioOrgAIRResponse(BaseModel):
     results: List[OrgAIRResponse]
     summary_table: List[Dict[str, Any]]
     duration_seconds: float
+    stage_timings: Optional[Dict[str, Dict[str, float]]] = None
 
 
 class ResultsGenerationResponse(BaseModel):
@@ -284,7 +291,8 @@ def _compute_orgair(ticker: str) -> OrgAIRResponse:
     and validation against CS3 Table 5 expected ranges.
     """,
 )
-async def generate_results():
+@offload(lane=SCORING_LANE)
+def generate_results():
     """Generate results JSON files for CS3 submission."""
     start = time.time()
 
@@ -300,19 +308,22 @@ async def generate_results():
     summary = []
     files_generated = 0
 
+    # 1. Run Org-AI-R for every ticker concurrently
+    run = get_portfolio_executor().run(CS3_PORTFOLIO, _compute_orgair)
+    responses = dict(zip(CS3_PORTFOLIO, run.results(_failed_orgair)))
+
     for ticker in CS3_PORTFOLIO:
         logger.info(f"\n{'─'*50}")
-        logger.info(f"Scoring {ticker}...")
+        logger.info(f"Writing results for {ticker}...")
 
-        # 1. Run Org-AI-R
-        response = _compute_orgair(ticker)
+        response = responses[ticker]
         if response.status != "success":
             logger.error(f"[{ticker}] FAILED: {response.error}")
             continue
 
         b = response.breakdown
 
-        # 2. Get TC+VR details for dimension scores
+        # 2. Get TC+VR details for dimension scores (memoized stage — no rescoring)
         from app.routers.tc_vr_scoring import _compute_tc_vr
         tc_vr = _compute_tc_vr(ticker)
 
@@ -473,6 +484,32 @@ async def generate_results():
     )
 
 
+def _score_and_save_orgair(ticker: str) -> OrgAIRResponse:
+    """Portfolio worker: compute Org-AI-R for one ticker and persist it on success."""
+    result = _compute_orgair(ticker)
+    if result.status == "success":
+        _save_orgair_result(result)
+    return result
+
+
+def _score_and_upload_orgair(ticker: str) -> OrgAIRResponse:
+    """Portfolio worker: compute Org-AI-R and save it to S3 (SCORING is written for the whole run)."""
+    result = _compute_orgair(ticker)
+    if result.status == "success":
+        _save_orgair_result(result, snowflake=False)
+    return result
+
+
+def _failed_orgair(outcome: TickerOutcome) -> OrgAIRResponse:
+    """Map a crashed or timed-out portfolio ticker to a failed response."""
+    return OrgAIRResponse(
+        ticker=outcome.ticker,
+        status="failed",
+        error=outcome.error,
+        duration_seconds=outcome.duration_seconds,
+    )
+
+
 # =====================================================================
 # POST /api/v1/scoring/orgair/portfolio
 # =====================================================================
@@ -490,18 +527,16 @@ async def score_portfolio_orgair():
     logger.info("Org-AI-R PORTFOLIO SCORING — 5 COMPANIES")
     logger.info("=" * 70)
 
-    results = []
-    scored = 0
-    failed = 0
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _score_and_upload_orgair)
+    results = run.results(_failed_orgair)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
 
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_orgair(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-            _save_orgair_result(result)
-        else:
-            failed += 1
+    # One SCORING MERGE for every scored company
+    try:
+        await run_blocking(_upsert_scoring_orgair, [r for r in results if r.status == "success"])
+    except Exception as e:
+        logger.warning(f"Snowflake SCORING upsert failed (non-fatal): {e}")
 
     summary = []
     logger.info("")
@@ -544,9 +579,46 @@ async def score_portfolio_orgair():
         companies_scored=scored, companies_failed=failed,
         results=results, summary_table=summary,
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
 
 
+# =====================================================================
+# POST /api/v1/scoring/orgair/portfolio/stream — NDJSON progress
+# =====================================================================
+
+@router.post(
+    "/orgair/portfolio/stream",
+    summary="Calculate Org-AI-R for all 5 companies, streaming progress",
+    description="""
+    Same pipeline as POST /orgair/portfolio, but emits one NDJSON line per
+    ticker as soon as it finishes (completion order), with its status,
+    Org-AI-R score, duration and per-stage timings.
+    """,
+)
+async def stream_portfolio_orgair():
+    """Stream per-ticker Org-AI-R progress as newline-delimited JSON."""
+
+    async def _events():
+        total = len(CS3_PORTFOLIO)
+        completed = 0
+        async for outcome in get_portfolio_executor().astream(CS3_PORTFOLIO, _score_and_save_orgair):
+            completed += 1
+            result = outcome.result if outcome.status == "success" else _failed_orgair(outcome)
+            yield json.dumps({
+                "ticker": outcome.ticker,
+                "status": result.status if outcome.status == "success" else outcome.status,
+                "completed": completed,
+                "total": total,
+                "org_air_score": result.org_air_score,
+                "error": result.error,
+                "duration_seconds": outcome.duration_seconds,
+                "stage_timings": outcome.stage_timings,
+            }) + "\n"
+
+    return StreamingResponse(_events(), media_type="application/x-ndjson")
+
+
 # =====================================================================
 # POST /api/v1/scoring/orgair/{ticker}
 # =====================================================================
@@ -556,7 +628,8 @@ async def score_portfolio_orgair():
     response_model=OrgAIRResponse,
     summary="Calculate Org-AI-R for one company",
 )
-async def score_orgair(ticker: str):
+@offload(lane=SCORING_LANE)
+def score_orgair(ticker: str):
     """Calculate Org-AI-R for one company."""
     result = _compute_orgair(ticker.upper())
     if result.status == "success":
@@ -568,7 +641,7 @@ async def score_orgair(ticker: str):
 # Persistence helpers
 # =====================================================================
 
-def _save_orgair_result(result: OrgAIRResponse) -> None:
+def _save_orgair_result(result: OrgAIRResponse, snowflake: bool = True) -> None:
     ticker = result.ticker
     try:
         from app.services.s3_storage import get_s3_service
@@ -580,49 +653,40 @@ def _save_orgair_result(result: OrgAIRResponse) -> None:
     except Exception as e:
         logger.warning(f"[{ticker}] S3 save failed (non-fatal): {e}")
 
+    if not snowflake:
+        return
     try:
-        _upsert_scoring_orgair(ticker, result)
+        _upsert_scoring_orgair([result])
         logger.info(f"[{ticker}] SCORING table upserted: org_air={result.org_air_score}")
     except Exception as e:
         logger.warning(f"[{ticker}] Snowflake SCORING upsert failed (non-fatal): {e}")
 
 
-def _upsert_scoring_orgair(ticker: str, result: OrgAIRResponse) -> None:
-    from app.services.snowflake import get_snowflake_connection
+SCORING_ORGAIR_SPEC = MergeSpec(
+    table="SCORING",
+    keys=("ticker",),
+    columns=("org_air", "vr_score", "hr_score", "synergy_score", "ci_lower", "ci_upper"),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
-    if not result.breakdown:
-        return
 
-    b = result.breakdown
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                org_air = %s, vr_score = %s, hr_score = %s,
-                synergy_score = %s, ci_lower = %s, ci_upper = %s,
-                updated_at = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT
-                (ticker, org_air, vr_score, hr_score, synergy_score,
-                 ci_lower, ci_upper, scored_at, updated_at)
-            VALUES (%s, %s, %s, %s, %s, %s, %s,
-                    CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP())
-        """
-        ci_lower = b.orgair_ci.ci_lower if b.orgair_ci else None
-        ci_upper = b.orgair_ci.ci_upper if b.orgair_ci else None
-        cursor.execute(sql, [
-            ticker, b.org_air_score, b.vr_score, b.hr_score,
-            b.synergy_score, ci_lower, ci_upper,
-            ticker, b.org_air_score, b.vr_score, b.hr_score,
-            b.synergy_score, ci_lower, ci_upper,
-        ])
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+def _upsert_scoring_orgair(results: List[OrgAIRResponse]) -> None:
+    """MERGE the Org-AI-R breakdown of each result into SCORING (one statement)."""
+    rows = []
+    for result in results:
+        b = result.breakdown
+        if not b:
+            continue
+        rows.append({
+            "ticker": result.ticker,
+            "org_air": b.org_air_score, "vr_score": b.vr_score, "hr_score": b.hr_score,
+            "synergy_score": b.synergy_score,
+            "ci_lower": b.orgair_ci.ci_lower if b.orgair_ci else None,
+            "ci_upper": b.orgair_ci.ci_upper if b.orgair_ci else None,
+        })
+    with BulkWriter() as writer:
+        writer.stage(SCORING_ORGAIR_SPEC, rows)
 
 
 # =====================================================================
@@ -667,7 +731,8 @@ def _fetch_orgair_row(ticker: str) -> Optional[OrgAIRScoringRecord]:
 
 @router.get("/orgair/portfolio", response_model=PortfolioOrgAIRScoringResponse,
             summary="Get last computed Org-AI-R for all 5 CS3 companies (from Snowflake)")
-async def get_portfolio_orgair():
+@offload
+def get_portfolio_orgair():
     results = []
     for ticker in CS3_PORTFOLIO:
         try:
@@ -686,7 +751,8 @@ async def get_portfolio_orgair():
 
 @router.get("/orgair/{ticker}", response_model=OrgAIRScoringRecord,
             summary="Get last computed Org-AI-R for one company (from Snowflake)")
-async def get_orgair(ticker: str):
+@offload
+def get_orgair(ticker: str):
     from fastapi import HTTPException
     row = _fetch_orgair_row(ticker.upper())
     if not row:
@@ -20,6 +20,7 @@ from fastapi import APIRouter, HTTPException, Query
 from app.pipelines.pdf_parser import PDFParser
 # from app.services.s3_storage import S3Storage
 from app.services.s3_storage import S3StorageService
+from app.services.blocking import SCORING_LANE, offload
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +28,8 @@ router = APIRouter(prefix="/api/v1/sec", tags=["Sample PDF Parsing"])
 
 
 @router.get("/parse-pdf")
-async def parse_sample_pdf(
+@offload(lane=SCORING_LANE)
+def parse_sample_pdf(
     ticker: str = Query(default="SAMPLE", description="Company ticker symbol"),
     upload_to_s3: bool = Query(default=True, description="Upload to S3"),
 ):
@@ -21,6 +21,10 @@ import time
 from fastapi.responses import StreamingResponse
 import io
 
+from app.repositories.bulk import BulkWriter, MergeSpec
+from app.services.portfolio_executor import TickerOutcome, get_portfolio_executor
+from app.services.blocking import SCORING_LANE, offload
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/scoring", tags=["CS3 Position Factor"])
@@ -104,6 +108,7 @@ class PortfolioPFResponse(BaseModel):
     results: List[PFResponse]
     summary_table: List[Dict[str, Any]]
     duration_seconds: float
+    stage_timings: Optional[Dict[str, Dict[str, float]]] = None
 
 
 # =====================================================================
@@ -220,6 +225,24 @@ def _compute_position_factor(ticker: str) -> PFResponse:
         )
 
 
+def _score_and_save_pf(ticker: str) -> PFResponse:
+    """Portfolio worker: compute Position Factor for one ticker and persist it on success."""
+    result = _compute_position_factor(ticker)
+    if result.status == "success":
+        _save_pf_result(result)
+    return result
+
+
+def _failed_pf(outcome: TickerOutcome) -> PFResponse:
+    """Map a crashed or timed-out portfolio ticker to a failed response."""
+    return PFResponse(
+        ticker=outcome.ticker,
+        status="failed",
+        error=outcome.error,
+        duration_seconds=outcome.duration_seconds,
+    )
+
+
 # =====================================================================
 # POST /api/v1/scoring/pf/portfolio — Calculate PF for all 5 companies
 # =====================================================================
@@ -248,18 +271,10 @@ async def score_portfolio_pf():
     logger.info("🚀 POSITION FACTOR PORTFOLIO SCORING — 5 COMPANIES")
     logger.info("=" * 70)
     
-    results = []
-    scored = 0
-    failed = 0
-    
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_position_factor(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-            _save_pf_result(result)
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _score_and_save_pf)
+    results = run.results(_failed_pf)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
 
     # Build summary table
     summary = []
@@ -316,6 +331,7 @@ async def score_portfolio_pf():
         results=results,
         summary_table=summary,
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
 
 
@@ -344,7 +360,8 @@ async def score_portfolio_pf():
     - PF < -0.3: Laggard
     """,
 )
-async def score_pf(ticker: str):
+@offload(lane=SCORING_LANE)
+def score_pf(ticker: str):
     """Calculate Position Factor for one company. Saves to S3 + Snowflake SCORING table."""
     result = _compute_position_factor(ticker.upper())
     if result.status == "success":
@@ -467,17 +484,10 @@ async def download_pf_report():
     logger.info("📝 Generating downloadable Position Factor Portfolio Report")
     
     # Run portfolio scoring
-    results = []
-    scored = 0
-    failed = 0
-    
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_position_factor(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _compute_position_factor)
+    results = run.results(_failed_pf)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
     
     portfolio = PortfolioPFResponse(
         status="success" if failed == 0 else "partial",
@@ -486,6 +496,7 @@ async def download_pf_report():
         results=results,
         summary_table=[],
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
     
     # Generate markdown content
@@ -528,108 +539,54 @@ def _save_pf_result(result: PFResponse) -> None:
     except Exception as e:
         logger.warning(f"[{ticker}] S3 save failed (non-fatal): {e}")
 
+    # SCORING + PF_SCORING — one transaction
     try:
-        _upsert_scoring_pf(ticker, pf=result.position_factor)
-        logger.info(f"[{ticker}] SCORING table upserted: PF={result.position_factor}")
+        with BulkWriter() as writer:
+            writer.stage(SCORING_PF_SPEC, [{"ticker": ticker, "pf": result.position_factor}])
+            writer.stage(PF_SCORING_SPEC, [_pf_scoring_row(result)])
+        logger.info(f"[{ticker}] SCORING, PF_SCORING tables upserted: PF={result.position_factor}")
     except Exception as e:
         logger.warning(f"[{ticker}] Snowflake SCORING upsert failed (non-fatal): {e}")
 
-    # PF_SCORING — breakdown detail table
-    try:
-        _upsert_pf_scoring(result)
-        logger.info(f"[{ticker}] PF_SCORING table upserted")
-    except Exception as e:
-        logger.warning(f"[{ticker}] PF_SCORING upsert failed (non-fatal): {e}")
 
+# SCORING — updates only the pf column, preserving existing tc/vr/hr
+SCORING_PF_SPEC = MergeSpec(
+    table="SCORING",
+    keys=("ticker",),
+    columns=("pf",),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
-def _upsert_pf_scoring(result: PFResponse) -> None:
-    """MERGE all PF sub-components into PF_SCORING."""
-    from app.services.snowflake import get_snowflake_connection
-    ticker = result.ticker
-    bd  = result.pf_breakdown
-    val = result.validation
-
-    position_factor       = result.position_factor
-    vr_score_used         = bd.vr_score          if bd else None
-    sector                = COMPANY_SECTORS.get(ticker.upper())
-    sector_avg_vr         = bd.sector_avg_vr     if bd else None
-    vr_diff               = bd.vr_diff           if bd else None
-    vr_component          = bd.vr_component      if bd else None
-    market_cap_percentile = bd.market_cap_percentile if bd else None
-    mcap_component        = bd.mcap_component    if bd else None
-    pf_in_range           = val.pf_in_range      if val else None
-    pf_expected           = val.pf_expected      if val else None
-
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO PF_SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                position_factor       = %s,
-                vr_score_used         = %s,
-                sector                = %s,
-                sector_avg_vr         = %s,
-                vr_diff               = %s,
-                vr_component          = %s,
-                market_cap_percentile = %s,
-                mcap_component        = %s,
-                pf_in_range           = %s,
-                pf_expected           = %s,
-                updated_at            = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT (
-                ticker, position_factor, vr_score_used, sector, sector_avg_vr,
-                vr_diff, vr_component, market_cap_percentile, mcap_component,
-                pf_in_range, pf_expected, scored_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP()
-            )
-        """
-        params = [
-            # USING clause
-            ticker,
-            # UPDATE SET
-            position_factor, vr_score_used, sector, sector_avg_vr,
-            vr_diff, vr_component, market_cap_percentile, mcap_component,
-            pf_in_range, pf_expected,
-            # INSERT VALUES
-            ticker, position_factor, vr_score_used, sector, sector_avg_vr,
-            vr_diff, vr_component, market_cap_percentile, mcap_component,
-            pf_in_range, pf_expected,
-        ]
-        cursor.execute(sql, params)
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+PF_SCORING_SPEC = MergeSpec(
+    table="PF_SCORING",
+    keys=("ticker",),
+    columns=(
+        "position_factor", "vr_score_used", "sector", "sector_avg_vr", "vr_diff",
+        "vr_component", "market_cap_percentile", "mcap_component", "pf_in_range", "pf_expected",
+    ),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
 
-def _upsert_scoring_pf(ticker: str, pf: Optional[float]) -> None:
-    """MERGE INTO SCORING — updates only the pf column, preserving existing tc/vr/hr."""
-    from app.services.snowflake import get_snowflake_connection
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                pf         = %s,
-                updated_at = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT
-                (ticker, pf, scored_at, updated_at)
-            VALUES
-                (%s, %s, CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP())
-        """
-        cursor.execute(sql, [ticker, pf, ticker, pf])
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+def _pf_scoring_row(result: PFResponse) -> Dict[str, Any]:
+    """All PF sub-components for PF_SCORING."""
+    bd  = result.pf_breakdown
+    val = result.validation
+    return {
+        "ticker":                result.ticker,
+        "position_factor":       result.position_factor,
+        "vr_score_used":         bd.vr_score              if bd else None,
+        "sector":                COMPANY_SECTORS.get(result.ticker.upper()),
+        "sector_avg_vr":         bd.sector_avg_vr         if bd else None,
+        "vr_diff":               bd.vr_diff               if bd else None,
+        "vr_component":          bd.vr_component          if bd else None,
+        "market_cap_percentile": bd.market_cap_percentile if bd else None,
+        "mcap_component":        bd.mcap_component        if bd else None,
+        "pf_in_range":           val.pf_in_range          if val else None,
+        "pf_expected":           val.pf_expected          if val else None,
+    }
 
 
 # =====================================================================
@@ -691,7 +648,8 @@ def _fetch_pf_row(ticker: str) -> Optional[PFScoringRecord]:
     Use POST /pf/portfolio to (re)compute and refresh the stored scores.
     """,
 )
-async def get_portfolio_pf():
+@offload
+def get_portfolio_pf():
     """Return last stored Position Factor for all 5 portfolio companies."""
     results = []
     for ticker in CS3_PORTFOLIO:
@@ -725,7 +683,8 @@ async def get_portfolio_pf():
     Use POST /pf/{ticker} to (re)compute and refresh the stored score.
     """,
 )
-async def get_pf(ticker: str):
+@offload
+def get_pf(ticker: str):
     """Return last stored Position Factor for one company."""
     from fastapi import HTTPException
     row = _fetch_pf_row(ticker.upper())
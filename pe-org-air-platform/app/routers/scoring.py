@@ -3,8 +3,9 @@ CS3 Dimensions Scoring API Router
 app/routers/scoring.py
 
 Endpoints:
-  POST /api/v1/scoring/{ticker}           — Score one company (full pipeline → Snowflake)
+  POST /api/v1/scoring/{ticker}           — Score one company (incremental pipeline → Snowflake)
   POST /api/v1/scoring/all                — Score all companies with CS2 data
+       ?dry_run=true                      — Only report which sources / dimensions are stale
   GET  /api/v1/scoring/{ticker}/matrix    — View mapping matrix (Table 1) from Snowflake
   GET  /api/v1/scoring/{ticker}/dimensions — View 7 dimension scores from Snowflake
   GET  /api/v1/scoring/{ticker}/full      — View matrix + dimensions + coverage
@@ -23,6 +24,8 @@ from datetime import datetime, timezone
 import logging
 import time
 
+from app.services.blocking import SCORING_LANE, offload, run_blocking
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["CS3 Dimensions Scoring"])
@@ -43,6 +46,7 @@ class ScoringResponse(BaseModel):
     coverage: Optional[Dict[str, Any]] = None
     evidence_sources: Optional[Dict[str, Any]] = None
     persisted: bool = False
+    staleness: Optional[Dict[str, Any]] = None
     duration_seconds: Optional[float] = None
     error: Optional[str] = None
 
@@ -100,17 +104,26 @@ class SummaryResponse(BaseModel):
     description="""
     Runs the CS3 Dimensions Scoring pipeline for every company that has a signal summary
     in `company_signal_summaries`. Returns individual results for each.
+
+    Each company is re-scored incrementally: only evidence sources whose fingerprint
+    changed are re-read, and only the dimensions they feed are rewritten.
+    With `dry_run=true` nothing is read or written — each result's `staleness` lists
+    the changed sources and stale dimensions.
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def score_all_companies():
+async def score_all_companies(dry_run: bool = False):
     """Score all companies."""
     start = time.time()
 
     try:
         from app.services.scoring_service import get_scoring_service
         service = get_scoring_service()
-        results = service.score_all_companies()
+        if dry_run:
+            reports = await run_blocking(service.check_all_staleness, lane=SCORING_LANE)
+            return _dry_run_response(reports, start)
+        # Tickers fan out across the portfolio executor; keep the event loop free
+        results = await run_blocking(service.score_all_companies, lane=SCORING_LANE)
 
         responses = []
         scored = 0
@@ -132,6 +145,7 @@ async def score_all_companies():
                     scored_at=r.get("scored_at"),
                     dimension_scores=r.get("dimension_scores"),
                     persisted=r.get("persisted", False),
+                    staleness=r.get("staleness"),
                 ))
 
         return AllScoringResponse(
@@ -163,19 +177,33 @@ async def score_all_companies():
     4. **Maps evidence** to 7 dimensions using weighted matrix (Task 5.0a)
     5. **Persists** mapping matrix + dimension scores to Snowflake
 
+    Steps 1-3 run only for sources whose fingerprint (signal `created_at`, chunk ETags,
+    board JSON hash, Glassdoor snapshot key) changed since the stored result; step 5
+    writes only the dimensions those sources feed. `force=true` re-runs everything;
+    `dry_run=true` only reports what is stale.
+
     **Prerequisite:** Company must have CS2 signal data (run signal scoring first).
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def score_company(ticker: str):
-    """Score one company — full CS3 pipeline."""
+@offload(lane=SCORING_LANE)
+def score_company(ticker: str, dry_run: bool = False, force: bool = False):
+    """Score one company — incremental CS3 pipeline."""
     start = time.time()
     ticker = ticker.upper()
 
     try:
         from app.services.scoring_service import get_scoring_service
         service = get_scoring_service()
-        result = service.score_company(ticker)
+        if dry_run:
+            staleness = service.check_staleness(ticker).to_dict()
+            return ScoringResponse(
+                ticker=ticker,
+                status="dry_run",
+                staleness=staleness,
+                duration_seconds=round(time.time() - start, 2),
+            )
+        result = service.score_company(ticker, force=force)
 
         return ScoringResponse(
             ticker=ticker,
@@ -187,6 +215,7 @@ async def score_company(ticker: str):
             coverage=result.get("coverage"),
             evidence_sources=result.get("evidence_sources"),
             persisted=result.get("persisted", False),
+            staleness=result.get("staleness"),
             duration_seconds=round(time.time() - start, 2),
         )
     except Exception as e:
@@ -220,7 +249,8 @@ async def score_company(ticker: str):
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def get_mapping_matrix(ticker: str):
+@offload
+def get_mapping_matrix(ticker: str):
     """View the mapping matrix from Snowflake."""
     ticker = ticker.upper()
 
@@ -268,7 +298,8 @@ async def get_mapping_matrix(ticker: str):
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def get_dimension_scores(ticker: str):
+@offload
+def get_dimension_scores(ticker: str):
     """View dimension scores from Snowflake."""
     ticker = ticker.upper()
 
@@ -311,7 +342,8 @@ async def get_dimension_scores(ticker: str):
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def get_full_scoring_view(ticker: str):
+@offload
+def get_full_scoring_view(ticker: str):
     """Full scoring view from Snowflake."""
     ticker = ticker.upper()
 
@@ -397,7 +429,8 @@ async def get_full_scoring_view(ticker: str):
     """,
     tags=["CS3 Dimensions Scoring"],
 )
-async def get_scoring_summary():
+@offload
+def get_scoring_summary():
     """View all companies' dimension scores."""
     try:
         from app.repositories.scoring_repository import get_scoring_repository
@@ -435,10 +468,11 @@ async def get_scoring_summary():
 @router.delete(
     "/scoring/{ticker}",
     summary="Delete scoring data for a company",
-    description="Removes mapping matrix and dimension scores from Snowflake.",
+    description="Removes mapping matrix, dimension scores and evidence fingerprints from Snowflake.",
     tags=["CS3 Dimensions Scoring"],
 )
-async def delete_scoring_data(ticker: str):
+@offload
+def delete_scoring_data(ticker: str):
     """Delete scoring data for a company."""
     ticker = ticker.upper()
 
@@ -448,11 +482,14 @@ async def delete_scoring_data(ticker: str):
 
         mapping_deleted = repo.delete_mapping_matrix(ticker)
         scores_deleted = repo.delete_dimension_scores(ticker)
+        # Without stored fingerprints the next scoring run is a full one
+        fingerprints_deleted = repo.delete_evidence_fingerprints(ticker)
 
         return {
             "ticker": ticker,
             "mapping_rows_deleted": mapping_deleted,
             "dimension_scores_deleted": scores_deleted,
+            "fingerprints_deleted": fingerprints_deleted,
             "message": f"Scoring data deleted for {ticker}",
         }
     except Exception as e:
@@ -464,6 +501,24 @@ async def delete_scoring_data(ticker: str):
 # Helpers
 # =====================================================================
 
+def _dry_run_response(reports: List[Dict[str, Any]], start: float) -> AllScoringResponse:
+    """AllScoringResponse listing each company's staleness report."""
+    results = [
+        ScoringResponse(ticker=r["ticker"], status="failed", error=r["error"]) if r.get("error")
+        else ScoringResponse(ticker=r["ticker"], status="dry_run", staleness=r)
+        for r in reports
+    ]
+    stale = sum(1 for r in reports if not r.get("error") and not r["up_to_date"])
+    logger.info(f"🔎 Dry run: {stale}/{len(reports)} companies have stale dimensions")
+    return AllScoringResponse(
+        status="dry_run",
+        companies_scored=0,
+        companies_failed=sum(1 for r in results if r.status == "failed"),
+        results=results,
+        duration_seconds=round(time.time() - start, 2),
+    )
+
+
 def _serialize_row(row: Dict) -> Dict:
     """Convert Decimal/datetime types to JSON-safe types."""
     from decimal import Decimal
@@ -499,7 +554,8 @@ def _safe_float(val) -> Optional[float]:
     description="Returns a downloadable markdown comparison report across all scored companies.",
     tags=["CS3 Reports"],
 )
-async def generate_portfolio_report():
+@offload
+def generate_portfolio_report():
     """Download portfolio summary as .md file."""
     from fastapi.responses import StreamingResponse
     import io
@@ -542,7 +598,8 @@ async def generate_portfolio_report():
     description="Returns a downloadable markdown scoring report for a single company.",
     tags=["CS3 Reports"],
 )
-async def generate_company_report_endpoint(ticker: str):
+@offload
+def generate_company_report_endpoint(ticker: str):
     """Download company scoring report as .md file."""
     from fastapi.responses import StreamingResponse
     import io
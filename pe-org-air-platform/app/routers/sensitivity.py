@@ -0,0 +1,194 @@
+"""
+routers/sensitivity.py — CS3 Scoring Sensitivity Analysis
+
+Endpoints:
+  POST /api/v1/scoring/sensitivity   — Monte Carlo + tornado analysis of Org-AI-R
+                                       over the Settings parameter ranges
+
+Per-company inputs are read, never computed: dimension scores from
+evidence_dimension_scores and TC from the SCORING table. A ticker with
+either missing is reported under `skipped` (run POST /tc-vr/{ticker}
+first). Every parameter sample is then scored for the whole portfolio by
+the vectorized batch kernel.
+
+Register in main.py BEFORE the CS3 Dimensions Scoring router, whose
+/api/v1/scoring/{ticker} routes would otherwise capture "sensitivity".
+"""
+
+import logging
+import time
+from dataclasses import asdict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+
+from app.config import settings
+from app.services.blocking import SCORING_LANE, offload
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/v1/scoring", tags=["CS3 Sensitivity Analysis"])
+
+
+# =====================================================================
+# Request / Response Models
+# =====================================================================
+
+class SensitivityRequest(BaseModel):
+    tickers: Optional[List[str]] = None   # default: the 5 CS3 companies
+    samples: int = Field(default=2000, ge=10)
+    seed: Optional[int] = None
+    weight_concentration: float = Field(default=200.0, ge=10.0, le=10000.0)
+    weight_shift: float = Field(default=0.05, gt=0.0, le=0.25)
+    tornado: bool = True
+
+
+class SensitivityResponse(BaseModel):
+    status: str  # "success", "partial" or "failed"
+    tickers: List[str]
+    skipped: Dict[str, str] = {}
+    samples_requested: int
+    samples_used: int
+    budget_capped: bool
+    seed: Optional[int] = None
+    parameter_ranges: List[Dict[str, Any]] = []
+    distributions: Dict[str, Dict[str, Dict[str, float]]] = {}
+    rank_stability: Dict[str, Any] = {}
+    tornado: Dict[str, List[Dict[str, Any]]] = {}
+    duration_seconds: float
+    error: Optional[str] = None
+
+
+# =====================================================================
+# Helpers
+# =====================================================================
+
+def _load_inputs(tickers: List[str]):
+    """Stored dimension scores + TC per ticker; tickers without both are skipped."""
+    from app.repositories.scoring_repository import get_scoring_repository
+    from app.routers.tc_vr_scoring import _fetch_scoring_row
+
+    wanted = set(tickers)
+    stored_dims: Dict[str, Dict[str, float]] = {}
+    skipped: Dict[str, str] = {}
+    try:
+        for row in get_scoring_repository().get_all_dimension_scores():
+            ticker = row["ticker"].upper()
+            if ticker in wanted and row.get("score") is not None:
+                stored_dims.setdefault(ticker, {})[row["dimension"]] = float(row["score"])
+    except Exception as e:
+        logger.warning(f"Failed to read stored dimension scores: {e}")
+        return _inputs_for([], {}, {}), {t: f"dimension scores unavailable: {e}" for t in tickers}
+
+    loaded, dims, tcs = [], {}, {}
+    for ticker in tickers:
+        if ticker not in stored_dims:
+            skipped[ticker] = "no stored dimension scores"
+            continue
+        try:
+            row = _fetch_scoring_row(ticker)
+        except Exception as e:
+            logger.warning(f"[{ticker}] Failed to fetch SCORING row: {e}")
+            skipped[ticker] = f"talent concentration unavailable: {e}"
+            continue
+        if row is None or row.tc is None:
+            skipped[ticker] = "no stored talent concentration"
+            continue
+        loaded.append(ticker)
+        dims[ticker], tcs[ticker] = stored_dims[ticker], float(row.tc)
+
+    return _inputs_for(loaded, dims, tcs), skipped
+
+
+def _inputs_for(tickers: List[str], dims: Dict[str, Dict[str, float]], tcs: Dict[str, float]):
+    from app.routers.orgair_scoring import COMPANY_SECTORS, MARKET_CAP_PERCENTILES, SECTOR_TIMING
+    from app.scoring.batch_scoring import dimension_matrix
+    from app.scoring.sensitivity import PortfolioInputs
+
+    sectors = [COMPANY_SECTORS.get(t, "") for t in tickers]
+    return PortfolioInputs(
+        tickers=list(tickers),
+        dimension_scores=dimension_matrix([dims[t] for t in tickers]),
+        talent_concentration=np.array([tcs[t] for t in tickers], dtype=float),
+        sectors=sectors,
+        market_cap_percentile=np.array([MARKET_CAP_PERCENTILES.get(t, 0.50) for t in tickers]),
+        timing_factor=np.array([SECTOR_TIMING.get(s, 1.0) for s in sectors]),
+    )
+
+
+# =====================================================================
+# POST /api/v1/scoring/sensitivity
+# =====================================================================
+
+@router.post(
+    "/sensitivity",
+    response_model=SensitivityResponse,
+    summary="Monte Carlo sensitivity of Org-AI-R to the scoring parameters",
+    description="""
+    Samples α (ALPHA_VR_WEIGHT), β (BETA_SYNERGY_WEIGHT), λ (LAMBDA_PENALTY),
+    δ (DELTA_POSITION) uniformly within their Settings bounds and the W_*
+    dimension weights from a Dirichlet around the defaults, re-scores the
+    portfolio for every sample, and returns:
+
+    - per-company Org-AI-R / V^R / H^R distributions (mean, std, percentiles)
+    - rank stability (rank probabilities, Kendall τ vs the baseline order)
+    - tornado data (one-at-a-time low/high swing per parameter)
+
+    `samples` is capped at SENSITIVITY_MAX_SAMPLES. Pass `seed` for
+    reproducible results.
+    """,
+)
+@offload(lane=SCORING_LANE)
+def run_sensitivity_analysis(request: Optional[SensitivityRequest] = None):
+    """Run the sensitivity analysis over the requested tickers."""
+    from app.routers.orgair_scoring import CS3_PORTFOLIO
+    from app.scoring.sensitivity import ParameterSpace, run_sensitivity
+
+    start = time.time()
+    request = request or SensitivityRequest()
+    tickers = [t.upper() for t in (request.tickers or CS3_PORTFOLIO)]
+    samples = min(request.samples, settings.SENSITIVITY_MAX_SAMPLES)
+    capped = samples < request.samples
+
+    logger.info(f"🎲 Sensitivity analysis: {len(tickers)} tickers × {samples} samples"
+                f"{' (capped by budget)' if capped else ''}")
+
+    inputs, skipped = _load_inputs(tickers)
+    base = dict(
+        tickers=inputs.tickers,
+        skipped=skipped,
+        samples_requested=request.samples,
+        samples_used=samples,
+        budget_capped=capped,
+        seed=request.seed,
+    )
+    if not inputs.tickers:
+        return SensitivityResponse(
+            status="failed",
+            error="No ticker had stored dimension scores and TC to analyse",
+            duration_seconds=round(time.time() - start, 2),
+            **base,
+        )
+
+    space = ParameterSpace.from_settings(
+        weight_concentration=request.weight_concentration,
+        weight_shift=request.weight_shift,
+    )
+    result = run_sensitivity(inputs, space, samples, seed=request.seed, tornado=request.tornado)
+
+    for ticker, dist in result.distributions.items():
+        org = dist["org_air"]
+        logger.info(f"  {ticker:<6} Org-AI-R {org['baseline']:6.2f}  "
+                    f"p05–p95 [{org['p05']:6.2f}, {org['p95']:6.2f}]  std {org['std']:.3f}")
+
+    payload = asdict(result)
+    payload.pop("samples")
+    payload.pop("seed")
+    return SensitivityResponse(
+        status="partial" if skipped else "success",
+        duration_seconds=round(time.time() - start, 2),
+        **payload,
+        **base,
+    )
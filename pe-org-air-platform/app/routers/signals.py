@@ -39,6 +39,7 @@ from app.services.leadership_service import get_leadership_service
 from app.services.patent_signal_service import get_patent_signal_service
 from app.services.s3_storage import get_s3_service
 from app.services.tech_signal_service import get_tech_signal_service
+from app.services.blocking import SCORING_LANE, offload, run_blocking, run_coroutine_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -191,7 +192,8 @@ def _get_company_or_404(ticker: str) -> dict:
     summary="Delete all signals for all companies",
     description="Deletes all signal records from Snowflake and all signal-related files from S3.",
 )
-async def reset_all_signals():
+@offload
+def reset_all_signals():
     """Delete all signals for all companies from Snowflake and S3."""
     repo = get_signal_repository()
     company_repo = CompanyRepository()
@@ -240,7 +242,8 @@ async def reset_all_signals():
         "**S3 prefixes cleared:** signals/jobs/{TICKER}/, signals/patents/{TICKER}/, signals/techstack/{TICKER}/"
     ),
 )
-async def reset_signals_by_ticker(ticker: str):
+@offload
+def reset_signals_by_ticker(ticker: str):
     """Delete all signals for a specific company."""
     ticker = ticker.upper()
     company = _get_company_or_404(ticker)
@@ -290,7 +293,8 @@ async def reset_signals_by_ticker(ticker: str):
     summary="Delete signals by category for a company",
     description="Deletes signal records for a specific category from Snowflake and S3.",
 )
-async def reset_signals_by_category(ticker: str, category: str):
+@offload
+def reset_signals_by_category(ticker: str, category: str):
     """Delete signals for a company filtered by category."""
     if category not in VALID_CATEGORIES:
         raise HTTPException(
@@ -341,7 +345,8 @@ async def reset_signals_by_category(ticker: str, category: str):
         "Returns a task_id to check status via GET /api/v1/signals/tasks/{task_id}"
     ),
 )
-async def collect_signals(request: CollectionRequest, background_tasks: BackgroundTasks):
+@offload
+def collect_signals(request: CollectionRequest, background_tasks: BackgroundTasks):
     """Trigger signal collection for a company."""
     task_id = str(uuid4())
     _task_store[task_id] = {
@@ -358,8 +363,12 @@ async def collect_signals(request: CollectionRequest, background_tasks: Backgrou
         "error": None,
     }
 
+    # Runs after the response on its own loop in the scoring lane, so the
+    # repository calls and collectors inside never block the request loop
     background_tasks.add_task(
+        run_coroutine_blocking,
         run_signal_collection,
+        lane=SCORING_LANE,
         task_id=task_id,
         company_id=request.company_id,
         categories=request.categories,
@@ -448,7 +457,8 @@ async def run_signal_collection(
     summary="List signals with details (filterable)",
     description="List all signals with optional filters by category, ticker, min_score, and limit.",
 )
-async def list_signals(
+@offload
+def list_signals(
     category: Optional[str] = Query(None, description="Filter by category"),
     ticker: Optional[str] = Query(None, description="Filter by company ticker"),
     min_score: Optional[float] = Query(None, ge=0, le=100, description="Minimum score"),
@@ -507,7 +517,9 @@ async def score_hiring(ticker: str, force_refresh: bool = False):
     start = time.time()
     try:
         service = get_job_signal_service()
-        result = await service.analyze_company(ticker.upper(), force_refresh=force_refresh)
+        result = await run_coroutine_blocking(
+            service.analyze_company, ticker.upper(), force_refresh=force_refresh, lane=SCORING_LANE
+        )
         return SingleSignalResponse(
             ticker=ticker.upper(),
             category="technology_hiring",
@@ -545,7 +557,9 @@ async def score_digital_presence(ticker: str, force_refresh: bool = False):
     start = time.time()
     try:
         service = get_tech_signal_service()
-        result = await service.analyze_company(ticker.upper(), force_refresh=force_refresh)
+        result = await run_coroutine_blocking(
+            service.analyze_company, ticker.upper(), force_refresh=force_refresh, lane=SCORING_LANE
+        )
         return SingleSignalResponse(
             ticker=ticker.upper(),
             category="digital_presence",
@@ -583,7 +597,9 @@ async def score_innovation(ticker: str, years_back: int = 5):
     start = time.time()
     try:
         service = get_patent_signal_service()
-        result = await service.analyze_company(ticker.upper(), years_back=years_back)
+        result = await run_coroutine_blocking(
+            service.analyze_company, ticker.upper(), years_back=years_back, lane=SCORING_LANE
+        )
         return SingleSignalResponse(
             ticker=ticker.upper(),
             category="innovation_activity",
@@ -623,7 +639,9 @@ async def score_leadership(ticker: str):
     start = time.time()
     try:
         service = get_leadership_service()
-        result = await service.analyze_company(ticker.upper())
+        result = await run_coroutine_blocking(
+            service.analyze_company, ticker.upper(), lane=SCORING_LANE
+        )
         return SingleSignalResponse(
             ticker=ticker.upper(),
             category="leadership_signals",
@@ -664,7 +682,7 @@ async def score_all_signals(ticker: str, force_refresh: bool = False):
     overall_start = time.time()
     ticker = ticker.upper()
 
-    company = CompanyRepository().get_by_ticker(ticker)
+    company = await run_blocking(CompanyRepository().get_by_ticker, ticker)
     company_name = company.get("name", ticker) if company else ticker
 
     results = {}
@@ -696,7 +714,8 @@ async def score_all_signals(ticker: str, force_refresh: bool = False):
     # Persist summary
     if company:
         try:
-            get_signal_repository().upsert_summary(
+            await run_blocking(
+                get_signal_repository().upsert_summary,
                 company_id=str(company["id"]),
                 ticker=ticker,
                 hiring_score=scores["technology_hiring"],
@@ -732,7 +751,8 @@ async def score_all_signals(ticker: str, force_refresh: bool = False):
     summary="Get current scores for a company",
     description="Get the latest stored scores for all signal categories (does NOT trigger new collection).",
 )
-async def get_score_status(ticker: str):
+@offload
+def get_score_status(ticker: str):
     """Get current signal scores for a company."""
     ticker = ticker.upper()
     company = _get_company_or_404(ticker)
@@ -21,6 +21,10 @@ import time
 from fastapi.responses import StreamingResponse
 import io
 
+from app.repositories.bulk import BulkWriter, MergeSpec
+from app.services.portfolio_executor import TickerOutcome, get_portfolio_executor, stage_timer
+from app.services.blocking import SCORING_LANE, offload
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/scoring", tags=["CS3 TC + V^R Scoring"])
@@ -107,6 +111,7 @@ class PortfolioTCVRResponse(BaseModel):
     results: List[TCVRResponse]
     summary_table: List[Dict[str, Any]]
     duration_seconds: float
+    stage_timings: Optional[Dict[str, Dict[str, float]]] = None
 
 
 # =====================================================================
@@ -138,19 +143,33 @@ def _compute_tc_vr(ticker: str) -> TCVRResponse:
         for ds in dim_scores_list:
             logger.info(f"  {ds['dimension']:25s} = {ds['score']:6.2f}")
 
+        from app.services.s3_storage import get_s3_service
+        s3 = get_s3_service()
+
+        # Reuse the stored TC+V^R result while dimensions and snapshots are unchanged
+        from app.services.scoring_cache import get_scoring_stage_cache, stage_digest
+        stage_cache = get_scoring_stage_cache()
+        with stage_timer("tc_vr_fingerprint"):
+            digest = stage_digest("tc_vr", _tc_vr_stage_inputs(ticker, base_result, s3))
+        cached = stage_cache.get("tc_vr", ticker, digest)
+        if cached is not None:
+            logger.info(f"[{ticker}] ♻️  Inputs unchanged — reusing TC+V^R stage {digest[:12]}")
+            response = TCVRResponse.model_validate(cached)
+            response.duration_seconds = round(time.time() - start, 2)
+            return response
+
         # ---- 2. Load job postings from S3 ----
         from app.scoring.talent_concentration import TalentConcentrationCalculator
         tc_calc = TalentConcentrationCalculator()
 
-        from app.services.s3_storage import get_s3_service
-        s3 = get_s3_service()
-
         # Load jobs
-        job_postings = _load_jobs_s3(ticker, s3)
+        with stage_timer("jobs_s3"):
+            job_postings = _load_jobs_s3(ticker, s3)
         logger.info(f"[{ticker}] Loaded {len(job_postings)} job postings from S3")
 
         # Analyze jobs
-        job_analysis = tc_calc.analyze_job_postings(job_postings)
+        with stage_timer("job_analysis"):
+            job_analysis = tc_calc.analyze_job_postings(job_postings)
         logger.info(f"[{ticker}] Job Analysis:")
         logger.info(f"  Total AI jobs:  {job_analysis.total_ai_jobs}")
         logger.info(f"  Senior AI jobs: {job_analysis.senior_ai_jobs}")
@@ -159,11 +178,13 @@ def _compute_tc_vr(ticker: str) -> TCVRResponse:
         logger.info(f"  Unique skills:  {len(job_analysis.unique_skills)} → {sorted(job_analysis.unique_skills)[:10]}")
 
         # ---- 3. Load Glassdoor reviews from S3 ----
-        glassdoor_reviews = tc_calc.load_glassdoor_reviews(ticker, s3)
+        with stage_timer("glassdoor_s3"):
+            glassdoor_reviews = tc_calc.load_glassdoor_reviews(ticker, s3)
         logger.info(f"[{ticker}] Loaded {len(glassdoor_reviews)} Glassdoor reviews from S3")
 
-        indiv_mentions, rev_count = tc_calc.count_individual_mentions(glassdoor_reviews)
-        ai_mentions, _ = tc_calc.count_ai_mentions(glassdoor_reviews)
+        with stage_timer("glassdoor_analysis"):
+            indiv_mentions, rev_count = tc_calc.count_individual_mentions(glassdoor_reviews)
+            ai_mentions, _ = tc_calc.count_ai_mentions(glassdoor_reviews)
         logger.info(f"[{ticker}] Glassdoor: {indiv_mentions} individual mentions, "
                      f"{ai_mentions} AI mentions out of {rev_count} reviews")
 
@@ -219,7 +240,7 @@ def _compute_tc_vr(ticker: str) -> TCVRResponse:
 
         logger.info("=" * 60)
 
-        return TCVRResponse(
+        response = TCVRResponse(
             ticker=ticker,
             status="success",
             talent_concentration=float(tc),
@@ -249,6 +270,8 @@ def _compute_tc_vr(ticker: str) -> TCVRResponse:
             duration_seconds=round(time.time() - start, 2),
             scored_at=datetime.now(timezone.utc).isoformat(),
         )
+        stage_cache.put("tc_vr", ticker, digest, response.model_dump(mode="json"))
+        return response
 
     except Exception as e:
         logger.error(f"TC+VR scoring failed for {ticker}: {e}", exc_info=True)
@@ -260,14 +283,38 @@ def _compute_tc_vr(ticker: str) -> TCVRResponse:
         )
 
 
+def _tc_vr_stage_inputs(ticker: str, base_result: Dict[str, Any], s3) -> Dict[str, Any]:
+    """Content-address the TC+V^R stage: upstream dimensions, S3 snapshots, constants."""
+    from app.scoring import talent_concentration, vr_calculator
+    from app.services.scoring_cache import constants_fingerprint, module_constants
+
+    return {
+        "dimensions": base_result.get("stage_digest") or base_result.get("dimension_scores"),
+        "jobs": _snapshot_version(s3, f"signals/jobs/{ticker}/"),
+        "glassdoor": _snapshot_version(s3, f"glassdoor_signals/raw/{ticker}/"),
+        "glassdoor_flat": s3.get_etag(f"glassdoor_signals/raw/{ticker}_raw.json"),
+        "constants": constants_fingerprint(
+            module_constants(talent_concentration),
+            module_constants(vr_calculator),
+            EXPECTED_RANGES,
+        ),
+    }
+
+
+def _snapshot_version(s3, prefix: str) -> Optional[List[str]]:
+    """(key, ETag) of the latest snapshot — older snapshots are immutable, so this versions the prefix."""
+    latest = s3.latest_object(prefix)
+    return [latest.key, latest.etag] if latest else None
+
+
 def _load_jobs_s3(ticker: str, s3) -> list:
     """Load job postings from S3 — same logic as vr_scoring_service.py."""
     import json
     prefix = f"signals/jobs/{ticker}/"
     try:
-        keys = s3.list_files(prefix)
-        for key in sorted(keys, reverse=True):
-            raw = s3.get_file(key)
+        for obj in s3.iter_newest(prefix):
+            key = obj.key
+            raw = s3.get_file(key, obj.etag)
             if raw is None:
                 continue
             data = json.loads(raw)
@@ -282,6 +329,24 @@ def _load_jobs_s3(ticker: str, s3) -> list:
     return []
 
 
+def _score_and_save_tc_vr(ticker: str) -> TCVRResponse:
+    """Portfolio worker: compute TC + V^R for one ticker and persist it on success."""
+    result = _compute_tc_vr(ticker)
+    if result.status == "success":
+        _save_tc_vr_result(result)
+    return result
+
+
+def _failed_tc_vr(outcome: TickerOutcome) -> TCVRResponse:
+    """Map a crashed or timed-out portfolio ticker to a failed response."""
+    return TCVRResponse(
+        ticker=outcome.ticker,
+        status="failed",
+        error=outcome.error,
+        duration_seconds=outcome.duration_seconds,
+    )
+
+
 # =====================================================================
 # POST /api/v1/scoring/tc-vr/portfolio — Score all 5 CS3 companies
 # =====================================================================
@@ -306,18 +371,10 @@ async def score_portfolio_tc_vr():
     logger.info("🚀 TC + V^R PORTFOLIO SCORING — 5 COMPANIES")
     logger.info("=" * 70)
 
-    results = []
-    scored = 0
-    failed = 0
-
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_tc_vr(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-            _save_tc_vr_result(result)
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _score_and_save_tc_vr)
+    results = run.results(_failed_tc_vr)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
 
     # Build summary table
     summary = []
@@ -369,6 +426,7 @@ async def score_portfolio_tc_vr():
         results=results,
         summary_table=summary,
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
 
 
@@ -638,17 +696,10 @@ async def download_portfolio_report():
     logger.info("📝 Generating downloadable TC + V^R Portfolio Report")
 
     # Run portfolio scoring
-    results = []
-    scored = 0
-    failed = 0
-
-    for ticker in CS3_PORTFOLIO:
-        result = _compute_tc_vr(ticker)
-        results.append(result)
-        if result.status == "success":
-            scored += 1
-        else:
-            failed += 1
+    run = await get_portfolio_executor().arun(CS3_PORTFOLIO, _compute_tc_vr)
+    results = run.results(_failed_tc_vr)
+    scored = sum(1 for r in results if r.status == "success")
+    failed = len(results) - scored
 
     portfolio = PortfolioTCVRResponse(
         status="success" if failed == 0 else "partial",
@@ -657,6 +708,7 @@ async def download_portfolio_report():
         results=results,
         summary_table=[],
         duration_seconds=round(time.time() - start, 2),
+        stage_timings=run.timings,
     )
 
     # Generate markdown content
@@ -698,7 +750,8 @@ async def download_portfolio_report():
     7. Save result to S3 and upsert TC + V^R into Snowflake SCORING table
     """,
 )
-async def score_tc_vr(ticker: str):
+@offload(lane=SCORING_LANE)
+def score_tc_vr(ticker: str):
     """Score one company — TC + V^R. Saves result to S3 + Snowflake SCORING table."""
     result = _compute_tc_vr(ticker.upper())
     if result.status == "success":
@@ -723,217 +776,102 @@ def _save_tc_vr_result(result: TCVRResponse) -> None:
     except Exception as e:
         logger.warning(f"[{ticker}] S3 save failed (non-fatal): {e}")
 
+    # SCORING + TC_SCORING + VR_SCORING — one transaction
+    tc = result.talent_concentration
+    vr = result.vr_result.vr_score if result.vr_result else None
     try:
-        tc = result.talent_concentration
-        vr = result.vr_result.vr_score if result.vr_result else None
-        _upsert_scoring_table(ticker, tc=tc, vr=vr)
-        logger.info(f"[{ticker}] SCORING table upserted: TC={tc}, VR={vr}")
+        with BulkWriter() as writer:
+            writer.stage(SCORING_SPEC, [{"ticker": ticker, "tc": tc, "vr": vr, "pf": None, "hr": None}])
+            writer.stage(TC_SCORING_SPEC, [_tc_scoring_row(result)])
+            writer.stage(VR_SCORING_SPEC, [_vr_scoring_row(result)])
+        logger.info(f"[{ticker}] SCORING, TC_SCORING, VR_SCORING tables upserted: TC={tc}, VR={vr}")
     except Exception as e:
         logger.warning(f"[{ticker}] Snowflake SCORING upsert failed (non-fatal): {e}")
 
-    # TC_SCORING — breakdown detail table
-    try:
-        _upsert_tc_scoring(result)
-        logger.info(f"[{ticker}] TC_SCORING table upserted")
-    except Exception as e:
-        logger.warning(f"[{ticker}] TC_SCORING upsert failed (non-fatal): {e}")
 
-    # VR_SCORING — breakdown detail table
-    try:
-        _upsert_vr_scoring(result)
-        logger.info(f"[{ticker}] VR_SCORING table upserted")
-    except Exception as e:
-        logger.warning(f"[{ticker}] VR_SCORING upsert failed (non-fatal): {e}")
+# SCORING — updates only the provided columns, preserving existing values
+SCORING_SPEC = MergeSpec(
+    table="SCORING",
+    keys=("ticker",),
+    columns=("tc", "vr", "pf", "hr"),
+    coalesce=True,
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
+TC_SCORING_SPEC = MergeSpec(
+    table="TC_SCORING",
+    keys=("ticker",),
+    columns=(
+        "talent_concentration", "leadership_ratio", "team_size_factor", "skill_concentration",
+        "individual_factor", "total_ai_jobs", "senior_ai_jobs", "mid_ai_jobs", "entry_ai_jobs",
+        "unique_skills_count", "individual_mentions", "review_count", "ai_mentions",
+        "tc_in_range", "tc_expected",
+    ),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
 
-def _upsert_tc_scoring(result: TCVRResponse) -> None:
-    """MERGE all TC sub-components into TC_SCORING."""
-    from app.services.snowflake import get_snowflake_connection
-    ticker = result.ticker
-    tc = result.talent_concentration
+VR_SCORING_SPEC = MergeSpec(
+    table="VR_SCORING",
+    keys=("ticker",),
+    columns=(
+        "vr_score", "weighted_dim_score", "talent_risk_adj", "tc_used",
+        "dim_data_infrastructure", "dim_ai_governance", "dim_technology_stack",
+        "dim_talent_skills", "dim_leadership_vision", "dim_use_case_portfolio",
+        "dim_culture_change", "vr_in_range", "vr_expected",
+    ),
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()", "updated_at": "CURRENT_TIMESTAMP()"},
+)
+
+
+def _tc_scoring_row(result: TCVRResponse) -> Dict[str, Any]:
+    """All TC sub-components for TC_SCORING."""
     bd = result.tc_breakdown
     ja = result.job_analysis
     val = result.validation
-
-    leadership_ratio    = bd.leadership_ratio    if bd else None
-    team_size_factor    = bd.team_size_factor    if bd else None
-    skill_concentration = bd.skill_concentration if bd else None
-    individual_factor   = bd.individual_factor   if bd else None
-
-    total_ai_jobs     = ja.total_ai_jobs         if ja else None
-    senior_ai_jobs    = ja.senior_ai_jobs        if ja else None
-    mid_ai_jobs       = ja.mid_ai_jobs           if ja else None
-    entry_ai_jobs     = ja.entry_ai_jobs         if ja else None
-    unique_skills_cnt = len(ja.unique_skills)    if ja else None
-
-    individual_mentions = result.individual_mentions
-    review_count        = result.review_count
-    ai_mentions         = result.ai_mentions
-
-    tc_in_range = val.tc_in_range if val else None
-    tc_expected = val.tc_expected if val else None
-
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO TC_SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                talent_concentration  = %s,
-                leadership_ratio      = %s,
-                team_size_factor      = %s,
-                skill_concentration   = %s,
-                individual_factor     = %s,
-                total_ai_jobs         = %s,
-                senior_ai_jobs        = %s,
-                mid_ai_jobs           = %s,
-                entry_ai_jobs         = %s,
-                unique_skills_count   = %s,
-                individual_mentions   = %s,
-                review_count          = %s,
-                ai_mentions           = %s,
-                tc_in_range           = %s,
-                tc_expected           = %s,
-                updated_at            = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT (
-                ticker, talent_concentration, leadership_ratio, team_size_factor,
-                skill_concentration, individual_factor, total_ai_jobs, senior_ai_jobs,
-                mid_ai_jobs, entry_ai_jobs, unique_skills_count, individual_mentions,
-                review_count, ai_mentions, tc_in_range, tc_expected, scored_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP()
-            )
-        """
-        params = [
-            # USING clause
-            ticker,
-            # UPDATE SET
-            tc, leadership_ratio, team_size_factor, skill_concentration, individual_factor,
-            total_ai_jobs, senior_ai_jobs, mid_ai_jobs, entry_ai_jobs, unique_skills_cnt,
-            individual_mentions, review_count, ai_mentions, tc_in_range, tc_expected,
-            # INSERT VALUES
-            ticker, tc, leadership_ratio, team_size_factor, skill_concentration,
-            individual_factor, total_ai_jobs, senior_ai_jobs, mid_ai_jobs, entry_ai_jobs,
-            unique_skills_cnt, individual_mentions, review_count, ai_mentions,
-            tc_in_range, tc_expected,
-        ]
-        cursor.execute(sql, params)
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
-
-
-def _upsert_vr_scoring(result: TCVRResponse) -> None:
-    """MERGE all VR sub-components into VR_SCORING."""
-    from app.services.snowflake import get_snowflake_connection
-    ticker = result.ticker
-    vr_r   = result.vr_result
-    val    = result.validation
-    dims   = result.dimension_scores or {}
-
-    vr_score          = vr_r.vr_score          if vr_r else None
-    weighted_dim_score= vr_r.weighted_dim_score if vr_r else None
-    talent_risk_adj   = vr_r.talent_risk_adj    if vr_r else None
-    tc_used           = result.talent_concentration
-
-    dim_data_infra    = dims.get("data_infrastructure")
-    dim_ai_gov        = dims.get("ai_governance")
-    dim_tech_stack    = dims.get("technology_stack")
-    dim_talent        = dims.get("talent_skills")
-    dim_leadership    = dims.get("leadership_vision")
-    dim_use_case      = dims.get("use_case_portfolio")
-    dim_culture       = dims.get("culture_change")
-
-    vr_in_range = val.vr_in_range if val else None
-    vr_expected = val.vr_expected if val else None
-
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO VR_SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                vr_score                = %s,
-                weighted_dim_score      = %s,
-                talent_risk_adj         = %s,
-                tc_used                 = %s,
-                dim_data_infrastructure = %s,
-                dim_ai_governance       = %s,
-                dim_technology_stack    = %s,
-                dim_talent_skills       = %s,
-                dim_leadership_vision   = %s,
-                dim_use_case_portfolio  = %s,
-                dim_culture_change      = %s,
-                vr_in_range             = %s,
-                vr_expected             = %s,
-                updated_at              = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT (
-                ticker, vr_score, weighted_dim_score, talent_risk_adj, tc_used,
-                dim_data_infrastructure, dim_ai_governance, dim_technology_stack,
-                dim_talent_skills, dim_leadership_vision, dim_use_case_portfolio,
-                dim_culture_change, vr_in_range, vr_expected, scored_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-                CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP()
-            )
-        """
-        params = [
-            # USING clause
-            ticker,
-            # UPDATE SET
-            vr_score, weighted_dim_score, talent_risk_adj, tc_used,
-            dim_data_infra, dim_ai_gov, dim_tech_stack, dim_talent,
-            dim_leadership, dim_use_case, dim_culture, vr_in_range, vr_expected,
-            # INSERT VALUES
-            ticker, vr_score, weighted_dim_score, talent_risk_adj, tc_used,
-            dim_data_infra, dim_ai_gov, dim_tech_stack, dim_talent,
-            dim_leadership, dim_use_case, dim_culture, vr_in_range, vr_expected,
-        ]
-        cursor.execute(sql, params)
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
-
-
-def _upsert_scoring_table(
-    ticker: str,
-    tc: Optional[float] = None,
-    vr: Optional[float] = None,
-    pf: Optional[float] = None,
-    hr: Optional[float] = None,
-) -> None:
-    """MERGE INTO SCORING — updates only the provided columns, preserving existing values."""
-    from app.services.snowflake import get_snowflake_connection
-    conn = get_snowflake_connection()
-    try:
-        cursor = conn.cursor()
-        sql = """
-            MERGE INTO SCORING AS tgt
-            USING (SELECT %s AS ticker) AS src
-            ON tgt.ticker = src.ticker
-            WHEN MATCHED THEN UPDATE SET
-                tc         = COALESCE(%s, tgt.tc),
-                vr         = COALESCE(%s, tgt.vr),
-                pf         = COALESCE(%s, tgt.pf),
-                hr         = COALESCE(%s, tgt.hr),
-                updated_at = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT
-                (ticker, tc, vr, pf, hr, scored_at, updated_at)
-            VALUES
-                (%s, %s, %s, %s, %s, CURRENT_TIMESTAMP(), CURRENT_TIMESTAMP())
-        """
-        cursor.execute(sql, [ticker, tc, vr, pf, hr, ticker, tc, vr, pf, hr])
-        conn.commit()
-        cursor.close()
-    finally:
-        conn.close()
+    return {
+        "ticker":               result.ticker,
+        "talent_concentration": result.talent_concentration,
+        "leadership_ratio":     bd.leadership_ratio    if bd else None,
+        "team_size_factor":     bd.team_size_factor    if bd else None,
+        "skill_concentration":  bd.skill_concentration if bd else None,
+        "individual_factor":    bd.individual_factor   if bd else None,
+        "total_ai_jobs":        ja.total_ai_jobs       if ja else None,
+        "senior_ai_jobs":       ja.senior_ai_jobs      if ja else None,
+        "mid_ai_jobs":          ja.mid_ai_jobs         if ja else None,
+        "entry_ai_jobs":        ja.entry_ai_jobs       if ja else None,
+        "unique_skills_count":  len(ja.unique_skills)  if ja else None,
+        "individual_mentions":  result.individual_mentions,
+        "review_count":         result.review_count,
+        "ai_mentions":          result.ai_mentions,
+        "tc_in_range":          val.tc_in_range if val else None,
+        "tc_expected":          val.tc_expected if val else None,
+    }
+
+
+def _vr_scoring_row(result: TCVRResponse) -> Dict[str, Any]:
+    """All VR sub-components for VR_SCORING."""
+    vr_r = result.vr_result
+    val  = result.validation
+    dims = result.dimension_scores or {}
+    return {
+        "ticker":                  result.ticker,
+        "vr_score":                vr_r.vr_score           if vr_r else None,
+        "weighted_dim_score":      vr_r.weighted_dim_score if vr_r else None,
+        "talent_risk_adj":         vr_r.talent_risk_adj    if vr_r else None,
+        "tc_used":                 result.talent_concentration,
+        "dim_data_infrastructure": dims.get("data_infrastructure"),
+        "dim_ai_governance":       dims.get("ai_governance"),
+        "dim_technology_stack":    dims.get("technology_stack"),
+        "dim_talent_skills":       dims.get("talent_skills"),
+        "dim_leadership_vision":   dims.get("leadership_vision"),
+        "dim_use_case_portfolio":  dims.get("use_case_portfolio"),
+        "dim_culture_change":      dims.get("culture_change"),
+        "vr_in_range":             val.vr_in_range if val else None,
+        "vr_expected":             val.vr_expected if val else None,
+    }
 
 
 # =====================================================================
@@ -1002,7 +940,8 @@ def _fetch_scoring_row(ticker: str) -> Optional[ScoringRecord]:
     Use POST /tc-vr/portfolio to (re)compute and refresh the stored scores.
     """,
 )
-async def get_portfolio_tc_vr():
+@offload
+def get_portfolio_tc_vr():
     """Return last stored TC + V^R for all 5 portfolio companies."""
     results = []
     for ticker in CS3_PORTFOLIO:
@@ -1036,7 +975,8 @@ async def get_portfolio_tc_vr():
     Use POST /tc-vr/{ticker} to (re)compute and refresh the stored scores.
     """,
 )
-async def get_tc_vr(ticker: str):
+@offload
+def get_tc_vr(ticker: str):
     """Return last stored TC + V^R for one company."""
     from fastapi import HTTPException
     row = _fetch_scoring_row(ticker.upper())
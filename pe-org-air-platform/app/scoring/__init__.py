@@ -3,7 +3,7 @@ scoring/ — CS3 AI Scoring Engine
 
 Modules:
     utils.py                  - Decimal utilities (Task 5.1)
-    evidence_mapper.py        - Evidence-to-Dimension Mapper (Task 5.0a)
+    evidence_mapper.py        - Evidence-to-Dimension Mapper (Task 5.0a), scalar + N-company matrix form
     rubric_scorer.py          - Rubric-Based Scorer (Task 5.0b)
     talent_concentration.py   - Talent Concentration Calculator (Task 5.0e)
     vr_calculator.py          - V^R (Venture Readiness) Calculator (Task 5.2)
@@ -12,5 +12,8 @@ Modules:
     synergy_calculator.py     - Synergy Calculator (Task 6.2)
     confidence_calculator.py  - SEM-based Confidence Calculator (Task 6.3)
     orgair_calculator.py      - Org-AI-R Composite Calculator (Task 6.4)
+    batch_kernel.py           - Vectorized V^R / PF / H^R / Synergy / Org-AI-R / CI kernels
+    batch_scoring.py          - N-company / N-scenario scoring in one call
+    sensitivity.py            - Monte Carlo / tornado sensitivity over the scoring parameters
     integration_service.py    - Full Pipeline Integration Service (Task 6.0b)
 """
\ No newline at end of file
@@ -0,0 +1,267 @@
+"""
+Batch Scoring Kernel — vectorized V^R / PF / H^R / Synergy / Org-AI-R / CI
+app/scoring/batch_kernel.py
+
+NumPy implementations of the CS3 formulas over arrays of companies (or
+sensitivity scenarios).  The scalar calculators are thin wrappers that
+call these kernels with N = 1, so there is one implementation of each
+formula.
+
+Precision contract:
+  The calculators historically computed in Decimal and quantized their
+  outputs (2 dp scores, 4 dp factors).  The kernels compute in float64 and
+  apply the same quantization steps, at the same points in the chain,
+  with the same rounding modes:
+    - ROUND_HALF_EVEN  for Decimal.quantize() defaults
+    - ROUND_HALF_UP    for utils.weighted_std_dev / coefficient_of_variation
+  Float noise is removed before rounding (values are snapped to 1e-9 of
+  the quantum) so that exact decimal ties round the way Decimal does.
+  tests/test_batch_kernel.py pins the results to the original Decimal code.
+
+All kernels accept scalars or arrays that broadcast together (so formula
+parameters can be (S, 1) columns against N companies); dimension scores
+are an (N, K) array where NaN marks a missing dimension.
+"""
+
+from dataclasses import dataclass
+import numpy as np
+
+# Digits (of the quantum) kept when snapping float noise before rounding
+_TIE_DIGITS = 9
+
+
+def _arr(x) -> np.ndarray:
+    return np.asarray(x, dtype=np.float64)
+
+
+def quantize(x, places: int, half_up: bool = False) -> np.ndarray:
+    """Round to `places` decimals like Decimal.quantize (HALF_EVEN, or HALF_UP)."""
+    scale = 10.0 ** places
+    scaled = np.round(_arr(x) * scale, _TIE_DIGITS)
+    if half_up:
+        rounded = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    else:
+        rounded = np.rint(scaled)
+    # + 0.0 turns -0.0 into 0.0
+    return rounded / scale + 0.0
+
+
+def round_like_python(x, places: int) -> np.ndarray:
+    """Vectorized built-in round() (exact on the binary value, unlike np.round near ties)."""
+    x = np.atleast_1d(_arr(x))
+    out = np.round(x, places)
+    scaled = x * 10.0 ** places
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if np.any(near_tie):
+        out[near_tie] = [round(float(v), places) for v in x[near_tie]]
+    return out
+
+
+# ---------------------------------------------------------------------------
+# V^R
+# ---------------------------------------------------------------------------
+
+@dataclass
+class VRBatch:
+    vr_score: np.ndarray               # 2 dp, [0, 100]
+    weighted_dim_score: np.ndarray     # 2 dp
+    talent_risk_adj: np.ndarray        # 4 dp, [0, 1]
+    cv_penalty: np.ndarray             # 4 dp, [0, 1]
+    coefficient_of_variation: np.ndarray
+    talent_concentration: np.ndarray   # round(tc, 4)
+
+
+def vr_batch(
+    dimension_scores,
+    weights,
+    talent_concentration,
+    tc_threshold: float = 0.25,
+    tc_penalty: float = 0.15,
+    cv_lambda: float = 0.25,
+) -> VRBatch:
+    """
+    V^R = weighted_dim × TalentRiskAdj × CVPenalty, clamped to [0, 100].
+
+    Args:
+        dimension_scores: (N, K) scores; NaN = dimension not supplied (weight dropped).
+        weights: (K,) dimension weights, or (S, 1, K) for S weight scenarios
+                 (outputs then have shape (S, N)).
+        talent_concentration: (N,) or scalar TC in [0, 1].
+    """
+    x = np.atleast_2d(_arr(dimension_scores))
+    present = ~np.isnan(x)
+    w = np.where(present, _arr(weights), 0.0)
+    vals = np.where(present, x, 0.0)
+
+    total_w = w.sum(axis=-1)
+    has_w = total_w > 0
+    safe_total = np.where(has_w, total_w, 1.0)
+    weighted_dim = np.where(has_w, (vals * w).sum(axis=-1) / safe_total, 50.0)
+
+    tc = round_like_python(talent_concentration, 4)
+    adj = np.clip(1.0 - tc_penalty * np.maximum(0.0, tc - tc_threshold), 0.0, 1.0)
+
+    variance = (w * (vals - weighted_dim[..., None]) ** 2).sum(axis=-1) / safe_total
+    std = np.where(has_w, quantize(np.sqrt(variance), 4, half_up=True), 0.0)
+    safe_mean = np.where(weighted_dim > 0, weighted_dim, 1.0)
+    cv = np.where(weighted_dim > 0, quantize(std / safe_mean, 4, half_up=True), 0.0)
+    cv_penalty = np.clip(1.0 - cv_lambda * cv, 0.0, 1.0)
+
+    vr = np.clip(quantize(weighted_dim * adj * cv_penalty, 2), 0.0, 100.0)
+
+    return VRBatch(
+        vr_score=vr,
+        weighted_dim_score=quantize(weighted_dim, 2),
+        talent_risk_adj=quantize(adj, 4),
+        cv_penalty=quantize(cv_penalty, 4),
+        coefficient_of_variation=cv,
+        talent_concentration=tc * np.ones_like(vr),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Position Factor
+# ---------------------------------------------------------------------------
+
+def position_factor_batch(vr_score, sector_avg_vr, market_cap_percentile) -> np.ndarray:
+    """PF = 0.6 × clip((VR − sector_avg) / 50) + 0.4 × (MCap − 0.5) × 2, clipped to [-1, 1], 4 dp."""
+    vr = _arr(vr_score)
+    mcap = _arr(market_cap_percentile)
+    if np.any((mcap < 0.0) | (mcap > 1.0)):
+        raise ValueError("market_cap_percentile must be in [0, 1]")
+    if np.any((vr < 0) | (vr > 100)):
+        raise ValueError("vr_score must be in [0, 100]")
+
+    vr_component = np.clip((vr - _arr(sector_avg_vr)) / 50, -1, 1)
+    mcap_component = (mcap - 0.5) * 2
+    pf = np.clip(0.6 * vr_component + 0.4 * mcap_component, -1, 1)
+    return quantize(pf, 4)
+
+
+# ---------------------------------------------------------------------------
+# H^R
+# ---------------------------------------------------------------------------
+
+def hr_batch(hr_base, position_factor, delta: float = 0.15) -> np.ndarray:
+    """H^R = HR_base × (1 + δ × PF), clamped to [0, 100], 2 dp."""
+    pf = _arr(position_factor)
+    if np.any((pf < -1.0) | (pf > 1.0)):
+        raise ValueError("position_factor must be in [-1, 1]")
+    return np.clip(quantize(_arr(hr_base) * (1.0 + delta * pf), 2), 0.0, 100.0)
+
+
+# ---------------------------------------------------------------------------
+# Synergy
+# ---------------------------------------------------------------------------
+
+@dataclass
+class SynergyBatch:
+    synergy_score: np.ndarray   # 2 dp, [0, 100]
+    alignment: np.ndarray       # 4 dp
+    timing_factor: np.ndarray   # 4 dp, [0.8, 1.2]
+
+
+def synergy_batch(
+    vr_score,
+    hr_score,
+    alignment=None,
+    timing_factor=1.0,
+    timing_min: float = 0.8,
+    timing_max: float = 1.2,
+) -> SynergyBatch:
+    """
+    Synergy = (VR × HR / 100) × Alignment × TimingFactor, clamped to [0, 100].
+
+    alignment=None (or NaN entries) → 1 − |VR − HR| / 100.
+    """
+    vr, hr = np.broadcast_arrays(_arr(vr_score), _arr(hr_score))
+    tf = np.clip(_arr(timing_factor), timing_min, timing_max)
+
+    auto = 1.0 - np.abs(vr - hr) / 100.0
+    if alignment is None:
+        align = auto
+    else:
+        given = _arr(alignment)
+        align = np.where(np.isnan(given), auto, np.clip(given, 0.0, 1.0))
+
+    raw = (vr * hr / 100.0) * align * tf
+    synergy = np.clip(quantize(raw, 2), 0.0, 100.0)
+    return SynergyBatch(
+        synergy_score=synergy,
+        alignment=quantize(align, 4) * np.ones_like(synergy),
+        timing_factor=quantize(tf, 4) * np.ones_like(synergy),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Org-AI-R
+# ---------------------------------------------------------------------------
+
+@dataclass
+class OrgAIRBatch:
+    org_air_score: np.ndarray         # 2 dp, [0, 100]
+    weighted_base: np.ndarray         # 2 dp
+    synergy_contribution: np.ndarray  # 2 dp
+    vr_weighted: np.ndarray           # 4 dp
+    hr_weighted: np.ndarray           # 4 dp
+    synergy_score_used: np.ndarray    # 2 dp
+
+
+def orgair_batch(vr_score, hr_score, synergy_score, alpha: float = 0.60, beta: float = 0.12) -> OrgAIRBatch:
+    """Org-AI-R = (1 − β) × [α × VR + (1 − α) × HR] + β × Synergy, clamped to [0, 100]."""
+    vr, hr, syn = np.broadcast_arrays(_arr(vr_score), _arr(hr_score), _arr(synergy_score))
+    vr_weighted = alpha * vr
+    hr_weighted = (1.0 - alpha) * hr
+    weighted_base = (1.0 - beta) * (vr_weighted + hr_weighted)
+    synergy_contribution = beta * syn
+
+    return OrgAIRBatch(
+        org_air_score=np.clip(quantize(weighted_base + synergy_contribution, 2), 0.0, 100.0),
+        weighted_base=quantize(weighted_base, 2),
+        synergy_contribution=quantize(synergy_contribution, 2),
+        vr_weighted=quantize(vr_weighted, 4),
+        hr_weighted=quantize(hr_weighted, 4),
+        synergy_score_used=quantize(syn, 2),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Confidence interval (Spearman-Brown / SEM)
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CIBatch:
+    ci_lower: np.ndarray     # 2 dp, [0, 100]
+    ci_upper: np.ndarray     # 2 dp, [0, 100]
+    sem: np.ndarray          # 4 dp
+    reliability: np.ndarray  # 4 dp
+
+
+def confidence_batch(
+    score,
+    evidence_count,
+    base_reliability: float = 0.70,
+    sigma: float = 15.0,
+    z: float = 1.96,
+) -> CIBatch:
+    """ρ = n·r / (1 + (n−1)·r); SEM = σ·√(1−ρ); CI = score ± z·SEM, clamped to [0, 100]."""
+    s, n = np.broadcast_arrays(_arr(score), _arr(evidence_count))
+    if np.any(n < 1):
+        raise ValueError("evidence_count must be >= 1")
+
+    rho = (n * base_reliability) / (1.0 + (n - 1.0) * base_reliability)
+    sem = sigma * np.sqrt(1.0 - rho)
+    margin = z * sem
+
+    return CIBatch(
+        ci_lower=np.clip(quantize(s - margin, 2), 0.0, 100.0),
+        ci_upper=np.clip(quantize(s + margin, 2), 0.0, 100.0),
+        sem=quantize(sem, 4),
+        reliability=quantize(rho, 4),
+    )
+
+
+def to_scalar(values: np.ndarray) -> float:
+    """First element as a Python float (N = 1 wrappers)."""
+    return float(np.atleast_1d(values)[0])
+
@@ -0,0 +1,220 @@
+"""
+Batch Scoring — portfolio / scenario scoring in one vectorized call
+app/scoring/batch_scoring.py
+
+Chains the batch kernels exactly the way orgair_scoring._compute_orgair
+chains the scalar calculators:
+
+    dims (N×7), TC ──► V^R ──► PF(V^R, sector, MCap) ──► H^R(sector, PF)
+                        │                                   │
+                        └──────────► Synergy(V^R, H^R, timing) ◄┘
+                                           │
+                               Org-AI-R(V^R, H^R, Synergy)
+                                           │
+                          CI(V^R), CI(H^R), CI(Org-AI-R)
+
+Each stage consumes the quantized output of the previous one, so row i of
+the result equals what the scalar pipeline reports for company i.
+
+Sector tables are read from the calculator classes, so there is still one
+place to recalibrate them.
+
+Usage:
+    from app.scoring.batch_scoring import score_batch
+
+    scores = score_batch(dims, tc, ["technology", "retail"], [0.95, 0.30])
+    scores.org_air.org_air_score      # np.ndarray, shape (2,)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+from app.scoring.batch_kernel import (
+    CIBatch,
+    OrgAIRBatch,
+    SynergyBatch,
+    VRBatch,
+    confidence_batch,
+    hr_batch,
+    orgair_batch,
+    position_factor_batch,
+    synergy_batch,
+    vr_batch,
+)
+from app.scoring.confidence_calculator import ConfidenceCalculator
+from app.scoring.hr_calculator import HRCalculator
+from app.scoring.orgair_calculator import ALPHA, BETA
+from app.scoring.position_factor import PositionFactorCalculator
+from app.scoring.synergy_calculator import SynergyCalculator
+from app.scoring.vr_calculator import _DIM_WEIGHTS, dimension_weight_vector
+
+logger = logging.getLogger(__name__)
+
+# Column order of the dimension matrix
+DIMENSIONS: Tuple[str, ...] = tuple(_DIM_WEIGHTS)
+
+# Sector code i ↔ SECTORS[i]; -1 = unknown sector (calculator defaults apply)
+SECTORS: Tuple[str, ...] = tuple(dict.fromkeys(
+    [*HRCalculator.SECTOR_HR_BASE, *PositionFactorCalculator.SECTOR_AVG_VR]
+))
+
+_DEFAULT_SECTOR_VALUE = 50.0
+
+
+def _sector_table(table: Dict[str, float]) -> np.ndarray:
+    """Per-code lookup array; the trailing slot (index -1) is the unknown-sector default."""
+    return np.array([table.get(s, _DEFAULT_SECTOR_VALUE) for s in SECTORS] + [_DEFAULT_SECTOR_VALUE])
+
+
+def encode_sectors(sectors: Iterable[Union[str, int]]) -> np.ndarray:
+    """Map sector names (case-insensitive) or codes to int codes; unknown → -1."""
+    index = {name: i for i, name in enumerate(SECTORS)}
+    codes = []
+    unknown = set()
+    for s in sectors:
+        if isinstance(s, str):
+            code = index.get(s.lower(), -1)
+            if code < 0:
+                unknown.add(s)
+        else:
+            code = int(s) if 0 <= int(s) < len(SECTORS) else -1
+        codes.append(code)
+    if unknown:
+        logger.warning(f"Unknown sector(s) {sorted(unknown)}, using default baselines=50.0")
+    return np.array(codes, dtype=np.int64)
+
+
+def dimension_matrix(rows: Sequence[Dict[str, float]]) -> np.ndarray:
+    """Stack {dimension: score} dicts into the (N×7) kernel input; missing → NaN."""
+    return np.array([
+        [float(row[d]) if d in row else np.nan for d in DIMENSIONS]
+        for row in rows
+    ], dtype=np.float64).reshape(len(rows), len(DIMENSIONS))
+
+
+@dataclass
+class BatchScores:
+    """Every downstream score for N companies / scenarios (arrays of shape (N,))."""
+    vr: VRBatch
+    position_factor: np.ndarray
+    hr_score: np.ndarray
+    synergy: SynergyBatch
+    org_air: OrgAIRBatch
+    vr_ci: CIBatch
+    hr_ci: CIBatch
+    org_air_ci: CIBatch
+
+    def __len__(self) -> int:
+        return self.org_air.org_air_score.shape[-1]
+
+    def row(self, i: int) -> Dict[str, float]:
+        """Flat dict of the headline numbers for one row (API / logging friendly)."""
+        return {
+            "vr_score": float(self.vr.vr_score[i]),
+            "position_factor": float(self.position_factor[i]),
+            "hr_score": float(self.hr_score[i]),
+            "synergy_score": float(self.synergy.synergy_score[i]),
+            "org_air_score": float(self.org_air.org_air_score[i]),
+            "vr_ci_lower": float(self.vr_ci.ci_lower[i]),
+            "vr_ci_upper": float(self.vr_ci.ci_upper[i]),
+            "hr_ci_lower": float(self.hr_ci.ci_lower[i]),
+            "hr_ci_upper": float(self.hr_ci.ci_upper[i]),
+            "org_air_ci_lower": float(self.org_air_ci.ci_lower[i]),
+            "org_air_ci_upper": float(self.org_air_ci.ci_upper[i]),
+        }
+
+
+def score_batch(
+    dimension_scores,
+    talent_concentration,
+    sectors: Union[Sequence[Union[str, int]], np.ndarray],
+    market_cap_percentile,
+    timing_factor=1.0,
+    evidence_count=7,
+    alignment=None,
+    weights=None,
+    alpha=None,
+    beta=None,
+    cv_lambda=None,
+    delta=None,
+) -> BatchScores:
+    """
+    Score N companies (or N perturbed scenarios of one company) at once.
+
+    Args:
+        dimension_scores: (N×7) array in DIMENSIONS order (NaN = missing),
+                          or a sequence of {dimension: score} dicts.
+        talent_concentration: (N,) or scalar TC in [0, 1].
+        sectors: (N,) sector names or codes from encode_sectors().
+        market_cap_percentile: (N,) or scalar in [0, 1].
+        timing_factor: (N,) or scalar synergy timing factor (clamped to [0.8, 1.2]).
+        evidence_count: (N,) or scalar n for the Spearman-Brown CIs.
+        alignment: Optional (N,) alignment override; None/NaN → auto.
+        weights, alpha, beta, cv_lambda, delta: Formula parameter overrides
+            (default: the calculator constants).  Pass (S, 1, 7) weights and
+            (S, 1) scalars to score S parameter scenarios at once; every
+            output then has shape (S, N).
+
+    Raises:
+        ValueError: Same input checks as the scalar calculators.
+    """
+    if len(dimension_scores) and isinstance(dimension_scores[0], dict):
+        dimension_scores = dimension_matrix(dimension_scores)
+    dims = np.atleast_2d(np.asarray(dimension_scores, dtype=np.float64))
+    n = dims.shape[0]
+
+    codes = np.asarray(sectors)
+    if codes.dtype.kind not in "iu":
+        codes = encode_sectors(sectors)
+    codes = np.broadcast_to(codes, (n,))
+
+    vr = vr_batch(
+        dims,
+        dimension_weight_vector() if weights is None else weights,
+        talent_concentration,
+        cv_lambda=0.25 if cv_lambda is None else cv_lambda,
+    )
+    pf = position_factor_batch(
+        vr.vr_score,
+        _sector_table(PositionFactorCalculator.SECTOR_AVG_VR)[codes],
+        market_cap_percentile,
+    )
+    hr = hr_batch(
+        _sector_table(HRCalculator.SECTOR_HR_BASE)[codes],
+        pf,
+        HRCalculator.DELTA if delta is None else delta,
+    )
+    synergy = synergy_batch(
+        vr.vr_score,
+        hr,
+        alignment=alignment,
+        timing_factor=timing_factor,
+        timing_min=float(SynergyCalculator.TIMING_MIN),
+        timing_max=float(SynergyCalculator.TIMING_MAX),
+    )
+    org_air = orgair_batch(
+        vr.vr_score,
+        hr,
+        synergy.synergy_score,
+        alpha=float(ALPHA) if alpha is None else alpha,
+        beta=float(BETA) if beta is None else beta,
+    )
+
+    ci_params = dict(
+        base_reliability=ConfidenceCalculator.BASE_RELIABILITY,
+        sigma=ConfidenceCalculator.SIGMA,
+        z=ConfidenceCalculator.Z_95,
+    )
+    return BatchScores(
+        vr=vr,
+        position_factor=pf,
+        hr_score=hr,
+        synergy=synergy,
+        org_air=org_air,
+        vr_ci=confidence_batch(vr.vr_score, evidence_count, **ci_params),
+        hr_ci=confidence_batch(hr, evidence_count, **ci_params),
+        org_air_ci=confidence_batch(org_air.org_air_score, evidence_count, **ci_params),
+    )
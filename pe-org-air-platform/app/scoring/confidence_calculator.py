@@ -15,11 +15,11 @@ Fixed parameters:
 """
 
 import logging
-import math
 from dataclasses import dataclass
 from decimal import Decimal
 
-from app.scoring.utils import clamp
+from app.scoring.batch_kernel import confidence_batch, to_scalar
+from app.scoring.utils import to_clamped_decimal, to_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -69,30 +69,18 @@ class ConfidenceCalculator:
             raise ValueError(f"evidence_count must be >= 1, got {evidence_count}")
 
         score_d = Decimal(str(score))
-        n = Decimal(str(evidence_count))
-        r = Decimal("0.70")
 
-        # Spearman-Brown: ρ = (n × r) / (1 + (n − 1) × r)
-        rho = (n * r) / (Decimal("1") + (n - Decimal("1")) * r)
-
-        # SEM = σ × √(1 − ρ)
-        sem_float = self.SIGMA * math.sqrt(float(Decimal("1") - rho))
-        margin = Decimal(str(self.Z_95 * sem_float))
-
-        # CI bounds, clamped to [0, 100]
-        ci_lower = clamp(
-            (score_d - margin).quantize(Decimal("0.01")),
-            Decimal("0"),
-            Decimal("100"),
+        batch = confidence_batch(
+            float(score_d),
+            evidence_count,
+            base_reliability=self.BASE_RELIABILITY,
+            sigma=self.SIGMA,
+            z=self.Z_95,
         )
-        ci_upper = clamp(
-            (score_d + margin).quantize(Decimal("0.01")),
-            Decimal("0"),
-            Decimal("100"),
-        )
-
-        rho_quantized = rho.quantize(Decimal("0.0001"))
-        sem_quantized = Decimal(str(sem_float)).quantize(Decimal("0.0001"))
+        ci_lower = to_clamped_decimal(to_scalar(batch.ci_lower))
+        ci_upper = to_clamped_decimal(to_scalar(batch.ci_upper))
+        rho_quantized = to_decimal(to_scalar(batch.reliability), 4)
+        sem_quantized = to_decimal(to_scalar(batch.sem), 4)
 
         logger.info(
             "confidence_calculated",
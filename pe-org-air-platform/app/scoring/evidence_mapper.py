@@ -14,13 +14,30 @@ Pipeline:
 Naming convention: Uses existing Dimension enum values from app.models.enumerations:
   data_infrastructure, ai_governance, technology_stack,
   talent_skills, leadership_vision, use_case_portfolio, culture_change
+
+Matrix form:
+  The mapping table is compiled once (compile_mapping_matrix) into a dense
+  9×7 weight matrix W, a reliability vector r and a 9×7 multiplicity
+  matrix M (how many times each source's row names each dimension).  For
+  N companies with score S, confidence C and item count K as N×9 arrays
+  (NaN = source missing):
+    sums    = (S ∘ C ∘ r) · W        weights = (C ∘ r) · W
+    score   = sums / weights          (50 where weights == 0)
+    conf    = (C · M) / (K · M)
+  map_evidence_batch returns these plus the contributing-source masks.
+  map_evidence_to_dimensions keeps returning DimensionScore objects in
+  exact Decimal arithmetic, driven by the same compiled table.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 from enum import Enum
 from decimal import Decimal, ROUND_HALF_UP
 
+import numpy as np
+
+from app.scoring.batch_kernel import quantize
+
 
 # ---------------------------------------------------------------------------
 # Enums — aligned with existing app.models.enumerations.Dimension
@@ -212,6 +229,170 @@ SIGNAL_TO_DIMENSION_MAP: Dict[SignalSource, DimensionMapping] = {
 }
 
 
+# Reverse index: dimension → the sources whose evidence its score depends on
+DIMENSION_SOURCES: Dict[Dimension, Tuple[SignalSource, ...]] = {
+    dim: tuple(
+        source for source, m in SIGNAL_TO_DIMENSION_MAP.items()
+        if m.primary_dimension == dim or dim in m.secondary_mappings
+    )
+    for dim in Dimension
+}
+
+
+def dimensions_for_sources(sources: Iterable[SignalSource]) -> List[Dimension]:
+    """Dimensions (in enum order) whose score can change when any of `sources` changes."""
+    changed = set(sources)
+    return [dim for dim, contributing in DIMENSION_SOURCES.items() if changed.intersection(contributing)]
+
+
+# ---------------------------------------------------------------------------
+# Compiled mapping matrix
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class MappingMatrix:
+    """SIGNAL_TO_DIMENSION_MAP as a dense source × dimension table."""
+    sources: Tuple[SignalSource, ...]           # row order (9)
+    dimensions: Tuple[Dimension, ...]           # column order (7)
+    weights: np.ndarray                         # (9, 7) float, 0 where unmapped
+    multiplicity: np.ndarray                    # (9, 7) int — times the row names the dimension
+    reliability: np.ndarray                     # (9,) float
+    # Exact Decimal rows: source → ((dimension, weight), ...) primary first
+    decimal_rows: Dict[SignalSource, Tuple[Tuple[Dimension, Decimal], ...]]
+    decimal_reliability: Dict[SignalSource, Decimal]
+
+    @property
+    def mapped(self) -> np.ndarray:
+        """(9, 7) bool — source contributes to dimension."""
+        return self.multiplicity > 0
+
+    def source_index(self, source: SignalSource) -> int:
+        return self.sources.index(source)
+
+
+def compile_mapping_matrix(
+    mappings: Dict[SignalSource, DimensionMapping],
+) -> MappingMatrix:
+    """Compile a mapping table once into W (sources × dimensions) and r."""
+    sources = tuple(mappings)
+    dimensions = tuple(Dimension)
+    weights = np.zeros((len(sources), len(dimensions)))
+    multiplicity = np.zeros((len(sources), len(dimensions)), dtype=np.int64)
+    reliability = np.zeros(len(sources))
+    decimal_rows = {}
+    for i, (source, mapping) in enumerate(mappings.items()):
+        row = ((mapping.primary_dimension, mapping.primary_weight),) + tuple(mapping.secondary_mappings.items())
+        for dim, weight in row:
+            weights[i, dimensions.index(dim)] += float(weight)
+            multiplicity[i, dimensions.index(dim)] += 1
+        reliability[i] = float(mapping.reliability)
+        decimal_rows[source] = row
+    weights.flags.writeable = False
+    multiplicity.flags.writeable = False
+    reliability.flags.writeable = False
+    return MappingMatrix(
+        sources=sources,
+        dimensions=dimensions,
+        weights=weights,
+        multiplicity=multiplicity,
+        reliability=reliability,
+        decimal_rows=decimal_rows,
+        decimal_reliability={source: m.reliability for source, m in mappings.items()},
+    )
+
+
+@dataclass
+class DimensionBatch:
+    """
+    Dimension results for N companies (columns follow MappingMatrix.dimensions).
+
+    Quantized like DimensionScore: score 2 dp, confidence 3 dp, total_weight
+    4 dp (ROUND_HALF_UP), computed in float64.
+    """
+    score: np.ndarray               # (N, 7)
+    confidence: np.ndarray          # (N, 7)
+    total_weight: np.ndarray        # (N, 7)
+    source_mask: np.ndarray         # (N, 7, 9) bool — source contributed to dimension
+    source_count: np.ndarray        # (N, 7) int
+
+    def __len__(self) -> int:
+        return self.score.shape[0]
+
+
+def evidence_tensor(
+    companies: Sequence[List[EvidenceScore]],
+    matrix: MappingMatrix,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stack per-company evidence lists into N × 9 score / confidence / count arrays.
+
+    Missing sources are NaN (count 0), and sources outside the mapping table
+    are ignored (as in the scalar mapper).  A source listed k times adds k
+    contributions there, so its confidences are summed, its score is their
+    confidence-weighted mean and its count is k.
+    """
+    shape = (len(companies), len(matrix.sources))
+    weighted, conf_sum, score_sum = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+    counts = np.zeros(shape, dtype=np.int64)
+    index = {source: i for i, source in enumerate(matrix.sources)}
+    for n, evidence in enumerate(companies):
+        for ev in evidence:
+            j = index.get(ev.source)
+            if j is None:
+                continue
+            score, confidence = float(ev.raw_score), float(ev.confidence)
+            weighted[n, j] += score * confidence
+            conf_sum[n, j] += confidence
+            score_sum[n, j] += score
+            counts[n, j] += 1
+    present = counts > 0
+    # A single item keeps its raw score exactly; zero total confidence contributes nothing
+    mean = np.divide(weighted, conf_sum, out=score_sum / np.maximum(counts, 1), where=(counts > 1) & (conf_sum > 0))
+    return np.where(present, mean, np.nan), np.where(present, conf_sum, np.nan), counts
+
+
+def map_evidence_batch(
+    scores: np.ndarray,
+    confidences: np.ndarray,
+    matrix: MappingMatrix,
+    counts: Optional[np.ndarray] = None,
+) -> DimensionBatch:
+    """
+    All N companies' dimension scores, confidence and source masks in one pass.
+
+    `counts` (N × 9) is the number of evidence items behind each source, as
+    returned by evidence_tensor; by default one per present source.
+    """
+    scores = np.atleast_2d(np.asarray(scores, dtype=np.float64))
+    confidences = np.atleast_2d(np.asarray(confidences, dtype=np.float64))
+    present = ~np.isnan(scores)
+    k = present.astype(np.float64) if counts is None else np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    s = np.where(present, scores, 0.0)
+    c = np.where(present, confidences, 0.0)
+    multiplicity = matrix.multiplicity.astype(np.float64)
+
+    cr = c * matrix.reliability
+    sums = (s * cr) @ matrix.weights
+    weights = cr @ matrix.weights
+    conf_sum = c @ multiplicity
+    count = k @ multiplicity
+
+    has_weight = weights > 0
+    safe_w = np.where(has_weight, weights, 1.0)
+    safe_n = np.where(count > 0, count, 1.0)
+    score = np.where(has_weight, np.clip(quantize(sums / safe_w, 2, half_up=True), 0.0, 100.0), 50.0)
+    confidence = np.where(has_weight, quantize(conf_sum / safe_n, 3, half_up=True), 0.0)
+
+    source_mask = present[:, None, :] & matrix.mapped.T[None, :, :]
+    return DimensionBatch(
+        score=score,
+        confidence=confidence,
+        total_weight=quantize(weights, 4, half_up=True),
+        source_mask=source_mask,
+        source_count=source_mask.sum(axis=2),
+    )
+
+
 # ---------------------------------------------------------------------------
 # EvidenceMapper
 # ---------------------------------------------------------------------------
@@ -233,6 +414,12 @@ class EvidenceMapper:
 
     def __init__(self):
         self.mappings = SIGNAL_TO_DIMENSION_MAP
+        self.matrix = compile_mapping_matrix(self.mappings)
+
+    def map_batch(self, companies: Sequence[List[EvidenceScore]]) -> DimensionBatch:
+        """Dimension results for many companies (one evidence list each) at once."""
+        scores, confidences, counts = evidence_tensor(companies, self.matrix)
+        return map_evidence_batch(scores, confidences, self.matrix, counts)
 
     def map_evidence_to_dimensions(
         self,
@@ -256,37 +443,31 @@ class EvidenceMapper:
         Returns:
             Dict mapping each Dimension to its aggregated DimensionScore
         """
-        # Step 1 — accumulators
+        # Step 1 — accumulators (one slot per dimension)
         dimension_sums: Dict[Dimension, Decimal] = {d: Decimal("0") for d in Dimension}
         dimension_weights: Dict[Dimension, Decimal] = {d: Decimal("0") for d in Dimension}
         dimension_sources: Dict[Dimension, List[SignalSource]] = {d: [] for d in Dimension}
         dimension_conf_sum: Dict[Dimension, Decimal] = {d: Decimal("0") for d in Dimension}
         dimension_conf_count: Dict[Dimension, int] = {d: 0 for d in Dimension}
 
-        # Step 2 — process each evidence score
+        # Step 2 — one pass over the evidence, using the compiled rows
+        rows = self.matrix.decimal_rows
         for ev in evidence_scores:
-            mapping = self.mappings.get(ev.source)
-            if not mapping:
+            row = rows.get(ev.source)
+            if not row:
                 continue
+            reliability = self.matrix.decimal_reliability[ev.source]
+            effective_score = ev.raw_score * ev.confidence * reliability
 
-            effective_score = ev.raw_score * ev.confidence * mapping.reliability
-
-            # Helper to accumulate a (dimension, weight) contribution
-            def _add(dim: Dimension, weight: Decimal):
+            # Primary contribution first, then secondaries
+            for dim, weight in row:
                 dimension_sums[dim] += effective_score * weight
-                dimension_weights[dim] += weight * ev.confidence * mapping.reliability
+                dimension_weights[dim] += weight * ev.confidence * reliability
                 if ev.source not in dimension_sources[dim]:
                     dimension_sources[dim].append(ev.source)
                 dimension_conf_sum[dim] += ev.confidence
                 dimension_conf_count[dim] += 1
 
-            # Primary contribution
-            _add(mapping.primary_dimension, mapping.primary_weight)
-
-            # Secondary contributions
-            for dim, weight in mapping.secondary_mappings.items():
-                _add(dim, weight)
-
         # Step 3 — weighted averages & defaults
         results: Dict[Dimension, DimensionScore] = {}
         for dim in Dimension:
@@ -319,10 +500,14 @@ class EvidenceMapper:
     def get_coverage_report(
         self,
         evidence_scores: List[EvidenceScore],
+        dimension_scores: Optional[Dict[Dimension, DimensionScore]] = None,
     ) -> Dict[Dimension, Dict]:
         """
         Report which dimensions have evidence and which have gaps.
 
+        Pass `dimension_scores` from map_evidence_to_dimensions to reuse them
+        instead of mapping the evidence again.
+
         Returns dict per dimension:
           - has_evidence: bool
           - source_count: int
@@ -330,7 +515,7 @@ class EvidenceMapper:
           - confidence: float
           - sources: list[str]
         """
-        dim_scores = self.map_evidence_to_dimensions(evidence_scores)
+        dim_scores = dimension_scores or self.map_evidence_to_dimensions(evidence_scores)
         report: Dict[Dimension, Dict] = {}
         for dim, ds in dim_scores.items():
             report[dim] = {
@@ -374,8 +559,9 @@ class EvidenceMapper:
             ev.source: ev for ev in evidence_scores
         }
 
+        matrix = self.matrix
         rows = []
-        for source, mapping in self.mappings.items():
+        for i, source in enumerate(matrix.sources):
             ev = ev_lookup.get(source)
             row = {
                 "ticker": ticker,
@@ -384,14 +570,9 @@ class EvidenceMapper:
                 "confidence": float(ev.confidence) if ev else None,
                 "evidence_count": ev.evidence_count if ev else 0,
             }
-            # Add weight columns for each dimension
-            for dim in Dimension:
-                weight = None
-                if dim == mapping.primary_dimension:
-                    weight = float(mapping.primary_weight)
-                elif dim in mapping.secondary_mappings:
-                    weight = float(mapping.secondary_mappings[dim])
-                row[dim.value] = weight
+            # Add weight columns for each dimension (None where unmapped)
+            for j, dim in enumerate(matrix.dimensions):
+                row[dim.value] = float(matrix.weights[i, j]) if matrix.mapped[i, j] else None
 
             rows.append(row)
 
@@ -401,9 +582,11 @@ class EvidenceMapper:
         self,
         evidence_scores: List[EvidenceScore],
         ticker: str,
+        dimension_scores: Optional[Dict[Dimension, DimensionScore]] = None,
     ) -> List[Dict]:
         """
         Build the final 7-dimension score summary for a company.
+        `dimension_scores` reuses an earlier map_evidence_to_dimensions result.
 
         Returns list of dicts ready for Snowflake insert:
         [
@@ -419,7 +602,7 @@ class EvidenceMapper:
           ...
         ]
         """
-        dim_scores = self.map_evidence_to_dimensions(evidence_scores)
+        dim_scores = dimension_scores or self.map_evidence_to_dimensions(evidence_scores)
         rows = []
         for dim in Dimension:
             ds = dim_scores[dim]
@@ -19,6 +19,9 @@ from typing import Dict, Optional
 from dataclasses import dataclass
 import logging
 
+from app.scoring.batch_kernel import hr_batch, to_scalar
+from app.scoring.utils import to_decimal
+
 logger = logging.getLogger(__name__)
 
 
@@ -106,18 +109,11 @@ class HRCalculator:
         pf_decimal = Decimal(str(position_factor))
         delta_decimal = Decimal(str(self.DELTA))
         
-        # Calculate position adjustment
+        # δ × PF (reported exactly, as before)
         position_adjustment = delta_decimal * pf_decimal
-        
-        # Calculate H^R
-        # H^R = HR_base × (1 + δ × PF)
-        hr_score = hr_base_decimal * (Decimal("1") + position_adjustment)
-        
-        # Bound to [0, 100]
-        hr_score = max(Decimal("0"), min(Decimal("100"), hr_score))
-        
-        # Round to 2 decimal places
-        hr_score = hr_score.quantize(Decimal("0.01"))
+
+        # H^R = HR_base × (1 + δ × PF), bounded to [0, 100], 2 dp
+        hr_score = to_decimal(to_scalar(hr_batch(hr_base, position_factor, self.DELTA)), 2)
         
         logger.info(
             f"H^R Calculation: sector={sector}, HR_base={hr_base}, "
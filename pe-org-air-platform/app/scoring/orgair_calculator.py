@@ -18,7 +18,8 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional
 
-from app.scoring.utils import clamp
+from app.scoring.batch_kernel import orgair_batch, to_scalar
+from app.scoring.utils import to_clamped_decimal, to_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -86,19 +87,14 @@ class OrgAIRCalculator:
         else:
             syn_d = Decimal(str(synergy_score))
 
-        # Weighted components
-        vr_weighted = ALPHA * vr_d
-        hr_weighted = (Decimal("1") - ALPHA) * hr_d
-        base_combined = vr_weighted + hr_weighted
-
-        weighted_base = (Decimal("1") - BETA) * base_combined
-        synergy_contribution = BETA * syn_d
-
-        org_air = clamp(
-            (weighted_base + synergy_contribution).quantize(Decimal("0.01")),
-            Decimal("0"),
-            Decimal("100"),
+        batch = orgair_batch(
+            float(vr_d), float(hr_d), float(syn_d), alpha=float(ALPHA), beta=float(BETA),
         )
+        vr_weighted = to_decimal(to_scalar(batch.vr_weighted), 4)
+        hr_weighted = to_decimal(to_scalar(batch.hr_weighted), 4)
+        weighted_base = to_decimal(to_scalar(batch.weighted_base), 2)
+        synergy_contribution = to_decimal(to_scalar(batch.synergy_contribution), 2)
+        org_air = to_clamped_decimal(to_scalar(batch.org_air_score))
 
         logger.info(
             "orgair_calculated",
@@ -116,11 +112,11 @@ class OrgAIRCalculator:
 
         return OrgAIRResult(
             org_air_score=org_air,
-            weighted_base=weighted_base.quantize(Decimal("0.01")),
-            synergy_contribution=synergy_contribution.quantize(Decimal("0.01")),
-            vr_weighted=vr_weighted.quantize(Decimal("0.0001")),
-            hr_weighted=hr_weighted.quantize(Decimal("0.0001")),
-            synergy_score_used=syn_d.quantize(Decimal("0.01")),
+            weighted_base=weighted_base,
+            synergy_contribution=synergy_contribution,
+            vr_weighted=vr_weighted,
+            hr_weighted=hr_weighted,
+            synergy_score_used=to_decimal(to_scalar(batch.synergy_score_used), 2),
             alpha=ALPHA,
             beta=BETA,
         )
@@ -18,11 +18,16 @@ SECTOR_AVG_VR calibration (v2):
 
   Technology was 65 (too high — implies avg tech company has 65/100 AI readiness).
   Lowered to 50 which is the neutral midpoint and consistent with CS3 targets.
+
+The formula itself is batch_kernel.position_factor_batch.
 """
 
 from decimal import Decimal
 from typing import Dict
 
+from app.scoring.batch_kernel import position_factor_batch, to_scalar
+from app.scoring.utils import to_decimal
+
 
 class PositionFactorCalculator:
     """
@@ -68,16 +73,5 @@ class PositionFactorCalculator:
         # Get sector average
         sector_avg = self.SECTOR_AVG_VR.get(sector.lower(), 50.0)
         
-        # Calculate VR component
-        vr_diff = vr_score - sector_avg
-        vr_component = max(-1, min(1, vr_diff / 50))
-        
-        # Calculate market cap component
-        mcap_component = (market_cap_percentile - 0.5) * 2
-        
-        # Weighted combination
-        pf = 0.6 * vr_component + 0.4 * mcap_component
-        
-        # Bound to [-1, 1]
-        pf_bounded = max(-1, min(1, pf))
-        return Decimal(str(pf_bounded)).quantize(Decimal("0.0001"))
\ No newline at end of file
+        pf = position_factor_batch(vr_score, sector_avg, market_cap_percentile)
+        return to_decimal(to_scalar(pf), 4)
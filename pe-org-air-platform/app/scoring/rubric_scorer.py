@@ -23,6 +23,8 @@ from enum import Enum
 from decimal import Decimal, ROUND_HALF_UP
 import re
 
+from app.pipelines.keyword_matcher import get_keyword_matcher
+
 
 # ---------------------------------------------------------------------------
 # Score Levels
@@ -590,6 +592,11 @@ class RubricScorer:
 
     def __init__(self):
         self.rubrics = DIMENSION_RUBRICS
+        # One automaton over every rubric keyword; each evidence text is
+        # scanned once and all five levels are answered from that scan
+        self._matcher = get_keyword_matcher(
+            *(criteria.keywords for rubric in self.rubrics.values() for criteria in rubric.values())
+        )
 
     def score_dimension(
         self,
@@ -626,6 +633,7 @@ class RubricScorer:
             )
 
         primary_metric = self._get_primary_metric(dimension, quantitative_metrics)
+        scan = self._matcher.scan(text)
 
         for level in [ScoreLevel.LEVEL_5, ScoreLevel.LEVEL_4, ScoreLevel.LEVEL_3,
                       ScoreLevel.LEVEL_2, ScoreLevel.LEVEL_1]:
@@ -633,7 +641,7 @@ class RubricScorer:
             if not criteria:
                 continue
 
-            matches = [kw for kw in criteria.keywords if kw in text]
+            matches = scan.matched(criteria.keywords)
             match_count = len(matches)
 
             quant_met = primary_metric >= criteria.quantitative_threshold if primary_metric is not None else True
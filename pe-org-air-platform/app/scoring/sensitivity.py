@@ -0,0 +1,284 @@
+"""
+Sensitivity Analysis — Monte Carlo over the CS3 scoring parameters
+app/scoring/sensitivity.py
+
+Answers "how stable is a company's Org-AI-R if α, β, λ, δ or the dimension
+weights move within their allowed ranges?"
+
+The allowed ranges are the `ge` / `le` bounds of the Settings fields:
+    ALPHA_VR_WEIGHT      α   (Org-AI-R V^R vs H^R blend)
+    BETA_SYNERGY_WEIGHT  β   (Synergy weight)
+    LAMBDA_PENALTY       λ   (V^R CV penalty)
+    DELTA_POSITION       δ   (H^R position adjustment)
+    W_*                      dimension weights (must sum to 1)
+
+Scalars are sampled uniformly over their range; weight vectors are drawn
+from a Dirichlet centred on the default weights (so every sample still
+sums to 1), with `weight_concentration` controlling the spread.
+
+Every sample re-scores the whole portfolio with one score_batch() call on
+the cached per-company inputs (dimension scores, TC, sector, market cap),
+so no S3 / rubric work happens per sample.
+
+Outputs:
+    - per-company distributions of Org-AI-R, V^R and H^R
+    - rank stability (rank probabilities, Kendall τ vs the baseline order)
+    - tornado data: one-at-a-time low/high swings per parameter
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.scoring.batch_scoring import DIMENSIONS, score_batch
+from app.scoring.hr_calculator import HRCalculator
+from app.scoring.orgair_calculator import ALPHA, BETA
+from app.scoring.vr_calculator import _DIM_WEIGHTS
+
+# Settings weight field → dimension key (column of the dimension matrix)
+WEIGHT_FIELDS: Dict[str, str] = {
+    "W_DATA_INFRA": "data_infrastructure",
+    "W_TALENT": "talent_skills",
+    "W_AI_GOVERNANCE": "ai_governance",
+    "W_TECH_STACK": "technology_stack",
+    "W_LEADERSHIP": "leadership_vision",
+    "W_USE_CASES": "use_case_portfolio",
+    "W_CULTURE": "culture_change",
+}
+
+_PERCENTILES = (5, 25, 50, 75, 95)
+
+
+@dataclass
+class ParameterRange:
+    """One scalar formula parameter and its allowed range."""
+    name: str      # Settings field name
+    kwarg: str     # score_batch() keyword
+    low: float
+    high: float
+    default: float
+
+
+def _settings_bounds(field_name: str) -> tuple:
+    """(ge, le) bounds declared on a Settings field."""
+    from app.config import Settings
+
+    low = high = None
+    for meta in Settings.model_fields[field_name].metadata:
+        low = getattr(meta, "ge", low)
+        high = getattr(meta, "le", high)
+    return float(low), float(high)
+
+
+@dataclass
+class ParameterSpace:
+    """Sampling space over the scalar parameters and the dimension weights."""
+    scalars: List[ParameterRange]
+    default_weights: np.ndarray                  # (7,), DIMENSIONS order
+    weight_concentration: float = 200.0          # Dirichlet α0; larger = tighter
+    weight_shift: float = 0.05                   # ± absolute shift for tornado rows
+
+    @classmethod
+    def from_settings(cls, weight_concentration: float = 200.0, weight_shift: float = 0.05) -> "ParameterSpace":
+        """Ranges from the Settings field bounds, defaults from the calculator constants."""
+        defaults = {
+            "ALPHA_VR_WEIGHT": ("alpha", float(ALPHA)),
+            "BETA_SYNERGY_WEIGHT": ("beta", float(BETA)),
+            "LAMBDA_PENALTY": ("cv_lambda", 0.25),
+            "DELTA_POSITION": ("delta", float(HRCalculator.DELTA)),
+        }
+        scalars = [
+            ParameterRange(name, kwarg, *_settings_bounds(name), default)
+            for name, (kwarg, default) in defaults.items()
+        ]
+        return cls(
+            scalars=scalars,
+            default_weights=np.array([float(_DIM_WEIGHTS[d]) for d in DIMENSIONS]),
+            weight_concentration=weight_concentration,
+            weight_shift=weight_shift,
+        )
+
+    def baseline(self) -> Dict[str, np.ndarray]:
+        """A single scenario at the default parameters."""
+        params = {p.kwarg: np.array([p.default]) for p in self.scalars}
+        params["weights"] = self.default_weights[None, :]
+        return params
+
+    def sample(self, n: int, rng: np.random.Generator) -> Dict[str, np.ndarray]:
+        """n random scenarios: uniform scalars, Dirichlet weights."""
+        params = {p.kwarg: rng.uniform(p.low, p.high, size=n) for p in self.scalars}
+        params["weights"] = rng.dirichlet(self.weight_concentration * self.default_weights, size=n)
+        return params
+
+    def tornado_cases(self) -> List[tuple]:
+        """(parameter, low_value, high_value, low_params, high_params) per parameter."""
+        cases = []
+        for p in self.scalars:
+            low, high = self.baseline(), self.baseline()
+            low[p.kwarg], high[p.kwarg] = np.array([p.low]), np.array([p.high])
+            cases.append((p.name, p.low, p.high, low, high))
+
+        for field_name, dim in WEIGHT_FIELDS.items():
+            i = DIMENSIONS.index(dim)
+            w0 = self.default_weights[i]
+            ends = []
+            for target in (max(0.0, w0 - self.weight_shift), min(1.0, w0 + self.weight_shift)):
+                # Move one weight, rescale the rest so the vector still sums to 1
+                w = self.default_weights * (1.0 - target) / (1.0 - w0)
+                w[i] = target
+                params = self.baseline()
+                params["weights"] = w[None, :]
+                ends.append((target, params))
+            cases.append((field_name, ends[0][0], ends[1][0], ends[0][1], ends[1][1]))
+        return cases
+
+
+@dataclass
+class PortfolioInputs:
+    """Per-company scoring inputs, loaded once and reused by every sample."""
+    tickers: List[str]
+    dimension_scores: np.ndarray        # (N, 7), DIMENSIONS order, NaN = missing
+    talent_concentration: np.ndarray    # (N,)
+    sectors: List[str]
+    market_cap_percentile: np.ndarray   # (N,)
+    timing_factor: np.ndarray           # (N,)
+    evidence_count: int = 7
+
+
+@dataclass
+class SensitivityResult:
+    samples: int
+    seed: Optional[int]
+    parameter_ranges: List[Dict[str, Any]]
+    distributions: Dict[str, Dict[str, Dict[str, float]]]
+    rank_stability: Dict[str, Any]
+    tornado: Dict[str, List[Dict[str, float]]] = field(default_factory=dict)
+
+
+def _score(inputs: PortfolioInputs, params: Dict[str, np.ndarray]):
+    """Score every company under every scenario → BatchScores with (S, N) arrays."""
+    return score_batch(
+        inputs.dimension_scores,
+        inputs.talent_concentration,
+        inputs.sectors,
+        inputs.market_cap_percentile,
+        timing_factor=inputs.timing_factor,
+        evidence_count=inputs.evidence_count,
+        weights=params["weights"][:, None, :],
+        **{k: v[:, None] for k, v in params.items() if k != "weights"},
+    )
+
+
+def _summary(values: np.ndarray, baseline: float) -> Dict[str, float]:
+    pct = np.percentile(values, _PERCENTILES)
+    out = {
+        "baseline": round(baseline, 2),
+        "mean": round(float(values.mean()), 2),
+        "std": round(float(values.std()), 4),
+        "min": round(float(values.min()), 2),
+        "max": round(float(values.max()), 2),
+    }
+    out.update({f"p{p:02d}": round(float(v), 2) for p, v in zip(_PERCENTILES, pct)})
+    return out
+
+
+def _ranks(scores: np.ndarray) -> np.ndarray:
+    """1 = highest score; ties keep portfolio order."""
+    order = np.argsort(-scores, axis=-1, kind="stable")
+    return np.argsort(order, axis=-1, kind="stable") + 1
+
+
+def _kendall_tau(samples: np.ndarray, baseline: np.ndarray) -> np.ndarray:
+    """Kendall τ-a of each sample's ordering against the baseline ordering."""
+    n = baseline.shape[-1]
+    i, j = np.triu_indices(n, k=1)
+    if len(i) == 0:
+        return np.ones(samples.shape[0])
+    agreement = np.sign(samples[:, i] - samples[:, j]) * np.sign(baseline[i] - baseline[j])
+    return agreement.sum(axis=1) / len(i)
+
+
+def _stack(scenarios: Sequence[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    """Concatenate single-scenario parameter dicts into one S-scenario dict."""
+    return {k: np.concatenate([s[k] for s in scenarios]) for k in scenarios[0]}
+
+
+def run_sensitivity(
+    inputs: PortfolioInputs,
+    space: ParameterSpace,
+    samples: int,
+    seed: Optional[int] = None,
+    tornado: bool = True,
+) -> SensitivityResult:
+    """Monte Carlo + one-at-a-time analysis of the portfolio's scores."""
+    rng = np.random.default_rng(seed)
+    base = _score(inputs, space.baseline())
+    mc = _score(inputs, space.sample(samples, rng))
+
+    base_org = base.org_air.org_air_score[0]
+    org = mc.org_air.org_air_score
+    distributions = {
+        ticker: {
+            "org_air": _summary(org[:, k], float(base_org[k])),
+            "vr": _summary(mc.vr.vr_score[:, k], float(base.vr.vr_score[0, k])),
+            "hr": _summary(mc.hr_score[:, k], float(base.hr_score[0, k])),
+        }
+        for k, ticker in enumerate(inputs.tickers)
+    }
+
+    ranks = _ranks(org)
+    base_ranks = _ranks(base_org)
+    n = len(inputs.tickers)
+    per_company = {}
+    for k, ticker in enumerate(inputs.tickers):
+        counts = np.bincount(ranks[:, k], minlength=n + 1)[1:] / samples
+        per_company[ticker] = {
+            "baseline_rank": int(base_ranks[k]),
+            "p_baseline_rank": round(float(counts[base_ranks[k] - 1]), 4),
+            "mean_rank": round(float(ranks[:, k].mean()), 3),
+            "rank_probabilities": {str(r + 1): round(float(p), 4) for r, p in enumerate(counts) if p > 0},
+        }
+    tau = _kendall_tau(org, base_org)
+    rank_stability = {
+        "baseline_order": [inputs.tickers[k] for k in np.argsort(base_ranks)],
+        "p_same_order": round(float((ranks == base_ranks).all(axis=1).mean()), 4),
+        "kendall_tau_mean": round(float(tau.mean()), 4),
+        "kendall_tau_p05": round(float(np.percentile(tau, 5)), 4),
+        "companies": per_company,
+    }
+
+    tornado_rows: Dict[str, List[Dict[str, float]]] = {}
+    if tornado:
+        cases = space.tornado_cases()
+        lows = _score(inputs, _stack([c[3] for c in cases])).org_air.org_air_score
+        highs = _score(inputs, _stack([c[4] for c in cases])).org_air.org_air_score
+        for k, ticker in enumerate(inputs.tickers):
+            rows = [
+                {
+                    "parameter": name,
+                    "low_value": round(low_v, 4),
+                    "high_value": round(high_v, 4),
+                    "score_at_low": float(lows[c, k]),
+                    "score_at_high": float(highs[c, k]),
+                    "swing": round(abs(float(highs[c, k] - lows[c, k])), 2),
+                }
+                for c, (name, low_v, high_v, _, _) in enumerate(cases)
+            ]
+            tornado_rows[ticker] = sorted(rows, key=lambda r: r["swing"], reverse=True)
+
+    return SensitivityResult(
+        samples=samples,
+        seed=seed,
+        parameter_ranges=[
+            {"parameter": p.name, "low": p.low, "high": p.high, "default": p.default} for p in space.scalars
+        ] + [
+            {"parameter": name, "low": 0.0, "high": 1.0,
+             "default": float(space.default_weights[DIMENSIONS.index(dim)])}
+            for name, dim in WEIGHT_FIELDS.items()
+        ],
+        distributions=distributions,
+        rank_stability=rank_stability,
+        tornado=tornado_rows,
+    )
+
@@ -0,0 +1,215 @@
+"""
+Skill Extractor — precompiled skill matching for job descriptions
+app/scoring/skill_extractor.py
+
+Same skill set per description as the per-skill loop it replaces in
+TalentConcentrationCalculator.analyze_job_postings:
+
+  whole-word skills   re.search(r"\\b skill \\b", desc)
+  other skills        skill in desc, else (len >= fuzzy_min_len)
+                      fuzz.partial_ratio(skill, desc) >= fuzzy_threshold
+
+Instead of one regex / substring test / partial_ratio per skill:
+
+  - whole-word skills: one alternation regex, longest skill first, tried at
+    every offset; a shorter whole-word skill that is a prefix of the one
+    reported (c / c++) is checked at the same offset
+  - substring skills and the n-gram pieces of the fuzzy-eligible skills:
+    one keyword_matcher automaton, scanned once per description
+  - fuzzy: partial_ratio is the best fuzz.ratio over the windows of the
+    description that have the skill's length L (plus shorter windows at
+    the two ends). A full window can only reach a ratio of t = threshold
+    / 100 with an LCS of at least t·L, i.e. at most k = L - ceil(t·L)
+    skill characters and k window characters left out of the alignment.
+    Each of those breaks at most one of 2k + 1 contiguous pieces of the
+    skill, so one piece occurs verbatim in the window, shifted by at most
+    k from its place in the skill (for L < 9 at the default threshold
+    k = 0: only an exact hit, handled above). Only the regions around
+    piece hits can hold a matching window; a skill whose regions (and end
+    windows) score below the threshold cannot match and is never scored
+    against the full text. The rest are scored with the very same
+    partial_ratio, for all descriptions at once, with
+    rapidfuzz.process.cpdist (multi-threaded via `workers=`).
+
+The filter only ever skips a skill that cannot reach the threshold, so the
+result is identical. Results are cached per description text.
+
+Usage:
+    extractor = SkillExtractor(skills, whole_word_skills, fuzzy_threshold=88, fuzzy_min_len=6)
+    skill_sets = extractor.extract_many([desc.lower() for desc in descriptions])
+"""
+import math
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from app.pipelines.keyword_matcher import KeywordMatcher, KeywordScan
+
+
+def _pieces(text: str, n: int) -> Tuple[Tuple[str, int], ...]:
+    """text cut into n contiguous, near-equal pieces, with their offsets."""
+    bounds = [round(i * len(text) / n) for i in range(n + 1)]
+    return tuple((text[a:b], a) for a, b in zip(bounds, bounds[1:]))
+
+
+class SkillExtractor:
+    """Compiled skill table; thread-safe."""
+
+    def __init__(
+        self,
+        skills: Iterable[str],
+        whole_word_skills: Iterable[str],
+        fuzzy_threshold: float,
+        fuzzy_min_len: int,
+        workers: int = -1,
+        cache_size: int = 4096,
+    ):
+        skills = frozenset(skills)
+        whole_word = skills & frozenset(whole_word_skills)
+        self.fuzzy_threshold = fuzzy_threshold
+        self.workers = workers
+        self.cache_size = cache_size
+
+        # Whole-word skills: longest first, so the reported alternative is the
+        # longest whole-word skill at an offset; shorter ones are its prefixes.
+        by_length = sorted(whole_word, key=lambda s: (-len(s), s))
+        self._whole_word = (
+            re.compile(r"(?=\b(" + "|".join(re.escape(s) for s in by_length) + r")\b)")
+            if by_length else None
+        )
+        self._prefixes: Dict[str, Tuple[Tuple[str, "re.Pattern[str]"], ...]] = {
+            s: tuple((p, re.compile(re.escape(p) + r"\b")) for p in by_length if p != s and s.startswith(p))
+            for s in by_length
+        }
+        self._n_whole_word = len(by_length)
+
+        # Substring skills; per fuzzy-eligible skill, k and its 2k + 1 pieces
+        self.substring_skills: Tuple[str, ...] = tuple(sorted(skills - whole_word))
+        ratio = fuzzy_threshold / 100.0
+        # (no pieces when only an exact hit can reach the threshold)
+        self._fuzzy: Dict[str, Tuple[int, Tuple[Tuple[str, int], ...]]] = {}
+        pieces: Set[str] = set()
+        for skill in self.substring_skills:
+            if len(skill) < fuzzy_min_len:
+                continue
+            max_diff = len(skill) - math.ceil(ratio * len(skill) - 1e-9)
+            self._fuzzy[skill] = (max_diff, _pieces(skill, 2 * max_diff + 1) if max_diff > 0 else ())
+            pieces.update(piece for piece, _ in self._fuzzy[skill][1])
+        self._edge = 2 * max((len(skill) for skill in self._fuzzy), default=0)
+        self._matcher = KeywordMatcher(set(self.substring_skills) | pieces)
+
+        self._cache: "OrderedDict[str, FrozenSet[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Per-description stages                                             #
+    # ------------------------------------------------------------------ #
+
+    def _whole_word_hits(self, desc: str) -> Set[str]:
+        found: Set[str] = set()
+        if self._whole_word is None:
+            return found
+        for m in self._whole_word.finditer(desc):
+            skill = m.group(1)
+            found.add(skill)
+            pos = m.start()
+            for prefix, pattern in self._prefixes[skill]:
+                if prefix not in found and pattern.match(desc, pos):
+                    found.add(prefix)
+            if len(found) == self._n_whole_word:
+                break
+        return found
+
+    def _in_regions(self, skill: str, desc: str, scan: KeywordScan) -> bool:
+        """False only if no full window of desc scores the threshold."""
+        size = len(skill)
+        max_diff, pieces = self._fuzzy[skill]
+        starts = sorted(
+            pos - offset
+            for piece, offset in pieces
+            for pos in scan.positions.get(piece, ())
+        )
+        if not starts:
+            return False
+        # Windows start within max_diff of a hit's aligned start; merge the
+        # overlapping regions. partial_ratio on a region is at least the best
+        # full window inside it (its cut ends can only score higher).
+        lo, hi = starts[0] - max_diff, starts[0] + max_diff
+        for start in starts[1:] + [None]:
+            if start is not None and start - max_diff <= hi + size:
+                hi = start + max_diff
+                continue
+            region = desc[max(lo, 0):hi + size]
+            if fuzz.partial_ratio(skill, region, score_cutoff=self.fuzzy_threshold) >= self.fuzzy_threshold:
+                return True
+            if start is not None:
+                lo, hi = start - max_diff, start + max_diff
+        return False
+
+    def _stage(self, desc: str) -> Tuple[Set[str], List[str]]:
+        """(skills found exactly, fuzzy candidates still to score)."""
+        found = self._whole_word_hits(desc)
+        scan = self._matcher.scan(desc)
+        fuzzy = []
+        for skill in self.substring_skills:
+            if skill in scan:
+                found.add(skill)
+            elif skill in self._fuzzy:
+                fuzzy.append(skill)
+        if not fuzzy:
+            return found, []
+
+        # End windows (desc[:i], desc[-i:]): partial_ratio against the first
+        # and last few characters sees them all, in one call for all skills.
+        ends = process.cdist(
+            fuzzy, [desc[:self._edge], desc[-self._edge:]],
+            scorer=fuzz.partial_ratio, score_cutoff=self.fuzzy_threshold, dtype=np.float64,
+        )
+        candidates = [
+            skill for skill, end_scores in zip(fuzzy, ends.tolist())
+            if len(desc) < 2 * len(skill)
+            or max(end_scores) >= self.fuzzy_threshold
+            or (self._fuzzy[skill][1] and self._in_regions(skill, desc, scan))
+        ]
+        return found, candidates
+
+    # ------------------------------------------------------------------ #
+    # Public API                                                         #
+    # ------------------------------------------------------------------ #
+
+    def extract_many(self, descriptions: Sequence[str]) -> List[FrozenSet[str]]:
+        """Skill set per (lower-cased) description, in input order."""
+        results: Dict[str, FrozenSet[str]] = {}
+        with self._lock:
+            for desc in descriptions:
+                hit = self._cache.get(desc)
+                if hit is not None:
+                    self._cache.move_to_end(desc)
+                    results[desc] = hit
+        pending = [d for d in dict.fromkeys(descriptions) if d not in results]
+
+        staged = [self._stage(desc) for desc in pending]
+        pairs = [(i, skill) for i, (_, candidates) in enumerate(staged) for skill in candidates]
+        if pairs:
+            scores = process.cpdist(
+                [skill for _, skill in pairs], [pending[i] for i, _ in pairs],
+                scorer=fuzz.partial_ratio, score_cutoff=self.fuzzy_threshold,
+                dtype=np.float64, workers=self.workers,
+            )
+            for (i, skill), score in zip(pairs, scores.tolist()):
+                if score >= self.fuzzy_threshold:
+                    staged[i][0].add(skill)
+
+        with self._lock:
+            for desc, (found, _) in zip(pending, staged):
+                results[desc] = self._cache[desc] = frozenset(found)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [results[desc] for desc in descriptions]
+
+    def extract(self, description: str) -> FrozenSet[str]:
+        return self.extract_many([description])[0]
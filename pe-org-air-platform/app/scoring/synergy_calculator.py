@@ -16,7 +16,8 @@ import logging
 from dataclasses import dataclass
 from decimal import Decimal
 
-from app.scoring.utils import clamp
+from app.scoring.batch_kernel import synergy_batch, to_scalar
+from app.scoring.utils import to_clamped_decimal, to_decimal
 
 logger = logging.getLogger(__name__)
 
@@ -69,31 +70,17 @@ class SynergyCalculator:
         vr_d = Decimal(str(vr_score))
         hr_d = Decimal(str(hr_score))
 
-        # Clamp timing factor to [0.8, 1.2]
-        tf_d = clamp(
-            Decimal(str(timing_factor)),
-            self.TIMING_MIN,
-            self.TIMING_MAX,
-        )
-
-        # Compute alignment
-        if alignment is None:
-            alignment_d = Decimal("1") - abs(vr_d - hr_d) / Decimal("100")
-        else:
-            alignment_d = clamp(
-                Decimal(str(alignment)),
-                Decimal("0"),
-                Decimal("1"),
-            )
-
-        # Synergy = (VR × HR / 100) × Alignment × TimingFactor
-        raw = (vr_d * hr_d / Decimal("100")) * alignment_d * tf_d
-
-        synergy = clamp(
-            raw.quantize(Decimal("0.01")),
-            Decimal("0"),
-            Decimal("100"),
+        batch = synergy_batch(
+            float(vr_score),
+            float(hr_score),
+            alignment=alignment,
+            timing_factor=float(timing_factor),
+            timing_min=float(self.TIMING_MIN),
+            timing_max=float(self.TIMING_MAX),
         )
+        synergy = to_clamped_decimal(to_scalar(batch.synergy_score))
+        alignment_d = to_decimal(to_scalar(batch.alignment), 4)
+        tf_d = to_decimal(to_scalar(batch.timing_factor), 4)
 
         logger.info(
             "synergy_calculated",
@@ -110,6 +97,6 @@ class SynergyCalculator:
             synergy_score=synergy,
             vr_used=vr_d,
             hr_used=hr_d,
-            alignment=alignment_d.quantize(Decimal("0.0001")),
-            timing_factor=tf_d.quantize(Decimal("0.0001")),
+            alignment=alignment_d,
+            timing_factor=tf_d,
         )
@@ -4,10 +4,13 @@ import logging
 import re
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import Iterable, List, Optional, Set
 
 from rapidfuzz import fuzz
 
+from app.scoring.skill_extractor import SkillExtractor
+
 logger = logging.getLogger(__name__)
 
 _SKILL_FUZZY_THRESHOLD     = 88   # partial_ratio: skill name vs description text
@@ -83,6 +86,24 @@ _WHOLE_WORD_SKILLS = frozenset([
 # _SKILL_DENOMINATOR = 25
 _SKILL_DENOMINATOR = 35
 
+
+@lru_cache(maxsize=1)
+def _skill_extractor() -> SkillExtractor:
+    """_EXPANDED_AI_SKILLS compiled once (see skill_extractor.py)."""
+    return SkillExtractor(
+        _EXPANDED_AI_SKILLS, _WHOLE_WORD_SKILLS,
+        fuzzy_threshold=_SKILL_FUZZY_THRESHOLD,
+        fuzzy_min_len=_FUZZY_SKILL_MIN_LEN,
+    )
+
+
+def _fuzzy_word_match(words: Iterable[str], kw_set: Set[str]) -> bool:
+    return any(
+        fuzz.ratio(w, kw) >= _SENIORITY_FUZZY_THRESHOLD
+        for w in words for kw in kw_set
+    )
+
+
 @dataclass
 class JobAnalysis:
     """Analysis of job postings for talent concentration."""
@@ -122,6 +143,7 @@ class TalentConcentrationCalculator:
         Skills are collected from TWO sources per posting:
           1. ai_skills_found (pre-computed by CS2 pipeline)
           2. Full description text scanned against _EXPANDED_AI_SKILLS
+             (all descriptions in one SkillExtractor batch)
         """
         senior_keywords = {"principal", "staff", "director", "vp", "head", "chief"}
         mid_keywords = {"senior", "lead", "manager"}
@@ -132,6 +154,7 @@ class TalentConcentrationCalculator:
         mid_ai_jobs = 0
         entry_ai_jobs = 0
         unique_skills: Set[str] = set()
+        descriptions: List[str] = []
 
         for posting in postings:
             if not posting.get("is_ai_role", False):
@@ -148,11 +171,6 @@ class TalentConcentrationCalculator:
             else:
                 # Fuzzy fallback: catches punctuation-attached words ("director,")
                 # and 1-2 char typos ("senor", "pricipal")
-                def _fuzzy_word_match(words, kw_set):
-                    return any(
-                        fuzz.ratio(w, kw) >= _SENIORITY_FUZZY_THRESHOLD
-                        for w in words for kw in kw_set
-                    )
                 if _fuzzy_word_match(title_words, senior_keywords):
                     senior_ai_jobs += 1
                 elif _fuzzy_word_match(title_words, mid_keywords):
@@ -164,20 +182,14 @@ class TalentConcentrationCalculator:
             unique_skills.update(posting.get("ai_skills_found", []))
 
             # Source 2: scan full description for expanded skill list
+            # (short tokens whole-word only; others substring, then fuzzy
+            # for "pytoch", "scikit learn", "tensor rt", etc.)
             desc = posting.get("description", "").lower()
             if desc:
-                for skill in _EXPANDED_AI_SKILLS:
-                    if skill in _WHOLE_WORD_SKILLS:
-                        # Short tokens: keep regex whole-word, no fuzzy (too short = high false-positive risk)
-                        if re.search(r"\b" + re.escape(skill) + r"\b", desc):
-                            unique_skills.add(skill)
-                    elif skill in desc:
-                        # Exact substring fast path
-                        unique_skills.add(skill)
-                    elif len(skill) >= _FUZZY_SKILL_MIN_LEN:
-                        # Fuzzy fallback: catches "pytoch", "scikit learn", "tensor rt", etc.
-                        if fuzz.partial_ratio(skill, desc) >= _SKILL_FUZZY_THRESHOLD:
-                            unique_skills.add(skill)
+                descriptions.append(desc)
+
+        for skills in _skill_extractor().extract_many(descriptions):
+            unique_skills.update(skills)
 
         return JobAnalysis(
             total_ai_jobs=total_ai_jobs,
@@ -209,10 +221,9 @@ class TalentConcentrationCalculator:
 
         # --- Attempt 1: timestamped subfolder path ---
         prefix = f"glassdoor_signals/raw/{ticker_upper}/"
-        keys = svc.list_files(prefix)
-        if keys:
-            latest_key = sorted(keys)[-1]
-            reviews = TalentConcentrationCalculator._parse_glassdoor_s3(svc, latest_key, ticker_upper)
+        latest = svc.latest_object(prefix)
+        if latest is not None:
+            reviews = TalentConcentrationCalculator._parse_glassdoor_s3(svc, latest.key, ticker_upper, latest.etag)
             if reviews is not None:
                 return reviews
 
@@ -226,9 +237,11 @@ class TalentConcentrationCalculator:
         return []
 
     @staticmethod
-    def _parse_glassdoor_s3(svc, key: str, ticker: str) -> Optional[List["GlassdoorReview"]]:
+    def _parse_glassdoor_s3(
+        svc, key: str, ticker: str, etag: Optional[str] = None,
+    ) -> Optional[List["GlassdoorReview"]]:
         """Parse a single Glassdoor S3 JSON file into GlassdoorReview list."""
-        raw = svc.get_file(key)
+        raw = svc.get_file(key, etag)
         if raw is None:
             return None
 
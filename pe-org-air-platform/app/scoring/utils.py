@@ -25,6 +25,22 @@ def clamp(
     return max(min_val, min(max_val, value))
 
 
+def to_clamped_decimal(
+    value: float,
+    places: int = 2,
+    min_val: Decimal = Decimal("0"),
+    max_val: Decimal = Decimal("100"),
+) -> Decimal:
+    """
+    Quantize, then clamp — as the scalar calculators did.
+
+    A value at or past a bound comes back as the bound itself
+    (Decimal("100"), not Decimal("100.00")), matching the serialized
+    scores of clamp(score.quantize(Decimal("0.01"))).
+    """
+    return clamp(to_decimal(value, places), min_val, max_val)
+
+
 def weighted_mean(values: List[Decimal], weights: List[Decimal]) -> Decimal:
     """
     Calculate weighted mean.
@@ -10,6 +10,9 @@ Formula:
     TalentRiskAdj = 1 − 0.15 × max(0, TC − 0.25)
     V^R = weighted_dim × TalentRiskAdj   clamped to [0, 100]
 
+The arithmetic lives in app/scoring/batch_kernel.py (vr_batch); this class
+is the single-company wrapper.
+
 Dimension weights from CLAUDE.md / config.py (sum = 1.0):
     data_infrastructure  0.18
     talent_skills        0.17
@@ -24,7 +27,10 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict
 
-from app.scoring.utils import weighted_std_dev, coefficient_of_variation, clamp
+import numpy as np
+
+from app.scoring.batch_kernel import to_scalar, vr_batch
+from app.scoring.utils import to_clamped_decimal, to_decimal
 
 logger = structlog.get_logger(__name__)
 
@@ -40,6 +46,11 @@ _DIM_WEIGHTS: Dict[str, Decimal] = {
 }
 
 
+def dimension_weight_vector() -> np.ndarray:
+    """_DIM_WEIGHTS as a float vector, in key order (columns of the batch kernel)."""
+    return np.array([float(w) for w in _DIM_WEIGHTS.values()])
+
+
 @dataclass
 class VRResult:
     """Output of VRCalculator.calculate()."""
@@ -72,58 +83,35 @@ class VRCalculator:
         """
         tc = Decimal(str(round(talent_concentration, 4)))
 
-        # Weighted average of dimension scores — collect parallel lists for CV
-        weighted_sum = Decimal("0")
-        total_weight = Decimal("0")
-        values: list[Decimal] = []
-        weights: list[Decimal] = []
-        for dim_val, score in dimension_scores.items():
-            w = _DIM_WEIGHTS.get(dim_val, Decimal("0"))
-            if w == 0:
-                continue
-            d_score = Decimal(str(float(score)))
-            weighted_sum += d_score * w
-            total_weight += w
-            values.append(d_score)
-            weights.append(w)
-
-        weighted_dim = (weighted_sum / total_weight) if total_weight > 0 else Decimal("50")
-
-        # TalentRiskAdj = 1 − 0.15 × max(0, TC − 0.25)
-        adj = Decimal("1") - Decimal("0.15") * max(Decimal("0"), tc - Decimal("0.25"))
-        adj = max(Decimal("0"), min(Decimal("1"), adj))
-
-        # Non-compensatory CV penalty (λ = 0.25)
-        std_dev = weighted_std_dev(values, weights, weighted_dim)
-        cv_D = coefficient_of_variation(std_dev, weighted_dim)
-        cv_penalty = clamp(
-            Decimal("1") - Decimal("0.25") * cv_D,
-            Decimal("0"),
-            Decimal("1"),
-        )
+        # One-row call into the batch kernel; unknown keys keep weight 0 (NaN column)
+        row = np.array([[
+            float(dimension_scores[dim]) if dim in dimension_scores else np.nan
+            for dim in _DIM_WEIGHTS
+        ]])
+        batch = vr_batch(row, dimension_weight_vector(), talent_concentration)
 
-        vr = clamp(
-            (weighted_dim * adj * cv_penalty).quantize(Decimal("0.01")),
-            Decimal("0"),
-            Decimal("100"),
-        )
+        weighted_dim = to_scalar(batch.weighted_dim_score)
+        adj = to_scalar(batch.talent_risk_adj)
+        cv_D = to_scalar(batch.coefficient_of_variation)
+        cv_penalty = to_scalar(batch.cv_penalty)
+        vr = to_scalar(batch.vr_score)
 
         logger.info(
             "vr_calculated",
             sector=sector,
             dimension_scores=dimension_scores,
-            weighted_dim_score=float(weighted_dim),
+            weighted_dim_score=weighted_dim,
             talent_concentration=float(tc),
-            talent_risk_adj=float(adj),
-            cv_D=float(cv_D),
-            cv_penalty=float(cv_penalty),
-            vr_score=float(vr),
+            talent_risk_adj=adj,
+            cv_D=cv_D,
+            cv_penalty=cv_penalty,
+            vr_score=vr,
         )
 
         return VRResult(
-            vr_score=vr,
-            weighted_dim_score=weighted_dim.quantize(Decimal("0.01")),
-            talent_risk_adj=adj.quantize(Decimal("0.0001")),
-            cv_penalty=cv_penalty.quantize(Decimal("0.0001")),
+            vr_score=to_clamped_decimal(vr),
+            weighted_dim_score=to_decimal(weighted_dim, 2),
+            talent_risk_adj=to_decimal(adj, 4),
+            cv_penalty=to_decimal(cv_penalty, 4),
             talent_concentration=tc,
         )
@@ -0,0 +1,146 @@
+"""
+Benchmark the response cache codecs: stored size and Redis-tier hit latency.
+
+Caches a synthetic PaginatedCompanyResponse (the /companies list payload)
+through TieredCache once per codec — text, orjson, msgpack (when
+installed) and orjson + zstd — with the L1 tier disabled, so every hit is
+a Redis GET plus a decode. For each codec this reports:
+  - bytes stored per entry (MEMORY USAGE of the key with --redis-url)
+  - hit latency through model validation (cache.get) and through the
+    trusted path (plain data, what the list endpoints send back)
+  - that every codec returns exactly the original response
+
+Without --redis-url values live in an in-process dict, which measures
+encode/decode cost only (no network round trip).
+
+Usage:
+    python -m app.scripts.bench_cache_codecs
+    python -m app.scripts.bench_cache_codecs --items 500 --repeat 2000
+    python -m app.scripts.bench_cache_codecs --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+from uuid import uuid4
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.config import settings
+from app.models.company import CompanyResponse, PaginatedCompanyResponse
+from app.services.cache_codecs import MSGPACK_AVAILABLE, ZSTD_AVAILABLE, get_codec
+from app.services.tiered_cache import CircuitBreaker, TieredCache
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+BENCH_KEY = "bench:codecs:companies"
+
+
+class _DictRedis:
+    """In-process stand-in for the Redis client (GET/SETEX only)."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    def unlink(self, key):
+        return int(self.data.pop(key, None) is not None)
+
+    def memory_usage(self, key):
+        value = self.data.get(key)
+        return len(value.encode("utf-8") if isinstance(value, str) else value) if value is not None else None
+
+
+class _DictBackend:
+    def __init__(self):
+        self.client = self.binary_client = _DictRedis()
+
+
+def _payload(n: int) -> PaginatedCompanyResponse:
+    now = datetime.now(timezone.utc)
+    items = [
+        CompanyResponse(
+            name=f"Portfolio Company {i:04d} Holdings", ticker_symbol=f"T{i:04d}", industry_id=uuid4(),
+            position_factor=round((i % 200) / 100 - 1.0, 2), created_at=now, updated_at=now,
+        )
+        for i in range(n)
+    ]
+    return PaginatedCompanyResponse(items=items, total=n, page=1, page_size=n, total_pages=1)
+
+
+def _best(fn, repeat: int) -> float:
+    """Best per-call time of `repeat` calls, in microseconds (median of 5 rounds)."""
+    rounds = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        rounds.append((time.perf_counter() - start) / repeat * 1e6)
+    return sorted(rounds)[2]
+
+
+def main(items: int, repeat: int, redis_url: Optional[str]) -> int:
+    if redis_url:
+        from app.services.redis_cache import RedisCache
+        settings.REDIS_URL = redis_url
+        backend = RedisCache()
+    else:
+        backend = _DictBackend()
+
+    value = _payload(items)
+    expected = value.model_dump(mode="json")
+    variants = [("text", "text", 0), ("orjson", "orjson", 0)]
+    if MSGPACK_AVAILABLE:
+        variants.append(("msgpack", "msgpack", 0))
+    if ZSTD_AVAILABLE:
+        variants.append(("orjson+zstd", "orjson", 1))
+        if MSGPACK_AVAILABLE:
+            variants.append(("msgpack+zstd", "msgpack", 1))
+    logger.info(f"📦 {items} companies, {len(value.model_dump_json()):,} bytes of JSON, "
+                f"{'Redis ' + redis_url if redis_url else 'in-process dict'}")
+
+    print()
+    print(f"{'Codec':<14} {'Stored bytes':>13} {'vs text':>8} {'Validated µs':>13} {'Trusted µs':>11} {'Same':>5}")
+    print("-" * 70)
+    baseline: List[float] = []
+    failed = []
+    for label, codec, compress_min_bytes in variants:
+        cache = TieredCache(backend, l1_ttl_seconds=0, breaker=CircuitBreaker(), codec=get_codec(codec),
+                            compress_min_bytes=compress_min_bytes)
+        cache.set(BENCH_KEY, value, 300)
+        stored = backend.binary_client.memory_usage(BENCH_KEY) or 0
+
+        def trusted():
+            return cache.get_or_load(BENCH_KEY, PaginatedCompanyResponse, 300, _payload, trusted=True)[0]
+
+        same = cache.get(BENCH_KEY, PaginatedCompanyResponse) == value and trusted() == expected
+        if not same:
+            failed.append(label)
+        t_validated = _best(lambda: cache.get(BENCH_KEY, PaginatedCompanyResponse), repeat)
+        t_trusted = _best(trusted, repeat)
+        if not baseline:
+            baseline = [stored]
+        print(f"{label:<14} {stored:>13,} {stored / baseline[0]:>8.0%} {t_validated:>13.1f} {t_trusted:>11.1f} "
+              f"{'✅' if same else '❌':>5}")
+        backend.client.unlink(BENCH_KEY)
+
+    print()
+    return 0 if not failed else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cache codec size + hit latency benchmark")
+    parser.add_argument("--items", type=int, default=100, help="Companies in the cached list response")
+    parser.add_argument("--repeat", type=int, default=500, help="Cache hits per timing round")
+    parser.add_argument("--redis-url", help="Measure against this Redis (use a scratch DB)")
+    args = parser.parse_args()
+
+    sys.exit(main(args.items, args.repeat, args.redis_url))
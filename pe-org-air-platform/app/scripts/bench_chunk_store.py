@@ -0,0 +1,138 @@
+"""
+Benchmark the Parquet chunk store against the JSON chunk files it replaces.
+
+A scoring run reads a ticker's 10-K chunk files once and extracts the
+text of three section groups (SEC_SECTION_MAP) plus, when those come up
+short, every chunk. The legacy path downloaded each JSON file, json.loads
+it whole and filtered the chunk dicts per section; the chunk store opens
+the Parquet file and decodes only the matching row groups' content column.
+
+Over the chunk files in data/chunks/*/ by default (each directory is one
+ticker's run), this reports per run and in total:
+  - bytes transferred (file sizes) in each format
+  - parse + extract time of both paths, best of --repeat
+  - that both paths extract identical text for every section group
+
+Usage:
+    python -m app.scripts.bench_chunk_store
+    python -m app.scripts.bench_chunk_store data/chunks/DE/*.json --repeat 5
+"""
+
+import argparse
+import glob
+import json
+import logging
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.pipelines.chunk_store import ChunkFile, json_to_parquet
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+# ScoringService.SEC_SECTION_MAP (kept here so the bench imports no services)
+SECTION_GROUPS = [
+    ["business", "item_1_business", "item_1"],
+    ["risk_factors", "item_1a_risk_factors", "item_1a"],
+    ["mda", "item_7_mda", "item_7"],
+]
+
+
+def legacy_parse_chunk_file(data: bytes) -> List[Dict]:
+    """The previous ScoringService._parse_chunk_file (reference)."""
+    parsed = json.loads(data.decode("utf-8"))
+    if isinstance(parsed, list):
+        return parsed
+    if isinstance(parsed, dict):
+        if "chunks" in parsed:
+            return parsed["chunks"]
+        if "content" in parsed:
+            return [parsed]
+    return []
+
+
+def legacy_run(files: List[bytes]) -> List[Optional[str]]:
+    """Section texts + all-chunks text of one scoring run, the previous way (reference)."""
+    parsed = [legacy_parse_chunk_file(data) for data in files]
+    texts = []
+    for names in SECTION_GROUPS:
+        wanted = {s.lower() for s in names}
+        parts = [
+            c.get("content", "") for chunks in parsed for c in chunks
+            if (c.get("section") or "").lower() in wanted and c.get("content", "") and c.get("content", "").strip()
+        ]
+        texts.append("\n\n".join(parts) or None)
+    everything = [c for chunks in parsed for c in chunks]
+    texts.append("\n\n".join(c.get("content", "") for c in everything if c.get("content")) or None)
+    return texts
+
+
+def store_run(files: List[bytes]) -> List[Optional[str]]:
+    """Section texts + all-chunks text of one scoring run through ChunkFile."""
+    opened = [ChunkFile.open(data) for data in files]
+    texts = []
+    for names in SECTION_GROUPS:
+        parts = [c for f in opened for c in f.contents(names) if c.strip()]
+        texts.append("\n\n".join(parts) or None)
+    texts.append("\n\n".join(c for f in opened for c in f.contents()) or None)
+    return texts
+
+
+def _best(fn, files: List[bytes], repeat: int):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(files)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(paths: List[str], repeat: int) -> int:
+    runs: Dict[str, List[bytes]] = defaultdict(list)
+    for p in paths:
+        runs[Path(p).parent.name].append(Path(p).read_bytes())
+    logger.info(f"📚 Corpus: {len(paths)} chunk files, {len(runs)} scoring run(s)")
+
+    print()
+    print(f"{'Run':<10} {'Files':>5} {'JSON bytes':>12} {'Parquet bytes':>14} {'JSON s':>8} {'Parquet s':>10} {'Same':>5}")
+    print("-" * 70)
+    totals = [0, 0, 0.0, 0.0]
+    mismatches = []
+    for run, json_files in sorted(runs.items()):
+        parquet_files = [json_to_parquet(data) for data in json_files]
+        t_old, old = _best(legacy_run, json_files, repeat)
+        t_new, new = _best(store_run, parquet_files, repeat)
+        same = old == new and store_run(json_files) == old   # JSON fallback reads identically too
+        if not same:
+            mismatches.append(run)
+        json_bytes, parquet_bytes = sum(map(len, json_files)), sum(map(len, parquet_files))
+        for i, v in enumerate((json_bytes, parquet_bytes, t_old, t_new)):
+            totals[i] += v
+        print(f"{run:<10} {len(json_files):>5} {json_bytes:>12,} {parquet_bytes:>14,} "
+              f"{t_old:>8.3f} {t_new:>10.3f} {'✅' if same else '❌':>5}")
+
+    print("-" * 70)
+    print(f"{'total':<10} {len(paths):>5} {totals[0]:>12,} {totals[1]:>14,} {totals[2]:>8.3f} {totals[3]:>10.3f}")
+    print()
+    print(f"Bytes transferred:        {totals[1] / totals[0]:.0%} of JSON")
+    print(f"Parse + extract speed-up: {totals[2] / totals[3] if totals[3] else float('inf'):.1f}x")
+    print(f"Identical text:           {'✅' if not mismatches else '❌ ' + ', '.join(mismatches)}")
+    print()
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Parquet vs. JSON chunk file size + read benchmark")
+    parser.add_argument("paths", nargs="*", help="JSON chunk files (default: data/chunks/*/*.json)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("data/chunks/*/*.json"))
+    if not paths:
+        logger.error("No corpus found — pass JSON chunk files explicitly")
+        sys.exit(2)
+
+    sys.exit(main(paths, args.repeat))
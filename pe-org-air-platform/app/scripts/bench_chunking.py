@@ -0,0 +1,137 @@
+"""
+Benchmark SemanticChunker against the word-list implementation it replaced.
+
+The legacy chunker re-joined `words[:start_idx]` for every chunk to estimate
+start_char, which is quadratic in section length, and its offsets drifted
+wherever the source had more than one whitespace character between words.
+
+For a 100k-word 10-K section (built from data/parsed/*/*_content.txt by
+default) this reports:
+  - wall time of both implementations and the speed-up
+  - that the word grouping is identical (same words in every chunk)
+  - that new offsets are exact: text[start_char:end_char] == content
+  - how many legacy offsets were wrong
+  - peak words held by the streaming generator
+
+Usage:
+    python -m app.scripts.bench_chunking
+    python -m app.scripts.bench_chunking --words 250000 --repeat 3
+    python -m app.scripts.bench_chunking path/to/10k.txt
+"""
+
+import argparse
+import glob
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+from app.pipelines.chunking import SemanticChunker
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+
+def legacy_chunk_text(text: str, chunk_size: int = 750, chunk_overlap: int = 50, min_chunk_size: int = 100) -> List[dict]:
+    """The previous SemanticChunker._chunk_text (reference)."""
+    words = text.split()
+    if len(words) <= min_chunk_size:
+        return [{"content": text, "start_char": 0, "end_char": len(text), "word_count": len(words)}]
+    chunks = []
+    start_idx = 0
+    while start_idx < len(words):
+        end_idx = min(start_idx + chunk_size, len(words))
+        if len(words) - end_idx < min_chunk_size:
+            end_idx = len(words)
+        chunk_words = words[start_idx:end_idx]
+        chunk_content = " ".join(chunk_words)
+        start_char = len(" ".join(words[:start_idx])) if start_idx > 0 else 0
+        chunks.append({
+            "content": chunk_content,
+            "start_char": start_char,
+            "end_char": start_char + len(chunk_content),
+            "word_count": len(chunk_words),
+        })
+        start_idx = end_idx - chunk_overlap
+        if end_idx >= len(words):
+            break
+    return chunks
+
+
+def build_section(paths: List[str], n_words: int) -> str:
+    """Concatenate filings (original whitespace kept) until the section has n_words words."""
+    parts, count = [], 0
+    while count < n_words:
+        for p in paths:
+            body = Path(p).read_text(encoding="utf-8", errors="ignore")
+            parts.append(body)
+            count += len(body.split())
+            if count >= n_words:
+                break
+    text = "\n".join(parts)
+    # Trim to exactly n_words words, keeping the original spacing
+    words = 0
+    in_word = False
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            in_word = False
+        elif not in_word:
+            in_word = True
+            words += 1
+            if words > n_words:
+                return text[:i]
+    return text
+
+
+def main(paths: List[str], n_words: int, repeat: int) -> int:
+    text = build_section(paths, n_words)
+    logger.info(f"📄 Section: {len(text.split()):,} words, {len(text):,} characters")
+
+    chunker = SemanticChunker()
+
+    t_old = t_new = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        old = legacy_chunk_text(text)
+        t_old = min(t_old, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        new = list(chunker.iter_chunks(text, "bench", "item_7"))
+        t_new = min(t_new, time.perf_counter() - start)
+
+    same_grouping = len(old) == len(new) and all(
+        o["content"].split() == n.content.split() and o["word_count"] == n.word_count
+        for o, n in zip(old, new)
+    )
+    exact = all(text[c.start_char:c.end_char] == c.content for c in new)
+    legacy_wrong = sum(text[o["start_char"]:o["end_char"]] != o["content"] for o in old)
+
+    print()
+    print(f"{'Implementation':<16} {'Chunks':>7} {'Seconds':>10}")
+    print("-" * 36)
+    print(f"{'legacy':<16} {len(old):>7} {t_old:>10.3f}")
+    print(f"{'streaming':<16} {len(new):>7} {t_new:>10.3f}")
+    print()
+    print(f"Speed-up:                 {t_old / t_new if t_new else float('inf'):.1f}x")
+    print(f"Identical word grouping:  {'✅' if same_grouping else '❌'}")
+    print(f"Exact offsets (new):      {'✅' if exact else '❌'}")
+    print(f"Legacy offsets wrong:     {legacy_wrong}/{len(old)}")
+    print(f"Peak words buffered:      {chunker.chunk_size + chunker.min_chunk_size} (vs {len(text.split()):,})")
+    print()
+    return 0 if same_grouping and exact else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SemanticChunker parity + speed benchmark")
+    parser.add_argument("paths", nargs="*", help="10-K text files (default: data/parsed/*/*_content.txt)")
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("data/parsed/*/*_content.txt"))
+    if not paths:
+        logger.error("No input text found — pass 10-K text files explicitly")
+        sys.exit(2)
+
+    sys.exit(main(paths, args.words, args.repeat))
@@ -0,0 +1,120 @@
+"""
+Benchmark the vectorized company matcher against is_company_match_fuzzy.
+
+Synthetic scrape results: for every ticker in COMPANY_NAME_MAPPINGS and
+each of its job search names, --rows rows of employer names drawn from the
+ticker's aliases, typo'd and suffixed variants, other portfolio companies
+and staffing agencies (about a third of the rows are distinct names, as in
+real jobspy output). Both paths are timed over the same rows and must
+produce identical accept/reject decisions.
+
+  legacy    is_company_match_fuzzy per row (the old iterrows loop)
+  matcher   CompanyNameMatcher.match_mask over the column, cold (fresh
+            matcher) and warm (decisions memoized from a previous search)
+
+Usage:
+    python -m app.scripts.bench_company_matcher
+    python -m app.scripts.bench_company_matcher --rows 10000 --workers 4
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from typing import List
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.config import COMPANY_NAME_MAPPINGS, get_job_search_names
+from app.pipelines.company_matcher import CompanyNameMatcher
+from app.pipelines.job_signals import is_company_match_fuzzy
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+THRESHOLD = 75.0
+AGENCIES = ["Robert Half", "Insight Global", "TEKsystems", "Randstad", "Staffing Solutions LLC",
+            "Jobot", "CyberCoders", "Apex Systems", "Kforce", "Actalent"]
+SUFFIXES = ["", " Inc", " Inc.", " LLC", " Corp", " Careers", " Technology", " Services", " USA"]
+
+
+def _typo(rng: random.Random, name: str) -> str:
+    if len(name) < 4:
+        return name
+    i = rng.randrange(1, len(name) - 1)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def synthetic_rows(rng: random.Random, ticker: str, rows: int) -> List[str]:
+    own = COMPANY_NAME_MAPPINGS[ticker]["aliases"]
+    others = [a for t, m in COMPANY_NAME_MAPPINGS.items() if t != ticker for a in m["aliases"]]
+    out = []
+    for _ in range(rows):
+        pick = rng.random()
+        if pick < 0.4:
+            name = rng.choice(own) + rng.choice(SUFFIXES)
+        elif pick < 0.5:
+            name = _typo(rng, rng.choice(own))
+        elif pick < 0.75:
+            name = rng.choice(others) + rng.choice(SUFFIXES)
+        else:
+            name = f"{rng.choice(AGENCIES)} {rng.randrange(rows // 3)}"
+        out.append(rng.choice([name, name.upper(), f" {name} "]))
+    return out
+
+
+def main(rows: int, repeat: int, workers: int, seed: int) -> int:
+    rng = random.Random(seed)
+    cases = [
+        (ticker, name, synthetic_rows(rng, ticker, rows))
+        for ticker in sorted(COMPANY_NAME_MAPPINGS)
+        for name in (get_job_search_names(ticker) or [COMPANY_NAME_MAPPINGS[ticker]["search"]])
+    ]
+    logger.info(f"🏢 {len(cases)} searches × {rows:,} rows, workers={workers}")
+
+    print()
+    print(f"{'Search':<28} {'Distinct':>8} {'Legacy s':>9} {'Cold s':>8} {'Warm s':>8} {'Speed-up':>9} {'Identical':>10}")
+    print("-" * 86)
+    totals = [0.0, 0.0, 0.0]
+    all_identical = True
+    for ticker, target, companies in cases:
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            legacy = [is_company_match_fuzzy(c, target, threshold=THRESHOLD, ticker=ticker) for c in companies]
+        t_legacy = (time.perf_counter() - t0) / repeat
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            matcher = CompanyNameMatcher(target, ticker, THRESHOLD, workers=workers)
+            mask = matcher.match_mask(companies)
+        t_cold = (time.perf_counter() - t0) / repeat
+
+        t0 = time.perf_counter()
+        for _ in range(repeat):
+            matcher.match_mask(companies)
+        t_warm = (time.perf_counter() - t0) / repeat
+
+        identical = mask.tolist() == legacy
+        all_identical &= identical
+        for i, t in enumerate((t_legacy, t_cold, t_warm)):
+            totals[i] += t
+        print(
+            f"{f'{ticker} / {target}':<28} {len(set(c.strip().lower() for c in companies)):>8,} "
+            f"{t_legacy:>9.3f} {t_cold:>8.3f} {t_warm:>8.3f} "
+            f"{t_legacy / t_cold if t_cold else float('inf'):>8.1f}x {'✅' if identical else '❌':>9}"
+        )
+    print("-" * 86)
+    print(f"{'total':<28} {'':>8} {totals[0]:>9.3f} {totals[1]:>8.3f} {totals[2]:>8.3f} "
+          f"{totals[0] / totals[1] if totals[1] else float('inf'):>8.1f}x")
+    print()
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Company matcher parity + speed benchmark")
+    parser.add_argument("--rows", type=int, default=10_000, help="scraped rows per search")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=-1, help="rapidfuzz cdist threads (-1 = all cores)")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    sys.exit(main(args.rows, args.repeat, args.workers, args.seed))
@@ -0,0 +1,150 @@
+"""
+Event-loop responsiveness benchmark.
+
+Measures p50/p95/p99 latency of /health and a cached GET /companies/{id}
+twice: once idle, and once while a portfolio Org-AI-R scoring job runs.
+With blocking work offloaded to lanes (app/services/blocking.py) the two
+phases should report near-identical percentiles; a stalled event loop
+shows up as p99 jumping to the duration of the scoring job.
+
+Start the API first (uvicorn app.main:app), then:
+
+Usage:
+    python -m app.scripts.bench_event_loop --company-id <uuid>
+    python -m app.scripts.bench_event_loop --company-id <uuid> --concurrency 20 --duration 30
+    python -m app.scripts.bench_event_loop --company-id <uuid> --base-url http://localhost:8000
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+SCORING_JOB = "/api/v1/scoring/orgair/portfolio"
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (samples in ms)."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    rank = max(1, int(round(pct / 100 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def summarize(samples: List[float], errors: int) -> Dict[str, float]:
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples) if samples else float("nan"),
+        "mean": statistics.fmean(samples) if samples else float("nan"),
+    }
+
+
+async def probe(
+    client: httpx.AsyncClient,
+    path: str,
+    stop_at: float,
+    samples: List[float],
+    errors: List[int],
+) -> None:
+    """Hit one endpoint back-to-back until stop_at, recording latency in ms."""
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        try:
+            resp = await client.get(path)
+            # /health answers 503 when a dependency is degraded — still a served request
+            if resp.status_code >= 500 and resp.status_code != 503:
+                errors[0] += 1
+                continue
+        except httpx.HTTPError:
+            errors[0] += 1
+            continue
+        samples.append((time.perf_counter() - start) * 1000)
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    paths: List[str],
+    concurrency: int,
+    duration: float,
+) -> Dict[str, Dict[str, float]]:
+    """Run `concurrency` probes per path for `duration` seconds."""
+    stop_at = time.perf_counter() + duration
+    samples: Dict[str, List[float]] = {p: [] for p in paths}
+    errors: Dict[str, List[int]] = {p: [0] for p in paths}
+    await asyncio.gather(*(
+        probe(client, path, stop_at, samples[path], errors[path])
+        for path in paths
+        for _ in range(concurrency)
+    ))
+    return {p: summarize(samples[p], errors[p][0]) for p in paths}
+
+
+async def start_scoring_job(client: httpx.AsyncClient) -> Optional[float]:
+    """Fire the portfolio scoring job; returns its wall time in seconds."""
+    start = time.perf_counter()
+    try:
+        resp = await client.post(SCORING_JOB, timeout=None)
+        logger.info(f"🏁 Scoring job finished: HTTP {resp.status_code} in {time.perf_counter() - start:.1f}s")
+    except httpx.HTTPError as e:
+        logger.error(f"Scoring job failed: {e}")
+        return None
+    return time.perf_counter() - start
+
+
+def print_report(idle: Dict[str, Dict[str, float]], loaded: Dict[str, Dict[str, float]]) -> None:
+    print()
+    print(f"{'Endpoint':<40} {'Phase':<8} {'Reqs':>6} {'Err':>4} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    print("-" * 96)
+    for path in idle:
+        for phase, stats in (("idle", idle[path]), ("scoring", loaded[path])):
+            print(
+                f"{path:<40} {phase:<8} {stats['requests']:>6} {stats['errors']:>4} "
+                f"{stats['p50']:>8.1f} {stats['p95']:>8.1f} {stats['p99']:>8.1f} {stats['max']:>8.1f}"
+            )
+        ratio = loaded[path]["p99"] / idle[path]["p99"] if idle[path]["p99"] else float("nan")
+        print(f"{'':<40} p99 ratio (scoring / idle): {ratio:.2f}x")
+    print()
+
+
+async def main(base_url: str, company_id: str, concurrency: int, duration: float) -> None:
+    paths = ["/health", f"/api/v1/companies/{company_id}"]
+    limits = httpx.Limits(max_connections=concurrency * len(paths) + 4)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+        # Warm the company cache so the loaded phase measures a cached read
+        await client.get(paths[1])
+
+        logger.info(f"📊 Idle phase: {concurrency} probes/endpoint for {duration:.0f}s")
+        idle = await run_phase(client, paths, concurrency, duration)
+
+        logger.info(f"📊 Scoring phase: POST {SCORING_JOB} + probes for {duration:.0f}s")
+        job = asyncio.create_task(start_scoring_job(client))
+        loaded = await run_phase(client, paths, concurrency, duration)
+        if not job.done():
+            logger.info("⏳ Probes finished before the scoring job — waiting for it to complete")
+        await job
+
+    print_report(idle, loaded)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="p99 latency of /health and GET /companies/{id} under scoring load")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--company-id", required=True, help="UUID of an existing company (cached read target)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent probes per endpoint")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per phase")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.base_url, args.company_id, args.concurrency, args.duration))
@@ -0,0 +1,176 @@
+"""
+Benchmark the HTML parser backends of DocumentParser on the same filings.
+
+  bs4   BeautifulSoup(html, 'html.parser') tree + get_text()   (default)
+  lxml  streaming lxml pull parser (app/pipelines/html_stream_parser.py)
+
+Each backend parses each filing in its own subprocess, so peak RSS is not
+shared between runs (VmHWM, reset after imports + file read on Linux;
+ru_maxrss elsewhere). Reported per filing:
+  - throughput (MB/s of raw HTML, best of --repeat runs)
+  - peak RSS growth over the process baseline
+  - words / tables / sections produced
+  - parity: identical tables and sections, and text lines present in
+    only one backend's output (expected: the <ix:header> hidden XBRL
+    facts, which the lxml backend drops)
+
+Usage:
+    python -m app.scripts.bench_html_parser
+    python -m app.scripts.bench_html_parser path/to/10k.htm --filing-type 10-K --repeat 3
+"""
+
+import argparse
+import gc
+import glob
+import json
+import logging
+import resource
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import List
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("bs4", "lxml")
+
+
+def _reset_peak_rss() -> None:
+    """Reset the peak-RSS high-water mark (Linux); elsewhere it keeps the import peak."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _rss_mb(field: str = "VmHWM") -> float:
+    """Peak (VmHWM) or current (VmRSS) resident set size in MB."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def extract(backend: str, content: bytes, filing_type: str):
+    """(text, tables, sections) from one backend"""
+    if backend == "lxml":
+        from app.pipelines.html_stream_parser import parse_html_stream
+        text, tables, scan = parse_html_stream(content, filing_type)
+    else:
+        from app.pipelines.document_parser import DocumentParser
+        text, tables, scan = DocumentParser(html_backend="bs4")._parse_html_soup(content, filing_type)
+    return text, tables, scan.sections(text)
+
+
+def worker(backend: str, path: str, filing_type: str, repeat: int) -> dict:
+    """Measure one backend on one filing (run in a fresh process)."""
+    import app.pipelines.html_stream_parser  # noqa: F401  (imports out of the baseline)
+    from app.pipelines.document_parser import DocumentParser  # noqa: F401
+
+    logging.disable(logging.INFO)
+    content = Path(path).read_bytes()
+    gc.collect()
+    _reset_peak_rss()
+    base = _rss_mb("VmRSS")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text, tables, sections = extract(backend, content, filing_type)
+        best = min(best, time.perf_counter() - start)
+    return {
+        "seconds": best,
+        "mb_per_s": len(content) / (1024 * 1024) / best if best else float("inf"),
+        "rss_base_mb": base,
+        "rss_peak_mb": _rss_mb(),
+        "words": len(text.split()),
+        "tables": len(tables),
+        "sections": len(sections),
+    }
+
+
+def measure(backend: str, path: str, filing_type: str, repeat: int) -> dict:
+    out = subprocess.run(
+        [sys.executable, "-m", "app.scripts.bench_html_parser", path,
+         "--worker", backend, "--filing-type", filing_type, "--repeat", str(repeat)],
+        check=True, capture_output=True, text=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def parity(path: str, filing_type: str) -> dict:
+    logging.disable(logging.INFO)
+    content = Path(path).read_bytes()
+    old_text, old_tables, old_sections = extract("bs4", content, filing_type)
+    new_text, new_tables, new_sections = extract("lxml", content, filing_type)
+    logging.disable(logging.NOTSET)
+    old_lines, new_lines = Counter(old_text.splitlines()), Counter(new_text.splitlines())
+    return {
+        "tables": old_tables == new_tables,
+        "sections": old_sections == new_sections,
+        "only_bs4": sum((old_lines - new_lines).values()),
+        "only_lxml": sum((new_lines - old_lines).values()),
+    }
+
+
+def guess_filing_type(path: str) -> str:
+    name = Path(path).name.lower()
+    if "def14a" in name or "def_14a" in name:
+        return "DEF 14A"
+    for filing_type in ("10-Q", "8-K"):
+        if filing_type.lower() in name:
+            return filing_type
+    return "10-K"
+
+
+def main(paths: List[str], filing_type: str, repeat: int) -> int:
+    ok = True
+    print()
+    print(f"{'Filing':<24} {'MB':>6} {'Backend':<7} {'Seconds':>8} {'MB/s':>7} {'ΔRSS MB':>8} "
+          f"{'Words':>9} {'Tables':>7} {'Sections':>8}")
+    print("-" * 94)
+    for path in paths:
+        ftype = filing_type or guess_filing_type(path)
+        size_mb = Path(path).stat().st_size / (1024 * 1024)
+        results = {b: measure(b, path, ftype, repeat) for b in BACKENDS}
+        for b, r in results.items():
+            print(f"{Path(path).name[:24]:<24} {size_mb:>6.2f} {b:<7} {r['seconds']:>8.3f} {r['mb_per_s']:>7.2f} "
+                  f"{r['rss_peak_mb'] - r['rss_base_mb']:>8.1f} {r['words']:>9,} {r['tables']:>7} {r['sections']:>8}")
+        old, new = results["bs4"], results["lxml"]
+        check = parity(path, ftype)
+        ok = ok and check["tables"] and check["sections"]
+        speedup = old["seconds"] / new["seconds"] if new["seconds"] else float("inf")
+        print(f"{'':<24} {'':>6} speed-up {speedup:.1f}x | tables {'✅' if check['tables'] else '❌'} "
+              f"| sections {'✅' if check['sections'] else '❌'} "
+              f"| text lines only in bs4 {check['only_bs4']:,}, only in lxml {check['only_lxml']:,}")
+        print()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="BeautifulSoup vs streaming lxml HTML parser benchmark")
+    parser.add_argument("paths", nargs="*", help="HTML filings (default: data/proxy_cache/*.html)")
+    parser.add_argument("--filing-type", default=None, help="10-K, 10-Q, 8-K or DEF 14A (default: from file name)")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--worker", choices=BACKENDS, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.paths[0], args.filing_type, args.repeat)))
+        sys.exit(0)
+
+    paths = args.paths or sorted(glob.glob("data/proxy_cache/*.html"))
+    if not paths:
+        logger.error("No HTML filings found — pass filing paths explicitly")
+        sys.exit(2)
+
+    sys.exit(main(paths, args.filing_type, args.repeat))
@@ -0,0 +1,203 @@
+"""
+Benchmark the shared keyword matcher against the per-keyword loops it replaced.
+
+For each consumer it checks that results are identical to the original
+logic and reports the speed-up:
+  - rubric      `[kw for kw in criteria.keywords if kw in text]` per level
+  - jobs        four substring / .count passes per posting
+  - sections    one `re.findall(r"\\b kw \\b")` per keyword
+
+Input is real 10-K text (data/parsed/*/*_content.txt by default), cut into
+150k-character windows for the SEC-section consumers and 4k-character
+windows for job descriptions.
+
+Usage:
+    python -m app.scripts.bench_keyword_matcher
+    python -m app.scripts.bench_keyword_matcher --backend regex
+    python -m app.scripts.bench_keyword_matcher path/to/10k.txt --repeat 5
+"""
+
+import argparse
+import glob
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+from app.pipelines.keyword_matcher import KeywordMatcher
+from app.pipelines.keywords import (
+    AI_KEYWORDS_CONTEXTUAL,
+    AI_KEYWORDS_STRONG,
+    AI_SKILLS,
+    AI_TECHSTACK_KEYWORDS,
+    TECH_JOB_TITLE_KEYWORDS,
+)
+from app.pipelines.section_analyzer import SectionAnalyzer
+from app.scoring.rubric_scorer import DIMENSION_RUBRICS
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+SECTION_WINDOW = 150_000
+POSTING_WINDOW = 4_000
+
+
+# ---------------------------------------------------------------------------
+# Original implementations (reference)
+# ---------------------------------------------------------------------------
+
+def legacy_rubric(text: str) -> list:
+    return [
+        [kw for kw in criteria.keywords if kw in text]
+        for rubric in DIMENSION_RUBRICS.values()
+        for criteria in rubric.values()
+    ]
+
+
+def legacy_job(title: str, desc: str) -> tuple:
+    title_lower, desc_lower = title.lower(), desc.lower()
+    full_text = f"{title_lower} {desc_lower}"
+    strong = [kw for kw in AI_KEYWORDS_STRONG if kw in full_text]
+    contextual = [
+        kw for kw in AI_KEYWORDS_CONTEXTUAL
+        if kw in title_lower or desc_lower.count(kw) >= 2
+    ]
+    skills = [sk for sk in AI_SKILLS if sk in full_text]
+    ts_kw = [kw for kw in AI_TECHSTACK_KEYWORDS if kw in full_text]
+    return strong + contextual, skills, ts_kw
+
+
+def legacy_sections(text: str) -> dict:
+    text_lower = text.lower()
+    counts = {}
+    for keyword in SectionAnalyzer.AI_KEYWORDS + SectionAnalyzer.TECH_KEYWORDS:
+        count = len(re.findall(r'\b' + re.escape(keyword) + r'\b', text_lower))
+        if count > 0:
+            counts[keyword] = count
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Matcher implementations (same shape as the consumers)
+# ---------------------------------------------------------------------------
+
+def build_consumers(backend: str) -> Tuple[Callable, Callable, Callable]:
+    rubric_matcher = KeywordMatcher(
+        (kw for rubric in DIMENSION_RUBRICS.values() for c in rubric.values() for kw in c.keywords),
+        backend=backend,
+    )
+    job_matcher = KeywordMatcher(
+        AI_KEYWORDS_STRONG | AI_KEYWORDS_CONTEXTUAL | AI_SKILLS | AI_TECHSTACK_KEYWORDS,
+        backend=backend,
+    )
+    section_matcher = KeywordMatcher(
+        SectionAnalyzer.AI_KEYWORDS + SectionAnalyzer.TECH_KEYWORDS, backend=backend,
+    )
+
+    def rubric(text: str) -> list:
+        scan = rubric_matcher.scan(text)
+        return [
+            scan.matched(criteria.keywords)
+            for r in DIMENSION_RUBRICS.values()
+            for criteria in r.values()
+        ]
+
+    def job(title: str, desc: str) -> tuple:
+        title_lower = title.lower()
+        full_text = f"{title_lower} {desc.lower()}"
+        scan = job_matcher.scan(full_text)
+        contextual = [
+            kw for kw in AI_KEYWORDS_CONTEXTUAL
+            if kw in scan and (
+                scan.contains(kw, end=len(title_lower))
+                or scan.count(kw, start=len(title_lower) + 1) >= 2
+            )
+        ]
+        return (
+            scan.matched(AI_KEYWORDS_STRONG) + contextual,
+            scan.matched(AI_SKILLS),
+            scan.matched(AI_TECHSTACK_KEYWORDS),
+        )
+
+    def sections(text: str) -> dict:
+        scan = section_matcher.scan(text.lower(), word_boundary=True)
+        counts = {}
+        for keyword in SectionAnalyzer.AI_KEYWORDS + SectionAnalyzer.TECH_KEYWORDS:
+            count = scan.count(keyword)
+            if count > 0:
+                counts[keyword] = count
+        return counts
+
+    return rubric, job, sections
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+def windows(text: str, size: int) -> List[str]:
+    return [text[i:i + size] for i in range(0, len(text), size) if text[i:i + size].strip()]
+
+
+def timed(fn: Callable, inputs: list, repeat: int) -> Tuple[float, list]:
+    best = float("inf")
+    out = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = [fn(*args) for args in inputs]
+        best = min(best, time.perf_counter() - start)
+    return best, out
+
+
+def main(paths: List[str], backend: str, repeat: int) -> int:
+    text = "\n".join(Path(p).read_text(encoding="utf-8", errors="ignore") for p in paths)
+    logger.info(f"📄 {len(paths)} filing(s), {len(text):,} characters, backend={backend}")
+
+    sections = [(w,) for w in windows(text, SECTION_WINDOW)]
+    rubric_inputs = [(w.lower(),) for (w,) in sections]
+    titles = TECH_JOB_TITLE_KEYWORDS + ["Senior Machine Learning Engineer", "Data Scientist, AI Platform"]
+    postings = [
+        (titles[i % len(titles)].title(), w)
+        for i, w in enumerate(windows(text, POSTING_WINDOW))
+    ]
+
+    new_rubric, new_job, new_sections = build_consumers(backend)
+    cases = [
+        ("rubric (150k sections)", legacy_rubric, new_rubric, rubric_inputs),
+        ("jobs (4k postings)", legacy_job, new_job, postings),
+        ("sections (150k, \\b)", legacy_sections, new_sections, sections),
+    ]
+
+    print()
+    print(f"{'Consumer':<26} {'Inputs':>7} {'Legacy s':>10} {'Matcher s':>10} {'Speed-up':>9} {'Identical':>10}")
+    print("-" * 78)
+    all_identical = True
+    for name, legacy, new, inputs in cases:
+        t_old, out_old = timed(legacy, inputs, repeat)
+        t_new, out_new = timed(new, inputs, repeat)
+        identical = out_old == out_new
+        all_identical &= identical
+        print(
+            f"{name:<26} {len(inputs):>7} {t_old:>10.3f} {t_new:>10.3f} "
+            f"{t_old / t_new if t_new else float('inf'):>8.1f}x {'✅' if identical else '❌':>9}"
+        )
+    print()
+    return 0 if all_identical else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keyword matcher parity + speed benchmark")
+    parser.add_argument("paths", nargs="*", help="10-K text files (default: data/parsed/*/*_content.txt)")
+    parser.add_argument("--backend", choices=["ahocorasick", "regex"], default=None)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("data/parsed/*/*_content.txt"))
+    if not paths:
+        logger.error("No input text found — pass 10-K text files explicitly")
+        sys.exit(2)
+
+    backend = args.backend or KeywordMatcher(()).backend
+    sys.exit(main(paths, backend, args.repeat))
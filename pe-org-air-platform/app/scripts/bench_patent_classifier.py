@@ -0,0 +1,130 @@
+"""
+Benchmark the single-pass patent classifier against the per-patent logic.
+
+Synthetic PatentsView abstracts (--count, default 10,000): boilerplate
+claim language with AI keywords, category phrases, near-misses
+("learning machine", "predictively", "deep-learning") and hyphenated /
+capitalised variants mixed in at random. Both paths classify the same
+patents and must produce identical is_ai_related / ai_categories.
+
+  legacy    one IGNORECASE regex per AI keyword + substring checks per
+            category, per patent (the old classify_patent)
+  batch     PatentSignalCollector.classify_patents, one scan per batch of
+            --page patents (the size of a PatentsView page)
+
+Usage:
+    python -m app.scripts.bench_patent_classifier
+    python -m app.scripts.bench_patent_classifier --count 10000 --page 1000
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List, Tuple
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.pipelines.patent_signals import Patent, PatentSignalCollector
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+FILLER = (
+    "a method and apparatus for controlling a hydraulic actuator wherein the housing comprises "
+    "a first member and a second member coupled to a sensor configured to receive a signal "
+    "from the controller and to determine a position of the valve based on the signal"
+).split()
+PHRASES = [
+    "machine learning", "neural network", "deep learning", "artificial intelligence",
+    "natural language processing", "computer vision", "reinforcement learning",
+    "predictive model", "classification algorithm", "image processing", "object detection",
+    "convolutional neural", "visual recognition", "predictive",
+    "learning machine", "predictively", "deep-learning", "Neural Networks", "machine-learning",
+]
+
+
+def synthetic_patents(rng: random.Random, count: int) -> List[Patent]:
+    patents = []
+    for i in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(60, 160))]
+        for _ in range(rng.choice([0, 0, 0, 1, 2, 3])):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(PHRASES))
+        title = " ".join(rng.choice(FILLER) for _ in range(6)).title()
+        patents.append(Patent(
+            patent_number=str(10_000_000 + i), title=title, abstract=" ".join(words) + ".",
+            filing_date=datetime(2024, 1, 1, tzinfo=timezone.utc), grant_date=None,
+            inventors=[], assignee="Acme Corp",
+        ))
+    return patents
+
+
+def legacy_classify(patent: Patent, keyword_patterns) -> Tuple[bool, List[str]]:
+    text = f"{patent.title} {patent.abstract}".lower()
+    is_ai = any(p.search(text) for p in keyword_patterns)
+    categories = []
+    if "neural network" in text or "deep learning" in text:
+        categories.append("deep_learning")
+    if "natural language" in text:
+        categories.append("nlp")
+    cv_phrases = [
+        "computer vision", "image recognition", "image classification",
+        "image segmentation", "image processing", "image analysis",
+        "object detection", "visual recognition", "convolutional neural",
+    ]
+    if any(phrase in text for phrase in cv_phrases):
+        categories.append("computer_vision")
+    if "predictive" in text or "classification algorithm" in text:
+        categories.append("predictive_analytics")
+    if is_ai and not categories:
+        if "reinforcement learning" in text:
+            categories.append("deep_learning")
+        if "machine learning" in text or "artificial intelligence" in text:
+            categories.append("predictive_analytics")
+    return is_ai or len(categories) > 0, sorted(set(categories))
+
+
+def main(count: int, page: int, repeat: int, seed: int) -> int:
+    patents = synthetic_patents(random.Random(seed), count)
+    collector = PatentSignalCollector()
+    keyword_patterns = [
+        re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE) for kw in collector.AI_PATENT_KEYWORDS
+    ]
+    logger.info(f"📄 {count:,} synthetic patents, pages of {page:,}")
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        legacy = [legacy_classify(p, keyword_patterns) for p in patents]
+    t_legacy = (time.perf_counter() - t0) / repeat
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for start in range(0, count, page):
+            collector.classify_patents(patents[start:start + page])
+    t_batch = (time.perf_counter() - t0) / repeat
+
+    batch = [(p.is_ai_related, sorted(p.ai_categories)) for p in patents]
+    identical = batch == legacy
+    ai = sum(is_ai for is_ai, _ in batch)
+
+    print()
+    print(f"{'Path':<10} {'Seconds':>9} {'Patents/s':>11}")
+    print("-" * 32)
+    print(f"{'legacy':<10} {t_legacy:>9.3f} {count / t_legacy:>11,.0f}")
+    print(f"{'batch':<10} {t_batch:>9.3f} {count / t_batch:>11,.0f}")
+    print("-" * 32)
+    print(f"speed-up {t_legacy / t_batch:.1f}x · {ai:,} AI patents · identical: {'✅' if identical else '❌'}")
+    print()
+    return 0 if identical else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Patent classifier parity + speed benchmark")
+    parser.add_argument("--count", type=int, default=10_000, help="synthetic patents")
+    parser.add_argument("--page", type=int, default=1000, help="patents per classify_patents batch")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    sys.exit(main(args.count, args.page, args.repeat, args.seed))
@@ -0,0 +1,170 @@
+"""
+Benchmark the S3 access layer: serial cold reads vs. parallel + disk cache.
+
+Uploads a synthetic corpus (chunk files for a portfolio of tickers plus
+timestamped job snapshots) to a bucket and reads it four ways:
+
+  legacy       one list_objects_v2 call + serial get_object per key, no cache
+  cold         paginated listing + concurrent get_files, empty disk cache
+  revalidate   get_files again: If-None-Match → 304, bodies from disk
+  warm         listing ETags passed to get_files: no GetObject at all
+
+By default the bucket lives in moto's in-process mock (mock_aws); S3 round
+trips there cost microseconds, so --latency-ms adds a per-request delay to
+model a real network. Point --endpoint-url at MinIO (or real S3 with
+--bucket) to measure actual round trips instead.
+
+Also reports that every strategy returns identical bodies and how many keys
+the legacy single-call listing misses (it stops at 1000).
+
+Usage:
+    python -m app.scripts.bench_s3
+    python -m app.scripts.bench_s3 --keys 1500 --latency-ms 20
+    python -m app.scripts.bench_s3 --endpoint-url http://localhost:9000 --bucket bench
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import boto3
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.services.s3_cache import S3DiskCache
+from app.services.s3_storage import S3StorageService
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+PREFIX = "bench/"
+
+
+def legacy_list_files(client, bucket: str, prefix: str) -> List[str]:
+    """The previous S3StorageService.list_files (reference): one page only."""
+    response = client.list_objects_v2(Bucket=bucket, Prefix=prefix)
+    return [obj['Key'] for obj in response.get('Contents', [])]
+
+
+def legacy_get_files(client, bucket: str, keys: List[str]) -> Dict[str, bytes]:
+    """The previous read path (reference): one serial get_object per key."""
+    return {key: client.get_object(Bucket=bucket, Key=key)['Body'].read() for key in keys}
+
+
+def make_corpus(n_keys: int, body_kb: int) -> Dict[str, bytes]:
+    """Chunk files and job snapshots shaped like the platform's S3 layout."""
+    corpus = {}
+    tickers = ["NVDA", "JPM", "WMT", "GE", "DG"]
+    for i in range(n_keys):
+        ticker = tickers[i % len(tickers)]
+        if i % 4 == 0:
+            key = f"{PREFIX}signals/jobs/{ticker}/2025{i:06d}_120000.json"
+            body = {"job_postings": [{"title": f"ML Engineer {i}", "ai_keywords_found": ["pytorch"]}]}
+        else:
+            key = f"{PREFIX}sec/chunks/{ticker}/10-K/{i:06d}_chunks.json"
+            body = {"chunks": [{"section": "item_1", "content": f"chunk {i} " + "x" * body_kb * 1024}]}
+        corpus[key] = json.dumps(body).encode("utf-8")
+    return corpus
+
+
+class RequestCounter:
+    """Counts S3 API calls by operation (and optionally delays each one)."""
+
+    def __init__(self, client, latency_ms: float):
+        self.counts: Dict[str, int] = {}
+        self.latency = latency_ms / 1000
+        client.meta.events.register("before-call.s3.*", self._before_call)
+
+    def _before_call(self, model, **kwargs):
+        self.counts[model.name] = self.counts.get(model.name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def take(self) -> Dict[str, int]:
+        counts, self.counts = self.counts, {}
+        return counts
+
+
+def run(args) -> int:
+    client = boto3.client("s3", region_name=args.region, endpoint_url=args.endpoint_url)
+    bucket = args.bucket
+    with contextlib.suppress(client.exceptions.BucketAlreadyOwnedByYou, client.exceptions.BucketAlreadyExists):
+        client.create_bucket(Bucket=bucket)
+
+    corpus = make_corpus(args.keys, args.body_kb)
+    logger.info(f"📤 Uploading {len(corpus)} objects ({sum(map(len, corpus.values())) / 1e6:.1f} MB) to {bucket}")
+    for key, body in corpus.items():
+        client.put_object(Bucket=bucket, Key=key, Body=body)
+
+    counter = RequestCounter(client, args.latency_ms)
+    results, timings = {}, []
+
+    def timed(name: str, fn):
+        start = time.perf_counter()
+        out = fn()
+        timings.append((name, time.perf_counter() - start, counter.take()))
+        return out
+
+    legacy_keys = timed("legacy list", lambda: legacy_list_files(client, bucket, PREFIX))
+    results["legacy"] = timed("legacy get", lambda: legacy_get_files(client, bucket, legacy_keys))
+
+    with tempfile.TemporaryDirectory(prefix="s3-bench-") as cache_dir:
+        cache = S3DiskCache(cache_dir, args.cache_mb * 1024 * 1024)
+        svc = S3StorageService(client, bucket, cache, max_concurrency=args.workers)
+
+        objects = timed("paginated list", lambda: svc.list_objects(PREFIX))
+        keys = [obj.key for obj in objects]
+        etags = {obj.key: obj.etag for obj in objects}
+        results["cold"] = timed("cold", lambda: svc.get_files(keys))
+        results["revalidate"] = timed("revalidate", lambda: svc.get_files(keys))
+        results["warm"] = timed("warm", lambda: svc.get_files(keys, etags=etags))
+        stats = cache.stats()
+
+    print()
+    print(f"{'Run':<16} {'Seconds':>9} {'Requests':>9}  Operations")
+    print("-" * 64)
+    for name, seconds, counts in timings:
+        ops = ", ".join(f"{op}={n}" for op, n in sorted(counts.items()))
+        print(f"{name:<16} {seconds:>9.3f} {sum(counts.values()):>9}  {ops}")
+    print()
+
+    legacy_total = timings[0][1] + timings[1][1]
+    cold, warm = timings[3][1], timings[5][1]
+    print(f"Keys listed (legacy/paginated):  {len(legacy_keys)}/{len(keys)}")
+    print(f"Cold speed-up vs legacy:         {legacy_total / (timings[2][1] + cold):.1f}x")
+    print(f"Warm speed-up vs legacy:         {legacy_total / (timings[2][1] + warm):.1f}x")
+    print(f"Disk cache:                      {stats}")
+
+    identical = all(results[name] == {k: corpus[k] for k in results[name]} for name in results)
+    identical = identical and all(len(results[name]) == len(corpus) for name in ("cold", "revalidate", "warm"))
+    print(f"Identical bodies:                {'✅' if identical else '❌'}")
+    print()
+    return 0 if identical else 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="S3 access layer cold/warm benchmark")
+    parser.add_argument("--keys", type=int, default=1200, help="objects to upload (>1000 exercises pagination)")
+    parser.add_argument("--body-kb", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="simulated per-request latency")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--cache-mb", type=int, default=512)
+    parser.add_argument("--bucket", default="orgair-bench")
+    parser.add_argument("--region", default="us-east-1")
+    parser.add_argument("--endpoint-url", default=None, help="MinIO / S3 endpoint (default: moto mock)")
+    args = parser.parse_args(argv)
+
+    if args.endpoint_url:
+        return run(args)
+
+    from moto import mock_aws
+    with mock_aws():
+        return run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
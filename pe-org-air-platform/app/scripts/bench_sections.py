@@ -0,0 +1,126 @@
+"""
+Benchmark the single-pass section scanner against the per-pattern search it replaced.
+
+The legacy _extract_sections upper-cased the whole document and ran one
+re.search per section start and end pattern. The scanner finds every
+heading word in one pass and tests the patterns only there.
+
+Over a regression corpus of filing text — data/parsed/*/*_content.txt and
+the section text stored in data/parsed/*/*.json by default — every text is
+scanned with the patterns of every filing type (10-K, 10-Q, 8-K, DEF 14A),
+and this reports:
+  - total time of both implementations and the speed-up
+  - that every (text, filing type) pair gives identical sections
+  - how many located sections start on a table-of-contents entry
+
+Usage:
+    python -m app.scripts.bench_sections
+    python -m app.scripts.bench_sections path/to/10k.txt --repeat 3
+"""
+
+import argparse
+import glob
+import json
+import logging
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from app.pipelines.section_scanner import SECTION_PATTERNS, scan_sections
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+FILING_TYPES = ("10-K", "10-Q", "8-K", "DEF 14A")
+
+
+def legacy_extract_sections(content: str, filing_type: str) -> Dict[str, str]:
+    """The previous DocumentParser._extract_sections (reference)."""
+    sections = {}
+    content_upper = content.upper()
+    for section_name, start_pattern, end_pattern in SECTION_PATTERNS.get(filing_type, []):
+        start_match = re.search(start_pattern, content_upper)
+        if not start_match:
+            continue
+        start_pos = start_match.start()
+        search_start = start_pos + 500
+        end_match = re.search(end_pattern, content_upper[search_start:])
+        if end_match:
+            end_pos = search_start + end_match.start()
+        else:
+            end_pos = min(start_pos + 150000, len(content))
+        section_text = content[start_pos:end_pos].strip()
+        if len(section_text.split()) > 100:
+            sections[section_name] = section_text
+    return sections
+
+
+def load_corpus(paths: List[str]) -> Dict[str, str]:
+    """{label: text} from .txt files and the sections of parsed .json files."""
+    corpus = {}
+    for p in paths:
+        path = Path(p)
+        if path.suffix == ".json":
+            sections = json.loads(path.read_text(encoding="utf-8")).get("sections") or {}
+            if sections:
+                corpus[f"{path.parent.name}/{path.stem[:12]}.json"] = "\n".join(sections.values())
+        else:
+            corpus[f"{path.parent.name}/{path.stem[:12]}"] = path.read_text(encoding="utf-8", errors="ignore")
+    return corpus
+
+
+def main(paths: List[str], repeat: int) -> int:
+    corpus = load_corpus(paths)
+    logger.info(f"📚 Corpus: {len(corpus)} texts, {sum(len(t) for t in corpus.values()):,} characters")
+
+    t_old = t_new = 0.0
+    mismatches, toc_starts, located = [], 0, 0
+    for label, text in corpus.items():
+        for filing_type in FILING_TYPES:
+            best_old = best_new = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                old = legacy_extract_sections(text, filing_type)
+                best_old = min(best_old, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                scan = scan_sections(text, filing_type)
+                new = scan.sections(text)
+                best_new = min(best_new, time.perf_counter() - start)
+            t_old += best_old
+            t_new += best_new
+            if old != new:
+                mismatches.append((label, filing_type))
+            located += len(scan.spans)
+            toc_starts += sum(s.start_in_toc for s in scan.spans)
+
+    print()
+    print(f"{'Implementation':<16} {'Seconds':>10}")
+    print("-" * 28)
+    print(f"{'legacy':<16} {t_old:>10.3f}")
+    print(f"{'scanner':<16} {t_new:>10.3f}")
+    print()
+    print(f"Speed-up:                 {t_old / t_new if t_new else float('inf'):.1f}x")
+    print(f"Identical sections:       {'✅' if not mismatches else '❌'} "
+          f"({len(corpus) * len(FILING_TYPES) - len(mismatches)}/{len(corpus) * len(FILING_TYPES)})")
+    for label, filing_type in mismatches:
+        print(f"    ❌ {label} ({filing_type})")
+    print(f"Spans starting in a TOC:  {toc_starts}/{located}")
+    print()
+    return 0 if not mismatches else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Section scanner parity + speed benchmark")
+    parser.add_argument("paths", nargs="*", help="Filing text / parsed JSON files (default: data/parsed/*/*)")
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob("data/parsed/*/*_content.txt") + glob.glob("data/parsed/*/*.json"))
+    if not paths:
+        logger.error("No corpus found — pass filing text files explicitly")
+        sys.exit(2)
+
+    sys.exit(main(paths, args.repeat))
@@ -0,0 +1,161 @@
+"""
+Convert existing JSON chunk files in S3 to the Parquet chunk store.
+
+For every sec/chunks/.../*_chunks.json object:
+
+  1. write the Parquet version next to it (…_chunks.parquet), checking it
+     decodes to the same chunks
+  2. repoint document_chunks.s3_key from the JSON key to the Parquet key
+  3. with --delete-json, delete the JSON file
+
+Steps run in that order, so scoring never sees a key without a file, and
+the script can be re-run after an interruption (existing Parquet files are
+reused). Without --delete-json the JSON files stay as a fallback: setting
+CHUNK_STORE_FORMAT=json and re-running with --revert points the rows back.
+
+Usage:
+    python -m app.scripts.migrate_chunks_parquet --dry-run
+    python -m app.scripts.migrate_chunks_parquet --ticker NVDA
+    python -m app.scripts.migrate_chunks_parquet --delete-json
+    python -m app.scripts.migrate_chunks_parquet --revert
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.pipelines.chunk_store import (
+    JSON_SUFFIX, PARQUET_CONTENT_TYPE, PARQUET_SUFFIX, ChunkFile, CHUNK_COLUMNS, chunks_key, json_to_parquet,
+)
+from app.services.s3_storage import S3StorageService, get_s3_service
+from app.services.snowflake import get_snowflake_connection
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+CHUNKS_ROOT = "sec/chunks/"
+
+
+@dataclass
+class MigrationReport:
+    converted: List[str] = field(default_factory=list)
+    reused: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    rows_repointed: int = 0
+    json_bytes: int = 0
+    parquet_bytes: int = 0
+
+
+def _same_chunks(json_body: bytes, parquet_body: bytes) -> bool:
+    legacy = [{c: row.get(c) for c in CHUNK_COLUMNS} for row in ChunkFile.open(json_body).read()]
+    return legacy == ChunkFile.open(parquet_body).read()
+
+
+def repoint(conn, old_key: str, new_key: str, dry_run: bool) -> int:
+    """Point document_chunks rows at new_key; returns how many rows match old_key."""
+    cur = conn.cursor()
+    try:
+        if dry_run:
+            cur.execute("SELECT COUNT(*) FROM document_chunks WHERE s3_key = %s", [old_key])
+            return cur.fetchone()[0]
+        cur.execute("UPDATE document_chunks SET s3_key = %s WHERE s3_key = %s", [new_key, old_key])
+        conn.commit()
+        return cur.rowcount or 0
+    finally:
+        cur.close()
+
+
+def migrate(
+    s3: S3StorageService,
+    conn,
+    prefix: str = CHUNKS_ROOT,
+    dry_run: bool = False,
+    delete_json: bool = False,
+) -> MigrationReport:
+    """Convert every JSON chunk file under `prefix` to Parquet and repoint its rows."""
+    report = MigrationReport()
+    objects = {obj.key: obj for obj in s3.list_objects(prefix)}
+    json_keys = sorted(key for key in objects if key.endswith(JSON_SUFFIX))
+    logger.info(f"📦 {len(json_keys)} JSON chunk file(s) under {prefix}")
+
+    bodies = s3.get_files(json_keys, etags={k: objects[k].etag for k in json_keys})
+    for key in json_keys:
+        target = chunks_key(key, "parquet")
+        body = bodies.get(key)
+        if body is None:
+            logger.warning(f"  ⚠️  Could not read {key}")
+            report.failed.append(key)
+            continue
+
+        existing = s3.get_file(target, objects[target].etag) if target in objects else None
+        parquet = existing if existing is not None and _same_chunks(body, existing) else None
+        try:
+            if parquet is None:
+                parquet = json_to_parquet(body)
+                if not _same_chunks(body, parquet):
+                    raise ValueError("round-trip mismatch")
+        except ValueError as e:
+            logger.warning(f"  ⚠️  Could not convert {key}: {e}")
+            report.failed.append(key)
+            continue
+
+        report.json_bytes += len(body)
+        report.parquet_bytes += len(parquet)
+        (report.reused if existing is not None else report.converted).append(key)
+        if not dry_run and existing is None:
+            s3.s3_client.put_object(
+                Bucket=s3.bucket_name, Key=target, Body=parquet, ContentType=PARQUET_CONTENT_TYPE,
+                Metadata={"chunk_count": str(len(ChunkFile.open(parquet)))},
+            )
+        report.rows_repointed += repoint(conn, key, target, dry_run)
+        if delete_json and not dry_run:
+            s3.delete_file(key)
+        logger.info(f"  ✅ {key} → {target.rsplit('/', 1)[-1]} ({len(body):,} → {len(parquet):,} bytes)")
+    return report
+
+
+def revert(s3: S3StorageService, conn, prefix: str = CHUNKS_ROOT, dry_run: bool = False) -> int:
+    """Point rows back at the JSON files that still exist; returns rows changed."""
+    keys = set(s3.list_files(prefix))
+    rows = 0
+    for key in sorted(k for k in keys if k.endswith(PARQUET_SUFFIX)):
+        legacy = chunks_key(key, "json")
+        if legacy in keys:
+            rows += repoint(conn, key, legacy, dry_run)
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Migrate JSON chunk files to the Parquet chunk store")
+    parser.add_argument("--ticker", help="Only this ticker's chunk files")
+    parser.add_argument("--dry-run", action="store_true", help="Convert in memory and report, write nothing")
+    parser.add_argument("--delete-json", action="store_true", help="Delete each JSON file once its rows are repointed")
+    parser.add_argument("--revert", action="store_true", help="Point rows back at the JSON files still in S3")
+    args = parser.parse_args(argv)
+
+    prefix = f"{CHUNKS_ROOT}{args.ticker.upper()}/" if args.ticker else CHUNKS_ROOT
+    s3 = get_s3_service()
+    conn = get_snowflake_connection()
+    try:
+        if args.revert:
+            rows = revert(s3, conn, prefix, dry_run=args.dry_run)
+            logger.info(f"{'🔍' if args.dry_run else '✅'} {rows} document_chunks row(s) pointed back at JSON")
+            return 0
+        report = migrate(s3, conn, prefix, dry_run=args.dry_run, delete_json=args.delete_json)
+    finally:
+        conn.close()
+
+    ratio = report.parquet_bytes / report.json_bytes if report.json_bytes else 0.0
+    logger.info(
+        f"{'🔍' if args.dry_run else '✅'} {len(report.converted)} converted, {len(report.reused)} already migrated, "
+        f"{len(report.failed)} failed; {report.rows_repointed} document_chunks row(s) repointed; "
+        f"{report.json_bytes:,} → {report.parquet_bytes:,} bytes ({ratio:.0%})"
+    )
+    return 1 if report.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -25,6 +25,7 @@ def recalc_company(ticker: str, dry_run: bool = False):
     import boto3
     from app.config import settings
     from app.pipelines.glassdoor_collector import CultureCollector, CultureReview, _normalize_date
+    from app.services.snapshot_manifest import record_snapshot
 
     ticker = ticker.upper()
 
@@ -112,13 +113,15 @@ def recalc_company(ticker: str, dry_run: bool = False):
     output_data["recalculated"] = True
 
     output_key = f"glassdoor_signals/output/{ticker}/{ts}_culture.json"
-    s3.put_object(
+    body = json.dumps(output_data, indent=2, default=str).encode("utf-8")
+    response = s3.put_object(
         Bucket=bucket,
         Key=output_key,
-        Body=json.dumps(output_data, indent=2, default=str).encode("utf-8"),
+        Body=body,
         ContentType="application/json",
     )
     logger.info(f"  ✅ Uploaded to S3: {output_key}")
+    record_snapshot(output_key, body, response.get("ETag"))
     return signal
 
 
@@ -8,11 +8,9 @@ Usage:
 """
 
 import sys
-import json
 import logging
 import argparse
 from uuid import uuid4
-from dataclasses import asdict
 
 logging.basicConfig(
     level=logging.INFO,
@@ -29,6 +27,7 @@ def reingest_company(ticker: str, dry_run: bool = False, years_back: int = 3):
     from app.pipelines.sec_edgar import SECEdgarCollector
     from app.pipelines.document_parser import DocumentParser
     from app.pipelines.chunking import SemanticChunker
+    from app.pipelines.chunk_store import chunks_key, encode_chunks
 
     ticker = ticker.upper()
     logger.info(f"{'='*60}")
@@ -143,16 +142,15 @@ def reingest_company(ticker: str, dry_run: bool = False, years_back: int = 3):
         cur.close()
 
         # Step 5: Upload chunks to S3
-        s3_key = f"sec/chunks/{ticker}/10-K/{filing.filing_date}_chunks.json"
-        chunk_data = [asdict(c) for c in chunks]
-        chunk_json = json.dumps(chunk_data, indent=2, default=str)
+        s3_key = chunks_key(f"sec/chunks/{ticker}/10-K/{filing.filing_date}", settings.CHUNK_STORE_FORMAT)
+        body, content_type = encode_chunks(chunks, settings.CHUNK_STORE_FORMAT)
 
         try:
             s3_client.put_object(
                 Bucket=bucket,
                 Key=s3_key,
-                Body=chunk_json.encode("utf-8"),
-                ContentType="application/json",
+                Body=body,
+                ContentType=content_type,
             )
             logger.info(f"   ✅ Uploaded to S3: s3://{bucket}/{s3_key}")
         except Exception as e:
@@ -0,0 +1,49 @@
+"""
+Rebuild the latest-snapshot manifests from a full S3 listing.
+
+Every snapshot prefix (signals/{type}/{TICKER}/, glassdoor_signals/raw/
+{TICKER}/, glassdoor_signals/output/{TICKER}/) gets manifests/{prefix}
+latest.json pointing at its greatest key; manifests whose prefix is now
+empty are deleted. Run it once after deploying the manifest subsystem, and
+whenever objects were written or deleted by tools that bypass it.
+
+Usage:
+    python -m app.scripts.repair_manifests --dry-run      # report only
+    python -m app.scripts.repair_manifests                # rebuild all
+    python -m app.scripts.repair_manifests --root signals/jobs/
+"""
+
+import argparse
+import logging
+import sys
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.services.s3_storage import get_s3_service
+from app.services.snapshot_manifest import SNAPSHOT_ROOTS
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Rebuild latest-snapshot manifests from S3 listings")
+    parser.add_argument("--root", action="append", help=f"Snapshot root to scan (default: {', '.join(SNAPSHOT_ROOTS)})")
+    parser.add_argument("--dry-run", action="store_true", help="Report what would change without writing")
+    args = parser.parse_args()
+
+    s3 = get_s3_service()
+    report = s3.manifest.repair(args.root or SNAPSHOT_ROOTS, dry_run=args.dry_run)
+
+    verb = "would be" if report.dry_run else "were"
+    for label, prefixes in [("created", report.created), ("updated", report.updated), ("removed", report.removed)]:
+        for prefix in prefixes:
+            logger.info(f"  {label:<8} {prefix}")
+    logger.info(
+        f"{'🔍' if report.dry_run else '✅'} {len(report.created)} created, {len(report.updated)} updated, "
+        f"{len(report.removed)} removed ({verb} changed), {len(report.unchanged)} already correct"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,79 @@
+"""
+Nightly incremental re-scoring: touch only companies whose evidence changed.
+
+Compares every company's evidence fingerprints (signal created_at, 10-K
+chunk ETags, board JSON hash, Glassdoor snapshot key) with the ones stored
+with its last scoring result, then re-scores only the stale companies —
+re-reading just the changed sources and rewriting just the dimensions they
+feed.
+
+Usage:
+    python -m app.scripts.rescore_stale --dry-run          # report stale companies / dimensions
+    python -m app.scripts.rescore_stale                    # re-score the stale ones
+    python -m app.scripts.rescore_stale --ticker NVDA --force
+"""
+
+import argparse
+import logging
+import sys
+from typing import Dict, List, Optional
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+from app.services.scoring_service import get_scoring_service
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+
+def _print_reports(reports: List[Dict]) -> None:
+    print()
+    print(f"{'Ticker':<8} {'Status':<12} {'Changed sources':<48} Stale dimensions")
+    print("-" * 110)
+    for r in reports:
+        if r.get("error"):
+            print(f"{r['ticker']:<8} {'error':<12} {r['error']}")
+            continue
+        status = "up to date" if r["up_to_date"] else ("full" if r["full"] else "stale")
+        sources = r["reason"] if r["full"] else ", ".join(r["changed_sources"]) or "—"
+        print(f"{r['ticker']:<8} {status:<12} {sources:<48} {', '.join(r['stale_dimensions']) or '—'}")
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-score only companies whose evidence changed")
+    parser.add_argument("--ticker", action="append", help="Only these tickers (default: every company with CS2 data)")
+    parser.add_argument("--dry-run", action="store_true", help="Report stale companies and dimensions, write nothing")
+    parser.add_argument("--force", action="store_true", help="Re-read every source and rewrite every dimension")
+    args = parser.parse_args(argv)
+
+    service = get_scoring_service()
+    if args.ticker:
+        reports = []
+        for ticker in args.ticker:
+            try:
+                reports.append(service.check_staleness(ticker).to_dict())
+            except Exception as e:
+                reports.append({"ticker": ticker.upper(), "error": str(e)})
+    else:
+        reports = service.check_all_staleness()
+    _print_reports(reports)
+
+    stale = [r["ticker"] for r in reports if not r.get("error") and (args.force or not r["up_to_date"])]
+    logger.info(f"🔎 {len(stale)}/{len(reports)} companies need re-scoring")
+    if args.dry_run or not stale:
+        return 0
+
+    failed = 0
+    for ticker in stale:
+        try:
+            result = service.score_company(ticker, force=args.force)
+            written = "persisted" if result.get("persisted") else "NOT persisted"
+            logger.info(f"  ✅ {ticker}: {len(result['staleness']['stale_dimensions'])} dimension(s) {written}")
+        except Exception as e:
+            failed += 1
+            logger.error(f"  ❌ {ticker}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
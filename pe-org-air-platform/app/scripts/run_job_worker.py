@@ -0,0 +1,78 @@
+"""
+Run a background job worker outside the API process.
+
+Claims queued (or abandoned) jobs from the job store — evidence backfills
+enqueued by POST /api/v1/evidence/backfill — and runs them until Ctrl+C.
+Several workers (API processes with JOB_WORKER_ENABLED, or this script on
+other hosts sharing the Redis job store) split the queue between them;
+a worker that stops mid-job leaves it to be resumed by the next claim.
+
+Usage:
+    python -m app.scripts.run_job_worker                   # run until interrupted
+    python -m app.scripts.run_job_worker --once            # drain the queue, then exit
+    python -m app.scripts.run_job_worker --list            # show recent jobs
+"""
+
+import argparse
+import logging
+import signal
+import sys
+import time
+from typing import List, Optional
+
+import app.core  # noqa: F401  — imports app.repositories before app.services (avoids an import cycle)
+import app.services.evidence_backfill  # noqa: F401  — registers the backfill job handler
+from app.config import settings
+from app.services.job_queue import JobWorker, get_job_store
+from app.shutdown import is_shutting_down, set_shutdown
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)-8s | %(message)s', datefmt='%H:%M:%S')
+logger = logging.getLogger(__name__)
+
+
+def _print_jobs(store, limit: int) -> None:
+    print()
+    print(f"{'Job':<38} {'Kind':<20} {'Status':<22} {'Progress':>9}  Created")
+    print("-" * 110)
+    for job in store.list_jobs(limit=limit):
+        progress = f"{job['progress']['completed']}/{job['progress']['total']}"
+        print(f"{job['job_id']:<38} {job['kind']:<20} {job['status']:<22} {progress:>9}  {job['created_at']}")
+    print()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the durable background job worker")
+    parser.add_argument("--once", action="store_true", help="Run queued jobs until none are left, then exit")
+    parser.add_argument("--list", action="store_true", help="List recent jobs and exit")
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_WORKER_CONCURRENCY,
+                        help="Items (companies) in flight per job")
+    args = parser.parse_args(argv)
+
+    store = get_job_store()
+    if args.list:
+        _print_jobs(store, limit=20)
+        return 0
+
+    worker = JobWorker(store, concurrency=args.concurrency, lease_seconds=settings.JOB_LEASE_SECONDS,
+                       poll_seconds=settings.JOB_POLL_SECONDS)
+    if args.once:
+        ran = 0
+        while worker.run_next():
+            ran += 1
+        logger.info(f"✅ Ran {ran} job(s)")
+        return 0
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: set_shutdown())
+    worker.start()
+    logger.info(f"👷 Worker {worker.worker_id} waiting for jobs ({store.backend}); Ctrl+C to stop")
+    while not is_shutting_down():
+        time.sleep(1.0)
+    logger.info("🛑 Stopping: waiting for the companies in flight to finish")
+    worker.stop()
+    logger.info("🛑 Worker stopped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from app.services.leadership_service import get_leadership_service
 from app.services.redis_cache import get_redis_cache
 from app.services.cache import get_cache
 from app.services.redis_cache import RedisCache
+from app.services.tiered_cache import TieredCache
 from app.services.s3_storage import get_s3_service
 from app.services.snowflake import get_snowflake_connection, SnowflakeService
 
@@ -77,6 +78,7 @@ __all__ = [
     "get_document_parsing_service",
     "get_leadership_service",
     "RedisCache",
+    "TieredCache",
     "get_s3_service",
     "get_snowflake_connection",
     "SnowflakeService",
@@ -0,0 +1,143 @@
+"""
+Blocking Work Execution Layer - PE Org-AI-R Platform
+app/services/blocking.py
+
+Keeps synchronous Snowflake cursors, boto3 calls and CPU-heavy scorers off
+the event loop.  Work is routed to dedicated thread pools ("lanes"):
+
+  io      — short blocking calls: Snowflake queries, S3, Redis
+            (BLOCKING_IO_WORKERS threads)
+  scoring — long CS3 scoring runs and SEC / signal ingestion pipelines
+            (SCORING_LANE_WORKERS threads)
+  cache   — background cache maintenance: pattern invalidation as
+            batched UNLINKs (1 thread, never competes with requests)
+
+Separate lanes mean a burst of scoring requests can never take the
+threads that serve /health or cached company reads.
+
+Usage:
+    # Sync endpoint body, run on a lane (signature kept for FastAPI)
+    @router.get("/companies/{id}")
+    @offload
+    def get_company(id: UUID): ...
+
+    # Ad-hoc blocking call inside an async handler
+    rows = await run_blocking(repo.get_all, lane="io")
+
+    # Async service whose body mixes awaits with blocking repository calls
+    result = await run_coroutine_blocking(service.analyze_company, ticker)
+"""
+import asyncio
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+IO_LANE = "io"
+SCORING_LANE = "scoring"
+CACHE_LANE = "cache"
+
+_executors: Dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def _lane_size(lane: str) -> int:
+    if lane == SCORING_LANE:
+        return settings.SCORING_LANE_WORKERS
+    if lane == CACHE_LANE:
+        return 1
+    return settings.BLOCKING_IO_WORKERS
+
+
+def get_executor(lane: str = IO_LANE) -> ThreadPoolExecutor:
+    """Return (creating on first use) the thread pool for a lane."""
+    executor = _executors.get(lane)
+    if executor is None:
+        with _lock:
+            executor = _executors.get(lane)
+            if executor is None:
+                executor = ThreadPoolExecutor(
+                    max_workers=_lane_size(lane),
+                    thread_name_prefix=f"blocking-{lane}",
+                )
+                _executors[lane] = executor
+                logger.info(f"🧵 Blocking lane '{lane}' started ({_lane_size(lane)} threads)")
+    return executor
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, lane: str = IO_LANE, **kwargs: Any) -> T:
+    """Run a blocking callable on a lane without stalling the event loop."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(lane), call)
+
+
+async def run_coroutine_blocking(
+    coro_fn: Callable[..., Awaitable[T]],
+    *args: Any,
+    lane: str = IO_LANE,
+    **kwargs: Any,
+) -> T:
+    """
+    Run an async function on a private event loop in a lane thread.
+
+    For legacy `async def` services whose bodies call blocking repositories
+    between awaits — the whole coroutine moves off the request loop.
+    """
+    return await run_blocking(lambda: asyncio.run(coro_fn(*args, **kwargs)), lane=lane)
+
+
+def _resolved_signature(fn: Callable) -> inspect.Signature:
+    """Signature with string annotations (PEP 563) evaluated in fn's own module."""
+    sig = inspect.signature(fn)
+    try:
+        hints = typing.get_type_hints(fn, include_extras=True)
+    except Exception:
+        return sig
+
+    def _resolve(name: str, annotation: Any) -> Any:
+        if isinstance(annotation, str):
+            resolved = hints.get(name, annotation)
+            return None if resolved is type(None) else resolved
+        return annotation
+
+    params = [p.replace(annotation=_resolve(p.name, p.annotation)) for p in sig.parameters.values()]
+    return sig.replace(parameters=params, return_annotation=_resolve("return", sig.return_annotation))
+
+
+def offload(fn: Optional[Callable] = None, *, lane: str = IO_LANE):
+    """
+    Turn a synchronous endpoint into an async one that runs on a lane.
+
+    FastAPI still sees the original parameters and return annotation, so
+    path/query/body parsing, dependencies and response_model inference
+    are unchanged.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await run_blocking(func, *args, lane=lane, **kwargs)
+
+        wrapper.__signature__ = _resolved_signature(func)
+        return wrapper
+
+    return decorator(fn) if fn is not None else decorator
+
+
+def shutdown_blocking_executors(wait: bool = False) -> None:
+    """Stop all lanes (called from the app shutdown hook)."""
+    with _lock:
+        for executor in _executors.values():
+            executor.shutdown(wait=wait, cancel_futures=True)
+        _executors.clear()
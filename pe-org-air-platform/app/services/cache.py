@@ -2,14 +2,22 @@
 Cache Service Singleton - PE Org-AI-R Platform
 app/services/cache.py
 
-Provides a singleton Redis cache instance with TTL constants.
-Gracefully handles Redis unavailability.
+Provides a singleton tiered cache (in-process L1 + Redis behind a circuit
+breaker, see tiered_cache.py) with TTL constants.
+Gracefully handles Redis unavailability: while the circuit is open Redis
+is skipped without waiting on a connect timeout and L1 keeps serving.
 """
 import redis
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+from fastapi.responses import Response
+from pydantic import BaseModel
+from app.services.cache_codecs import json_dumps
 from app.services.redis_cache import RedisCache
+from app.services.tiered_cache import TieredCache, build_tiered_cache
 from app.config import settings
 
+T = TypeVar("T", bound=BaseModel)
+
 # TTL constants from requirements (in seconds)
 TTL_COMPANY = 300              # 5 minutes
 TTL_ASSESSMENT = 120           # 2 minutes
@@ -17,30 +25,72 @@ TTL_INDUSTRY = 3600            # 1 hour
 TTL_DIMENSION_WEIGHTS = 86400  # 24 hours
 
 # Singleton instance
-_cache: Optional[RedisCache] = None
+_cache: Optional[TieredCache] = None
 
 
-def get_cache() -> Optional[RedisCache]:
+def get_cache() -> Optional[TieredCache]:
     """
-    Get or create Redis cache instance.
+    Get or create the tiered cache instance.
 
     Returns:
-        RedisCache instance if Redis is available, None otherwise.
+        TieredCache instance if Redis is configured, None otherwise.
 
     Note:
-        Returns None if Redis is unavailable, allowing the application
-        to continue functioning without caching (graceful degradation).
+        Built once; Redis being down does not return None — the circuit
+        breaker inside TieredCache skips Redis until a half-open probe
+        succeeds, instead of retrying a connection on every call.
+        Returns None only if the Redis client cannot be created at all,
+        allowing the application to continue without caching.
     """
     global _cache
     if _cache is None:
         try:
-            _cache = RedisCache()
-            _cache.client.ping()  # Test connection
-        except (redis.RedisError, ConnectionError):
-            _cache = None
+            cache = build_tiered_cache(RedisCache())
+        except (redis.RedisError, ConnectionError, ValueError):
+            return None
+        cache.ping()  # Test connection (a failure counts towards opening the circuit)
+        _cache = cache
     return _cache
 
 
+def load_through_cache(
+    key: str,
+    model: Type[T],
+    ttl_seconds: int,
+    loader: Callable[[], T],
+    namespace: Optional[str] = None,
+    trusted: bool = False,
+) -> Tuple[Any, Optional[str]]:
+    """
+    Cached value or loader() with stampede protection.
+
+    Keys inside a namespace are dropped together by
+    cache.invalidate_namespace(namespace) (O(1) generation bump).
+    Returns (value, tier) — tier is "l1", "redis", or None when loader ran.
+    With trusted=True a hit is the decoded JSON data (no model validation),
+    meant for cached_response(); a loaded value is always a model instance.
+    Without a cache the loader simply runs.
+    """
+    cache = get_cache()
+    if cache is None:
+        return loader(), None
+    return cache.get_or_load(key, model, ttl_seconds, loader, namespace=namespace, trusted=trusted)
+
+
+def cached_response(data: Dict[str, Any], **overrides: Optional[BaseModel]) -> Response:
+    """
+    HTTP response straight from a trusted cache hit.
+
+    The data was produced by the endpoint's own response model, so it is sent
+    as-is instead of being validated into models and serialised again;
+    overrides replace top-level fields (e.g. the per-request cache info).
+    """
+    body = dict(data)
+    for field, value in overrides.items():
+        body[field] = value.model_dump(mode="json") if value is not None else None
+    return Response(content=json_dumps(body), media_type="application/json")
+
+
 def reset_cache() -> None:
     """
     Reset the cache singleton.
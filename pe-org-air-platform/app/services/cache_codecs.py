@@ -0,0 +1,128 @@
+"""
+Cache Codecs — value encodings for the tiered response cache
+app/services/cache_codecs.py
+
+CACHE_CODEC selects how TieredCache stores Pydantic responses in Redis:
+
+  text      legacy "xf1|…" str envelope around model_dump_json() (default)
+  orjson    JSON bytes in the binary "xf2|…" envelope
+  msgpack   MessagePack of model_dump(mode="json") in the binary envelope
+
+Binary envelopes carry the codec name, a schema tag (digest of the
+model's JSON schema, so a deploy that changes a response model never
+decodes an old layout) and — above CACHE_COMPRESS_MIN_BYTES — zstd
+compression (pyarrow's codec, already a dependency for the chunk store).
+
+Every codec offers two decoders:
+  validate(payload, model)   full Pydantic validation (model instances)
+  loads(payload)             plain JSON-compatible data, no validation —
+                             the trusted fast path, used by endpoints that
+                             send cache hits straight back as the HTTP body
+"""
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # pragma: no cover - falls back to json
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:  # pragma: no cover - msgpack codec unavailable
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    ZSTD_AVAILABLE = pa.Codec.is_available("zstd")
+except ImportError:  # pragma: no cover - compression disabled
+    pa = None
+    ZSTD_AVAILABLE = False
+
+T = TypeVar("T", bound=BaseModel)
+
+
+def json_loads(data: Any) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def json_dumps(data: Any) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+class CacheCodec:
+    """JSON text (the legacy format); also the base for the binary codecs."""
+
+    name = "text"
+    binary = False
+    available = True
+
+    def dumps(self, model: BaseModel) -> bytes:
+        return model.model_dump_json().encode("utf-8")
+
+    def loads(self, payload: bytes) -> Any:
+        return json_loads(payload)
+
+    def validate(self, payload: bytes, model: Type[T]) -> T:
+        return model.model_validate_json(payload)
+
+
+class OrjsonCodec(CacheCodec):
+    name = "orjson"
+    binary = True
+
+
+class MsgpackCodec(CacheCodec):
+    name = "msgpack"
+    binary = True
+    available = MSGPACK_AVAILABLE
+
+    def dumps(self, model: BaseModel) -> bytes:
+        return msgpack.packb(model.model_dump(mode="json"), use_bin_type=True)
+
+    def loads(self, payload: bytes) -> Any:
+        return msgpack.unpackb(payload, raw=False)
+
+    def validate(self, payload: bytes, model: Type[T]) -> T:
+        return model.model_validate(self.loads(payload))
+
+
+CODECS: Dict[str, CacheCodec] = {c.name: c for c in (CacheCodec(), OrjsonCodec(), MsgpackCodec())}
+
+
+def get_codec(name: str) -> CacheCodec:
+    """Codec by name; msgpack falls back to orjson when the package is missing."""
+    if name == "msgpack" and not MSGPACK_AVAILABLE:
+        return CODECS["orjson"]
+    if name not in CODECS:
+        raise ValueError(f"Unknown cache codec {name!r} (expected one of {sorted(CODECS)})")
+    return CODECS[name]
+
+
+@lru_cache(maxsize=256)
+def schema_tag(model: Type[BaseModel]) -> str:
+    """Short digest of a model's JSON schema (changes whenever its layout does)."""
+    blob = json.dumps(model.model_json_schema(), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:8]
+
+
+def compress(payload: bytes, min_bytes: int) -> Optional[bytes]:
+    """zstd-compressed payload, or None when below the threshold / not worth it."""
+    if not ZSTD_AVAILABLE or min_bytes <= 0 or len(payload) < min_bytes:
+        return None
+    packed = pa.compress(payload, codec="zstd", asbytes=True)
+    return packed if len(packed) < len(payload) else None
+
+
+def decompress(payload: bytes, size: int) -> bytes:
+    return pa.decompress(payload, decompressed_size=size, codec="zstd", asbytes=True)
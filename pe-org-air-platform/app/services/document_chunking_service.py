@@ -1,12 +1,14 @@
 import json
 import logging
 from typing import List, Dict, Optional
-from dataclasses import asdict
 from uuid import uuid4
+from app.config import settings
 from app.pipelines.chunking import create_chunker, DocumentChunk
+from app.pipelines.chunk_store import chunks_key, encode_chunks
 from app.services.s3_storage import get_s3_service
 from app.repositories.document_repository import get_document_repository
 from app.repositories.chunk_repository import get_chunk_repository
+from app.services.scoring_cache import invalidate_scoring_stages
 
 logging.basicConfig(
     level=logging.INFO,
@@ -30,9 +32,9 @@ class DocumentChunkingService:
         return f"sec/parsed/{ticker}/{clean_filing_type}/{filing_date}_full.json"
     
     def _generate_chunks_s3_key(self, ticker: str, filing_type: str, filing_date: str) -> str:
-        """Generate S3 key for chunks"""
+        """Generate S3 key for chunks (suffix follows CHUNK_STORE_FORMAT)"""
         clean_filing_type = filing_type.replace(" ", "")
-        return f"sec/chunks/{ticker}/{clean_filing_type}/{filing_date}_chunks.json"
+        return chunks_key(f"sec/chunks/{ticker}/{clean_filing_type}/{filing_date}", settings.CHUNK_STORE_FORMAT)
     
     def chunk_document(
         self, 
@@ -84,14 +86,14 @@ class DocumentChunkingService:
         
         # Save chunks to S3
         chunks_s3_key = self._generate_chunks_s3_key(ticker, filing_type, filing_date)
-        chunks_data = [asdict(c) for c in chunks]
+        body, content_type = encode_chunks(chunks, settings.CHUNK_STORE_FORMAT)
         
-        logger.info(f"  📤 Uploading {len(chunks)} chunks to S3: {chunks_s3_key}")
+        logger.info(f"  📤 Uploading {len(chunks)} chunks to S3: {chunks_s3_key} ({len(body):,} bytes)")
         self.s3_service.s3_client.put_object(
             Bucket=self.s3_service.bucket_name,
             Key=chunks_s3_key,
-            Body=json.dumps(chunks_data, indent=2).encode('utf-8'),
-            ContentType="application/json",
+            Body=body,
+            ContentType=content_type,
             Metadata={
                 'ticker': ticker,
                 'filing_type': filing_type,
@@ -106,6 +108,7 @@ class DocumentChunkingService:
         # Update document status and chunk count
         self.doc_repo.update_status(document_id, "chunked")
         self.doc_repo.update_chunk_count(document_id, len(chunks))
+        invalidate_scoring_stages(ticker)
         
         logger.info(f"  ✅ Document chunked successfully!")
         
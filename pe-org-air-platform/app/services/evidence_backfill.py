@@ -0,0 +1,123 @@
+"""
+Evidence Backfill — per-company collection run as a durable job
+app/services/evidence_backfill.py
+
+One job item = one company: SEC document collection and the four signal
+categories, run in parallel (as the in-process backfill did). The job
+worker runs several companies at once, so each external host is guarded
+by a rate_limiter slot:
+
+  SEC filings          sec          (+ a request token per EDGAR call)
+  technology_hiring    jobspy
+  innovation_activity  patentsview
+
+The per-company result is the CompanyBackfillResult payload; it is the
+job checkpoint, so a resumed backfill skips companies already collected.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.models.document import DocumentCollectionRequest
+from app.services.blocking import SCORING_LANE, get_executor
+from app.services.document_collector import get_document_collector_service
+from app.services.job_queue import register_job_handler
+from app.services.job_signal_service import get_job_signal_service
+from app.services.leadership_service import get_leadership_service
+from app.services.patent_signal_service import get_patent_signal_service
+from app.services.rate_limiter import JOBSPY_HOST, PATENTSVIEW_HOST, SEC_HOST, get_host_limiter
+from app.services.tech_signal_service import get_tech_signal_service
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_JOB = "evidence_backfill"
+
+# (category, host slot or None, coroutine factory)
+SIGNAL_CATEGORIES: List[Tuple[str, Optional[str], Callable[[str], Any]]] = [
+    ("technology_hiring", JOBSPY_HOST, lambda t: get_job_signal_service().analyze_company(t, force_refresh=True)),
+    ("innovation_activity", PATENTSVIEW_HOST, lambda t: get_patent_signal_service().analyze_company(t, years_back=5)),
+    ("digital_presence", None, lambda t: get_tech_signal_service().analyze_company(t, force_refresh=True)),
+    ("leadership_signals", None, lambda t: get_leadership_service().analyze_company(t)),
+]
+
+
+def _in_slot(host: Optional[str], fn: Callable[[], Any]) -> Any:
+    if host is None:
+        return fn()
+    with get_host_limiter(host).slot():
+        return fn()
+
+
+def collect_signals_for_company(ticker: str) -> Dict[str, Any]:
+    """Run all 4 signal categories for a company."""
+    signal_results = {}
+    errors = []
+
+    for category, host, service_call in SIGNAL_CATEGORIES:
+        try:
+            result = _in_slot(host, lambda: asyncio.run(service_call(ticker)))
+            signal_results[category] = {
+                "status": "success",
+                "score": result.get("normalized_score") if isinstance(result, dict) else None,
+            }
+        except Exception as e:
+            logger.error(f"Signal error for {ticker}/{category}: {e}")
+            signal_results[category] = {"status": "failed", "error": str(e)}
+            errors.append(f"{category}: {str(e)}")
+
+    return {"signals": signal_results, "errors": errors}
+
+
+def collect_sec_for_company(ticker: str) -> Dict[str, Any]:
+    """Run SEC document collection for a company."""
+    service = get_document_collector_service()
+    request = DocumentCollectionRequest(ticker=ticker)
+    result = _in_slot(SEC_HOST, lambda: service.collect_for_company(request))
+    return {
+        "documents_found": result.documents_found,
+        "documents_uploaded": result.documents_uploaded,
+        "documents_skipped": result.documents_skipped,
+        "documents_failed": result.documents_failed,
+        "summary": result.summary,
+    }
+
+
+def backfill_company(ticker: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Job handler: SEC + signals for one company, in parallel."""
+    start = time.perf_counter()
+    company_result = {
+        "ticker": ticker, "status": "success",
+        "sec_result": None, "signal_result": None, "error": None,
+        "duration_seconds": None, "has_errors": False,
+    }
+    logger.info(f"Backfill: processing {ticker}")
+
+    try:
+        sec_future = get_executor(SCORING_LANE).submit(collect_sec_for_company, ticker)
+        try:
+            company_result["signal_result"] = collect_signals_for_company(ticker)
+            if company_result["signal_result"].get("errors"):
+                company_result["has_errors"] = True
+        except Exception as e:
+            logger.error(f"Signal collection failed for {ticker}: {e}")
+            company_result["signal_result"] = {"status": "failed", "error": str(e)}
+            company_result["has_errors"] = True
+
+        try:
+            company_result["sec_result"] = sec_future.result()
+        except Exception as e:
+            logger.error(f"SEC collection failed for {ticker}: {e}")
+            company_result["sec_result"] = {"status": "failed", "error": str(e)}
+            company_result["has_errors"] = True
+
+    except Exception as e:
+        logger.error(f"Backfill failed for {ticker}: {e}")
+        company_result["status"] = "failed"
+        company_result["error"] = str(e)
+
+    company_result["duration_seconds"] = round(time.perf_counter() - start, 1)
+    return company_result
+
+
+register_job_handler(BACKFILL_JOB, backfill_company)
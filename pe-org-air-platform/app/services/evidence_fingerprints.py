@@ -0,0 +1,108 @@
+"""
+Evidence Fingerprints — change detection for incremental re-scoring
+app/services/evidence_fingerprints.py
+
+Every evidence source of the CS3 pipeline gets a cheap fingerprint that
+changes whenever the evidence it would produce can change:
+
+  technology_hiring … leadership_signals   summary score + (count, max created_at)
+                                           of the category's external_signals
+  sec_item_1 / 1a / 7                      10-K chunk keys, sections, S3 ETags and
+                                           rubric constants (shared: a section can
+                                           fall back to all chunks of the filing)
+  board_composition                        sha256 of the latest board JSON
+  glassdoor_reviews                        key + ETag of the latest culture snapshot
+
+plus one "_constants" entry for the mapping table and stage schema.
+
+The fingerprints used for the last stored result are kept per ticker in
+the evidence_fingerprints table, together with the evidence each source
+produced. A new run compares fingerprints first, re-reads only the sources
+that changed, rebuilds the others from the stored evidence, and writes
+back only the dimensions those sources feed (SIGNAL_TO_DIMENSION_MAP's
+reverse index, DIMENSION_SOURCES). A run in which nothing changed reads no
+evidence at all; a dry run just reports the StalenessReport.
+
+Schema: app/database/evidence_fingerprints_schema.sql
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+from app.scoring.evidence_mapper import Dimension, SignalSource, dimensions_for_sources
+from app.services.scoring_cache import stage_digest
+
+# Pseudo-source for everything that is not evidence (mapping table, stage schema)
+CONSTANTS_SOURCE = "_constants"
+
+# Sources that are read together (one query / one rubric stage)
+CS2_SOURCES = (
+    SignalSource.TECHNOLOGY_HIRING, SignalSource.INNOVATION_ACTIVITY,
+    SignalSource.DIGITAL_PRESENCE, SignalSource.LEADERSHIP_SIGNALS,
+)
+SEC_SOURCES = (SignalSource.SEC_ITEM_1, SignalSource.SEC_ITEM_1A, SignalSource.SEC_ITEM_7)
+
+
+def fingerprint(value: Any) -> str:
+    """Digest of a source's version inputs (any JSON-friendly structure)."""
+    return stage_digest("fingerprint", value)
+
+
+@dataclass
+class StoredSource:
+    """What the last stored result used for one source."""
+    fingerprint: str
+    evidence: Optional[Dict[str, Any]] = None   # serialised EvidenceScore; None = source had no evidence
+
+
+@dataclass
+class StalenessReport:
+    """Which sources changed since the stored result, and which dimensions that makes stale."""
+    ticker: str
+    changed_sources: List[SignalSource] = field(default_factory=list)
+    stale_dimensions: List[Dimension] = field(default_factory=list)
+    full: bool = False          # nothing stored, or constants changed: every source is re-read
+    reason: str = ""
+
+    @property
+    def up_to_date(self) -> bool:
+        return not self.changed_sources and not self.full
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ticker": self.ticker,
+            "up_to_date": self.up_to_date,
+            "full": self.full,
+            "reason": self.reason,
+            "changed_sources": [s.value for s in self.changed_sources],
+            "stale_dimensions": [d.value for d in self.stale_dimensions],
+        }
+
+
+def diff_fingerprints(
+    ticker: str,
+    stored: Mapping[str, StoredSource],
+    current: Mapping[str, str],
+) -> StalenessReport:
+    """Compare current fingerprints with the stored ones."""
+    if not stored:
+        return StalenessReport(ticker, list(SignalSource), list(Dimension), full=True, reason="no stored result")
+    previous = stored.get(CONSTANTS_SOURCE)
+    if previous is None or previous.fingerprint != current.get(CONSTANTS_SOURCE):
+        return StalenessReport(ticker, list(SignalSource), list(Dimension), full=True, reason="constants changed")
+
+    changed = [
+        source for source in SignalSource
+        if source.value not in stored or stored[source.value].fingerprint != current.get(source.value)
+    ]
+    return StalenessReport(
+        ticker,
+        changed_sources=changed,
+        stale_dimensions=dimensions_for_sources(changed),
+        reason=f"{len(changed)} source(s) changed" if changed else "unchanged",
+    )
+
+
+def full_report(ticker: str, reason: str) -> StalenessReport:
+    """A report that treats every source as changed (forced or unchecked runs)."""
+    return StalenessReport(ticker, list(SignalSource), list(Dimension), full=True, reason=reason)
@@ -0,0 +1,667 @@
+"""
+Job Queue — durable background jobs with resumable per-item checkpoints
+app/services/job_queue.py
+
+Long multi-company runs (evidence backfills, portfolio refreshes) are
+stored as job records instead of living in one API process' memory:
+
+  POST /…/backfill ──► store.create(job) ──► JobWorker (any process)
+                                               │ claim (lease)
+                                               ├─► item 1 ─┐
+                                               ├─► item 2 ─┼─► checkpoint + event per item
+                                               └─► item N ─┘
+
+  - Stores: Redis (JOB_STORE="redis") or a local SQLite file
+    (JOB_STORE="sqlite"); "auto" uses Redis when it answers a ping.
+  - A worker holds a lease on the job it runs and renews it while the job
+    runs. A worker that dies or restarts lets the lease lapse, and the
+    next worker to claim the job resumes it; finished items are skipped
+    using their checkpoints.
+  - Items run concurrently (JOB_WORKER_CONCURRENCY); handlers apply the
+    per-host limits (rate_limiter.py) so SEC / jobspy / PatentsView see
+    no more traffic than a sequential run.
+  - Every job / checkpoint write a worker makes is fenced on its lease:
+    once the lease lapses and another worker claims the job, the old
+    worker's writes are dropped and it stops without touching the record.
+  - Cancellation is a flag checked before each item starts; items in
+    flight finish and are kept. Shutdown stops scheduling and releases
+    the lease without cancelling, so the job resumes on the next start.
+  - Every state change appends an event (seq-numbered) that clients can
+    stream with store.events(job_id, after=seq).
+
+Usage:
+    register_job_handler("evidence_backfill", backfill_company)
+    job = enqueue_job("evidence_backfill", ["CAT", "DE"], params={...})
+    get_job_worker().start()
+"""
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.shutdown import is_shutting_down
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_COMPLETED_WITH_ERRORS = "completed_with_errors"
+JOB_CANCELLED = "cancelled"
+JOB_FAILED = "failed"
+TERMINAL_STATUSES = (JOB_COMPLETED, JOB_COMPLETED_WITH_ERRORS, JOB_CANCELLED, JOB_FAILED)
+
+# Per-item handler: (item, job params) -> JSON-serialisable result dict.
+# A result whose "status" is not "success", or that sets "has_errors",
+# makes the job finish as completed_with_errors.
+JobHandler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _item_failed(result: Dict[str, Any]) -> bool:
+    return result.get("status") != "success" or bool(result.get("has_errors"))
+
+
+# ---------------------------------------------------------------------------
+# Stores
+# ---------------------------------------------------------------------------
+
+class RedisJobStore:
+    """
+    Jobs in Redis (string-decoding client).
+
+      jobs:{id}              job record (JSON)
+      jobs:{id}:checkpoints  HASH item → result JSON
+      jobs:{id}:events       LIST of event JSON (seq = list position, from 1)
+      jobs:{id}:cancel       cancel flag
+      jobs:{id}:lease        worker id, SET NX with a TTL — expires on its own
+      jobs:active            SET of unfinished job ids
+      jobs:index             ZSET of every job id by creation time
+
+    Writes made on behalf of a worker (save / save_checkpoint with
+    worker_id) and lease renewal / release are Lua scripts that first
+    check the lease still holds that worker id, so a worker whose lease
+    lapsed cannot overwrite the job's next owner.
+    """
+
+    backend = "redis"
+
+    # KEYS: lease; ARGV: worker id, lease ms
+    RENEW_SCRIPT = """
+        if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+        return redis.call('PEXPIRE', KEYS[1], ARGV[2])
+    """
+    # KEYS: lease; ARGV: worker id
+    RELEASE_SCRIPT = """
+        if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+        return redis.call('DEL', KEYS[1])
+    """
+    # KEYS: lease, job, checkpoints, events, cancel, jobs:active
+    # ARGV: worker id, record, retention seconds ('' while unfinished), job id
+    SAVE_SCRIPT = """
+        if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+        if ARGV[3] == '' then
+            redis.call('SET', KEYS[2], ARGV[2])
+            return 1
+        end
+        redis.call('SET', KEYS[2], ARGV[2], 'EX', ARGV[3])
+        for i = 3, 5 do redis.call('EXPIRE', KEYS[i], ARGV[3]) end
+        redis.call('SREM', KEYS[6], ARGV[4])
+        return 1
+    """
+    # KEYS: lease, checkpoints; ARGV: worker id, item, result
+    CHECKPOINT_SCRIPT = """
+        if redis.call('GET', KEYS[1]) ~= ARGV[1] then return 0 end
+        redis.call('HSET', KEYS[2], ARGV[2], ARGV[3])
+        return 1
+    """
+
+    def __init__(self, client, retention_seconds: int = 7 * 86400):
+        self.client = client
+        self.retention_seconds = retention_seconds
+        self._renew = client.register_script(self.RENEW_SCRIPT)
+        self._release = client.register_script(self.RELEASE_SCRIPT)
+        self._save = client.register_script(self.SAVE_SCRIPT)
+        self._save_checkpoint = client.register_script(self.CHECKPOINT_SCRIPT)
+
+    def _key(self, job_id: str, suffix: str = "") -> str:
+        return f"jobs:{job_id}{':' + suffix if suffix else ''}"
+
+    def create(self, job: Dict[str, Any]) -> None:
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._key(job["job_id"]), json.dumps(job))
+        pipe.zadd("jobs:index", {job["job_id"]: job["created_ts"]})
+        if job["status"] not in TERMINAL_STATUSES:
+            pipe.sadd("jobs:active", job["job_id"])
+        pipe.execute()
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self._key(job_id))
+        if raw is None:
+            return None
+        job = json.loads(raw)
+        job["cancel_requested"] = bool(self.client.exists(self._key(job_id, "cancel")))
+        return job
+
+    def save(self, job: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        """Write the job record; with `worker_id`, only while that worker holds the lease."""
+        record = {k: v for k, v in job.items() if k != "cancel_requested"}
+        job_id = job["job_id"]
+        terminal = job["status"] in TERMINAL_STATUSES
+        if worker_id is not None:
+            keys = [self._key(job_id, "lease"), self._key(job_id)]
+            keys += [self._key(job_id, suffix) for suffix in ("checkpoints", "events", "cancel")]
+            keys.append("jobs:active")
+            args = [worker_id, json.dumps(record), self.retention_seconds if terminal else "", job_id]
+            return bool(self._save(keys=keys, args=args))
+        if not terminal:
+            self.client.set(self._key(job_id), json.dumps(record))
+            return True
+        pipe = self.client.pipeline(transaction=True)
+        pipe.set(self._key(job_id), json.dumps(record), ex=self.retention_seconds)
+        for suffix in ("checkpoints", "events", "cancel"):
+            pipe.expire(self._key(job_id, suffix), self.retention_seconds)
+        pipe.srem("jobs:active", job_id)
+        pipe.execute()
+        return True
+
+    def list_jobs(self, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        jobs = []
+        for job_id in self.client.zrevrange("jobs:index", 0, -1):
+            job = self.get(job_id)
+            if job is None:
+                self.client.zrem("jobs:index", job_id)        # aged out
+            elif kind is None or job["kind"] == kind:
+                jobs.append(job)
+                if len(jobs) >= limit:
+                    break
+        return jobs
+
+    def request_cancel(self, job_id: str) -> None:
+        self.client.set(self._key(job_id, "cancel"), "1")
+
+    def cancel_requested(self, job_id: str) -> bool:
+        return bool(self.client.exists(self._key(job_id, "cancel")))
+
+    def save_checkpoint(self, job_id: str, item: str, result: Dict[str, Any],
+                        worker_id: Optional[str] = None) -> bool:
+        """Record an item result; with `worker_id`, only while that worker holds the lease."""
+        if worker_id is not None:
+            keys = [self._key(job_id, "lease"), self._key(job_id, "checkpoints")]
+            return bool(self._save_checkpoint(keys=keys, args=[worker_id, item, json.dumps(result)]))
+        self.client.hset(self._key(job_id, "checkpoints"), item, json.dumps(result))
+        return True
+
+    def checkpoints(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        raw = self.client.hgetall(self._key(job_id, "checkpoints"))
+        return {item: json.loads(result) for item, result in raw.items()}
+
+    def append_event(self, job_id: str, event: Dict[str, Any]) -> int:
+        return int(self.client.rpush(self._key(job_id, "events"), json.dumps(event)))
+
+    def events(self, job_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        raw = self.client.lrange(self._key(job_id, "events"), after, -1)
+        return [{"seq": after + i + 1, **json.loads(e)} for i, e in enumerate(raw)]
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        jobs = [j for j in (self.get(job_id) for job_id in self.client.smembers("jobs:active")) if j is not None]
+        for job in sorted(jobs, key=lambda j: j["created_ts"]):
+            if self.client.set(self._key(job["job_id"], "lease"), worker_id, nx=True, px=int(lease_seconds * 1000)):
+                return job
+        return None
+
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        return bool(self._renew(keys=[self._key(job_id, "lease")], args=[worker_id, int(lease_seconds * 1000)]))
+
+    def release(self, job_id: str, worker_id: str) -> None:
+        self._release(keys=[self._key(job_id, "lease")], args=[worker_id])
+
+
+class SQLiteJobStore:
+    """Local stand-in with the same semantics; safe across processes on one host (WAL + leases)."""
+
+    backend = "sqlite"
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY, kind TEXT NOT NULL, status TEXT NOT NULL,
+            created_ts REAL NOT NULL, record TEXT NOT NULL,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT, lease_expires REAL
+        );
+        CREATE TABLE IF NOT EXISTS job_checkpoints (
+            job_id TEXT NOT NULL, item TEXT NOT NULL, result TEXT NOT NULL,
+            PRIMARY KEY (job_id, item)
+        );
+        CREATE TABLE IF NOT EXISTS job_events (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, event TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS job_events_by_job ON job_events (job_id, seq);
+    """
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=30)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def create(self, job: Dict[str, Any]) -> None:
+        self._execute(
+            "INSERT INTO jobs (job_id, kind, status, created_ts, record) VALUES (?, ?, ?, ?, ?)",
+            (job["job_id"], job["kind"], job["status"], job["created_ts"], json.dumps(job)),
+        )
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute("SELECT record, cancel_requested FROM jobs WHERE job_id = ?", (job_id,))
+        if not rows:
+            return None
+        job = json.loads(rows[0][0])
+        job["cancel_requested"] = bool(rows[0][1])
+        return job
+
+    def save(self, job: Dict[str, Any], worker_id: Optional[str] = None) -> bool:
+        record = {k: v for k, v in job.items() if k != "cancel_requested"}
+        sql = "UPDATE jobs SET status = ?, record = ? WHERE job_id = ?"
+        params = [job["status"], json.dumps(record), job["job_id"]]
+        if worker_id is not None:
+            sql += " AND lease_owner = ?"
+            params.append(worker_id)
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount == 1
+
+    def list_jobs(self, kind: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        sql = "SELECT job_id FROM jobs" + (" WHERE kind = ?" if kind else "") + " ORDER BY created_ts DESC LIMIT ?"
+        rows = self._execute(sql, ((kind,) if kind else ()) + (limit,))
+        return [job for job in (self.get(r[0]) for r in rows) if job is not None]
+
+    def request_cancel(self, job_id: str) -> None:
+        self._execute("UPDATE jobs SET cancel_requested = 1 WHERE job_id = ?", (job_id,))
+
+    def cancel_requested(self, job_id: str) -> bool:
+        rows = self._execute("SELECT cancel_requested FROM jobs WHERE job_id = ?", (job_id,))
+        return bool(rows and rows[0][0])
+
+    def save_checkpoint(self, job_id: str, item: str, result: Dict[str, Any],
+                        worker_id: Optional[str] = None) -> bool:
+        if worker_id is None:
+            self._execute("INSERT OR REPLACE INTO job_checkpoints (job_id, item, result) VALUES (?, ?, ?)",
+                          (job_id, item, json.dumps(result)))
+            return True
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR REPLACE INTO job_checkpoints (job_id, item, result) SELECT ?, ?, ? "
+                "WHERE EXISTS (SELECT 1 FROM jobs WHERE job_id = ? AND lease_owner = ?)",
+                (job_id, item, json.dumps(result), job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def checkpoints(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        rows = self._execute("SELECT item, result FROM job_checkpoints WHERE job_id = ? ORDER BY rowid", (job_id,))
+        return {item: json.loads(result) for item, result in rows}
+
+    def append_event(self, job_id: str, event: Dict[str, Any]) -> int:
+        with self._lock:
+            cursor = self._conn.execute("INSERT INTO job_events (job_id, event) VALUES (?, ?)",
+                                        (job_id, json.dumps(event)))
+            return int(cursor.lastrowid)
+
+    def events(self, job_id: str, after: int = 0) -> List[Dict[str, Any]]:
+        rows = self._execute("SELECT seq, event FROM job_events WHERE job_id = ? AND seq > ? ORDER BY seq",
+                             (job_id, after))
+        return [{"seq": seq, **json.loads(event)} for seq, event in rows]
+
+    def claim(self, worker_id: str, lease_seconds: float) -> Optional[Dict[str, Any]]:
+        now = self._clock()
+        placeholders = ",".join("?" * len(TERMINAL_STATUSES))
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    f"SELECT job_id FROM jobs WHERE status NOT IN ({placeholders}) "
+                    "AND (lease_expires IS NULL OR lease_expires <= ?) ORDER BY created_ts LIMIT 1",
+                    (*TERMINAL_STATUSES, now),
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE jobs SET lease_owner = ?, lease_expires = ? WHERE job_id = ?",
+                                       (worker_id, now + lease_seconds, row[0]))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row[0]) if row is not None else None
+
+    def renew(self, job_id: str, worker_id: str, lease_seconds: float) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE job_id = ? AND lease_owner = ?",
+                (self._clock() + lease_seconds, job_id, worker_id),
+            )
+            return cursor.rowcount == 1
+
+    def release(self, job_id: str, worker_id: str) -> None:
+        self._execute("UPDATE jobs SET lease_owner = NULL, lease_expires = NULL WHERE job_id = ? AND lease_owner = ?",
+                      (job_id, worker_id))
+
+
+# ---------------------------------------------------------------------------
+# Handlers / enqueueing
+# ---------------------------------------------------------------------------
+
+_handlers: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(kind: str, handler: JobHandler) -> None:
+    _handlers[kind] = handler
+
+
+def new_job(kind: str, items: Sequence[str], params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """A fresh job record (queued; completed at once when there is nothing to do)."""
+    items = list(dict.fromkeys(items))
+    done = not items
+    return {
+        "job_id": str(uuid.uuid4()),
+        "kind": kind,
+        "status": JOB_COMPLETED if done else JOB_QUEUED,
+        "items": items,
+        "params": params or {},
+        "progress": {"completed": 0, "total": len(items), "running": []},
+        "created_ts": time.time(),
+        "created_at": _now_iso(),
+        "started_at": None,
+        "completed_at": _now_iso() if done else None,
+        "attempts": 0,
+        "error": None,
+    }
+
+
+def enqueue_job(kind: str, items: Sequence[str], params: Optional[Dict[str, Any]] = None,
+                store=None) -> Dict[str, Any]:
+    store = store or get_job_store()
+    job = new_job(kind, items, params)
+    store.create(job)
+    store.append_event(job["job_id"], {"type": "queued", "status": job["status"], "total": len(job["items"])})
+    logger.info(f"📥 Job queued: {kind} {job['job_id']} ({len(job['items'])} items)")
+    return job
+
+
+def job_results(
+    job: Dict[str, Any],
+    checkpoints: Dict[str, Dict[str, Any]],
+    key: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Checkpointed item results in the job's item order.
+
+    The worker's own failed / cancelled checkpoints don't know the handler's
+    result shape; pass `key` to have every result carry its item under that
+    name (e.g. key="ticker").
+    """
+    items = [item for item in job["items"] if item in checkpoints]
+    if key is None:
+        return [checkpoints[item] for item in items]
+    return [{key: item, **checkpoints[item]} for item in items]
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+class JobWorker:
+    """Claims jobs from a store and runs their items on a bounded thread pool."""
+
+    def __init__(
+        self,
+        store,
+        concurrency: int = 3,
+        lease_seconds: float = 60.0,
+        poll_seconds: float = 2.0,
+        worker_id: Optional[str] = None,
+        handlers: Optional[Dict[str, JobHandler]] = None,
+    ):
+        self.store = store
+        self.concurrency = max(1, concurrency)
+        self.lease_seconds = lease_seconds
+        self.poll_seconds = poll_seconds
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.handlers = handlers if handlers is not None else _handlers
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="job-worker", daemon=True)
+        self._thread.start()
+        logger.info(f"👷 Job worker {self.worker_id} started ({self.store.backend}, {self.concurrency} concurrent items)")
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _stopping(self) -> bool:
+        return self._stop.is_set() or is_shutting_down()
+
+    def _loop(self) -> None:
+        while not self._stopping():
+            try:
+                if not self.run_next():
+                    self._stop.wait(self.poll_seconds)
+            except Exception as e:
+                logger.error(f"Job worker loop error: {e}", exc_info=True)
+                self._stop.wait(self.poll_seconds)
+
+    def run_next(self) -> bool:
+        """Claim and run one job; False when there was nothing to claim."""
+        job = self.store.claim(self.worker_id, self.lease_seconds)
+        if job is None:
+            return False
+        self.run_job(job)
+        return True
+
+    # -- one job ----------------------------------------------------------
+
+    def _event(self, job: Dict[str, Any], event_type: str, **fields: Any) -> None:
+        self.store.append_event(job["job_id"], {"type": event_type, "at": _now_iso(), **fields})
+
+    def _finish(self, job: Dict[str, Any], status: str, error: Optional[str] = None) -> bool:
+        """Save the final status; False (nothing written) when the lease was lost."""
+        job.update(status=status, completed_at=_now_iso(), error=error)
+        job["progress"]["running"] = []
+        if not self.store.save(job, self.worker_id):
+            logger.warning(f"⚠️  Job {job['job_id']} lease lost before it finished ({status}); left to its new owner")
+            return False
+        self._event(job, "finished", status=status, completed=job["progress"]["completed"],
+                    total=job["progress"]["total"], error=error)
+        self.store.release(job["job_id"], self.worker_id)
+        logger.info(f"🏁 Job {job['job_id']} {status} ({job['progress']['completed']}/{job['progress']['total']})")
+        return True
+
+    def run_job(self, job: Dict[str, Any]) -> str:
+        """Run (or resume) a claimed job; returns the status it ended in."""
+        job_id = job["job_id"]
+        handler = self.handlers.get(job["kind"])
+        if handler is None:
+            error = f"No handler registered for job kind {job['kind']!r}"
+            return JOB_FAILED if self._finish(job, JOB_FAILED, error=error) else JOB_QUEUED
+
+        done = self.store.checkpoints(job_id)
+        pending = [item for item in job["items"] if item not in done]
+        job.update(status=JOB_RUNNING, started_at=job["started_at"] or _now_iso(), attempts=job["attempts"] + 1)
+        job["progress"].update(completed=len(done), running=[])
+        if not self.store.save(job, self.worker_id):
+            logger.warning(f"⚠️  Job {job_id} lease lost before it started")
+            return JOB_QUEUED
+        self._event(job, "started", worker=self.worker_id, resumed=len(done), pending=len(pending))
+        if done:
+            logger.info(f"🔁 Resuming job {job_id}: {len(done)} done, {len(pending)} pending")
+
+        lost = threading.Event()
+        heartbeat_stop = threading.Event()
+
+        def _save() -> None:
+            if not self.store.save(job, self.worker_id):
+                lost.set()
+
+        def _heartbeat() -> None:
+            while not heartbeat_stop.wait(self.lease_seconds / 3):
+                try:
+                    if not self.store.renew(job_id, self.worker_id, self.lease_seconds):
+                        lost.set()
+                        return
+                except Exception as e:
+                    logger.warning(f"Job {job_id} lease renewal failed: {e}")
+
+        heartbeat = threading.Thread(target=_heartbeat, name=f"job-lease-{job_id[:8]}", daemon=True)
+        heartbeat.start()
+
+        has_errors = any(_item_failed(r) for r in done.values())
+        stop_reason: Optional[str] = None
+        running: Dict[Future, str] = {}
+        params = job["params"]
+        pool = ThreadPoolExecutor(max_workers=min(self.concurrency, max(1, len(pending))),
+                                  thread_name_prefix=f"job-{job_id[:8]}")
+        try:
+            queue = list(pending)
+            while queue or running:
+                while queue and len(running) < self.concurrency and stop_reason is None:
+                    if self.store.cancel_requested(job_id):
+                        stop_reason = "cancelled"
+                    elif lost.is_set():
+                        stop_reason = "lease_lost"
+                    elif self._stopping():
+                        stop_reason = "shutdown"
+                    else:
+                        item = queue.pop(0)
+                        running[pool.submit(handler, item, params)] = item
+                        job["progress"]["running"] = list(running.values())
+                        _save()
+                        self._event(job, "item_started", item=item)
+                if not running:
+                    break
+
+                finished, _ = wait(list(running), timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    item = running.pop(fut)
+                    try:
+                        result = fut.result()
+                    except Exception as e:
+                        logger.error(f"Job {job_id} item {item} failed: {e}", exc_info=True)
+                        result = {"status": "failed", "error": str(e)}
+                    if not self.store.save_checkpoint(job_id, item, result, self.worker_id):
+                        # Another worker owns the job now and will redo the item
+                        lost.set()
+                        continue
+                    has_errors = has_errors or _item_failed(result)
+                    job["progress"]["completed"] += 1
+                    job["progress"]["running"] = list(running.values())
+                    _save()
+                    self._event(job, "item_finished", item=item, status=result.get("status"),
+                                completed=job["progress"]["completed"], total=job["progress"]["total"])
+        finally:
+            pool.shutdown(wait=True)
+            heartbeat_stop.set()
+
+        if lost.is_set():
+            # The job may already belong to (or be finished by) another worker
+            stop_reason = "lease_lost"
+        if stop_reason == "cancelled":
+            for item in queue:
+                self.store.save_checkpoint(job_id, item, {"status": "cancelled", "error": "Cancelled by user"},
+                                           self.worker_id)
+            return JOB_CANCELLED if self._finish(job, JOB_CANCELLED) else JOB_QUEUED
+        if stop_reason == "lease_lost":
+            self._event(job, "interrupted", reason=stop_reason, completed=job["progress"]["completed"])
+            logger.info(f"⏸️  Job {job_id} interrupted (lease_lost); leaving it to the next owner")
+            return JOB_QUEUED
+        if stop_reason is not None:
+            # Not cancelled: leave the job unfinished for the next worker to resume
+            job["progress"]["running"] = []
+            job["status"] = JOB_QUEUED
+            self.store.save(job, self.worker_id)
+            self._event(job, "interrupted", reason=stop_reason, completed=job["progress"]["completed"])
+            self.store.release(job_id, self.worker_id)
+            logger.info(f"⏸️  Job {job_id} interrupted ({stop_reason}); {len(queue)} items left for resume")
+            return JOB_QUEUED
+
+        status = JOB_COMPLETED_WITH_ERRORS if has_errors else JOB_COMPLETED
+        return status if self._finish(job, status) else JOB_QUEUED
+
+
+# ---------------------------------------------------------------------------
+# Singletons
+# ---------------------------------------------------------------------------
+
+_store = None
+_worker: Optional[JobWorker] = None
+_singleton_lock = threading.Lock()
+
+
+def _build_store():
+    if settings.JOB_STORE in ("redis", "auto"):
+        try:
+            from app.services.redis_cache import RedisCache
+            client = RedisCache().client
+            client.ping()
+            return RedisJobStore(client, retention_seconds=settings.JOB_RETENTION_SECONDS)
+        except Exception as e:
+            if settings.JOB_STORE == "redis":
+                raise
+            logger.warning(f"Redis unavailable for the job store ({e}); using SQLite at {settings.JOB_SQLITE_PATH}")
+    return SQLiteJobStore(settings.JOB_SQLITE_PATH)
+
+
+def get_job_store():
+    global _store
+    if _store is None:
+        with _singleton_lock:
+            if _store is None:
+                _store = _build_store()
+                logger.info(f"🗂️  Job store: {_store.backend}")
+    return _store
+
+
+def get_job_worker() -> JobWorker:
+    global _worker
+    if _worker is None:
+        with _singleton_lock:
+            if _worker is None:
+                _worker = JobWorker(
+                    get_job_store(),
+                    concurrency=settings.JOB_WORKER_CONCURRENCY,
+                    lease_seconds=settings.JOB_LEASE_SECONDS,
+                    poll_seconds=settings.JOB_POLL_SECONDS,
+                )
+    return _worker
+
+
+def reset_job_queue() -> None:
+    """Stop the worker and drop the singletons (tests / shutdown)."""
+    global _store, _worker
+    with _singleton_lock:
+        if _worker is not None:
+            _worker.stop(timeout=0)
+        _store, _worker = None, None
@@ -257,7 +257,7 @@ class PatentSignalService:
         self.company_repo = CompanyRepository()
         self.signal_repo = get_signal_repository()
 
-    async def analyze_company(self, ticker: str, years_back: int = 5) -> Dict:
+    async def analyze_company(self, ticker: str, years_back: int = 5, incremental: bool = False) -> Dict:
         ticker = ticker.upper()
         logger.info("=" * 60)
         logger.info(f"🎯 ANALYZING INNOVATION ACTIVITY SIGNALS FOR: {ticker}")
@@ -281,7 +281,9 @@ class PatentSignalService:
 
         try:
             logger.info("📊 Running patent signals pipeline...")
-            state = await run_patent_signals(state, years_back=years_back, results_per_company=100)
+            state = await run_patent_signals(
+                state, years_back=years_back, results_per_company=100, incremental=incremental,
+            )
 
             patent_score = state.patent_scores.get(company_id, 0.0)
             ai_patents = sum(1 for p in state.patents if p.get("is_ai_related"))
@@ -0,0 +1,282 @@
+"""
+Portfolio Executor — Concurrent CS3 Portfolio Scoring
+app/services/portfolio_executor.py
+
+Fans a per-ticker scoring function out across bounded worker threads:
+
+  tickers ──► [worker 1] NVDA ──┐
+              [worker 2] JPM  ──┼──► outcomes (in portfolio order) + progress
+              [worker N] ...  ──┘
+
+  - Concurrency capped by PORTFOLIO_MAX_WORKERS, across every run of the
+    executor (concurrent portfolio requests share the same slots)
+  - Per-ticker timeout (PORTFOLIO_TICKER_TIMEOUT), measured from when the
+    ticker starts running, not from when it was queued
+  - Failures and timeouts are isolated to their ticker
+  - Per-stage timings collected via stage_timer() inside the scoring code
+
+Threads (not processes) are used because the scoring chain is dominated by
+Snowflake and S3 round trips, and the pooled connections / boto3 clients
+are shared per process.  A timed-out ticker is reported immediately, but
+its thread cannot be killed: it keeps its slot (and its pooled Snowflake
+connection) until it actually returns, and only then does the next queued
+ticker start — so the number of scoring threads never exceeds
+PORTFOLIO_MAX_WORKERS.
+
+Usage:
+    executor = get_portfolio_executor()
+    run = await executor.arun(CS3_PORTFOLIO, _compute_orgair)
+    for outcome in run.outcomes: ...
+"""
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+from app.config import settings
+from app.services.blocking import SCORING_LANE, run_blocking
+
+logger = logging.getLogger(__name__)
+
+_stage_timings: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "portfolio_stage_timings", default=None
+)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """
+    Record the wall time of a scoring stage for the ticker being executed.
+
+    No-op outside a PortfolioExecutor worker, so single-ticker endpoints
+    pay nothing for the instrumentation.
+    """
+    timings = _stage_timings.get()
+    if timings is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = round(timings.get(stage, 0.0) + time.perf_counter() - start, 3)
+
+
+@dataclass
+class TickerOutcome:
+    """Result of running the scoring function for one ticker."""
+    ticker: str
+    status: str                      # "success", "failed" or "timeout"
+    result: Any = None
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class PortfolioRun:
+    """All outcomes of a portfolio run, in the order the tickers were given."""
+    outcomes: List[TickerOutcome]
+    duration_seconds: float
+    max_workers: int
+
+    def results(self, on_failure: Callable[[TickerOutcome], Any]) -> List[Any]:
+        """Per-ticker results in order; failed or timed-out tickers go through on_failure."""
+        return [o.result if o.status == "success" else on_failure(o) for o in self.outcomes]
+
+    @property
+    def timings(self) -> Dict[str, Dict[str, float]]:
+        """Per-ticker total + per-stage timings, for response payloads."""
+        return {
+            o.ticker: {"total": o.duration_seconds, **o.stage_timings}
+            for o in self.outcomes
+        }
+
+
+class PortfolioExecutor:
+    """Run a per-ticker function across a portfolio with bounded parallelism."""
+
+    def __init__(self, max_workers: int = 5, ticker_timeout: float = 300.0):
+        self.max_workers = max_workers
+        self.ticker_timeout = ticker_timeout
+        # Worker slots shared by all runs; released when a ticker's thread
+        # returns, not when the ticker is reported (timeouts keep theirs).
+        self._slots = threading.Condition()
+        self._in_use = 0
+
+    @property
+    def threads_in_use(self) -> int:
+        """Scoring threads alive right now, including abandoned timed-out ones."""
+        with self._slots:
+            return self._in_use
+
+    def run(
+        self,
+        tickers: Sequence[str],
+        fn: Callable[[str], Any],
+        on_progress: Optional[Callable[[TickerOutcome, int, int], None]] = None,
+    ) -> PortfolioRun:
+        """
+        Score every ticker and return outcomes in input order.
+
+        Args:
+            tickers: Tickers to score.
+            fn: Blocking per-ticker function; exceptions become "failed" outcomes.
+            on_progress: Called as (outcome, completed, total) when each ticker ends.
+        """
+        start = time.perf_counter()
+        tickers = list(dict.fromkeys(tickers))
+        total = len(tickers)
+        if total == 0:
+            return PortfolioRun(outcomes=[], duration_seconds=0.0, max_workers=self.max_workers)
+
+        workers = max(1, min(self.max_workers, total))
+        timings: Dict[str, Dict[str, float]] = {t: {} for t in tickers}
+        queued = list(tickers)
+        running: Dict[Future, str] = {}
+        started_at: Dict[str, float] = {}
+        outcomes: Dict[str, TickerOutcome] = {}
+
+        def _launch(ticker: str) -> None:
+            fut: Future = Future()
+
+            def _task() -> None:
+                _stage_timings.set(timings[ticker])
+                result, error = None, None
+                try:
+                    result = fn(ticker)
+                except Exception as e:
+                    error = e
+                except BaseException:
+                    # Not a ticker failure (SystemExit, KeyboardInterrupt): return
+                    # the slot and let it propagate; the run reports a timeout
+                    with self._slots:
+                        self._in_use -= 1
+                        self._slots.notify_all()
+                    raise
+                # Slot returned together with the outcome, so a finished run
+                # never leaves its last slot briefly held
+                with self._slots:
+                    self._in_use -= 1
+                    if error is None:
+                        fut.set_result(result)
+                    else:
+                        fut.set_exception(error)
+                    self._slots.notify_all()
+
+            ctx = contextvars.copy_context()
+            started_at[ticker] = time.perf_counter()
+            running[fut] = ticker
+            # A daemon thread per ticker (holding one of the executor's slots):
+            # a hung ticker is reported on timeout and never blocks shutdown.
+            threading.Thread(
+                target=ctx.run, args=(_task,), name=f"portfolio-{ticker}", daemon=True
+            ).start()
+
+        def _finish(outcome: TickerOutcome) -> None:
+            outcomes[outcome.ticker] = outcome
+            icon = "✅" if outcome.status == "success" else ("⏱️ " if outcome.status == "timeout" else "❌")
+            logger.info(
+                f"   [{len(outcomes)}/{total}] {icon} {outcome.ticker} "
+                f"{outcome.status} in {outcome.duration_seconds:.2f}s"
+            )
+            if on_progress is not None:
+                try:
+                    on_progress(outcome, len(outcomes), total)
+                except Exception as e:
+                    logger.warning(f"Portfolio progress callback failed: {e}")
+
+        while queued or running:
+            with self._slots:
+                while queued and len(running) < workers and self._in_use < self.max_workers:
+                    self._in_use += 1
+                    _launch(queued.pop(0))
+
+                done = [fut for fut in running if fut.done()]
+                if not done:
+                    # Woken by any thread of any run returning its slot
+                    timeout = None
+                    if running:
+                        next_deadline = min(started_at[t] for t in running.values()) + self.ticker_timeout
+                        timeout = max(0.0, next_deadline - time.perf_counter())
+                    self._slots.wait(timeout)
+                    done = [fut for fut in running if fut.done()]
+
+            for fut in done:
+                ticker = running.pop(fut)
+                elapsed = round(time.perf_counter() - started_at[ticker], 3)
+                try:
+                    result = fut.result()
+                    _finish(TickerOutcome(
+                        ticker=ticker, status="success", result=result,
+                        duration_seconds=elapsed, stage_timings=dict(timings[ticker]),
+                    ))
+                except Exception as e:
+                    logger.error(f"Portfolio scoring failed for {ticker}: {e}", exc_info=True)
+                    _finish(TickerOutcome(
+                        ticker=ticker, status="failed", error=str(e),
+                        duration_seconds=elapsed, stage_timings=dict(timings[ticker]),
+                    ))
+
+            now = time.perf_counter()
+            for fut, ticker in list(running.items()):
+                if now - started_at[ticker] >= self.ticker_timeout:
+                    running.pop(fut)
+                    _finish(TickerOutcome(
+                        ticker=ticker, status="timeout",
+                        error=f"Timed out after {self.ticker_timeout:.0f}s",
+                        duration_seconds=round(now - started_at[ticker], 3),
+                        stage_timings=dict(timings[ticker]),
+                    ))
+
+        return PortfolioRun(
+            outcomes=[outcomes[t] for t in tickers],
+            duration_seconds=round(time.perf_counter() - start, 2),
+            max_workers=workers,
+        )
+
+    async def arun(
+        self,
+        tickers: Sequence[str],
+        fn: Callable[[str], Any],
+        on_progress: Optional[Callable[[TickerOutcome, int, int], None]] = None,
+    ) -> PortfolioRun:
+        """Async wrapper for routers — the run is supervised from the scoring lane."""
+        return await run_blocking(self.run, tickers, fn, on_progress, lane=SCORING_LANE)
+
+    async def astream(
+        self,
+        tickers: Sequence[str],
+        fn: Callable[[str], Any],
+    ) -> AsyncIterator[TickerOutcome]:
+        """Yield each TickerOutcome as soon as its ticker finishes."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        tickers = list(dict.fromkeys(tickers))
+
+        def _progress(outcome: TickerOutcome, completed: int, total: int) -> None:
+            loop.call_soon_threadsafe(queue.put_nowait, outcome)
+
+        task = asyncio.ensure_future(self.arun(tickers, fn, _progress))
+        for _ in range(len(tickers)):
+            yield await queue.get()
+        await task
+
+
+# Singleton instance
+_executor: Optional[PortfolioExecutor] = None
+
+
+def get_portfolio_executor() -> PortfolioExecutor:
+    global _executor
+    if _executor is None:
+        _executor = PortfolioExecutor(
+            max_workers=settings.PORTFOLIO_MAX_WORKERS,
+            ticker_timeout=settings.PORTFOLIO_TICKER_TIMEOUT,
+        )
+    return _executor
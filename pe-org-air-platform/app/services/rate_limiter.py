@@ -0,0 +1,176 @@
+"""
+Host Rate Limiter — per-host politeness shared by every caller in the process
+app/services/rate_limiter.py
+
+Each external host we scrape or query gets one HostLimiter:
+
+  rate      token bucket, refilled at `rate` requests/second up to `burst`
+            (acquire() blocks until a token is available)
+  slots     cap on concurrent units of work against the host — e.g. at
+            most one company's jobspy searches at a time, however many
+            companies the job worker runs in parallel
+
+  host         rate                          slots
+  sec          SEC_RATE_LIMIT / s            JOB_HOST_CONCURRENCY["sec"]
+  jobspy       1 / JOBSPY_REQUEST_DELAY      JOB_HOST_CONCURRENCY["jobspy"]
+  patentsview  PATENTSVIEW_RATE_LIMIT / s    JOB_HOST_CONCURRENCY["patentsview"]
+
+Limiters are per process; concurrency across companies inside a worker
+therefore never exceeds what one sequential caller was allowed.
+
+Usage:
+    limiter = get_host_limiter("sec")
+    limiter.acquire()                 # before each request
+    await limiter.acquire_async()     # same, from a coroutine (sleeps on the loop)
+    with limiter.slot():              # around a company's whole SEC stage
+        collect(...)
+"""
+import asyncio
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+SEC_HOST = "sec"
+JOBSPY_HOST = "jobspy"
+PATENTSVIEW_HOST = "patentsview"
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens/second, at most `burst` banked."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> float:
+        """Take tokens if available; otherwise return the seconds to wait (0.0 = taken)."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+            return (tokens - self._tokens) / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until the tokens are taken; returns the seconds spent waiting."""
+        waited = 0.0
+        while True:
+            wait = self.try_acquire(tokens)
+            if wait <= 0:
+                return waited
+            self._sleep(wait)
+            waited += wait
+
+
+class HostLimiter:
+    """Request rate + concurrent-work cap for one external host."""
+
+    def __init__(self, host: str, rate: float, slots: int = 1, burst: float = 1.0, **bucket_kwargs):
+        self.host = host
+        self.bucket = TokenBucket(rate, burst, **bucket_kwargs)
+        self.slots = max(1, slots)
+        self._semaphore = threading.BoundedSemaphore(self.slots)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "waited_seconds": 0.0, "slot_waits": 0}
+
+    def acquire(self) -> float:
+        """Wait for a request token; returns the seconds spent waiting."""
+        return self._record(self.bucket.acquire())
+
+    async def acquire_async(self) -> float:
+        """acquire() for coroutines: waits with asyncio.sleep, never blocking the loop."""
+        waited = 0.0
+        while True:
+            wait = self.bucket.try_acquire()
+            if wait <= 0:
+                return self._record(waited)
+            await asyncio.sleep(wait)
+            waited += wait
+
+    def _record(self, waited: float) -> float:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["waited_seconds"] += waited
+        if waited:
+            logger.debug(f"  ⏳ {self.host}: rate limited for {waited:.3f}s")
+        return waited
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the host's concurrent-work slots for the block."""
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                self._stats["slot_waits"] += 1
+            self._semaphore.acquire()
+        try:
+            yield
+        finally:
+            self._semaphore.release()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {"rate": self.bucket.rate, "slots": self.slots, **self._stats,
+                    "waited_seconds": round(self._stats["waited_seconds"], 3)}
+
+
+def _host_config(host: str) -> Dict[str, float]:
+    slots = settings.JOB_HOST_CONCURRENCY.get(host, 1)
+    if host == SEC_HOST:
+        return {"rate": float(settings.SEC_RATE_LIMIT), "slots": slots}
+    if host == JOBSPY_HOST:
+        return {"rate": 1.0 / settings.JOBSPY_REQUEST_DELAY, "slots": slots}
+    if host == PATENTSVIEW_HOST:
+        return {"rate": settings.PATENTSVIEW_RATE_LIMIT, "slots": slots}
+    return {"rate": 1.0, "slots": slots}
+
+
+_limiters: Dict[str, HostLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_host_limiter(host: str) -> HostLimiter:
+    """Process-wide limiter for a host (created from settings on first use)."""
+    limiter = _limiters.get(host)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(host)
+            if limiter is None:
+                limiter = HostLimiter(host, **_host_config(host))
+                _limiters[host] = limiter
+    return limiter
+
+
+def host_limiter_stats() -> Dict[str, Dict[str, float]]:
+    return {host: limiter.stats() for host, limiter in sorted(_limiters.items())}
+
+
+def reset_host_limiters(host: Optional[str] = None) -> None:
+    """Drop limiters (tests / settings changes); they are rebuilt on next use."""
+    with _limiters_lock:
+        if host is None:
+            _limiters.clear()
+        else:
+            _limiters.pop(host, None)
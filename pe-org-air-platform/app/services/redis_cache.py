@@ -1,8 +1,8 @@
 import redis
-from typing import Optional, TypeVar, Type
+from typing import List, Optional, TypeVar, Type
 from pydantic import BaseModel
 from app.config import settings
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -12,9 +12,19 @@ class RedisCache:
         self.client = redis.from_url(
             settings.REDIS_URL,
             decode_responses=True,
-            socket_connect_timeout=5,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
         )
 
+    @cached_property
+    def binary_client(self) -> redis.Redis:
+        """Same server, undecoded bytes (values of the binary cache codecs)."""
+        return redis.from_url(
+            settings.REDIS_URL,
+            decode_responses=False,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
 
     def get(self, key: str, model: Type[T]) -> Optional[T]:
         """Get cached item and deserialize to Pydantic model."""
@@ -35,10 +45,30 @@ class RedisCache:
         """Invalidate single cache entry."""
         self.client.delete(key)
 
-    def delete_pattern(self, pattern: str) -> None:
-        """Invalidate all keys matching pattern."""
-        for key in self.client.scan_iter(match=pattern):
-            self.client.delete(key)
+    def delete_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Invalidate all keys matching pattern; returns the number removed.
+
+        SCAN pages of batch_size keys are removed with one pipelined UNLINK
+        each (memory is reclaimed off the Redis main thread). This walks the
+        whole keyspace — request paths use generation-versioned keys
+        (TieredCache.invalidate_namespace) and run this in the background.
+        """
+        removed = 0
+        batch = []
+        for key in self.client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                removed += self._unlink(batch)
+                batch = []
+        if batch:
+            removed += self._unlink(batch)
+        return removed
+
+    def _unlink(self, keys: List[str]) -> int:
+        pipe = self.client.pipeline(transaction=False)
+        pipe.unlink(*keys)
+        return sum(int(n or 0) for n in pipe.execute())
 # ---- FastAPI dependency singleton ----
 @lru_cache
 def get_redis_cache() -> RedisCache:
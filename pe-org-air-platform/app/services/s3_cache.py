@@ -0,0 +1,214 @@
+"""
+S3 Object Disk Cache — content-addressed local copies of S3 objects
+app/services/s3_cache.py
+
+Keeps the bodies of S3 objects on local disk so repeated scoring runs read
+chunk files, job snapshots and Glassdoor/board JSON from disk instead of
+the network:
+
+    {root}/objects/ab/abcdef...   body, named by sha256(body)
+    {root}/refs/12/1234...        "etag digest" for sha256(bucket/key)
+
+A ref records which ETag a key had when its body was stored. Callers that
+already know the current ETag (from a listing) read the blob with no
+request at all; otherwise S3StorageService sends GetObject with
+If-None-Match and serves the blob when S3 answers 304 Not Modified.
+
+Identical bodies under different keys share one blob. Total blob size is
+capped at S3_CACHE_MAX_BYTES: every hit touches the blob's mtime and the
+least recently used blobs are evicted first. Refs to evicted blobs are
+simply misses. Writes go to a temp file and are renamed into place, so
+several worker processes can share one cache directory.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedObject:
+    """What the cache holds for one S3 key."""
+    etag: str
+    digest: str          # sha256 of the body (blob name)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _fan_out(base: Path, name: str) -> Path:
+    return base / name[:2] / name
+
+
+class S3DiskCache:
+    """Size-capped, content-addressed on-disk cache of S3 object bodies."""
+
+    def __init__(self, root: str, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._objects = self.root / "objects"
+        self._refs = self.root / "refs"
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None      # blob bytes on disk, computed lazily
+        self.hits = self.misses = self.evictions = 0   # served from disk / downloaded / evicted
+
+    # ---- paths -------------------------------------------------------------
+
+    def _ref_path(self, bucket: str, key: str) -> Path:
+        return _fan_out(self._refs, _sha256(f"{bucket}/{key}".encode("utf-8")))
+
+    def _blob_path(self, digest: str) -> Path:
+        return _fan_out(self._objects, digest)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+    # ---- lookups -----------------------------------------------------------
+
+    def lookup(self, bucket: str, key: str) -> Optional[CachedObject]:
+        """The ETag and blob recorded for a key, if its blob is still on disk."""
+        try:
+            etag, digest = self._ref_path(bucket, key).read_text().split()
+        except (OSError, ValueError):
+            return None
+        if not self._blob_path(digest).exists():
+            return None
+        return CachedObject(etag=etag, digest=digest)
+
+    def read(self, entry: CachedObject) -> Optional[bytes]:
+        """The body of a cached object (marking it recently used), or None if evicted."""
+        path = self._blob_path(entry.digest)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        if _sha256(data) != entry.digest:
+            logger.warning(f"⚠️  S3 disk cache: corrupt blob {entry.digest[:12]}, discarding")
+            self._unlink(path)
+            return None
+        self.hits += 1
+        return data
+
+    def get(self, bucket: str, key: str, etag: str) -> Optional[bytes]:
+        """The cached body of a key if it was stored under this ETag."""
+        entry = self.lookup(bucket, key)
+        if entry is None or entry.etag != etag:
+            return None
+        return self.read(entry)
+
+    # ---- writes ------------------------------------------------------------
+
+    def put(self, bucket: str, key: str, etag: str, data: bytes) -> None:
+        """Store a body fetched from S3 and record it as the content of `key` at `etag`."""
+        self.misses += 1
+        if not etag or len(data) > self.max_bytes:
+            return
+        digest = _sha256(data)
+        blob = self._blob_path(digest)
+        try:
+            if blob.exists():
+                os.utime(blob)
+            else:
+                self._write_atomic(blob, data)
+                self._grow(len(data))
+            self._write_atomic(self._ref_path(bucket, key), f"{etag} {digest}".encode("ascii"))
+        except OSError as e:
+            logger.warning(f"⚠️  S3 disk cache write failed for {key}: {e}")
+            return
+        self._evict_if_needed()
+
+    def forget(self, bucket: str, key: str) -> None:
+        """Drop the ref for a key (its blob ages out, or is shared)."""
+        self._unlink(self._ref_path(bucket, key))
+
+    # ---- eviction ----------------------------------------------------------
+
+    def _blobs(self):
+        """(mtime, size, path) of every blob on disk."""
+        if not self._objects.exists():
+            return
+        for shard in os.scandir(self._objects):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith(".tmp-"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:        # evicted by another process meanwhile
+                    continue
+                yield st.st_mtime, st.st_size, entry.path
+
+    def _grow(self, n: int) -> None:
+        with self._lock:
+            if self._size is not None:
+                self._size += n
+
+    @property
+    def size_bytes(self) -> int:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._blobs())
+            return self._size
+
+    def _evict_if_needed(self) -> None:
+        if self.size_bytes <= self.max_bytes:
+            return
+        with self._lock:
+            # Re-scan: other processes may have added or evicted blobs
+            blobs = sorted(self._blobs())      # oldest access first
+            size = sum(s for _, s, _ in blobs)
+            for _, blob_size, path in blobs:
+                if size <= self.max_bytes:
+                    break
+                if self._unlink(Path(path)):
+                    size -= blob_size
+                    self.evictions += 1
+            self._size = size
+
+    @staticmethod
+    def _unlink(path: Path) -> bool:
+        try:
+            path.unlink()
+            return True
+        except OSError:
+            return False
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+
+def build_disk_cache() -> Optional[S3DiskCache]:
+    """The disk cache configured by S3_CACHE_DIR / S3_CACHE_MAX_BYTES (None if disabled)."""
+    if not settings.S3_CACHE_DIR or settings.S3_CACHE_MAX_BYTES <= 0:
+        return None
+    return S3DiskCache(settings.S3_CACHE_DIR, settings.S3_CACHE_MAX_BYTES)
@@ -1,21 +1,51 @@
 import boto3
 import hashlib
+import json
 import logging
-from typing import Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from app.config import settings
+from app.services.s3_cache import S3DiskCache, build_disk_cache
+from app.services.snapshot_manifest import SnapshotManifest, is_snapshot_prefix
 
 logger = logging.getLogger(__name__)
 
+# Error codes botocore reports for a 304 answer to If-None-Match
+_NOT_MODIFIED = {"304", "NotModified"}
+_MISSING = {"404", "NoSuchKey", "NotFound"}
+
+
+@dataclass(frozen=True)
+class S3Object:
+    """One entry of a bucket listing."""
+    key: str
+    etag: str
+    size: int
+    last_modified: Optional[datetime] = None
+
+
+def _error_code(e: ClientError) -> str:
+    return str(e.response.get("Error", {}).get("Code", ""))
+
+
 class S3StorageService:
-    def __init__(self):
-        self.s3_client = boto3.client(
+    def __init__(self, s3_client=None, bucket_name: Optional[str] = None,
+                 disk_cache: Optional[S3DiskCache] = None, max_concurrency: Optional[int] = None):
+        self.max_concurrency = max_concurrency or settings.S3_MAX_CONCURRENCY
+        self.s3_client = s3_client or boto3.client(
             's3',
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID.get_secret_value(),
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY.get_secret_value(),
-            region_name=settings.AWS_REGION
+            region_name=settings.AWS_REGION,
+            config=Config(max_pool_connections=self.max_concurrency),
         )
-        self.bucket_name = settings.S3_BUCKET
+        self.bucket_name = bucket_name or settings.S3_BUCKET
+        self.disk_cache = disk_cache if disk_cache is not None else build_disk_cache()
+        self.manifest = SnapshotManifest(self, ttl=settings.SNAPSHOT_MANIFEST_TTL)
         logger.info(f"S3 Storage initialized with bucket: {self.bucket_name}")
 
     def _generate_s3_key(self, ticker: str, filing_type: str, filing_date: str, filename: str, accession_number: str = "") -> str:
@@ -95,35 +125,177 @@ class S3StorageService:
         except ClientError:
             return False
 
-    def get_file(self, s3_key: str) -> Optional[bytes]:
-        """Download a file from S3"""
+    def get_file(self, s3_key: str, etag: Optional[str] = None, missing_ok: bool = False) -> Optional[bytes]:
+        """
+        Download a file from S3, through the local disk cache.
+
+        With `etag` (e.g. from list_objects) a cached copy at that ETag is
+        returned without any request. Otherwise a cached copy is revalidated
+        with If-None-Match and served if S3 answers 304 Not Modified.
+        """
+        cache = self.disk_cache
+        cached = cache.lookup(self.bucket_name, s3_key) if cache else None
+        if cached is not None and etag is not None and cached.etag == etag.strip('"'):
+            data = cache.read(cached)
+            if data is not None:
+                return data
+
+        request = {"Bucket": self.bucket_name, "Key": s3_key}
+        if cached is not None:
+            request["IfNoneMatch"] = f'"{cached.etag}"'
+        try:
+            response = self.s3_client.get_object(**request)
+        except ClientError as e:
+            code = _error_code(e)
+            if code in _NOT_MODIFIED:
+                data = cache.read(cached)
+                if data is not None:
+                    return data
+                return self._get_uncached(s3_key)
+            if code in _MISSING:
+                if cache:
+                    cache.forget(self.bucket_name, s3_key)
+                if missing_ok:
+                    return None
+            logger.error(f"Failed to get file from S3: {e}")
+            return None
+
+        data = response['Body'].read()
+        if cache:
+            cache.put(self.bucket_name, s3_key, response.get('ETag', '').strip('"'), data)
+        return data
+
+    def _get_uncached(self, s3_key: str) -> Optional[bytes]:
+        """Unconditional GET (the cached blob vanished after a 304)."""
         try:
             response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
-            return response['Body'].read()
         except ClientError as e:
             logger.error(f"Failed to get file from S3: {e}")
             return None
+        data = response['Body'].read()
+        if self.disk_cache:
+            self.disk_cache.put(self.bucket_name, s3_key, response.get('ETag', '').strip('"'), data)
+        return data
+
+    def get_files(
+        self,
+        keys: Iterable[str],
+        etags: Optional[Dict[str, str]] = None,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Optional[bytes]]:
+        """Download many files concurrently (bounded pool); maps each key to its body or None."""
+        keys = list(dict.fromkeys(keys))
+        etags = etags or {}
+        if len(keys) <= 1:
+            return {key: self.get_file(key, etags.get(key)) for key in keys}
+        workers = min(max_workers or self.max_concurrency, len(keys))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-get") as pool:
+            bodies = pool.map(lambda key: self.get_file(key, etags.get(key)), keys)
+            return dict(zip(keys, bodies))
+
+    def download_json(self, s3_key: str) -> Optional[Any]:
+        """Download and parse a JSON file, or None if it is missing or invalid"""
+        data = self.get_file(s3_key)
+        if data is None:
+            return None
+        try:
+            return json.loads(data.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            logger.error(f"Invalid JSON in S3 file {s3_key}: {e}")
+            return None
 
     def delete_file(self, s3_key: str) -> bool:
         """Delete a file from S3"""
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=s3_key)
+            if self.disk_cache:
+                self.disk_cache.forget(self.bucket_name, s3_key)
+            self.manifest.forget_key(s3_key)
             return True
         except ClientError as e:
             logger.error(f"Failed to delete file from S3: {e}")
             return False
 
-    def list_files(self, prefix: str) -> list:
-        """List files in S3 with given prefix"""
+    def list_objects(self, prefix: str) -> List[S3Object]:
+        """Every object under a prefix (all pages of list_objects_v2), in key order"""
+        objects: List[S3Object] = []
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-            return [obj['Key'] for obj in response.get('Contents', [])]
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+                for obj in page.get('Contents', []):
+                    objects.append(S3Object(
+                        key=obj['Key'],
+                        etag=obj.get('ETag', '').strip('"'),
+                        size=obj.get('Size', 0),
+                        last_modified=obj.get('LastModified'),
+                    ))
         except ClientError as e:
             logger.error(f"Failed to list S3 files: {e}")
             return []
+        return objects
+
+    def list_files(self, prefix: str) -> list:
+        """List files in S3 with given prefix"""
+        return [obj.key for obj in self.list_objects(prefix)]
+
+    def list_etags(self, prefix: str) -> Dict[str, str]:
+        """Map each key under a prefix to its ETag (content fingerprint)"""
+        return {obj.key: obj.etag for obj in self.list_objects(prefix)}
+
+    def latest_object(self, prefix: str) -> Optional[S3Object]:
+        """
+        The object with the greatest key under a prefix (keys are timestamped).
+
+        Snapshot prefixes (signals/{type}/{TICKER}/, glassdoor_signals/...)
+        are resolved through their manifest instead of a listing.
+        """
+        if is_snapshot_prefix(prefix):
+            pointer = self.manifest.resolve(prefix)
+            return pointer.to_object() if pointer else None
+        objects = self.list_objects(prefix)
+        return max(objects, key=lambda obj: obj.key) if objects else None
+
+    def get_latest(self, prefix: str) -> Tuple[Optional[str], Optional[bytes]]:
+        """(key, body) of the latest object under a prefix, or (None, None)"""
+        latest = self.latest_object(prefix)
+        if latest is None:
+            return None, None
+        body = self.get_file(latest.key, latest.etag, missing_ok=True)
+        if body is None and is_snapshot_prefix(prefix):
+            # Manifest points at an object deleted behind our back: rebuild from a listing
+            pointer = self.manifest.rebuild(prefix, force=True)
+            if pointer is None:
+                return None, None
+            latest = pointer.to_object()
+            body = self.get_file(latest.key, latest.etag)
+        return latest.key, body
+
+    def iter_newest(self, prefix: str) -> Iterator[S3Object]:
+        """Objects under a prefix newest first; lists the prefix only if the caller reads past the latest"""
+        latest = self.latest_object(prefix)
+        if latest is None:
+            return
+        yield latest
+        for obj in sorted(self.list_objects(prefix), key=lambda o: o.key, reverse=True):
+            if obj.key != latest.key:
+                yield obj
+
+    def get_etag(self, s3_key: str) -> Optional[str]:
+        """Return the ETag of an S3 object, or None if it does not exist"""
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return response.get('ETag', '').strip('"') or None
+        except ClientError:
+            return None
+
+    def get_etags(self, keys: Iterable[str], max_workers: Optional[int] = None) -> Dict[str, Optional[str]]:
+        """ETags of many objects, looked up concurrently"""
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: self.get_etag(key) for key in keys}
+        workers = min(max_workers or self.max_concurrency, len(keys))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="s3-head") as pool:
+            return dict(zip(keys, pool.map(self.get_etag, keys)))
 
     def upload_content(self, content: str, s3_key: str, content_type: str = "application/json") -> str:
         """
@@ -137,18 +309,23 @@ class S3StorageService:
         Returns:
             s3_key on success
         """
+        body = content.encode('utf-8')
         try:
-            self.s3_client.put_object(
+            response = self.s3_client.put_object(
                 Bucket=self.bucket_name,
                 Key=s3_key,
-                Body=content.encode('utf-8'),
+                Body=body,
                 ContentType=content_type
             )
             logger.info(f"  ✅ Uploaded to S3: {s3_key}")
-            return s3_key
         except ClientError as e:
             logger.error(f"  ❌ S3 upload failed: {e}")
             raise
+        try:
+            self.manifest.record(s3_key, body, response.get('ETag', ''))
+        except ClientError as e:
+            logger.warning(f"  ⚠️  Manifest update failed for {s3_key}: {e}")
+        return s3_key
 
     def upload_json(self, data: dict, s3_key: str) -> str:
         """
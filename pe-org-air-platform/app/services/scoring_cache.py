@@ -0,0 +1,270 @@
+"""
+Scoring Stage Cache — CS3 Memoized Stage Graph
+app/services/scoring_cache.py
+
+Content-addressed cache for the per-ticker CS3 scoring DAG:
+
+  SEC chunks (keys + ETags) ──► sec_rubric ──┐
+  CS2 signals / board / culture evidence ────┴──► dimensions ──► tc_vr ──► PF ──► H^R ──► Org-AI-R
+  job + Glassdoor snapshots (keys + ETags) ──────────────────────┘
+
+PF, H^R and Org-AI-R are closed-form functions of V^R and static sector
+tables, so they are not stored — they reuse the memoized tc_vr stage.
+
+Each stage result is stored under sha256(stage, inputs), where the inputs
+include upstream stage digests, S3 object ETags and the calculator
+constants.  Any change to evidence, snapshots or constants yields a new
+key, so stale entries are never served — they simply age out.
+
+Two tiers:
+  L1 — in-process LRU (bounded by SCORING_STAGE_CACHE_SIZE)
+  L2 — Redis (shared by all workers, TTL = CACHE_TTL_SCORES)
+
+Explicit invalidation (invalidate_scoring_stages) bumps a per-ticker
+generation counter that is folded into every key, so a signal or document
+write drops all cached stages for that ticker in O(1).
+"""
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import fields, is_dataclass
+from decimal import Decimal
+from enum import Enum
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
+
+import redis
+
+from app.config import settings
+from app.services.cache import get_cache
+
+logger = logging.getLogger(__name__)
+
+# Bump when stage logic changes in a way the inputs do not capture
+STAGE_SCHEMA_VERSION = 1
+
+STAGE_KEY_PREFIX = "scoring:stage"
+
+
+def canonicalize(obj: Any) -> Any:
+    """
+    Convert an object into a deterministic JSON-friendly structure.
+
+    Sets are sorted and dict keys stringified so the result does not depend
+    on PYTHONHASHSEED — digests must agree across worker processes.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, Enum):
+        return canonicalize(obj.value)
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, dict):
+        return {str(canonicalize(k)): canonicalize(v) for k, v in obj.items()}
+    if isinstance(obj, (set, frozenset)):
+        return sorted((canonicalize(v) for v in obj), key=lambda v: json.dumps(v, sort_keys=True))
+    if isinstance(obj, (list, tuple)):
+        return [canonicalize(v) for v in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: canonicalize(getattr(obj, f.name)) for f in fields(obj)}
+    return repr(obj)
+
+
+def stage_digest(stage: str, inputs: Any) -> str:
+    """sha256 over the canonical JSON of a stage name and its inputs."""
+    payload = {"v": STAGE_SCHEMA_VERSION, "stage": stage, "inputs": canonicalize(inputs)}
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def constants_fingerprint(*objects: Any) -> str:
+    """Short digest of calculator constants (weight tables, thresholds, rubrics)."""
+    blob = json.dumps([canonicalize(o) for o in objects], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+def module_constants(module: ModuleType) -> Dict[str, Any]:
+    """
+    Collect the ALL_CAPS constants of a calculator module and its classes.
+
+    Lets a stage key pick up any tweak to thresholds or keyword tables
+    without listing every private name by hand.
+    """
+    def _is_constant(name: str, value: Any) -> bool:
+        return name.lstrip("_").isupper() and not callable(value) and not isinstance(value, ModuleType)
+
+    found: Dict[str, Any] = {}
+    for name, value in vars(module).items():
+        if _is_constant(name, value):
+            found[name] = value
+        elif isinstance(value, type) and value.__module__ == module.__name__:
+            for attr, attr_value in vars(value).items():
+                if _is_constant(attr, attr_value):
+                    found[f"{name}.{attr}"] = attr_value
+    return found
+
+
+class ScoringStageCache:
+    """Two-tier (LRU + Redis) store for content-addressed stage results."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: int = 3600,
+        redis_getter: Callable[[], Any] = get_cache,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._redis_getter = redis_getter
+        self._lru: "OrderedDict[str, str]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"l1_hits": 0, "l2_hits": 0, "misses": 0, "writes": 0, "invalidations": 0}
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def _client(self):
+        cache = self._redis_getter()
+        return cache.client if cache is not None else None
+
+    def _generation(self, ticker: str, client) -> int:
+        if client is not None:
+            try:
+                raw = client.get(f"{STAGE_KEY_PREFIX}:gen:{ticker}")
+                gen = int(raw) if raw is not None else 0
+                with self._lock:
+                    self._generations[ticker] = gen
+                return gen
+            except (redis.RedisError, ValueError) as e:
+                logger.warning(f"Stage cache generation lookup failed for {ticker}: {e}")
+        with self._lock:
+            return self._generations.get(ticker, 0)
+
+    def _key(self, stage: str, ticker: str, digest: str, client) -> str:
+        gen = self._generation(ticker, client)
+        return f"{STAGE_KEY_PREFIX}:{ticker}:g{gen}:{stage}:{digest}"
+
+    # ------------------------------------------------------------------
+    # Get / put
+    # ------------------------------------------------------------------
+
+    def get(self, stage: str, ticker: str, digest: str) -> Optional[Dict[str, Any]]:
+        """Return the cached stage result, checking L1 then L2."""
+        ticker = ticker.upper()
+        client = self._client()
+        key = self._key(stage, ticker, digest, client)
+
+        with self._lock:
+            blob = self._lru.get(key)
+            if blob is not None:
+                self._lru.move_to_end(key)
+                self._stats["l1_hits"] += 1
+        if blob is not None:
+            return json.loads(blob)
+
+        if client is not None:
+            try:
+                raw = client.get(key)
+                if raw is not None:
+                    blob = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+                    value = json.loads(blob)
+                    self._remember(key, blob)
+                    with self._lock:
+                        self._stats["l2_hits"] += 1
+                    return value
+            except (redis.RedisError, ValueError) as e:
+                logger.warning(f"Stage cache read failed for {key}: {e}")
+
+        with self._lock:
+            self._stats["misses"] += 1
+        return None
+
+    def put(self, stage: str, ticker: str, digest: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serialisable stage result in both tiers."""
+        ticker = ticker.upper()
+        client = self._client()
+        key = self._key(stage, ticker, digest, client)
+        blob = json.dumps(value, default=str)
+        self._remember(key, blob)
+        with self._lock:
+            self._stats["writes"] += 1
+
+        if client is not None:
+            try:
+                client.setex(key, self.ttl_seconds, blob)
+            except redis.RedisError as e:
+                logger.warning(f"Stage cache write failed for {key}: {e}")
+
+    def _remember(self, key: str, blob: str) -> None:
+        # L1 keeps the serialised form so callers never share mutable results
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[key] = blob
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate_ticker(self, ticker: str) -> None:
+        """Drop every cached stage for a ticker by bumping its generation."""
+        ticker = ticker.upper()
+        client = self._client()
+        bumped = False
+        if client is not None:
+            try:
+                gen = int(client.incr(f"{STAGE_KEY_PREFIX}:gen:{ticker}"))
+                with self._lock:
+                    self._generations[ticker] = gen
+                bumped = True
+            except redis.RedisError as e:
+                logger.warning(f"Stage cache invalidation failed for {ticker}: {e}")
+
+        prefix = f"{STAGE_KEY_PREFIX}:{ticker}:"
+        with self._lock:
+            if not bumped:
+                self._generations[ticker] = self._generations.get(ticker, 0) + 1
+            for key in [k for k in self._lru if k.startswith(prefix)]:
+                del self._lru[key]
+            self._stats["invalidations"] += 1
+        logger.info(f"♻️  Scoring stage cache invalidated for {ticker}")
+
+    def clear(self) -> None:
+        """Drop the in-process tier (Redis entries age out via TTL)."""
+        with self._lock:
+            self._lru.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "l1_size": len(self._lru), "l1_max_entries": self.max_entries}
+
+
+# Singleton instance
+_stage_cache: Optional[ScoringStageCache] = None
+
+
+def get_scoring_stage_cache() -> ScoringStageCache:
+    global _stage_cache
+    if _stage_cache is None:
+        _stage_cache = ScoringStageCache(
+            max_entries=settings.SCORING_STAGE_CACHE_SIZE,
+            ttl_seconds=settings.CACHE_TTL_SCORES,
+        )
+    return _stage_cache
+
+
+def invalidate_scoring_stages(ticker: Optional[str]) -> None:
+    """Invalidate memoized scoring stages after a signal or document write."""
+    if not ticker:
+        return
+    try:
+        get_scoring_stage_cache().invalidate_ticker(ticker)
+    except Exception as e:
+        logger.warning(f"Scoring stage invalidation failed for {ticker}: {e}")
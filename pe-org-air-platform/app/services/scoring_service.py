@@ -16,10 +16,14 @@ Changes in this version:
 
 import json
 import logging
+import threading
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set
 from datetime import datetime, timezone
 
+from app.pipelines.chunk_store import ChunkFile
+from app.scoring import evidence_mapper, rubric_scorer
 from app.scoring.evidence_mapper import (
     EvidenceMapper, EvidenceScore, SignalSource, Dimension,
 )
@@ -27,7 +31,15 @@ from app.scoring.rubric_scorer import RubricScorer
 from app.repositories.scoring_repository import get_scoring_repository
 from app.repositories.signal_repository import get_signal_repository
 from app.repositories.company_repository import CompanyRepository
-from app.services.snowflake import get_snowflake_connection
+from app.services.snowflake import get_pooled_connection
+from app.services.portfolio_executor import get_portfolio_executor, stage_timer
+from app.services.scoring_cache import (
+    STAGE_SCHEMA_VERSION, get_scoring_stage_cache, stage_digest, constants_fingerprint, module_constants,
+)
+from app.services.evidence_fingerprints import (
+    CONSTANTS_SOURCE, CS2_SOURCES, SEC_SOURCES, StalenessReport, StoredSource,
+    diff_fingerprints, fingerprint, full_report,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +47,83 @@ logger = logging.getLogger(__name__)
 _MIN_SECTION_WORDS = 3000
 
 
+def _evidence_to_dict(ev: EvidenceScore) -> Dict[str, Any]:
+    return {
+        "source": ev.source.value,
+        "raw_score": str(ev.raw_score),
+        "confidence": str(ev.confidence),
+        "evidence_count": ev.evidence_count,
+        "metadata": ev.metadata,
+    }
+
+
+def _evidence_from_dict(data: Dict[str, Any]) -> EvidenceScore:
+    return EvidenceScore(
+        source=SignalSource(data["source"]),
+        raw_score=Decimal(data["raw_score"]),
+        confidence=Decimal(data["confidence"]),
+        evidence_count=data["evidence_count"],
+        metadata=data.get("metadata", {}),
+    )
+
+
+def _cacheable(result: Dict[str, Any]) -> Dict[str, Any]:
+    """A scoring result without its per-run fields (timings, fingerprint rows to write)."""
+    return {k: v for k, v in result.items() if k not in ("stage_timings", "fingerprint_rows")}
+
+
+def _sec_details(sec_evidence: List[EvidenceScore]) -> Dict[str, Any]:
+    """Per-section rubric details, from the SEC evidence (fresh or stored)."""
+    details = {}
+    for source in SEC_SOURCES:
+        ev = next((e for e in sec_evidence if e.source == source), None)
+        if ev is None:
+            details[source.value] = {"found": False, "word_count": 0}
+            continue
+        details[source.value] = {
+            "found": True,
+            "word_count": ev.metadata.get("word_count", 0),
+            "rubric_score": float(ev.raw_score),
+            "rubric_level": ev.metadata.get("rubric_level"),
+            "rubric_confidence": float(ev.confidence),
+            "matched_keywords": ev.metadata.get("matched_keywords", []),
+        }
+    return details
+
+
+def _fingerprint_rows(
+    ticker: str,
+    staleness: StalenessReport,
+    fingerprints: Dict[str, str],
+    evidence_by_source: Dict[SignalSource, Optional[EvidenceScore]],
+    failed: Set[SignalSource],
+) -> List[Dict[str, Any]]:
+    """
+    evidence_fingerprints rows for the sources this run re-read.
+
+    Sources whose read failed get no row, so the next run reads them again
+    instead of trusting the missing evidence.
+    """
+    rows = [
+        {
+            "ticker": ticker,
+            "source": source.value,
+            "fingerprint": fingerprints[source.value],
+            "evidence": _evidence_to_dict(evidence_by_source[source]) if evidence_by_source.get(source) else None,
+        }
+        for source in staleness.changed_sources
+        if source not in failed
+    ]
+    if staleness.full:
+        rows.append({"ticker": ticker, "source": CONSTANTS_SOURCE, "fingerprint": fingerprints[CONSTANTS_SOURCE]})
+    return rows
+
+
+@lru_cache(maxsize=1)
+def _mapper_constants() -> str:
+    return constants_fingerprint(module_constants(evidence_mapper))
+
+
 class ScoringService:
     """Orchestrates the CS3 scoring pipeline."""
 
@@ -56,13 +145,40 @@ class ScoringService:
         self.scoring_repo = get_scoring_repository()
         self.signal_repo = get_signal_repository()
         self.company_repo = CompanyRepository()
-        self.conn = get_snowflake_connection()
-        self._s3_chunk_cache: Dict[str, List[Dict]] = {}
+        self.conn = get_pooled_connection()
+        self._local = threading.local()
+
+    @property
+    def _s3_chunk_cache(self) -> Dict[str, Any]:
+        """Per-thread chunk file cache — portfolio runs score tickers concurrently."""
+        cache = getattr(self._local, "chunk_cache", None)
+        if cache is None:
+            cache = self._local.chunk_cache = {}
+        return cache
+
+    @property
+    def _fetch_errors(self) -> Set[SignalSource]:
+        """Sources whose read raised during this thread's current run."""
+        errors = getattr(self._local, "fetch_errors", None)
+        if errors is None:
+            errors = self._local.fetch_errors = set()
+        return errors
+
+    def score_company(self, ticker: str, persist: bool = True, force: bool = False) -> Dict[str, Any]:
+        """
+        Full scoring pipeline for a company.
 
-    def score_company(self, ticker: str) -> Dict[str, Any]:
-        """Full scoring pipeline for a company."""
+        Incremental: sources whose fingerprint matches the stored result are
+        rebuilt from their stored evidence instead of re-read, and only the
+        dimensions fed by changed sources are written. force=True re-reads
+        and rewrites everything.
+
+        With persist=False the rows are returned unsaved (and not cached);
+        score_all_companies writes the whole portfolio in one transaction.
+        """
         ticker = ticker.upper()
         self._s3_chunk_cache.clear()
+        self._fetch_errors.clear()
 
         logger.info(f"{'='*60}")
         logger.info(f"🎯 CS3 SCORING PIPELINE: {ticker}")
@@ -73,59 +189,85 @@ class ScoringService:
             raise ValueError(f"Company not found for ticker: {ticker}")
         company_id = str(company["id"])
 
-        # Step 1: CS2 signals
-        logger.info(f"📊 Step 1: Fetching CS2 signal scores...")
-        cs2_evidence = self._fetch_cs2_signals(company_id, ticker)
-        logger.info(f"   Found {len(cs2_evidence)} CS2 signal scores")
+        # Step 0: Which sources changed since the stored result
+        with stage_timer("fingerprints"):
+            sec_inputs = self._sec_stage_inputs(ticker)
+            fingerprints = self._source_fingerprints(ticker, company_id, sec_inputs)
+            stored = {} if force else self._stored_fingerprints(ticker)
+        staleness = full_report(ticker, "forced") if force else diff_fingerprints(ticker, stored, fingerprints)
+        changed = set(staleness.changed_sources)
+        logger.info(
+            f"🔎 Step 0: {staleness.reason} — re-reading {len(changed)} source(s), "
+            f"{len(staleness.stale_dimensions)} stale dimension(s)"
+        )
+
+        evidence_by_source: Dict[SignalSource, Optional[EvidenceScore]] = {
+            source: _evidence_from_dict(stored[source.value].evidence)
+            if stored[source.value].evidence else None
+            for source in SignalSource if source not in changed
+        }
 
-        # Step 2: SEC rubric scores
-        logger.info(f"📄 Step 2: Fetching SEC sections & rubric scoring...")
-        sec_evidence, sec_details = self._fetch_and_score_sec_sections(ticker)
-        logger.info(f"   Found {len(sec_evidence)} SEC section scores")
+        # Step 1: CS2 signals
+        if changed.intersection(CS2_SOURCES):
+            logger.info(f"📊 Step 1: Fetching CS2 signal scores...")
+            with stage_timer("cs2_signals"):
+                fresh = {ev.source: ev for ev in self._fetch_cs2_signals(company_id, ticker)}
+            evidence_by_source.update({s: fresh.get(s) for s in CS2_SOURCES if s in changed})
+
+        # Step 2: SEC rubric scores (memoized on chunk keys + ETags)
+        if changed.intersection(SEC_SOURCES):
+            logger.info(f"📄 Step 2: Fetching SEC sections & rubric scoring...")
+            with stage_timer("sec_rubric"):
+                fresh = {ev.source: ev for ev in self._score_sec_sections_cached(ticker, sec_inputs)[0]}
+            evidence_by_source.update({s: fresh.get(s) for s in SEC_SOURCES if s in changed})
 
         # Step 2.5a: Board governance
-        logger.info(f"🏛️  Step 2.5a: Fetching board governance from S3...")
-        board_evidence = self._fetch_board_governance(ticker)
-        if board_evidence:
-            logger.info(f"   ✅ board_composition: {board_evidence.raw_score}")
-        else:
-            logger.info(f"   ⚠️  board_composition: not found in S3")
+        if SignalSource.BOARD_COMPOSITION in changed:
+            logger.info(f"🏛️  Step 2.5a: Fetching board governance from S3...")
+            with stage_timer("board_culture_s3"):
+                evidence_by_source[SignalSource.BOARD_COMPOSITION] = self._fetch_board_governance(ticker)
 
         # Step 2.5b: Culture signal
-        logger.info(f"💬 Step 2.5b: Fetching culture signal from S3...")
-        culture_evidence = self._fetch_culture_signal(ticker)
-        if culture_evidence:
-            logger.info(f"   ✅ glassdoor_reviews: {culture_evidence.raw_score}")
-        else:
-            logger.info(f"   ⚠️  glassdoor_reviews: not found in S3")
-
-        # Step 3: Combine all evidence
-        all_evidence = cs2_evidence + sec_evidence
-        if board_evidence:
-            all_evidence.append(board_evidence)
-        if culture_evidence:
-            all_evidence.append(culture_evidence)
+        if SignalSource.GLASSDOOR_REVIEWS in changed:
+            logger.info(f"💬 Step 2.5b: Fetching culture signal from S3...")
+            with stage_timer("board_culture_s3"):
+                evidence_by_source[SignalSource.GLASSDOOR_REVIEWS] = self._fetch_culture_signal(ticker)
+
+        # Step 3: Combine all evidence (CS2, SEC, board, culture order)
+        all_evidence = [evidence_by_source[s] for s in SignalSource if evidence_by_source.get(s)]
+        cs2_evidence = [ev for ev in all_evidence if ev.source in CS2_SOURCES]
+        sec_evidence = [ev for ev in all_evidence if ev.source in SEC_SOURCES]
+        board_evidence = evidence_by_source.get(SignalSource.BOARD_COMPOSITION)
+        culture_evidence = evidence_by_source.get(SignalSource.GLASSDOOR_REVIEWS)
         logger.info(f"📋 Step 3: Total evidence sources = {len(all_evidence)}")
+        failed = set(self._fetch_errors)
+        if failed:
+            logger.warning(
+                f"⚠️  Read failed for {', '.join(sorted(s.value for s in failed))} — "
+                f"scoring without them; they are re-read next run"
+            )
+
+        # Same evidence + same mapping table → same dimensions (already persisted)
+        stage_cache = get_scoring_stage_cache()
+        dims_digest = stage_digest("dimensions", {
+            "evidence": [_evidence_to_dict(ev) for ev in all_evidence],
+            "constants": _mapper_constants(),
+        })
+        cached = stage_cache.get("dimensions", ticker, dims_digest) if staleness.up_to_date else None
+        if cached is not None:
+            logger.info(f"♻️  Evidence unchanged for {ticker} — reusing dimensions stage {dims_digest[:12]}")
+            cached["staleness"] = staleness.to_dict()
+            return cached
 
         # Step 4: Map to dimensions
         logger.info(f"🔄 Step 4: Mapping evidence to 7 dimensions...")
-        dim_scores = self.mapper.map_evidence_to_dimensions(all_evidence)
+        with stage_timer("evidence_mapping"):
+            dim_scores = self.mapper.map_evidence_to_dimensions(all_evidence)
 
-        # Step 5: Build outputs
-        mapping_matrix = self.mapper.build_mapping_matrix(all_evidence, ticker)
-        dimension_summary = self.mapper.build_dimension_summary(all_evidence, ticker)
-        coverage = self.mapper.get_coverage_report(all_evidence)
-
-        # Step 6: Persist
-        logger.info(f"💾 Step 5: Persisting to Snowflake...")
-        persisted = False
-        try:
-            self.scoring_repo.upsert_mapping_matrix(mapping_matrix)
-            self.scoring_repo.upsert_dimension_scores(dimension_summary)
-            persisted = True
-            logger.info(f"   ✅ Persisted {len(mapping_matrix)} mapping rows + {len(dimension_summary)} dimension scores")
-        except Exception as e:
-            logger.error(f"   ❌ Persistence failed: {e}")
+            # Step 5: Build outputs
+            mapping_matrix = self.mapper.build_mapping_matrix(all_evidence, ticker)
+            dimension_summary = self.mapper.build_dimension_summary(all_evidence, ticker, dim_scores)
+            coverage = self.mapper.get_coverage_report(all_evidence, dim_scores)
 
         result = {
             "ticker": ticker,
@@ -139,12 +281,26 @@ class ScoringService:
                 "sec_sections": len(sec_evidence),
                 "board_composition": board_evidence is not None,
                 "glassdoor_reviews": culture_evidence is not None,
-                "sec_details": sec_details,
+                "sec_details": _sec_details(sec_evidence),
                 "total": len(all_evidence),
             },
-            "persisted": persisted,
+            # Nothing changed → the stored rows already are this result
+            "persisted": staleness.up_to_date,
+            "stage_digest": dims_digest,
+            "staleness": staleness.to_dict(),
+            "fetch_errors": sorted(s.value for s in failed),
+            "fingerprint_rows": _fingerprint_rows(ticker, staleness, fingerprints, evidence_by_source, failed),
         }
 
+        # Step 6: Persist changed mapping rows + stale dimensions in one transaction
+        if persist and not staleness.up_to_date:
+            logger.info(f"💾 Step 5: Persisting to Snowflake...")
+            with stage_timer("persist"):
+                self._persist_results([result])
+
+        if result["persisted"]:
+            stage_cache.put("dimensions", ticker, dims_digest, _cacheable(result))
+
         logger.info(f"\n{'─'*60}")
         logger.info(f"📊 DIMENSION SCORES FOR {ticker}:")
         logger.info(f"{'─'*60}")
@@ -159,21 +315,119 @@ class ScoringService:
         return result
 
     def score_all_companies(self) -> List[Dict[str, Any]]:
-        """Score all companies that have CS2 signal data."""
+        """Score all companies that have CS2 signal data (tickers run concurrently)."""
         summaries = self.signal_repo.get_all_summaries()
+        tickers = [s["ticker"] for s in summaries if s.get("ticker")]
+
+        run = get_portfolio_executor().run(tickers, lambda t: self.score_company(t, persist=False))
         results = []
-        for summary in summaries:
-            ticker = summary.get("ticker")
-            if not ticker:
-                continue
-            try:
-                result = self.score_company(ticker)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to score {ticker}: {e}")
-                results.append({"ticker": ticker, "error": str(e), "persisted": False})
+        for outcome in run.outcomes:
+            if outcome.status == "success":
+                results.append({**outcome.result, "stage_timings": outcome.stage_timings})
+            else:
+                logger.error(f"Failed to score {outcome.ticker}: {outcome.error}")
+                results.append({"ticker": outcome.ticker, "error": outcome.error, "persisted": False})
+        self._persist_portfolio([r for r in results if "error" not in r and not r.get("persisted")])
+        logger.info(f"✅ Scored {len(tickers)} companies in {run.duration_seconds:.2f}s")
         return results
 
+    def _persist_portfolio(self, results: List[Dict[str, Any]]) -> None:
+        """Write every ticker's changed mapping + dimension rows in one transaction, then cache them."""
+        if not results or not self._persist_results(results):
+            return
+        stage_cache = get_scoring_stage_cache()
+        for r in results:
+            stage_cache.put("dimensions", r["ticker"], r["stage_digest"], _cacheable(r))
+
+    def _persist_results(self, results: List[Dict[str, Any]]) -> bool:
+        """
+        Upsert the rows the results' changed sources and stale dimensions own,
+        then record the fingerprints they were computed from.
+
+        Fingerprints are written after the scores (separately): if that write
+        fails the next run just recomputes, never the other way round.
+        """
+        mapping_rows, dimension_rows, fingerprint_rows = [], [], []
+        for r in results:
+            staleness = r["staleness"]
+            changed, stale = set(staleness["changed_sources"]), set(staleness["stale_dimensions"])
+            mapping_rows += [row for row in r["mapping_matrix"] if row["source"] in changed]
+            dimension_rows += [row for row in r["dimension_scores"] if row["dimension"] in stale]
+            fingerprint_rows += r["fingerprint_rows"]
+        try:
+            write = self.scoring_repo.upsert_scoring_outputs(mapping_rows, dimension_rows)
+        except Exception as e:
+            logger.error(f"❌ Scoring persistence failed: {e}")
+            return False
+        logger.info(
+            f"💾 Persisted {len(results)} company(ies): {write.total_rows} rows "
+            f"in {write.statements} statements ({write.seconds:.2f}s)"
+        )
+        for r in results:
+            r["persisted"] = True
+        try:
+            self.scoring_repo.upsert_evidence_fingerprints(fingerprint_rows)
+        except Exception as e:
+            logger.warning(f"⚠️  Fingerprint write failed (next run recomputes): {e}")
+        return True
+
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+
+    def check_staleness(self, ticker: str) -> StalenessReport:
+        """Dry run: which sources changed and which dimensions are stale — reads no evidence."""
+        ticker = ticker.upper()
+        company = self.company_repo.get_by_ticker(ticker)
+        if not company:
+            raise ValueError(f"Company not found for ticker: {ticker}")
+        fingerprints = self._source_fingerprints(ticker, str(company["id"]), self._sec_stage_inputs(ticker))
+        return diff_fingerprints(ticker, self._stored_fingerprints(ticker), fingerprints)
+
+    def check_all_staleness(self) -> List[Dict[str, Any]]:
+        """Dry run over every company with CS2 data (tickers checked concurrently)."""
+        tickers = [s["ticker"] for s in self.signal_repo.get_all_summaries() if s.get("ticker")]
+        run = get_portfolio_executor().run(tickers, lambda t: self.check_staleness(t).to_dict())
+        return run.results(lambda outcome: {"ticker": outcome.ticker, "error": outcome.error})
+
+    def _stored_fingerprints(self, ticker: str) -> Dict[str, StoredSource]:
+        try:
+            rows = self.scoring_repo.get_evidence_fingerprints(ticker)
+        except Exception as e:
+            logger.warning(f"   ⚠️  Stored fingerprints unavailable for {ticker} (full run): {e}")
+            return {}
+        return {source: StoredSource(row["fingerprint"], row["evidence"]) for source, row in rows.items()}
+
+    def _source_fingerprints(self, ticker: str, company_id: str, sec_inputs: Dict[str, Any]) -> Dict[str, str]:
+        """Current fingerprint of every evidence source (see app.services.evidence_fingerprints)."""
+        from app.services.s3_storage import get_s3_service
+        s3 = get_s3_service()
+
+        summary = self.signal_repo.get_summary_by_ticker(ticker) or {}
+        versions = self.signal_repo.get_category_versions(company_id)
+        fingerprints = {
+            source.value: fingerprint({
+                "score": summary.get(f"{source.value}_score"),
+                "signals": versions.get(source.value),
+            })
+            for source in CS2_SOURCES
+        }
+
+        sec = fingerprint(sec_inputs)
+        fingerprints.update({source.value: sec for source in SEC_SOURCES})
+
+        board = s3.manifest.resolve(f"signals/board_composition/{ticker}/")
+        fingerprints[SignalSource.BOARD_COMPOSITION.value] = fingerprint(board.sha256 if board else None)
+
+        culture = s3.latest_object(f"glassdoor_signals/output/{ticker}/")
+        fingerprints[SignalSource.GLASSDOOR_REVIEWS.value] = fingerprint(
+            [culture.key, culture.etag] if culture
+            else s3.get_etag(f"glassdoor_signals/output/{ticker}_culture.json")
+        )
+
+        fingerprints[CONSTANTS_SOURCE] = fingerprint([_mapper_constants(), STAGE_SCHEMA_VERSION])
+        return fingerprints
+
     # ------------------------------------------------------------------
     # CS2 signals
     # ------------------------------------------------------------------
@@ -234,12 +488,7 @@ class ScoringService:
             s3 = get_s3_service()
 
             prefix = f"signals/board_composition/{ticker.upper()}/"
-            keys = s3.list_files(prefix)
-            if not keys:
-                return None
-
-            latest_key = sorted(keys)[-1]
-            raw = s3.get_file(latest_key)
+            latest_key, raw = s3.get_latest(prefix)
             if raw is None:
                 return None
 
@@ -277,6 +526,7 @@ class ScoringService:
             )
         except Exception as e:
             logger.warning(f"   Board governance load failed for {ticker}: {e}")
+            self._fetch_errors.add(SignalSource.BOARD_COMPOSITION)
             return None
 
     # ------------------------------------------------------------------
@@ -294,13 +544,10 @@ class ScoringService:
 
             # Attempt 1: timestamped subfolder
             prefix = f"glassdoor_signals/output/{ticker_upper}/"
-            keys = s3.list_files(prefix)
-            if keys:
-                latest_key = sorted(keys)[-1]
-                raw = s3.get_file(latest_key)
-                if raw is not None:
-                    data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
-                    source_key = latest_key
+            latest_key, raw = s3.get_latest(prefix)
+            if raw is not None:
+                data = json.loads(raw if isinstance(raw, str) else raw.decode("utf-8"))
+                source_key = latest_key
 
             # Attempt 2: flat file
             if data is None:
@@ -348,12 +595,63 @@ class ScoringService:
             )
         except Exception as e:
             logger.warning(f"   Culture signal load failed for {ticker}: {e}")
+            self._fetch_errors.add(SignalSource.GLASSDOOR_REVIEWS)
             return None
 
     # ------------------------------------------------------------------
     # SEC sections + rubric scoring
     # ------------------------------------------------------------------
 
+    def _sec_stage_inputs(self, ticker: str) -> Dict[str, Any]:
+        """Fingerprint of the 10-K chunk files the rubric stage would read."""
+        sql = """
+        SELECT DISTINCT dc.s3_key, LOWER(dc.section)
+        FROM document_chunks dc
+        JOIN documents d ON dc.document_id = d.id
+        WHERE d.ticker = %s
+        AND d.filing_type = '10-K'
+        AND d.status IN ('chunked', 'indexed', 'parsed')
+        AND dc.s3_key IS NOT NULL
+        """
+        cur = self.conn.cursor()
+        try:
+            cur.execute(sql, [ticker.upper()])
+            rows = [(row[0], row[1] or "") for row in cur.fetchall() if row[0]]
+        finally:
+            cur.close()
+
+        from app.services.s3_storage import get_s3_service
+        s3 = get_s3_service()
+        s3_keys = sorted({key for key, _ in rows})
+
+        return {
+            "chunks": sorted(rows),
+            "etags": s3.get_etags(s3_keys),
+            "constants": _sec_constants(),
+        }
+
+    def _score_sec_sections_cached(
+        self, ticker: str, inputs: Optional[Dict[str, Any]] = None
+    ) -> tuple[List[EvidenceScore], Dict[str, Any]]:
+        """Rubric-score SEC sections, reusing the result while chunk files are unchanged."""
+        stage_cache = get_scoring_stage_cache()
+        digest = stage_digest("sec_rubric", inputs if inputs is not None else self._sec_stage_inputs(ticker))
+
+        cached = stage_cache.get("sec_rubric", ticker, digest)
+        if cached is not None:
+            logger.info(f"   ♻️  SEC chunks unchanged — reusing rubric stage {digest[:12]}")
+            evidence = [_evidence_from_dict(ev) for ev in cached["evidence"]]
+            return evidence, cached["details"]
+
+        evidence, details = self._fetch_and_score_sec_sections(ticker)
+        if self._fetch_errors.intersection(SEC_SOURCES):
+            return evidence, details        # a failed chunk download is not this digest's result
+        stage_cache.put("sec_rubric", ticker, digest, {
+            "evidence": [_evidence_to_dict(ev) for ev in evidence],
+            "details": details,
+        })
+        return evidence, details
+
     def _fetch_and_score_sec_sections(
         self, ticker: str
     ) -> tuple[List[EvidenceScore], Dict[str, Any]]:
@@ -457,19 +755,12 @@ class ScoringService:
 
         logger.info(f"   📦 Found {len(s3_keys)} S3 file(s) with target sections")
 
-        section_names_lower = {s.lower() for s in section_names}
         text_parts = []
+        self._prefetch_chunks(s3_keys)
 
         for s3_key in s3_keys:
-            chunks = self._load_chunks_from_s3(s3_key)
-            if not chunks:
-                continue
-            for chunk in chunks:
-                chunk_section = (chunk.get("section") or "").lower()
-                if chunk_section in section_names_lower:
-                    content = chunk.get("content", "")
-                    if content and content.strip():
-                        text_parts.append(content)
+            chunk_file = self._load_chunks_from_s3(s3_key)
+            text_parts.extend(c for c in chunk_file.contents(section_names) if c.strip())
 
         if text_parts:
             combined = "\n\n".join(text_parts)
@@ -486,9 +777,9 @@ class ScoringService:
         """
         cache_key = f"__all_chunks_{ticker}"
         if cache_key in self._s3_chunk_cache:
-            chunks = self._s3_chunk_cache[cache_key]
-            if chunks:
-                return "\n\n".join(c.get("content", "") for c in chunks if c.get("content"))
+            contents = self._s3_chunk_cache[cache_key]
+            if contents:
+                return "\n\n".join(contents)
             return None
 
         sql = """
@@ -511,62 +802,78 @@ class ScoringService:
             self._s3_chunk_cache[cache_key] = []
             return None
 
-        all_chunks = []
+        contents = []
+        self._prefetch_chunks(s3_keys)
         for s3_key in s3_keys:
-            chunks = self._load_chunks_from_s3(s3_key)
-            all_chunks.extend(chunks)
+            contents.extend(self._load_chunks_from_s3(s3_key).contents())
 
-        self._s3_chunk_cache[cache_key] = all_chunks
+        self._s3_chunk_cache[cache_key] = contents
 
-        if all_chunks:
-            text = "\n\n".join(c.get("content", "") for c in all_chunks if c.get("content"))
-            logger.info(f"   📦 All-chunks fallback: {len(all_chunks)} chunks, {len(text.split())} words for {ticker}")
+        if contents:
+            text = "\n\n".join(contents)
+            logger.info(f"   📦 All-chunks fallback: {len(contents)} chunks, {len(text.split())} words for {ticker}")
             return text
 
         return None
 
-    def _load_chunks_from_s3(self, s3_key: str) -> List[Dict]:
-        """Download a chunks JSON file from S3."""
+    def _prefetch_chunks(self, s3_keys: List[str]) -> None:
+        """Download the chunk files not cached yet concurrently (one bounded pool)."""
+        missing = [key for key in dict.fromkeys(s3_keys) if key not in self._s3_chunk_cache]
+        if len(missing) < 2:
+            return
+        try:
+            from app.services.s3_storage import get_s3_service
+            bodies = get_s3_service().get_files(missing)
+        except Exception as e:
+            logger.warning(f"   ⚠️  S3 prefetch failed: {e}")
+            return
+        for s3_key, data in bodies.items():
+            self._parse_chunk_file(s3_key, data)
+
+    def _load_chunks_from_s3(self, s3_key: str) -> ChunkFile:
+        """Download a chunk file (Parquet, or legacy JSON) from S3."""
         if s3_key in self._s3_chunk_cache:
             return self._s3_chunk_cache[s3_key]
 
         try:
             from app.services.s3_storage import get_s3_service
             s3 = get_s3_service()
-
             data = s3.get_file(s3_key)
-            if data is None:
-                logger.warning(f"   ⚠️  S3 file not found: {s3_key}")
-                self._s3_chunk_cache[s3_key] = []
-                return []
-
-            text = data.decode("utf-8") if isinstance(data, bytes) else str(data)
-            parsed = json.loads(text)
-
-            if isinstance(parsed, list):
-                chunks = parsed
-            elif isinstance(parsed, dict):
-                if "chunks" in parsed:
-                    chunks = parsed["chunks"]
-                elif "content" in parsed:
-                    chunks = [parsed]
-                else:
-                    chunks = []
-            else:
-                chunks = []
-
-            logger.info(f"   📦 Loaded {len(chunks)} chunks from S3: {s3_key}")
-            self._s3_chunk_cache[s3_key] = chunks
-            return chunks
-
-        except json.JSONDecodeError as e:
-            logger.warning(f"   ⚠️  JSON parse failed for {s3_key}: {e}")
-            self._s3_chunk_cache[s3_key] = []
-            return []
         except Exception as e:
             logger.warning(f"   ⚠️  S3 load failed for {s3_key}: {e}")
-            self._s3_chunk_cache[s3_key] = []
-            return []
+            self._fetch_errors.update(SEC_SOURCES)
+            self._s3_chunk_cache[s3_key] = ChunkFile()
+            return self._s3_chunk_cache[s3_key]
+        return self._parse_chunk_file(s3_key, data)
+
+    def _parse_chunk_file(self, s3_key: str, data: Optional[bytes]) -> ChunkFile:
+        """
+        Open a downloaded chunk file and remember it for this run.
+
+        Parquet files are decoded lazily — only the sections and columns a
+        caller asks for — so one open file serves every section query.
+        """
+        chunk_file = ChunkFile()
+        if data is None:
+            logger.warning(f"   ⚠️  S3 file not found: {s3_key}")
+        else:
+            try:
+                chunk_file = ChunkFile.open(data)
+                logger.info(f"   📦 Loaded {len(chunk_file)} chunks ({chunk_file.format}) from S3: {s3_key}")
+            except (ValueError, OSError) as e:   # bad JSON/UTF-8, corrupt Parquet
+                logger.warning(f"   ⚠️  Chunk file parse failed for {s3_key}: {e}")
+        self._s3_chunk_cache[s3_key] = chunk_file
+        return chunk_file
+
+
+@lru_cache(maxsize=1)
+def _sec_constants() -> str:
+    return constants_fingerprint(
+        ScoringService.SEC_SECTION_MAP,
+        ScoringService.SEC_RUBRIC_MAP,
+        module_constants(rubric_scorer),
+        _MIN_SECTION_WORDS,
+    )
 
 
 # Singleton
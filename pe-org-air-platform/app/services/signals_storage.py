@@ -536,6 +536,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import boto3
 from botocore.exceptions import ClientError, NoCredentialsError
 
+from app.services.snapshot_manifest import record_snapshot
+
 
 class S3SignalsStorage:
     """S3 storage backend for all signal data."""
@@ -570,10 +572,11 @@ class S3SignalsStorage:
             return None
         try:
             body = json.dumps(data, indent=2, default=str).encode("utf-8")
-            self.client.put_object(
+            resp = self.client.put_object(
                 Bucket=self.bucket, Key=s3_key,
                 Body=body, ContentType="application/json",
             )
+            record_snapshot(s3_key, body, resp.get("ETag"))
             return s3_key
         except (ClientError, Exception) as e:
             print(f"[S3SignalsStorage] Upload failed {s3_key}: {e}")
@@ -707,13 +710,23 @@ class SignalsStorage:
     def get_latest(self, signal_type: str, ticker: str) -> Optional[Dict[str, Any]]:
         """Get the most recent signal data for a company by type."""
         prefix = f"{self.S3_PREFIX}/{signal_type}/{ticker.upper()}/"
-        keys = self._s3.list_keys(prefix)
-        if not keys:
+        latest_key = self._latest_key(prefix)
+        if latest_key is None:
             return None
-        # Keys are timestamped, so last alphabetically = most recent
-        latest_key = sorted(keys)[-1]
         return self._s3.download_json(latest_key)
 
+    def _latest_key(self, prefix: str) -> Optional[str]:
+        """Newest key under a prefix, from its snapshot manifest (listing as a fallback)."""
+        try:
+            from app.services.s3_storage import get_s3_service
+            latest = get_s3_service().latest_object(prefix)
+            return latest.key if latest else None
+        except Exception as e:
+            print(f"[SignalsStorage] Manifest lookup failed for {prefix}, listing instead: {e}")
+        keys = self._s3.list_keys(prefix)
+        # Keys are timestamped, so last alphabetically = most recent
+        return sorted(keys)[-1] if keys else None
+
     def list_companies_with_signals(self, signal_type: str) -> List[str]:
         """List tickers that have signal data for a given type."""
         prefix = f"{self.S3_PREFIX}/{signal_type}/"
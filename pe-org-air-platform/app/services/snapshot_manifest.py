@@ -0,0 +1,286 @@
+"""
+Snapshot Manifest — "latest snapshot" pointers for timestamped S3 prefixes
+app/services/snapshot_manifest.py
+
+Signal writers store one timestamped object per run:
+
+    signals/{type}/{TICKER}/{timestamp}.json
+    glassdoor_signals/raw/{TICKER}/{timestamp}_raw.json
+    glassdoor_signals/output/{TICKER}/{timestamp}_culture.json
+
+and readers want the newest one. Instead of listing the prefix and taking
+sorted(keys)[-1] on every read, each snapshot prefix has a small manifest:
+
+    manifests/{prefix}latest.json
+    {"prefix": ..., "key": ..., "etag": ..., "size": ..., "sha256": ..., "updated_at": ...}
+
+Writers update it after each upload with a compare-and-swap PUT (If-Match
+on the manifest's ETag, If-None-Match: * when creating it), and only move
+it forward: the pointer always names the greatest key, exactly what the
+list-and-sort readers picked. Readers resolve a prefix with one GET of the
+manifest (a 304 revalidation through the S3 disk cache) or, within
+SNAPSHOT_MANIFEST_TTL seconds, from an in-process copy.
+
+A missing manifest is rebuilt from one listing on first read, and deleting
+the object a manifest points at drops the manifest. The repair command
+(python -m app.scripts.repair_manifests) rebuilds all of them from a full
+listing.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+
+from botocore.exceptions import ClientError
+
+if TYPE_CHECKING:
+    from app.services.s3_storage import S3Object, S3StorageService
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_ROOT = "manifests/"
+
+# Roots holding timestamped snapshots, one level below {root}{type-or-ticker}/
+SNAPSHOT_ROOTS = ("signals/", "glassdoor_signals/raw/", "glassdoor_signals/output/")
+
+# Segments in a snapshot key: root parts + ticker + file name
+_SNAPSHOT_KEY_PARTS = 4
+
+# Conflicting concurrent manifest writes (S3 conditional PUT)
+_CONFLICT = {"PreconditionFailed", "412", "ConditionalRequestConflict", "409"}
+_MAX_PUBLISH_ATTEMPTS = 5
+
+
+def snapshot_prefix(key: str) -> Optional[str]:
+    """The snapshot prefix a key belongs to ("signals/jobs/NVDA/"), or None if untracked."""
+    if not key.startswith(SNAPSHOT_ROOTS):
+        return None
+    parts = key.split("/")
+    if len(parts) != _SNAPSHOT_KEY_PARTS or not all(parts):
+        return None
+    return "/".join(parts[:-1]) + "/"
+
+
+def is_snapshot_prefix(prefix: str) -> bool:
+    return snapshot_prefix(prefix + "x") == prefix
+
+
+def manifest_key(prefix: str) -> str:
+    return f"{MANIFEST_ROOT}{prefix}latest.json"
+
+
+@dataclass(frozen=True)
+class SnapshotPointer:
+    """The newest object under a snapshot prefix."""
+    prefix: str
+    key: str
+    etag: str
+    size: int
+    sha256: str
+    updated_at: str
+
+    @classmethod
+    def for_body(cls, key: str, body: bytes, etag: str) -> "SnapshotPointer":
+        return cls(
+            prefix=snapshot_prefix(key) or "",
+            key=key,
+            etag=(etag or "").strip('"'),
+            size=len(body),
+            sha256=hashlib.sha256(body).hexdigest(),
+            updated_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    @classmethod
+    def from_json(cls, raw: bytes) -> Optional["SnapshotPointer"]:
+        try:
+            data = json.loads(raw.decode("utf-8"))
+            return cls(**{f: data[f] for f in cls.__dataclass_fields__})
+        except (UnicodeDecodeError, json.JSONDecodeError, KeyError, TypeError):
+            return None
+
+    def to_json(self) -> bytes:
+        return json.dumps(asdict(self), sort_keys=True).encode("utf-8")
+
+    def to_object(self) -> "S3Object":
+        from app.services.s3_storage import S3Object
+        return S3Object(key=self.key, etag=self.etag, size=self.size)
+
+
+@dataclass
+class RepairReport:
+    """What a manifest repair found (and, unless dry_run, fixed)."""
+    created: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    dry_run: bool = False
+
+    @property
+    def changed(self) -> int:
+        return len(self.created) + len(self.updated) + len(self.removed)
+
+
+class SnapshotManifest:
+    """Reads and maintains the latest-snapshot manifests of one bucket."""
+
+    def __init__(self, s3: "S3StorageService", ttl: float = 0.0):
+        self.s3 = s3
+        self.ttl = ttl
+        self._memo: Dict[str, Tuple[float, Optional[SnapshotPointer]]] = {}
+        self._lock = threading.Lock()
+
+    # ---- reads -------------------------------------------------------------
+
+    def resolve(self, prefix: str) -> Optional[SnapshotPointer]:
+        """The latest snapshot under a prefix: in-process copy, one manifest GET, or a rebuild."""
+        if self.ttl > 0:
+            with self._lock:
+                expires, pointer = self._memo.get(prefix, (0.0, None))
+            if expires > time.monotonic():
+                return pointer
+
+        raw = self.s3.get_file(manifest_key(prefix), missing_ok=True)
+        pointer = SnapshotPointer.from_json(raw) if raw is not None else None
+        if pointer is None or pointer.prefix != prefix:
+            pointer = self.rebuild(prefix)
+        self._remember(prefix, pointer)
+        return pointer
+
+    def _fetch(self, prefix: str) -> Tuple[Optional[SnapshotPointer], Optional[str]]:
+        """Current manifest and its ETag, read directly (no caches) for compare-and-swap."""
+        try:
+            response = self.s3.s3_client.get_object(Bucket=self.s3.bucket_name, Key=manifest_key(prefix))
+        except ClientError as e:
+            if str(e.response.get("Error", {}).get("Code", "")) in {"404", "NoSuchKey", "NotFound"}:
+                return None, None
+            raise
+        return SnapshotPointer.from_json(response["Body"].read()), response.get("ETag")
+
+    def _remember(self, prefix: str, pointer: Optional[SnapshotPointer]) -> None:
+        if self.ttl > 0:
+            with self._lock:
+                self._memo[prefix] = (time.monotonic() + self.ttl, pointer)
+
+    # ---- writes ------------------------------------------------------------
+
+    def record(self, key: str, body: bytes, etag: str) -> Optional[SnapshotPointer]:
+        """Advance the manifest of `key`'s prefix to `key` (no-op for untracked keys)."""
+        if snapshot_prefix(key) is None:
+            return None
+        return self.publish(SnapshotPointer.for_body(key, body, etag))
+
+    def publish(self, pointer: SnapshotPointer, force: bool = False) -> Optional[SnapshotPointer]:
+        """
+        Write a pointer with compare-and-swap; returns the manifest's resulting pointer.
+
+        Without force the manifest only moves to a greater key, so a slow
+        writer never replaces a newer snapshot.
+        """
+        for _ in range(_MAX_PUBLISH_ATTEMPTS):
+            current, manifest_etag = self._fetch(pointer.prefix)
+            if current is not None and (
+                (current.key, current.etag) == (pointer.key, pointer.etag)
+                or (not force and current.key > pointer.key)
+            ):
+                self._remember(pointer.prefix, current)
+                return current
+            condition = {"IfMatch": manifest_etag} if manifest_etag else {"IfNoneMatch": "*"}
+            try:
+                self.s3.s3_client.put_object(
+                    Bucket=self.s3.bucket_name,
+                    Key=manifest_key(pointer.prefix),
+                    Body=pointer.to_json(),
+                    ContentType="application/json",
+                    **condition,
+                )
+            except ClientError as e:
+                if str(e.response.get("Error", {}).get("Code", "")) in _CONFLICT:
+                    continue
+                raise
+            self._remember(pointer.prefix, pointer)
+            return pointer
+        logger.warning(f"⚠️  Manifest for {pointer.prefix} kept changing, gave up after {_MAX_PUBLISH_ATTEMPTS} attempts")
+        return None
+
+    def rebuild(self, prefix: str, force: bool = False) -> Optional[SnapshotPointer]:
+        """Point the manifest at the greatest key found by listing the prefix."""
+        objects = [obj for obj in self.s3.list_objects(prefix) if snapshot_prefix(obj.key) == prefix]
+        if not objects:
+            return None
+        return self._publish_object(max(objects, key=lambda obj: obj.key), force)
+
+    def _publish_object(self, obj: "S3Object", force: bool) -> Optional[SnapshotPointer]:
+        body = self.s3.get_file(obj.key, obj.etag)
+        if body is None:
+            return None
+        return self.publish(SnapshotPointer.for_body(obj.key, body, obj.etag), force=force)
+
+    def forget_key(self, key: str) -> None:
+        """Drop the manifest if it points at `key` (called when the object is deleted)."""
+        prefix = snapshot_prefix(key)
+        if prefix is None:
+            return
+        with self._lock:
+            self._memo.pop(prefix, None)
+        try:
+            current, _ = self._fetch(prefix)
+            if current is not None and current.key == key:
+                self.s3.s3_client.delete_object(Bucket=self.s3.bucket_name, Key=manifest_key(prefix))
+        except ClientError as e:
+            logger.warning(f"⚠️  Could not drop manifest for {prefix} (repair will fix it): {e}")
+
+    # ---- repair ------------------------------------------------------------
+
+    def repair(self, roots: Sequence[str] = SNAPSHOT_ROOTS, dry_run: bool = False) -> RepairReport:
+        """Rebuild every manifest under `roots` from a full listing."""
+        report = RepairReport(dry_run=dry_run)
+        for root in roots:
+            latest: Dict[str, "S3Object"] = {}
+            for obj in self.s3.list_objects(root):
+                prefix = snapshot_prefix(obj.key)
+                if prefix is not None and (prefix not in latest or obj.key > latest[prefix].key):
+                    latest[prefix] = obj
+
+            manifests: Dict[str, str] = {}
+            for obj in self.s3.list_objects(MANIFEST_ROOT + root):
+                if obj.key.endswith("/latest.json"):
+                    manifests[obj.key[len(MANIFEST_ROOT):-len("latest.json")]] = obj.key
+
+            for prefix in sorted(latest):
+                obj = latest[prefix]
+                current, _ = self._fetch(prefix) if prefix in manifests else (None, None)
+                if current is not None and (current.key, current.etag) == (obj.key, obj.etag):
+                    report.unchanged.append(prefix)
+                    continue
+                (report.updated if prefix in manifests else report.created).append(prefix)
+                if not dry_run:
+                    self._publish_object(obj, force=True)
+
+            for prefix in sorted(set(manifests) - set(latest)):
+                report.removed.append(prefix)
+                if not dry_run:
+                    self.s3.s3_client.delete_object(Bucket=self.s3.bucket_name, Key=manifests[prefix])
+
+        with self._lock:
+            self._memo.clear()
+        return report
+
+
+def record_snapshot(key: str, body: bytes, etag: Optional[str]) -> None:
+    """
+    Advance the manifest after an upload made outside S3StorageService.
+
+    Never raises: a stale manifest is repaired on read, a failed upload is not.
+    """
+    if snapshot_prefix(key) is None:
+        return
+    try:
+        from app.services.s3_storage import get_s3_service
+        get_s3_service().manifest.record(key, body, etag or "")
+    except Exception as e:
+        logger.warning(f"⚠️  Manifest update failed for {key}: {e}")
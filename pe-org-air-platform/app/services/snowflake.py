@@ -1,37 +1,39 @@
 from __future__ import annotations
 
-import os
 import uuid
 from datetime import datetime, timezone
 from typing import List, Optional
 
 import snowflake.connector
-from dotenv import load_dotenv
 
 from app.pipelines.chunking import DocumentChunk
+from app.services.snowflake_pool import (
+    PooledConnection,
+    PooledConnectionHandle,
+    get_snowflake_pool,
+)
 
 
 
 # MODULE-LEVEL CONNECTION (USED BY REPOSITORIES)
 
 
-def get_snowflake_connection():
+def get_snowflake_connection() -> PooledConnection:
     """
     Backward-compatible Snowflake connection factory.
-    Used by repositories via dependency injection.
+
+    Borrows a connection from the shared pool; conn.close() returns it to
+    the pool instead of tearing down the session.
     """
-    # Load environment variables from .env file
-    load_dotenv()
-    
-    return snowflake.connector.connect(
-        account=os.getenv("SNOWFLAKE_ACCOUNT"),
-        user=os.getenv("SNOWFLAKE_USER"),
-        password=os.getenv("SNOWFLAKE_PASSWORD"),
-        warehouse=os.getenv("SNOWFLAKE_WAREHOUSE"),
-        database=os.getenv("SNOWFLAKE_DATABASE"),
-        schema=os.getenv("SNOWFLAKE_SCHEMA"),
-        role=os.getenv("SNOWFLAKE_ROLE"),
-    )
+    return get_snowflake_pool().acquire()
+
+
+def get_pooled_connection() -> PooledConnectionHandle:
+    """
+    Long-lived connection handle for repositories and services that keep a
+    `self.conn` attribute. Borrows from the pool per cursor.
+    """
+    return PooledConnectionHandle(get_snowflake_pool)
 
 
 
@@ -49,10 +51,10 @@ class SnowflakeService:
     """
     
     def __init__(self):
-        self.conn = get_snowflake_connection()
+        self.conn = get_pooled_connection()
 
     def close(self):
-        """Close the Snowflake connection."""
+        """Release any pooled connection still held by this service."""
         try:
             self.conn.close()
         except Exception:
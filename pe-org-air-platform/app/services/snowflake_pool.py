@@ -0,0 +1,453 @@
+"""
+Snowflake Connection Pool - PE Org-AI-R Platform
+app/services/snowflake_pool.py
+
+Bounded, thread-safe pool of Snowflake connections shared by every repository,
+SnowflakeService and ScoringService.
+
+- acquire()/release() hand out PooledConnection proxies; proxy.close() returns
+  the connection to the pool instead of closing the socket.
+- Idle connections are evicted after SNOWFLAKE_POOL_MAX_IDLE_SECONDS and
+  recycled after SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS.
+- Connections idle longer than SNOWFLAKE_POOL_VALIDATE_AFTER_SECONDS are
+  health-checked (SELECT 1) before being handed out.
+- PooledConnectionHandle is a long-lived stand-in for the old `self.conn`
+  attribute: it borrows a connection per cursor and returns it on cursor.close().
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Generator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Window used to compute the connects/sec rate
+_CONNECT_RATE_WINDOW_SECONDS = 60.0
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available within the timeout."""
+
+    pass
+
+
+@dataclass
+class _PoolEntry:
+    """A physical connection plus the bookkeeping the pool needs."""
+
+    conn: Any
+    created_at: float = field(default_factory=time.monotonic)
+    last_used_at: float = field(default_factory=time.monotonic)
+
+
+class PooledConnection:
+    """
+    Proxy around a borrowed Snowflake connection.
+
+    Behaves like a snowflake.connector connection except that close() returns
+    it to the pool. Call discard() instead when the connection is known to be
+    broken so the pool drops it.
+    """
+
+    def __init__(self, pool: "SnowflakeConnectionPool", entry: _PoolEntry):
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    @property
+    def raw(self) -> Any:
+        """The underlying snowflake.connector connection."""
+        return self._entry.conn
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._entry)
+
+    def discard(self) -> None:
+        """Close the physical connection and free its pool slot."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._entry, discard=True)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._entry.conn, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class SnowflakeConnectionPool:
+    """Bounded LIFO pool of Snowflake connections."""
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        max_size: int = 8,
+        timeout: float = 30.0,
+        max_idle_seconds: float = 600.0,
+        max_lifetime_seconds: float = 3600.0,
+        validate_after_seconds: float = 60.0,
+    ):
+        self._connect = connect
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+        self.max_lifetime_seconds = max_lifetime_seconds
+        self.validate_after_seconds = validate_after_seconds
+
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._idle: Deque[_PoolEntry] = deque()
+        self._size = 0  # idle + in use + being created
+
+        # Metrics
+        self._acquisitions = 0
+        self._timeouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_connects = 0
+        self._connect_failures = 0
+        self._recent_connects: Deque[float] = deque()
+        self._evictions = {"idle": 0, "lifetime": 0, "health_check": 0, "discarded": 0}
+
+    # ------------------------------------------------------------------
+    # Borrow / return
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> PooledConnection:
+        """
+        Borrow a connection, creating one if the pool is below max_size.
+
+        Raises:
+            PoolTimeoutError: if the pool stays exhausted for `timeout` seconds
+        """
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            entry = None
+            create = False
+            with self._available:
+                while True:
+                    self._evict_idle_locked()
+                    if self._idle:
+                        entry = self._idle.pop()
+                        break
+                    if self._size < self.max_size:
+                        self._size += 1
+                        create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeoutError(
+                            f"No Snowflake connection available after {timeout:.1f}s "
+                            f"(pool size {self.max_size})"
+                        )
+                    self._available.wait(remaining)
+
+            if create:
+                entry = self._create_entry()
+            elif not self._validate(entry):
+                self._drop(entry, reason="health_check")
+                continue
+
+            waited = time.monotonic() - started
+            with self._lock:
+                self._acquisitions += 1
+                self._total_wait += waited
+                self._max_wait = max(self._max_wait, waited)
+            return PooledConnection(self, entry)
+
+    def release(self, entry: _PoolEntry, discard: bool = False) -> None:
+        """Return a connection to the pool, closing it if it should not be reused."""
+        now = time.monotonic()
+        if discard:
+            self._drop(entry, reason="discarded")
+            return
+        if now - entry.created_at >= self.max_lifetime_seconds or self._is_closed(entry):
+            self._drop(entry, reason="lifetime")
+            return
+
+        entry.last_used_at = now
+        with self._available:
+            self._idle.append(entry)
+            self._available.notify()
+
+    @contextmanager
+    def connection(self, timeout: Optional[float] = None) -> Generator[PooledConnection, None, None]:
+        """Context manager that borrows a connection and always returns it."""
+        conn = self.acquire(timeout)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def close_all(self) -> None:
+        """Close every idle connection. Borrowed connections close on release."""
+        with self._available:
+            entries = list(self._idle)
+            self._idle.clear()
+            self._size -= len(entries)
+            self._available.notify_all()
+        for entry in entries:
+            self._close_quietly(entry)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool utilisation for the /health router."""
+        now = time.monotonic()
+        with self._lock:
+            self._trim_connect_window_locked(now)
+            idle = len(self._idle)
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._size - idle,
+                "idle": idle,
+                "acquisitions": self._acquisitions,
+                "timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait / self._acquisitions * 1000, 2)
+                if self._acquisitions else 0.0,
+                "max_wait_ms": round(self._max_wait * 1000, 2),
+                "total_connects": self._total_connects,
+                "connect_failures": self._connect_failures,
+                "connects_per_sec": round(
+                    len(self._recent_connects) / _CONNECT_RATE_WINDOW_SECONDS, 4
+                ),
+                "evictions": dict(self._evictions),
+            }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _create_entry(self) -> _PoolEntry:
+        try:
+            conn = self._connect()
+        except Exception:
+            with self._available:
+                self._size -= 1
+                self._connect_failures += 1
+                self._available.notify()
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            self._total_connects += 1
+            self._recent_connects.append(now)
+            self._trim_connect_window_locked(now)
+        return _PoolEntry(conn=conn, created_at=now, last_used_at=now)
+
+    def _validate(self, entry: _PoolEntry) -> bool:
+        """Health-check a connection that has been idle for a while."""
+        if self._is_closed(entry):
+            return False
+        if time.monotonic() - entry.last_used_at < self.validate_after_seconds:
+            return True
+        try:
+            cur = entry.conn.cursor()
+            try:
+                cur.execute("SELECT 1")
+                cur.fetchone()
+            finally:
+                cur.close()
+            return True
+        except Exception as e:
+            logger.warning(f"Snowflake pool health check failed, dropping connection: {e}")
+            return False
+
+    def _evict_idle_locked(self) -> None:
+        """Drop idle connections past their idle or lifetime limit (lock held)."""
+        if not self._idle:
+            return
+        now = time.monotonic()
+        keep: Deque[_PoolEntry] = deque()
+        expired = []
+        for entry in self._idle:
+            if now - entry.created_at >= self.max_lifetime_seconds:
+                expired.append((entry, "lifetime"))
+            elif now - entry.last_used_at >= self.max_idle_seconds:
+                expired.append((entry, "idle"))
+            else:
+                keep.append(entry)
+        if not expired:
+            return
+        self._idle = keep
+        self._size -= len(expired)
+        for entry, reason in expired:
+            self._evictions[reason] += 1
+            self._close_quietly(entry)
+
+    def _drop(self, entry: _PoolEntry, reason: str) -> None:
+        self._close_quietly(entry)
+        with self._available:
+            self._size -= 1
+            self._evictions[reason] += 1
+            self._available.notify()
+
+    def _trim_connect_window_locked(self, now: float) -> None:
+        while self._recent_connects and now - self._recent_connects[0] > _CONNECT_RATE_WINDOW_SECONDS:
+            self._recent_connects.popleft()
+
+    @staticmethod
+    def _is_closed(entry: _PoolEntry) -> bool:
+        is_closed = getattr(entry.conn, "is_closed", None)
+        try:
+            return bool(is_closed()) if callable(is_closed) else False
+        except Exception:
+            return True
+
+    @staticmethod
+    def _close_quietly(entry: _PoolEntry) -> None:
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+
+class _LeasedCursor:
+    """Cursor wrapper that hands its connection back to the handle on close()."""
+
+    def __init__(self, handle: "PooledConnectionHandle", cursor: Any):
+        self._handle = handle
+        self._cursor = cursor
+        self._closed = False
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._cursor.close()
+        finally:
+            self._handle._return_lease()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self) -> "_LeasedCursor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class PooledConnectionHandle:
+    """
+    Long-lived, thread-safe stand-in for a Snowflake connection.
+
+    Repositories keep this as `self.conn`. Each cursor() call borrows a pooled
+    connection for the calling thread; commit()/rollback() act on that borrowed
+    connection, and it goes back to the pool when the last open cursor on the
+    thread is closed. Nested cursors on one thread share the same connection,
+    so transactions behave exactly as they did with a dedicated connection.
+    """
+
+    def __init__(self, pool_getter: Callable[[], SnowflakeConnectionPool]):
+        self._pool_getter = pool_getter
+        self._local = threading.local()
+
+    def cursor(self, *args, **kwargs) -> _LeasedCursor:
+        lease: Optional[PooledConnection] = getattr(self._local, "lease", None)
+        if lease is None:
+            lease = self._pool_getter().acquire()
+            self._local.lease = lease
+            self._local.depth = 0
+        try:
+            cur = lease.cursor(*args, **kwargs)
+        except Exception:
+            if self._local.depth == 0:
+                self._local.lease = None
+                lease.discard()
+            raise
+        self._local.depth += 1
+        return _LeasedCursor(self, cur)
+
+    def commit(self) -> None:
+        lease = getattr(self._local, "lease", None)
+        if lease is not None:
+            lease.commit()
+
+    def rollback(self) -> None:
+        lease = getattr(self._local, "lease", None)
+        if lease is not None:
+            lease.rollback()
+
+    def close(self) -> None:
+        """Release this thread's connection if a cursor was left open."""
+        lease = getattr(self._local, "lease", None)
+        if lease is not None:
+            self._local.lease = None
+            self._local.depth = 0
+            lease.close()
+
+    def _return_lease(self) -> None:
+        self._local.depth -= 1
+        if self._local.depth <= 0:
+            self.close()
+
+
+# Singleton
+_pool: Optional[SnowflakeConnectionPool] = None
+_pool_lock = threading.Lock()
+
+
+def _connect_from_settings() -> Any:
+    import snowflake.connector
+    from app.config import settings
+
+    return snowflake.connector.connect(
+        account=settings.SNOWFLAKE_ACCOUNT,
+        user=settings.SNOWFLAKE_USER,
+        password=settings.SNOWFLAKE_PASSWORD.get_secret_value(),
+        warehouse=settings.SNOWFLAKE_WAREHOUSE,
+        database=settings.SNOWFLAKE_DATABASE,
+        schema=settings.SNOWFLAKE_SCHEMA,
+        role=settings.SNOWFLAKE_ROLE,
+    )
+
+
+def get_snowflake_pool() -> SnowflakeConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from app.config import settings
+
+                _pool = SnowflakeConnectionPool(
+                    connect=_connect_from_settings,
+                    max_size=settings.SNOWFLAKE_POOL_SIZE,
+                    timeout=settings.SNOWFLAKE_POOL_TIMEOUT,
+                    max_idle_seconds=settings.SNOWFLAKE_POOL_MAX_IDLE_SECONDS,
+                    max_lifetime_seconds=settings.SNOWFLAKE_POOL_MAX_LIFETIME_SECONDS,
+                    validate_after_seconds=settings.SNOWFLAKE_POOL_VALIDATE_AFTER_SECONDS,
+                )
+    return _pool
+
+
+def reset_snowflake_pool() -> None:
+    """Close idle connections and drop the singleton (tests / shutdown)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close_all()
+        _pool = None
@@ -0,0 +1,561 @@
+"""
+Tiered Cache — resilient front end for the Redis response cache
+app/services/tiered_cache.py
+
+Wraps RedisCache with four pieces so a Redis outage or a hot-key expiry
+never turns into a stall or a thundering herd on Snowflake:
+
+  CircuitBreaker   after CACHE_BREAKER_FAILURES consecutive Redis errors the
+                   circuit opens and Redis is skipped outright; after
+                   CACHE_BREAKER_RESET_SECONDS one half-open probe decides
+                   whether it closes again
+  L1               in-process TTL LRU in front of Redis, holding serialised
+                   JSON (callers never share mutable models).  Lifetime is
+                   capped at CACHE_L1_TTL_SECONDS because invalidations in
+                   other workers cannot reach it
+  SingleFlight     concurrent misses on one key run the loader once per
+                   process; the others wait for and share its result
+  Early expiry     values carry their logical expiry and recompute time
+                   (delta); a reader refreshes early with probability
+                   exp(-remaining / (delta · beta)) ("XFetch"), so one
+                   request recomputes a hot key shortly before it expires
+                   while everyone else keeps being served
+
+Invalidation never walks the keyspace on a request path.  Collections
+(company lists, per-industry lists) live in a namespace whose generation
+counter (Redis INCR at cache:gen:<namespace>) is folded into their keys:
+invalidate_namespace() bumps it in O(1) and the old generation's entries
+simply age out via TTL.  Generations are re-read at most every
+GENERATION_REFRESH_SECONDS per process; a bump that could not reach Redis
+is retried before the next read.  Remaining pattern deletes run on the
+background "cache" lane as pipelined UNLINK batches.
+
+Values are encoded by the CACHE_CODEC codec (cache_codecs.py); readers
+accept every format, so the codec can be switched without a flush.
+get_or_load(trusted=True) returns hits as plain decoded data for
+endpoints that send them back without re-validating (cached_response).
+
+Per-tier hit / miss / stale counters and the breaker state are exported
+by GET /health/cache/stats.
+"""
+import fnmatch
+import logging
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+
+import redis
+from pydantic import BaseModel
+
+from app.config import settings
+from app.services.blocking import CACHE_LANE, get_executor
+from app.services.cache_codecs import CODECS, CacheCodec, compress, decompress, get_codec, schema_tag
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T", bound=BaseModel)
+
+# Redis values written by TieredCache:
+#   text codec     "xf1|<expiry epoch>|<delta s>|<model json>"
+#   binary codecs  b"xf2|<expiry>|<delta>|<codec>|<schema tag>|<raw size if zstd, else 0>|<payload>"
+ENVELOPE_PREFIX = "xf1|"
+BINARY_PREFIX = b"xf2|"
+
+GENERATION_KEY_PREFIX = "cache:gen:"
+GENERATION_REFRESH_SECONDS = 1.0
+
+_UNAVAILABLE = object()
+
+
+class CircuitBreaker:
+    """closed → (N failures) → open → (reset timeout) → half-open → one probe → closed / open."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 15.0, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self._stats = {"opened": 0, "short_circuited": 0, "probes": 0}
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.reset_seconds:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def available(self) -> bool:
+        """True when a call could go through (closed, or due for a probe); consumes nothing."""
+        with self._lock:
+            state = self._current_state()
+            return state == self.CLOSED or (state == self.HALF_OPEN and not self._probing)
+
+    def allow(self) -> bool:
+        """Admit one call; in half-open state only a single probe is admitted."""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                self._stats["probes"] += 1
+                return True
+            self._stats["short_circuited"] += 1
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("✅ Redis circuit closed")
+            self._state, self._failures, self._probing = self.CLOSED, 0, False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats["opened"] += 1
+                    logger.warning(f"⚠️  Redis circuit opened for {self.reset_seconds:.0f}s after {self._failures} failure(s)")
+                self._state, self._opened_at, self._probing = self.OPEN, self._clock(), False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"state": self._current_state(), "consecutive_failures": self._failures, **self._stats}
+
+
+class SingleFlight:
+    """Per-key request coalescing: one caller runs fn, concurrent callers wait for its outcome."""
+
+    class _Call:
+        __slots__ = ("done", "result", "error")
+
+        def __init__(self):
+            self.done = threading.Event()
+            self.result: Any = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, "SingleFlight._Call"] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Return (result, shared); shared is True for callers that waited on another's call."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+        return call.result, False
+
+
+class _GuardedClient:
+    """Redis client proxy whose calls go through the circuit breaker (for raw-client users)."""
+
+    def __init__(self, client, breaker: CircuitBreaker):
+        self._client = client
+        self._breaker = breaker
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def guarded(*args, **kwargs):
+            if not self._breaker.allow():
+                raise redis.ConnectionError("Redis circuit open")
+            try:
+                result = attr(*args, **kwargs)
+            except (redis.RedisError, OSError):
+                self._breaker.record_failure()
+                raise
+            self._breaker.record_success()
+            return result
+
+        return guarded
+
+
+class TieredCache:
+    """L1 + Redis cache with a circuit breaker, single-flight loads and early expiry."""
+
+    TIERS = ("l1", "redis")
+
+    def __init__(
+        self,
+        backend,
+        l1_max_entries: int = 1024,
+        l1_ttl_seconds: int = 10,
+        early_expiry_beta: float = 1.0,
+        breaker: Optional[CircuitBreaker] = None,
+        clock: Callable[[], float] = time.time,
+        codec: Optional[CacheCodec] = None,
+        compress_min_bytes: int = 0,
+    ):
+        self.backend = backend
+        self.codec = codec or get_codec("text")
+        self.compress_min_bytes = compress_min_bytes
+        self.l1_max_entries = l1_max_entries
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.early_expiry_beta = early_expiry_beta
+        self.breaker = breaker or CircuitBreaker()
+        self._clock = clock
+        # key → ((codec, schema tag, payload), l1 deadline, logical expiry, delta)
+        self._l1: "OrderedDict[str, Tuple[Tuple[str, Optional[str], bytes], float, float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._flight = SingleFlight()
+        # namespace → (generation, fetched at); namespaces whose bump has not reached Redis yet
+        self._generations: Dict[str, Tuple[int, float]] = {}
+        self._pending_bumps: set = set()
+        self._stats = {tier: {"hits": 0, "misses": 0, "stale": 0} for tier in self.TIERS}
+        self._stats["redis"].update(errors=0, skipped=0)
+        self._stats["loads"] = {"loads": 0, "coalesced": 0, "load_errors": 0}
+        self._stats["invalidations"] = {"namespaces": 0, "pattern_deletes": 0, "keys_unlinked": 0}
+
+    # ------------------------------------------------------------------
+    # Redis access (through the breaker)
+    # ------------------------------------------------------------------
+
+    @property
+    def client(self):
+        """The Redis client behind the breaker, or None while the circuit is open."""
+        if not self.breaker.available():
+            return None
+        return _GuardedClient(self.backend.client, self.breaker)
+
+    def _redis(self, op: str, *args, values: bool = False):
+        if not self.breaker.allow():
+            self._bump("redis", "skipped")
+            return _UNAVAILABLE
+        # Cached values are read undecoded whatever this process' codec: another
+        # process may have written a binary (possibly compressed) envelope
+        client = self.backend.binary_client if values else self.backend.client
+        try:
+            result = getattr(client, op)(*args)
+        except (redis.RedisError, OSError) as e:
+            self.breaker.record_failure()
+            self._bump("redis", "errors")
+            logger.warning(f"Redis {op} failed: {e}")
+            return _UNAVAILABLE
+        self.breaker.record_success()
+        return result
+
+    def ping(self) -> bool:
+        return self._redis("ping") is not _UNAVAILABLE
+
+    # ------------------------------------------------------------------
+    # Namespaces (generation-versioned keys)
+    # ------------------------------------------------------------------
+
+    def generation(self, namespace: str) -> int:
+        """Current generation of a namespace (0 until first invalidated)."""
+        now = self._clock()
+        with self._lock:
+            cached = self._generations.get(namespace)
+            pending = namespace in self._pending_bumps
+        if cached is not None and not pending and now - cached[1] < GENERATION_REFRESH_SECONDS:
+            return cached[0]
+
+        raw = self._redis("incr" if pending else "get", f"{GENERATION_KEY_PREFIX}{namespace}")
+        if raw is _UNAVAILABLE:
+            return cached[0] if cached is not None else 0
+        gen = int(raw) if raw is not None else 0
+        with self._lock:
+            self._generations[namespace] = (gen, now)
+            self._pending_bumps.discard(namespace)
+        return gen
+
+    def versioned_key(self, namespace: Optional[str], key: str) -> str:
+        """Physical key of a logical key inside a namespace."""
+        if not namespace:
+            return key
+        return f"{namespace}:g{self.generation(namespace)}:{key}"
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop every entry of a namespace in O(1) by bumping its generation."""
+        prefix = f"{namespace}:g"
+        with self._lock:
+            for key in [k for k in self._l1 if k.startswith(prefix)]:
+                del self._l1[key]
+            self._stats["invalidations"]["namespaces"] += 1
+
+        raw = self._redis("incr", f"{GENERATION_KEY_PREFIX}{namespace}")
+        with self._lock:
+            if raw is _UNAVAILABLE:
+                # L1 is already clean; Redis gets the bump before this process reads it again
+                self._pending_bumps.add(namespace)
+            else:
+                self._generations[namespace] = (int(raw), self._clock())
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: str, model: Type[T], namespace: Optional[str] = None) -> Optional[T]:
+        """Cached model from L1 or Redis, or None."""
+        value, _ = self._lookup(self.versioned_key(namespace, key), model, early=False, trusted=False)
+        return value
+
+    def get_or_load(
+        self,
+        key: str,
+        model: Type[T],
+        ttl_seconds: int,
+        loader: Callable[[], T],
+        namespace: Optional[str] = None,
+        trusted: bool = False,
+    ) -> Tuple[Any, Optional[str]]:
+        """
+        Return (value, tier) where tier is "l1", "redis" or None (loaded).
+
+        Misses — and the one reader picked for an early refresh — run
+        loader through single-flight, then store its result in both tiers.
+        Loader exceptions propagate to every coalesced caller.
+
+        trusted=True returns hits as decoded JSON-compatible data without
+        model validation (the entry's schema tag still has to match model);
+        loaded values are always model instances.
+        """
+        key = self.versioned_key(namespace, key)
+        value, tier = self._lookup(key, model, early=True, trusted=trusted)
+        if value is not None:
+            return value, tier
+
+        def load() -> T:
+            start = time.perf_counter()
+            try:
+                loaded = loader()
+            except Exception:
+                self._bump("loads", "load_errors")
+                raise
+            self._bump("loads", "loads")
+            self._store(key, loaded, ttl_seconds, time.perf_counter() - start)
+            return loaded
+
+        loaded, shared = self._flight.do(key, load)
+        if shared:
+            self._bump("loads", "coalesced")
+            loaded = loaded.model_copy()
+        return loaded, None
+
+    def _lookup(self, key: str, model: Type[T], early: bool, trusted: bool) -> Tuple[Any, Optional[str]]:
+        now = self._clock()
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None and entry[1] > now:
+                self._l1.move_to_end(key)
+                self._stats["l1"]["hits"] += 1
+            elif entry is not None:
+                del self._l1[key]
+                self._stats["l1"]["stale"] += 1
+                entry = None
+            else:
+                self._stats["l1"]["misses"] += 1
+        if entry is not None:
+            try:
+                return self._decode(entry[0], model, trusted), "l1"
+            except ValueError:
+                self.delete(key)
+                return None, None
+
+        raw = self._redis("get", key, values=True)
+        if raw is _UNAVAILABLE:
+            return None, None
+        if raw is None:
+            self._bump("redis", "misses")
+            return None, None
+
+        try:
+            stored, expiry, delta = _unwrap(raw)
+            if early and self._refresh_early(now, expiry, delta):
+                self._bump("redis", "stale")
+                return None, None
+            value = self._decode(stored, model, trusted)
+        except ValueError as e:
+            # Older model layout or unknown codec: treat as a miss, the load overwrites it
+            logger.warning(f"Discarding undecodable cache entry {key}: {e}")
+            self._bump("redis", "misses")
+            return None, None
+        self._bump("redis", "hits")
+        self._remember(key, stored, expiry, delta, now)
+        return value, "redis"
+
+    @staticmethod
+    def _decode(stored: Tuple[str, Optional[str], bytes], model: Type[T], trusted: bool) -> Any:
+        codec_name, tag, payload = stored
+        codec = CODECS.get(codec_name)
+        if codec is None or not codec.available:
+            raise ValueError(f"codec {codec_name!r} not available")
+        if tag is not None and tag != schema_tag(model):
+            raise ValueError(f"schema tag {tag} does not match {model.__name__}")
+        return codec.loads(payload) if trusted else codec.validate(payload, model)
+
+    def _refresh_early(self, now: float, expiry: float, delta: float) -> bool:
+        if not expiry or delta <= 0 or self.early_expiry_beta <= 0:
+            return False
+        # XFetch: -delta·beta·ln(U) is exponential with mean delta·beta
+        return now - delta * self.early_expiry_beta * math.log(1.0 - random.random()) >= expiry
+
+    # ------------------------------------------------------------------
+    # Writes / invalidation
+    # ------------------------------------------------------------------
+
+    def set(self, key: str, value: BaseModel, ttl_seconds: int, namespace: Optional[str] = None) -> None:
+        """Cache a Pydantic model in both tiers with TTL."""
+        self._store(self.versioned_key(namespace, key), value, ttl_seconds, 0.0)
+
+    def _store(self, key: str, value: BaseModel, ttl_seconds: int, delta: float) -> None:
+        now = self._clock()
+        expiry = now + ttl_seconds
+        payload = self.codec.dumps(value)
+        if not self.codec.binary:
+            self._remember(key, ("text", None, payload), expiry, delta, now)
+            self._redis("setex", key, ttl_seconds, f"{ENVELOPE_PREFIX}{expiry:.3f}|{delta:.4f}|{payload.decode('utf-8')}")
+            return
+
+        tag = schema_tag(type(value))
+        self._remember(key, (self.codec.name, tag, payload), expiry, delta, now)
+        packed = compress(payload, self.compress_min_bytes)
+        header = f"{expiry:.3f}|{delta:.4f}|{self.codec.name}|{tag}|{len(payload) if packed is not None else 0}|"
+        body = BINARY_PREFIX + header.encode("ascii") + (packed if packed is not None else payload)
+        self._redis("setex", key, ttl_seconds, body, values=True)
+
+    def _remember(self, key: str, blob: Tuple[str, Optional[str], bytes], expiry: float, delta: float, now: float) -> None:
+        if self.l1_max_entries <= 0 or self.l1_ttl_seconds <= 0:
+            return
+        deadline = min(expiry, now + self.l1_ttl_seconds) if expiry else now + self.l1_ttl_seconds
+        with self._lock:
+            self._l1[key] = (blob, deadline, expiry, delta)
+            self._l1.move_to_end(key)
+            while len(self._l1) > self.l1_max_entries:
+                self._l1.popitem(last=False)
+
+    def delete(self, key: str, namespace: Optional[str] = None) -> None:
+        """Invalidate a single cache entry in both tiers (UNLINK: freed off Redis' main thread)."""
+        key = self.versioned_key(namespace, key)
+        with self._lock:
+            self._l1.pop(key, None)
+        self._redis("unlink", key)
+
+    def delete_pattern(self, pattern: str) -> Future:
+        """
+        Invalidate all keys matching a glob pattern.
+
+        L1 is purged immediately; Redis is scanned and UNLINKed in batches on
+        the background cache lane, so the caller never waits on the keyspace.
+        Prefer invalidate_namespace for anything invalidated on a request path.
+        """
+        with self._lock:
+            for key in [k for k in self._l1 if fnmatch.fnmatchcase(k, pattern)]:
+                del self._l1[key]
+            self._stats["invalidations"]["pattern_deletes"] += 1
+        return get_executor(CACHE_LANE).submit(self._delete_pattern_redis, pattern)
+
+    def _delete_pattern_redis(self, pattern: str) -> int:
+        if not self.breaker.allow():
+            self._bump("redis", "skipped")
+            return 0
+        try:
+            removed = self.backend.delete_pattern(pattern) or 0
+        except (redis.RedisError, OSError) as e:
+            self.breaker.record_failure()
+            self._bump("redis", "errors")
+            logger.warning(f"Redis delete_pattern {pattern} failed: {e}")
+            return 0
+        self.breaker.record_success()
+        with self._lock:
+            self._stats["invalidations"]["keys_unlinked"] += removed
+        return removed
+
+    def flush(self) -> bool:
+        """Drop the L1 tier and flush the Redis database; False if Redis was unreachable."""
+        with self._lock:
+            self._l1.clear()
+        return self._redis("flushdb") is not _UNAVAILABLE
+
+    # ------------------------------------------------------------------
+    # Stats
+    # ------------------------------------------------------------------
+
+    def _bump(self, group: str, counter: str) -> None:
+        with self._lock:
+            self._stats[group][counter] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-tier counters and rates, load counters and breaker state."""
+        with self._lock:
+            tiers = {tier: dict(self._stats[tier]) for tier in self.TIERS}
+            loads = dict(self._stats["loads"])
+            invalidations = dict(self._stats["invalidations"])
+            l1_entries = len(self._l1)
+        for counters in tiers.values():
+            total = counters["hits"] + counters["misses"] + counters["stale"]
+            for name, rate in (("hits", "hit_rate"), ("misses", "miss_rate"), ("stale", "stale_rate")):
+                counters[rate] = round(counters[name] / total, 4) if total else 0.0
+        tiers["l1"]["entries"] = l1_entries
+        return {
+            "codec": self.codec.name,
+            "tiers": tiers,
+            "loads": loads,
+            "invalidations": invalidations,
+            "circuit": self.breaker.snapshot(),
+        }
+
+
+def _unwrap(raw: Any) -> Tuple[Tuple[str, Optional[str], bytes], float, float]:
+    """Split a stored value into ((codec, schema tag, payload), logical expiry, delta)."""
+    if isinstance(raw, bytes) and raw.startswith(BINARY_PREFIX):
+        _, expiry, delta, codec, tag, size, body = raw.split(b"|", 6)
+        if int(size):
+            body = decompress(body, int(size))
+        return (codec.decode("ascii"), tag.decode("ascii"), body), float(expiry), float(delta)
+
+    data = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+    if data.startswith(ENVELOPE_PREFIX):
+        try:
+            _, expiry, delta, blob = data.split("|", 3)
+            return ("text", None, blob.encode("utf-8")), float(expiry), float(delta)
+        except ValueError:
+            pass
+    # Plain model JSON (written before the envelope existed)
+    return ("text", None, data.encode("utf-8")), 0.0, 0.0
+
+
+def build_tiered_cache(backend) -> TieredCache:
+    """TieredCache configured from settings."""
+    return TieredCache(
+        backend,
+        l1_max_entries=settings.CACHE_L1_MAX_ENTRIES,
+        l1_ttl_seconds=settings.CACHE_L1_TTL_SECONDS,
+        early_expiry_beta=settings.CACHE_EARLY_EXPIRY_BETA,
+        breaker=CircuitBreaker(settings.CACHE_BREAKER_FAILURES, settings.CACHE_BREAKER_RESET_SECONDS),
+        codec=get_codec(settings.CACHE_CODEC),
+        compress_min_bytes=settings.CACHE_COMPRESS_MIN_BYTES,
+    )
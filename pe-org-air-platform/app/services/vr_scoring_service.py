@@ -119,9 +119,9 @@ class VRScoringService:
         s3 = get_s3_service()
         prefix = f"signals/jobs/{ticker}/"
         try:
-            keys = s3.list_files(prefix)
-            for key in sorted(keys, reverse=True):
-                raw = s3.get_file(key)
+            for obj in s3.iter_newest(prefix):
+                key = obj.key
+                raw = s3.get_file(key, obj.etag)
                 if raw is None:
                     continue
                 data = json.loads(raw)
@@ -0,0 +1,235 @@
+"""
+Batch Scoring Kernel Tests - PE Org-AI-R Platform
+tests/test_batch_kernel.py
+
+Pins the vectorized kernels (and the scalar calculators that now wrap
+them) to the original Decimal implementations, reproduced below as
+reference functions, at the quantized precision of each output.
+"""
+import math
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.scoring.batch_kernel import quantize
+from app.scoring.batch_scoring import DIMENSIONS, SECTORS, encode_sectors, score_batch
+from app.scoring.confidence_calculator import ConfidenceCalculator
+from app.scoring.hr_calculator import HRCalculator
+from app.scoring.orgair_calculator import OrgAIRCalculator
+from app.scoring.position_factor import PositionFactorCalculator
+from app.scoring.synergy_calculator import SynergyCalculator
+from app.scoring.vr_calculator import _DIM_WEIGHTS, VRCalculator
+
+Q2, Q4 = Decimal("0.01"), Decimal("0.0001")
+
+
+def _clamp(v, lo=Decimal("0"), hi=Decimal("100")):
+    return max(lo, min(hi, v))
+
+
+# ---------------------------------------------------------------------------
+# Reference Decimal implementations (pre-kernel calculator code)
+# ---------------------------------------------------------------------------
+
+def ref_vr(dimension_scores, talent_concentration):
+    tc = Decimal(str(round(talent_concentration, 4)))
+    weighted_sum = total_weight = Decimal("0")
+    values, weights = [], []
+    for dim, score in dimension_scores.items():
+        w = _DIM_WEIGHTS.get(dim, Decimal("0"))
+        if w == 0:
+            continue
+        d = Decimal(str(float(score)))
+        weighted_sum += d * w
+        total_weight += w
+        values.append(d)
+        weights.append(w)
+    weighted_dim = (weighted_sum / total_weight) if total_weight > 0 else Decimal("50")
+    adj = _clamp(Decimal("1") - Decimal("0.15") * max(Decimal("0"), tc - Decimal("0.25")), Decimal("0"), Decimal("1"))
+    if total_weight == 0:
+        std = Decimal("0")
+    else:
+        variance = sum(w * (v - weighted_dim) ** 2 for v, w in zip(values, weights)) / total_weight
+        std = Decimal(str(float(variance) ** 0.5)).quantize(Q4, rounding=ROUND_HALF_UP)
+    cv = (std / weighted_dim).quantize(Q4, rounding=ROUND_HALF_UP) if weighted_dim > 0 else Decimal("0")
+    cvp = _clamp(Decimal("1") - Decimal("0.25") * cv, Decimal("0"), Decimal("1"))
+    vr = _clamp((weighted_dim * adj * cvp).quantize(Q2))
+    return vr, weighted_dim.quantize(Q2), adj.quantize(Q4), cvp.quantize(Q4)
+
+
+def ref_pf(vr_score, sector, mcap):
+    sector_avg = PositionFactorCalculator.SECTOR_AVG_VR.get(sector.lower(), 50.0)
+    vr_component = max(-1, min(1, (vr_score - sector_avg) / 50))
+    pf = 0.6 * vr_component + 0.4 * ((mcap - 0.5) * 2)
+    return Decimal(str(max(-1, min(1, pf)))).quantize(Q4)
+
+
+def ref_hr(sector, pf):
+    base = Decimal(str(HRCalculator.SECTOR_HR_BASE.get(sector.lower(), 50.0)))
+    hr = base * (Decimal("1") + Decimal("0.15") * Decimal(str(pf)))
+    return max(Decimal("0"), min(Decimal("100"), hr)).quantize(Q2)
+
+
+def ref_synergy(vr, hr, alignment=None, timing=1.0):
+    vr_d, hr_d = Decimal(str(vr)), Decimal(str(hr))
+    tf = _clamp(Decimal(str(timing)), Decimal("0.8"), Decimal("1.2"))
+    if alignment is None:
+        al = Decimal("1") - abs(vr_d - hr_d) / Decimal("100")
+    else:
+        al = _clamp(Decimal(str(alignment)), Decimal("0"), Decimal("1"))
+    syn = _clamp(((vr_d * hr_d / Decimal("100")) * al * tf).quantize(Q2))
+    return syn, al.quantize(Q4), tf.quantize(Q4)
+
+
+def ref_orgair(vr, hr, syn):
+    a, b = Decimal("0.60"), Decimal("0.12")
+    vr_w = a * Decimal(str(vr))
+    hr_w = (Decimal("1") - a) * Decimal(str(hr))
+    base = (Decimal("1") - b) * (vr_w + hr_w)
+    contrib = b * Decimal(str(syn))
+    org = _clamp((base + contrib).quantize(Q2))
+    return org, base.quantize(Q2), contrib.quantize(Q2), vr_w.quantize(Q4), hr_w.quantize(Q4)
+
+
+def ref_ci(score, n):
+    score_d, n_d, r = Decimal(str(score)), Decimal(str(n)), Decimal("0.70")
+    rho = (n_d * r) / (Decimal("1") + (n_d - Decimal("1")) * r)
+    sem = 15.0 * math.sqrt(float(Decimal("1") - rho))
+    margin = Decimal(str(1.96 * sem))
+    lower = _clamp((score_d - margin).quantize(Q2))
+    upper = _clamp((score_d + margin).quantize(Q2))
+    return lower, upper, Decimal(str(sem)).quantize(Q4), rho.quantize(Q4)
+
+
+# ---------------------------------------------------------------------------
+# Strategies
+# ---------------------------------------------------------------------------
+
+score_2dp = st.integers(0, 10_000).map(lambda i: i / 100)
+fraction_4dp = st.integers(0, 10_000).map(lambda i: i / 10_000)
+dims_strategy = st.dictionaries(st.sampled_from(DIMENSIONS), score_2dp, max_size=len(DIMENSIONS))
+sector_strategy = st.sampled_from(list(SECTORS) + ["unknown_sector"])
+
+
+class TestQuantize:
+    """Decimal-compatible rounding on float64."""
+
+    @pytest.mark.parametrize("value,places,expected", [
+        (0.125, 2, 0.12), (0.135, 2, 0.14), (2.675, 2, 2.68), (-0.125, 2, -0.12), (1.00005, 4, 1.0),
+    ])
+    def test_half_even_matches_decimal(self, value, places, expected):
+        assert quantize(value, places) == expected
+        assert float(Decimal(str(value)).quantize(Decimal(10) ** -places)) == expected
+
+    def test_half_up(self):
+        assert quantize([0.125, 0.00005, -0.125], 2, half_up=True).tolist() == [0.13, 0.0, -0.13]
+
+    def test_no_negative_zero(self):
+        assert math.copysign(1.0, float(quantize(-0.00001, 2))) == 1.0
+
+
+class TestScalarParity:
+    """Each calculator (now a kernel wrapper) matches the reference Decimal code exactly."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(dims=dims_strategy, tc=fraction_4dp)
+    def test_vr(self, dims, tc):
+        result = VRCalculator().calculate(dims, tc)
+        vr, wd, adj, cvp = ref_vr(dims, tc)
+        assert (result.vr_score, result.weighted_dim_score, result.talent_risk_adj, result.cv_penalty) == (vr, wd, adj, cvp)
+
+    @settings(max_examples=300, deadline=None)
+    @given(vr=score_2dp, sector=sector_strategy, mcap=st.integers(0, 100).map(lambda i: i / 100))
+    def test_pf_and_hr(self, vr, sector, mcap):
+        pf = PositionFactorCalculator().calculate_position_factor(vr, sector, mcap)
+        assert pf == ref_pf(vr, sector, mcap)
+        assert HRCalculator().calculate(sector, float(pf)).hr_score == ref_hr(sector, float(pf))
+
+    @settings(max_examples=300, deadline=None)
+    @given(
+        vr=score_2dp, hr=score_2dp,
+        alignment=st.none() | fraction_4dp,
+        timing=st.sampled_from([0.7, 0.8, 0.95, 1.0, 1.05, 1.1, 1.2, 1.3]),
+    )
+    def test_synergy_and_orgair(self, vr, hr, alignment, timing):
+        syn = SynergyCalculator().calculate(vr, hr, alignment, timing)
+        assert (syn.synergy_score, syn.alignment, syn.timing_factor) == ref_synergy(vr, hr, alignment, timing)
+
+        org = OrgAIRCalculator().calculate(vr, hr, float(syn.synergy_score))
+        assert (
+            org.org_air_score, org.weighted_base, org.synergy_contribution, org.vr_weighted, org.hr_weighted,
+        ) == ref_orgair(vr, hr, float(syn.synergy_score))
+
+    @settings(max_examples=300, deadline=None)
+    @given(score=score_2dp, n=st.integers(1, 60))
+    def test_confidence(self, score, n):
+        ci = ConfidenceCalculator().calculate(score, n, "vr")
+        assert (ci.ci_lower, ci.ci_upper, ci.sem, ci.reliability) == ref_ci(score, n)
+
+    def test_bounds_serialize_like_reference(self):
+        """Clamped scores keep the bound's own exponent: "100" / "0", not "100.00" / "0.00"."""
+        dims = {d: 100.0 for d in DIMENSIONS}
+        assert str(VRCalculator().calculate(dims, 0.0).vr_score) == str(ref_vr(dims, 0.0)[0]) == "100"
+        assert str(SynergyCalculator().calculate(100.0, 100.0, 1.0, 1.2).synergy_score) == "100"
+        assert str(OrgAIRCalculator().calculate(100.0, 100.0, 100.0).org_air_score) == "100"
+        ci = ConfidenceCalculator().calculate(99.0, 1, "vr")
+        lower, upper, *_ = ref_ci(99.0, 1)
+        assert (str(ci.ci_lower), str(ci.ci_upper)) == (str(lower), str(upper))
+        assert str(ci.ci_upper) == "100"
+        assert str(ConfidenceCalculator().calculate(1.0, 1, "vr").ci_lower) == "0"
+        assert str(HRCalculator().calculate("technology", 1.0).hr_score) == str(ref_hr("technology", 1.0))
+
+    def test_validation_errors_preserved(self):
+        with pytest.raises(ValueError):
+            PositionFactorCalculator().calculate_position_factor(50.0, "technology", 1.5)
+        with pytest.raises(ValueError):
+            HRCalculator().calculate("technology", 1.2)
+        with pytest.raises(ValueError):
+            ConfidenceCalculator().calculate(50.0, 0, "vr")
+
+
+class TestScoreBatch:
+    """One vectorized call reproduces the scalar _compute_orgair chain row by row."""
+
+    @staticmethod
+    def scalar_chain(dims, tc, sector, mcap, timing, n):
+        vr, *_ = ref_vr(dims, tc)
+        pf = ref_pf(float(vr), sector, mcap)
+        hr = ref_hr(sector, float(pf))
+        syn, *_ = ref_synergy(float(vr), float(hr), None, timing)
+        org, *_ = ref_orgair(float(vr), float(hr), float(syn))
+        return {
+            "vr_score": float(vr), "position_factor": float(pf), "hr_score": float(hr),
+            "synergy_score": float(syn), "org_air_score": float(org),
+            **{f"vr_ci_{k}": float(v) for k, v in zip(("lower", "upper"), ref_ci(float(vr), n)[:2])},
+            **{f"hr_ci_{k}": float(v) for k, v in zip(("lower", "upper"), ref_ci(float(hr), n)[:2])},
+            **{f"org_air_ci_{k}": float(v) for k, v in zip(("lower", "upper"), ref_ci(float(org), n)[:2])},
+        }
+
+    @settings(max_examples=40, deadline=None)
+    @given(rows=st.lists(
+        st.tuples(dims_strategy, fraction_4dp, sector_strategy, st.integers(0, 100).map(lambda i: i / 100),
+                  st.sampled_from([0.9, 1.0, 1.05, 1.1]), st.integers(1, 20)),
+        min_size=1, max_size=25,
+    ))
+    def test_rows_match_scalar_chain(self, rows):
+        dims, tc, sectors, mcap, timing, n = zip(*rows)
+        scores = score_batch(list(dims), tc, list(sectors), mcap, timing_factor=timing, evidence_count=n)
+        assert len(scores) == len(rows)
+        for i, row in enumerate(rows):
+            assert scores.row(i) == self.scalar_chain(*row)
+
+    def test_sector_codes_equal_names(self):
+        dims = np.full((3, len(DIMENSIONS)), 70.0)
+        names = ["technology", "Retail", "nowhere"]
+        by_name = score_batch(dims, 0.3, names, 0.6)
+        by_code = score_batch(dims, 0.3, encode_sectors(names), 0.6)
+        np.testing.assert_array_equal(by_name.org_air.org_air_score, by_code.org_air.org_air_score)
+        assert encode_sectors(names)[-1] == -1
+
+    def test_out_of_range_market_cap_rejected(self):
+        with pytest.raises(ValueError):
+            score_batch(np.full((1, len(DIMENSIONS)), 50.0), 0.2, ["technology"], [1.5])
@@ -0,0 +1,115 @@
+"""
+Blocking Work Lanes Tests - PE Org-AI-R Platform
+tests/test_blocking.py
+
+Tests that offloaded endpoints keep their FastAPI contract and that slow
+blocking work no longer stalls other requests on the event loop.
+"""
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI, Query
+
+from app.services.blocking import (
+    IO_LANE,
+    SCORING_LANE,
+    get_executor,
+    offload,
+    run_blocking,
+    run_coroutine_blocking,
+)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/slow")
+    @offload(lane=SCORING_LANE)
+    def slow(seconds: float = Query(default=0.5)):
+        time.sleep(seconds)
+        return {"thread": threading.current_thread().name}
+
+    @app.get("/items/{item_id}")
+    @offload
+    def get_item(item_id: int, q: Optional[str] = None) -> dict:
+        return {"item_id": item_id, "q": q, "thread": threading.current_thread().name}
+
+    return app
+
+
+class TestRunBlocking:
+    """run_blocking / run_coroutine_blocking execute off the loop."""
+
+    def test_runs_on_lane_thread(self):
+        name = asyncio.run(run_blocking(lambda: threading.current_thread().name))
+        assert name.startswith(f"blocking-{IO_LANE}")
+
+    def test_loop_keeps_ticking_while_blocked(self):
+        async def scenario():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(ticker())
+            await run_blocking(time.sleep, 0.3, lane=SCORING_LANE)
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(scenario()) >= 10
+
+    def test_coroutine_runs_on_private_loop(self):
+        async def legacy(x):
+            await asyncio.sleep(0)
+            return x * 2, threading.current_thread().name
+
+        value, name = asyncio.run(run_coroutine_blocking(legacy, 21, lane=SCORING_LANE))
+        assert value == 42
+        assert name.startswith(f"blocking-{SCORING_LANE}")
+
+    def test_lanes_are_separate_pools(self):
+        assert get_executor(IO_LANE) is not get_executor(SCORING_LANE)
+
+
+class TestOffloadEndpoints:
+    """Offloaded handlers parse params as before and do not block each other."""
+
+    def test_params_and_return_are_preserved(self):
+        async def scenario():
+            transport = httpx.ASGITransport(app=build_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/items/7", params={"q": "nvda"})
+
+        resp = asyncio.run(scenario())
+        assert resp.status_code == 200
+        body = resp.json()
+        assert (body["item_id"], body["q"]) == (7, "nvda")
+        assert body["thread"].startswith(f"blocking-{IO_LANE}")
+
+    def test_validation_still_applies(self):
+        async def scenario():
+            transport = httpx.ASGITransport(app=build_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get("/items/not-a-number")
+
+        assert asyncio.run(scenario()).status_code == 422
+
+    def test_fast_request_not_stalled_by_slow_one(self):
+        async def scenario():
+            transport = httpx.ASGITransport(app=build_app())
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                slow = asyncio.create_task(client.get("/slow", params={"seconds": 0.6}))
+                await asyncio.sleep(0.05)
+                start = time.perf_counter()
+                await client.get("/items/1")
+                fast_latency = time.perf_counter() - start
+                await slow
+                return fast_latency
+
+        assert asyncio.run(scenario()) < 0.3
@@ -0,0 +1,136 @@
+"""
+Bulk Writer Tests - PE Org-AI-R Platform
+tests/test_bulk_writer.py
+
+Set-based upserts: rows for many tickers become one multi-row MERGE per
+table inside one transaction, with row counts reported back.
+"""
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.repositories.bulk import BulkWriter, MergeSpec, dedupe_rows, merge_sql
+from app.repositories.scoring_repository import ScoringRepository
+from app.repositories.signal_repository import SignalRepository
+from app.scoring.evidence_mapper import EvidenceMapper, EvidenceScore, SignalSource
+
+SPEC = MergeSpec(
+    table="SCORING",
+    keys=("ticker",),
+    columns=("tc", "vr"),
+    coalesce=True,
+    on_update={"updated_at": "CURRENT_TIMESTAMP()"},
+    on_insert={"scored_at": "CURRENT_TIMESTAMP()"},
+)
+
+
+class RecordingConnection:
+    """Connection stand-in that records every statement on one cursor."""
+
+    def __init__(self, fail_on=None):
+        self.executed = []
+        self.commits = self.rollbacks = 0
+        self.fail_on = fail_on
+
+    def cursor(self):
+        cur = MagicMock()
+        cur.rowcount = 0
+
+        def execute(sql, params=None):
+            if self.fail_on and self.fail_on in sql:
+                raise RuntimeError("boom")
+            self.executed.append((sql, params))
+            cur.rowcount = sql.count("(%s") if params else 0
+
+        cur.execute.side_effect = execute
+        return cur
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    @property
+    def statements(self):
+        return [sql for sql, _ in self.executed if sql != "BEGIN"]
+
+
+class TestMergeSql:
+    def test_multi_row_values_merge(self):
+        sql, params = merge_sql(SPEC, [{"ticker": "NVDA", "tc": 0.1, "vr": None}, {"ticker": "JPM", "tc": None, "vr": 70.0}])
+        assert "FROM VALUES (%s, %s, %s), (%s, %s, %s)" in sql
+        assert "column1 AS ticker, column2 AS tc, column3 AS vr" in sql
+        assert "ON t.ticker = s.ticker" in sql
+        assert "tc = COALESCE(s.tc, t.tc)" in sql and "updated_at = CURRENT_TIMESTAMP()" in sql
+        assert "INSERT (ticker, tc, vr, scored_at) VALUES (s.ticker, s.tc, s.vr, CURRENT_TIMESTAMP())" in sql
+        assert params == ["NVDA", 0.1, None, "JPM", None, 70.0]
+
+    def test_duplicate_keys_last_wins(self):
+        rows = [{"ticker": "A", "tc": 1}, {"ticker": "B", "tc": 2}, {"ticker": "A", "tc": 3}]
+        assert dedupe_rows(("ticker",), rows) == [{"ticker": "A", "tc": 3}, {"ticker": "B", "tc": 2}]
+
+
+class TestBulkWriter:
+    def test_one_transaction_with_chunking(self):
+        conn = RecordingConnection()
+        with BulkWriter(conn, max_rows=40) as writer:
+            writer.stage(SPEC, [{"ticker": f"T{i}", "tc": i, "vr": i} for i in range(100)])
+        assert conn.executed[0][0] == "BEGIN" and conn.commits == 1
+        assert len(conn.statements) == 3
+        result = writer.result
+        assert (result.rows, result.affected, result.statements) == ({"SCORING": 100}, {"SCORING": 100}, 3)
+
+    def test_failure_rolls_back(self):
+        conn = RecordingConnection(fail_on="MERGE")
+        with pytest.raises(RuntimeError):
+            with BulkWriter(conn) as writer:
+                writer.stage(SPEC, [{"ticker": "A", "tc": 1, "vr": 2}])
+        assert (conn.commits, conn.rollbacks) == (0, 1)
+
+    def test_nothing_staged_issues_no_statements(self):
+        conn = RecordingConnection()
+        with BulkWriter(conn) as writer:
+            writer.stage(SPEC, [])
+        assert conn.executed == [] and writer.result.total_rows == 0
+
+
+class TestRepositories:
+    def test_portfolio_scoring_outputs_in_two_statements(self):
+        mapper = EvidenceMapper()
+        mapping_rows, dimension_rows = [], []
+        for i in range(100):
+            ev = [EvidenceScore(SignalSource.TECHNOLOGY_HIRING, Decimal("70"), Decimal("0.8"), 3)]
+            mapping_rows += mapper.build_mapping_matrix(ev, f"t{i}")
+            dimension_rows += mapper.build_dimension_summary(ev, f"t{i}")
+
+        repo = ScoringRepository.__new__(ScoringRepository)
+        repo.conn = RecordingConnection()
+        result = repo.upsert_scoring_outputs(mapping_rows, dimension_rows)
+
+        assert result.rows == {"signal_dimension_mapping": 900, "evidence_dimension_scores": 700}
+        assert result.statements == 2 and repo.conn.commits == 1
+        sql, params = repo.conn.executed[1]
+        assert sql.startswith("MERGE INTO signal_dimension_mapping") and "UUID_STRING()" in sql
+        assert params[:2] == ["T0", "technology_hiring"]
+
+    def test_signal_summaries_single_merge(self, monkeypatch):
+        invalidated = []
+        monkeypatch.setattr("app.repositories.signal_repository.invalidate_scoring_stages", invalidated.append)
+        repo = SignalRepository.__new__(SignalRepository)
+        repo.conn = RecordingConnection()
+        result = repo.upsert_summaries([
+            {"company_id": "c1", "ticker": "NVDA", "hiring_score": 80.0},
+            {"company_id": "c2", "ticker": "JPM", "leadership_score": 60.0, "digital_score": 50.0},
+        ])
+        assert result.statements == 1 and result.rows == {"company_signal_summaries": 2}
+        sql, params = repo.conn.executed[1]
+        assert "SELECT company_id, COUNT(*) AS n FROM external_signals\n" in sql
+        assert ("WHERE company_id IN (SELECT company_id FROM "
+                "(SELECT column1 AS company_id FROM VALUES (%s), (%s)))") in sql
+        assert sql.count("%s") == len(params)
+        assert "technology_hiring_score = COALESCE(s.technology_hiring_score, t.technology_hiring_score)" in sql
+        assert "0.30 * COALESCE(s.technology_hiring_score" in sql
+        assert params == ["c1", "NVDA", None, 80.0, None, None, "c2", "JPM", 60.0, None, None, 50.0, "c1", "c2"]
+        assert invalidated == ["NVDA", "JPM"]
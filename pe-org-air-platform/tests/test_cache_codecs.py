@@ -0,0 +1,113 @@
+"""
+Cache Codec Tests - PE Org-AI-R Platform
+tests/test_cache_codecs.py
+
+Every codec must round-trip a response model exactly, through both the
+validating and the trusted decoder, and every reader must accept what
+any codec wrote.
+"""
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.cache import cached_response
+from app.services.cache_codecs import CODECS, MSGPACK_AVAILABLE, ZSTD_AVAILABLE, get_codec, schema_tag
+from app.services.tiered_cache import BINARY_PREFIX, CircuitBreaker, TieredCache
+from tests.test_tiered_cache import Clock, FakeBackend, FakeRedis
+
+
+class Info(BaseModel):
+    hit: bool
+    source: str
+
+
+class Company(BaseModel):
+    id: UUID
+    name: str
+    position_factor: float
+    score: Decimal
+    created_at: datetime
+
+
+class CompanyList(BaseModel):
+    items: List[Company]
+    total: int
+    cache: Optional[Info] = None
+
+
+class CompanyListV2(CompanyList):
+    page: int = 1
+
+
+def _companies(n=3):
+    now = datetime(2026, 1, 28, 12, 0, tzinfo=timezone.utc)
+    items = [Company(id=uuid4(), name=f"Company {i}", position_factor=0.1 * i, score=Decimal("71.25"), created_at=now)
+             for i in range(n)]
+    return CompanyList(items=items, total=n, cache=Info(hit=False, source="database"))
+
+
+def _cache(codec, redis_client=None, compress_min_bytes=0):
+    clock = Clock()
+    return TieredCache(
+        FakeBackend(redis_client), l1_ttl_seconds=0, codec=get_codec(codec), compress_min_bytes=compress_min_bytes,
+        breaker=CircuitBreaker(clock=clock), clock=clock,
+    )
+
+
+CODEC_NAMES = ["text", "orjson"] + (["msgpack"] if MSGPACK_AVAILABLE else [])
+
+
+@pytest.mark.parametrize("codec", CODEC_NAMES)
+class TestRoundTrip:
+    def test_validated_and_trusted(self, codec):
+        cache, value = _cache(codec), _companies()
+        cache.set("k", value, 60)
+        assert cache.get("k", CompanyList) == value
+        trusted, tier = cache.get_or_load("k", CompanyList, 60, lambda: pytest.fail("loaded"), trusted=True)
+        assert tier == "redis" and trusted == value.model_dump(mode="json")
+
+    def test_readers_accept_every_format(self, codec):
+        shared, value = FakeRedis(), _companies()
+        _cache(codec, shared).set("k", value, 60)
+        for reader in CODEC_NAMES:
+            assert _cache(reader, shared).get("k", CompanyList) == value
+
+
+class TestBinaryEnvelope:
+    def test_schema_change_is_a_miss(self):
+        shared = FakeRedis()
+        _cache("orjson", shared).set("k", _companies(), 60)
+        assert schema_tag(CompanyList) != schema_tag(CompanyListV2)
+        assert _cache("orjson", shared).get("k", CompanyListV2) is None
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstd codec not available")
+    def test_large_values_are_compressed(self):
+        plain, packed = _cache("orjson"), _cache("orjson", compress_min_bytes=1024)
+        value = _companies(200)
+        plain.set("k", value, 60)
+        packed.set("k", value, 60)
+        raw_plain, raw_packed = plain.backend.client.data["k"], packed.backend.client.data["k"]
+        assert raw_packed.startswith(BINARY_PREFIX) and raw_packed.split(b"|")[5] != b"0"
+        assert len(raw_packed) < len(raw_plain) / 3
+        assert packed.get("k", CompanyList) == value
+
+    def test_unknown_codec_name(self):
+        with pytest.raises(ValueError):
+            get_codec("pickle")
+        assert set(CODECS) == {"text", "orjson", "msgpack"}
+
+
+class TestCachedResponse:
+    def test_body_matches_model_serialisation(self):
+        value = _companies()
+        data = json.loads(value.model_dump_json())
+        info = Info(hit=True, source="l1")
+        response = cached_response(data, cache=info)
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == value.model_copy(update={"cache": info}).model_dump(mode="json")
+        assert data["cache"]["hit"] is False                 # the cached data itself is not modified
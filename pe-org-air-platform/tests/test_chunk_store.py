@@ -0,0 +1,152 @@
+"""
+Chunk Store Tests - PE Org-AI-R Platform
+tests/test_chunk_store.py
+
+Parquet chunk files must read back exactly like the JSON files they
+replace — same chunks, same order, same section filtering — and the JSON
+files must keep working through the same interface.
+"""
+import json
+import threading
+from unittest.mock import MagicMock
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.pipelines.chunk_store import (
+    CHUNK_COLUMNS, ChunkFile, chunks_key, chunks_to_parquet, encode_chunks, json_to_parquet,
+)
+from app.pipelines.chunking import DocumentChunk
+from app.services.s3_cache import S3DiskCache
+from app.services.s3_storage import S3StorageService
+from app.services.scoring_service import ScoringService
+
+BUCKET = "orgair-test"
+
+
+def _chunk(i, section, content=None):
+    return DocumentChunk(
+        document_id="doc-1", chunk_index=i, content=content if content is not None else f"{section} text {i}",
+        section=section, start_char=i * 100, end_char=i * 100 + 99, word_count=3,
+    )
+
+
+# chunk_index restarts per section, and sections may recur
+CHUNKS = [
+    _chunk(0, "item_1"), _chunk(1, "item_1"),
+    _chunk(0, "item_1a"), _chunk(1, "item_1a", content="   "),
+    _chunk(0, None), _chunk(2, "item_1"),
+]
+
+
+def _as_rows(chunks):
+    return [{c: getattr(chunk, c) for c in CHUNK_COLUMNS} for chunk in chunks]
+
+
+class TestRoundTrip:
+    def test_parquet_reads_back_in_file_order(self):
+        f = ChunkFile.open(chunks_to_parquet(CHUNKS))
+        assert f.format == "parquet" and len(f) == 6
+        assert f.read() == _as_rows(CHUNKS)
+        assert f.sections() == ["item_1", "item_1a", None]
+
+    @pytest.mark.parametrize("wrap", [
+        lambda rows: rows,
+        lambda rows: {"document_id": "doc-1", "ticker": "NVDA", "chunks": rows},
+    ])
+    def test_json_conversion_matches_json_reads(self, wrap):
+        data = json.dumps(wrap(_as_rows(CHUNKS))).encode()
+        legacy, converted = ChunkFile.open(data), ChunkFile.open(json_to_parquet(data))
+        assert legacy.format == "json"
+        assert converted.read() == legacy.read()
+        assert converted.file_meta == legacy.file_meta
+        for sections in (["ITEM_1"], ["item_1a", "risk_factors"], [""], ["item_7"], None):
+            assert converted.contents(sections) == legacy.contents(sections)
+
+    def test_single_chunk_json(self):
+        f = ChunkFile.open(json.dumps({"content": "only", "section": "item_1"}).encode())
+        assert f.contents(["item_1"]) == ["only"]
+
+    def test_empty(self):
+        assert ChunkFile.open(chunks_to_parquet([])).read() == []
+        assert ChunkFile.open(None).contents() == []
+
+    def test_reads_local_paths(self, tmp_path):
+        path = tmp_path / "x_chunks.parquet"
+        path.write_bytes(chunks_to_parquet(CHUNKS))
+        assert ChunkFile.open(str(path)).read(["item_1a"], ["chunk_index"]) == [{"chunk_index": 0}, {"chunk_index": 1}]
+
+
+class TestSectionReads:
+    def test_section_filter_decodes_only_matching_row_groups(self):
+        f = ChunkFile.open(chunks_to_parquet(CHUNKS))
+        assert f.contents(["Item_1"]) == ["item_1 text 0", "item_1 text 1", "item_1 text 2"]
+        assert sorted(f._contents) == [0, 3]          # the two item_1 runs
+        assert f.contents() == ["item_1 text 0", "item_1 text 1", "item_1a text 0", "   ",
+                                "None text 0", "item_1 text 2"]
+
+    def test_columns(self):
+        f = ChunkFile.open(chunks_to_parquet(CHUNKS))
+        assert f.read([""], ("section", "content")) == [{"section": None, "content": "None text 0"}]
+
+
+class TestFormats:
+    def test_chunks_key(self):
+        assert chunks_key("sec/chunks/NVDA/10-K/2024-01-01_chunks.json", "parquet") == \
+            "sec/chunks/NVDA/10-K/2024-01-01_chunks.parquet"
+        assert chunks_key("sec/chunks/NVDA/10-K/2024-01-01_chunks.parquet", "json") == \
+            "sec/chunks/NVDA/10-K/2024-01-01_chunks.json"
+        assert chunks_key("sec/chunks/NVDA/10-K/2024-01-01", "parquet").endswith("2024-01-01_chunks.parquet")
+
+    def test_encode_chunks(self):
+        body, content_type = encode_chunks(CHUNKS, "json")
+        assert content_type == "application/json" and ChunkFile.open(body).read() == _as_rows(CHUNKS)
+        with pytest.raises(ValueError):
+            encode_chunks(CHUNKS, "avro")
+
+
+class TestScoringReads:
+    @pytest.fixture
+    def service(self):
+        svc = ScoringService.__new__(ScoringService)
+        svc._local = threading.local()
+        return svc
+
+    @pytest.mark.parametrize("fmt", ["parquet", "json"])
+    def test_parse_chunk_file(self, service, fmt):
+        body, _ = encode_chunks(CHUNKS, fmt)
+        f = service._parse_chunk_file("k", body)
+        assert f.format == fmt and f.contents(["item_1a"]) == ["item_1a text 0", "   "]
+        assert service._load_chunks_from_s3("k") is f
+
+    @pytest.mark.parametrize("body", [None, b"{not json", b"PAR1 truncated"])
+    def test_unreadable_files_are_empty(self, service, body):
+        assert service._parse_chunk_file("k", body).contents() == []
+
+
+class TestMigration:
+    @pytest.fixture
+    def s3(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        with mock_aws():
+            client = boto3.client("s3", region_name="us-east-1")
+            client.create_bucket(Bucket=BUCKET)
+            yield S3StorageService(client, BUCKET, S3DiskCache(str(tmp_path / "s3"), 1024 * 1024))
+
+    def test_migrate_converts_and_repoints(self, s3):
+        from app.scripts.migrate_chunks_parquet import migrate
+
+        key = "sec/chunks/NVDA/10-K/2024-01-01_chunks.json"
+        s3.s3_client.put_object(Bucket=BUCKET, Key=key, Body=json.dumps(_as_rows(CHUNKS)).encode())
+        conn = MagicMock()
+        conn.cursor.return_value.rowcount = 6
+
+        report = migrate(s3, conn, delete_json=True)
+        target = chunks_key(key, "parquet")
+        assert report.converted == [key] and report.rows_repointed == 6 and not report.failed
+        assert ChunkFile.open(s3.get_file(target)).read() == _as_rows(CHUNKS)
+        conn.cursor.return_value.execute.assert_called_with(
+            "UPDATE document_chunks SET s3_key = %s WHERE s3_key = %s", [target, key])
+        assert s3.list_files("sec/chunks/") == [target]
@@ -0,0 +1,92 @@
+"""
+Semantic Chunker Tests - PE Org-AI-R Platform
+tests/test_chunking.py
+
+Word grouping matches the previous word-list chunker, offsets are exact
+slices of the source text, and chunks stream lazily.
+"""
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.pipelines.chunking import SemanticChunker
+from app.scripts.bench_chunking import legacy_chunk_text
+
+SIZES = dict(chunk_size=20, chunk_overlap=5, min_chunk_size=6)
+
+words = st.text(alphabet="abcXYZ.,$%-", min_size=1, max_size=8)
+gaps = st.sampled_from([" ", "  ", "\n", "\n\n", "\t", "   ", "\r\n"])
+
+
+@st.composite
+def documents(draw):
+    tokens = draw(st.lists(words, max_size=120))
+    seps = draw(st.lists(gaps, min_size=len(tokens) + 1, max_size=len(tokens) + 1))
+    return seps[0] + "".join(t + s for t, s in zip(tokens, seps[1:]))
+
+
+class TestParity:
+    """Same chunks as the legacy implementation, with exact offsets."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(text=documents())
+    def test_grouping_matches_legacy(self, text):
+        chunker = SemanticChunker(**SIZES)
+        new = chunker._chunk_text(text, "doc", "item_1")
+        old = legacy_chunk_text(text, **SIZES)
+        if not text.strip():
+            assert new == []
+            return
+        assert [c.content.split() for c in new] == [o["content"].split() for o in old]
+        assert [c.word_count for c in new] == [o["word_count"] for o in old]
+
+    @settings(max_examples=300, deadline=None)
+    @given(text=documents())
+    def test_offsets_are_exact_slices(self, text):
+        for chunk in SemanticChunker(**SIZES).iter_chunks(text, "doc", None):
+            assert text[chunk.start_char:chunk.end_char] == chunk.content
+
+    def test_small_text_is_single_chunk(self):
+        text = "  short\n\ntext  "
+        (chunk,) = SemanticChunker(**SIZES)._chunk_text(text, "doc", None)
+        assert (chunk.content, chunk.start_char, chunk.end_char, chunk.word_count) == (text, 0, len(text), 2)
+
+
+class TestStreaming:
+    """Generator API and document-level indexing."""
+
+    def test_chunks_are_yielded_lazily(self, monkeypatch):
+        from app.pipelines import chunking
+
+        pulled = []
+        word_re = chunking._WORD_RE
+
+        class CountingPattern:
+            def finditer(self, text):
+                for match in word_re.finditer(text):
+                    pulled.append(match)
+                    yield match
+
+        monkeypatch.setattr(chunking, "_WORD_RE", CountingPattern())
+        text = " ".join(f"w{i}" for i in range(100_000))
+        gen = SemanticChunker(chunk_size=50, chunk_overlap=5, min_chunk_size=10).iter_chunks(text, "doc", None)
+        first = next(gen)
+        assert first.word_count == 50 and first.start_char == 0
+        assert first.content.split()[-1] == "w49"
+        assert len(pulled) <= 60  # chunk_size + min_chunk_size lookahead, not the whole text
+
+    def test_document_chunks_indexed_across_sections(self):
+        chunker = SemanticChunker(**SIZES)
+        sections = {"item_1": " ".join(["alpha"] * 50), "item_7": "", "item_1a": " ".join(["beta"] * 30)}
+        chunks = chunker.chunk_document("doc", "ignored", sections)
+        assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+        assert {c.section for c in chunks} == {"item_1", "item_1a"}
+
+    def test_falls_back_to_full_content(self):
+        chunks = SemanticChunker(**SIZES).chunk_document("doc", "body " * 30, {"item_1": "   "})
+        assert chunks and all(c.section is None for c in chunks)
+
+    def test_overlap_not_smaller_than_chunk_still_terminates(self):
+        chunks = SemanticChunker(chunk_size=5, chunk_overlap=5, min_chunk_size=1)._chunk_text(
+            " ".join(["x"] * 40), "doc", None,
+        )
+        assert chunks[-1].end_char == len(" ".join(["x"] * 40))
@@ -0,0 +1,81 @@
+"""
+Company Matcher Tests - PE Org-AI-R Platform
+tests/test_company_matcher.py
+
+The vectorized company filter against is_company_match_fuzzy: identical
+accept/reject decisions per ticker, on exact-threshold scores, for the
+official-name alias path, and inside _postings_from_frame.
+"""
+import math
+
+import pandas as pd
+import pytest
+from rapidfuzz import fuzz
+
+from app.config import COMPANY_NAME_MAPPINGS, get_job_search_names
+from app.pipelines.company_matcher import CompanyNameMatcher, get_company_matcher
+from app.pipelines.job_signals import _postings_from_frame, is_company_match_fuzzy
+from app.pipelines.utils import clean_nan
+
+SCRAPED = [
+    "Caterpillar", "CATERPILLAR INC.", "  caterpillar inc ", "Caterpiller", "Cat Financial",
+    "John Deere", "Deere & Co", "Blue River Tech", "JD Power", "Deer Park Refining",
+    "UnitedHealth Group", "Optum", "OptumRx", "United Healthcare Services", "United Airlines",
+    "JPMorgan Chase & Co.", "J.P. Morgan", "Chase", "Morgan Stanley",
+    "Walmart", "Wal-Mart Stores", "Sam's Club", "Goldman Sachs", "Accenture", "Robert Half",
+    "Staffing Solutions LLC", "", "   ", None, math.nan, "nan", 42,
+]
+
+
+def _legacy(companies, target, ticker, threshold):
+    return [is_company_match_fuzzy(c, target, threshold=threshold, ticker=ticker) for c in companies]
+
+
+class TestParity:
+    @pytest.mark.parametrize("ticker", sorted(COMPANY_NAME_MAPPINGS))
+    @pytest.mark.parametrize("threshold", [60.0, 75.0, 90.0])
+    def test_same_decisions_per_ticker(self, ticker, threshold):
+        companies = SCRAPED + COMPANY_NAME_MAPPINGS[ticker]["aliases"]
+        for target in get_job_search_names(ticker) or [COMPANY_NAME_MAPPINGS[ticker]["search"]]:
+            matcher = CompanyNameMatcher(target, ticker, threshold, workers=2)
+            assert matcher.match_mask(companies).tolist() == _legacy(companies, target, ticker, threshold)
+
+    def test_score_exactly_on_threshold(self):
+        name = "Caterpillar Financial"
+        threshold = max(fuzz.token_sort_ratio(name.lower(), a.lower()) for a in ["caterpillar", "cat"])
+        for t in (threshold, threshold + 1e-9):
+            matcher = CompanyNameMatcher("Caterpillar", "CAT", t)
+            assert matcher.matches(name) == is_company_match_fuzzy(name, "Caterpillar", threshold=t, ticker="CAT")
+
+    def test_official_name_aliases_without_ticker(self):
+        target = COMPANY_NAME_MAPPINGS["DE"]["official"]
+        matcher = CompanyNameMatcher(target, None, 75.0)
+        assert matcher.match_mask(SCRAPED).tolist() == _legacy(SCRAPED, target, None, 75.0)
+        assert matcher.matches("Blue River Technology")
+
+    def test_missing_target_matches_nothing(self):
+        assert not CompanyNameMatcher("", "CAT").match_mask(["Caterpillar"]).any()
+
+    def test_memoized_decisions_and_cached_matcher(self):
+        matcher = get_company_matcher("Walmart", "WMT", 75.0)
+        assert matcher is get_company_matcher("Walmart", "WMT", 75.0)
+        first = matcher.match_mask(["Sam's Club", "Walmart Inc", "Acme"]).tolist()
+        assert matcher.match_mask(["Acme", "Walmart Inc"]).tolist() == [first[2], first[1]]
+
+
+class TestPostingsFromFrame:
+    def test_filters_rows_like_the_row_loop(self):
+        df = pd.DataFrame({
+            "company": SCRAPED,
+            "title": [f"Engineer {i}" for i in range(len(SCRAPED))],
+            "site": "indeed",
+        })
+        postings, raw, filtered = _postings_from_frame(df, "c-cat", "Caterpillar", "CAT")
+        companies = [str(c) if clean_nan(c) else "" for c in df["company"]]
+        expected = [c for c, ok in zip(companies, _legacy(companies, "Caterpillar", "CAT", 75.0)) if ok]
+        assert [p["company_name"] for p in postings] == expected
+        assert raw == len(SCRAPED) and filtered == raw - len(expected)
+
+    def test_frame_without_company_column(self):
+        postings, raw, filtered = _postings_from_frame(pd.DataFrame({"title": ["x", "y"]}), "c", "Caterpillar", "CAT")
+        assert postings == [] and (raw, filtered) == (2, 2)
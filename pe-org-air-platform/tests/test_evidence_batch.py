@@ -0,0 +1,188 @@
+"""
+Evidence Mapper Matrix Tests - PE Org-AI-R Platform
+tests/test_evidence_batch.py
+
+The compiled 9×7 mapping matrix reproduces the original per-item Decimal
+mapper: DimensionScore objects bit-for-bit, and the N-company batch at the
+quantized precision of each output.
+"""
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.scoring.evidence_mapper import (
+    SIGNAL_TO_DIMENSION_MAP, Dimension, DimensionMapping, DimensionScore, EvidenceMapper, EvidenceScore,
+    SignalSource, compile_mapping_matrix,
+)
+
+
+# ---------------------------------------------------------------------------
+# Reference implementation (pre-matrix map_evidence_to_dimensions)
+# ---------------------------------------------------------------------------
+
+def ref_map_evidence_to_dimensions(evidence_scores):
+    dimension_sums = {d: Decimal("0") for d in Dimension}
+    dimension_weights = {d: Decimal("0") for d in Dimension}
+    dimension_sources = {d: [] for d in Dimension}
+    dimension_conf_sum = {d: Decimal("0") for d in Dimension}
+    dimension_conf_count = {d: 0 for d in Dimension}
+    for ev in evidence_scores:
+        mapping = SIGNAL_TO_DIMENSION_MAP.get(ev.source)
+        if not mapping:
+            continue
+        effective_score = ev.raw_score * ev.confidence * mapping.reliability
+
+        def _add(dim, weight):
+            dimension_sums[dim] += effective_score * weight
+            dimension_weights[dim] += weight * ev.confidence * mapping.reliability
+            if ev.source not in dimension_sources[dim]:
+                dimension_sources[dim].append(ev.source)
+            dimension_conf_sum[dim] += ev.confidence
+            dimension_conf_count[dim] += 1
+
+        _add(mapping.primary_dimension, mapping.primary_weight)
+        for dim, weight in mapping.secondary_mappings.items():
+            _add(dim, weight)
+
+    results = {}
+    for dim in Dimension:
+        total_w = dimension_weights[dim]
+        if total_w > 0:
+            score = (dimension_sums[dim] / total_w).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            score = max(Decimal("0"), min(Decimal("100"), score))
+            conf = (dimension_conf_sum[dim] / Decimal(str(dimension_conf_count[dim]))).quantize(
+                Decimal("0.001"), rounding=ROUND_HALF_UP)
+        else:
+            score = Decimal("50.00")
+            conf = Decimal("0.000")
+        results[dim] = DimensionScore(
+            dimension=dim, score=score, contributing_sources=dimension_sources[dim],
+            total_weight=total_w.quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP), confidence=conf,
+        )
+    return results
+
+
+decimals = lambda lo, hi, places: st.decimals(  # noqa: E731
+    min_value=lo, max_value=hi, places=places, allow_nan=False, allow_infinity=False)
+
+evidence_item = st.builds(
+    EvidenceScore,
+    source=st.sampled_from(list(SignalSource)),
+    raw_score=decimals(0, 100, 2),
+    confidence=decimals(0, 1, 3),
+    evidence_count=st.integers(min_value=0, max_value=50),
+)
+evidence_lists = st.lists(evidence_item, max_size=12)
+unique_evidence = st.lists(evidence_item, max_size=9, unique_by=lambda ev: ev.source)
+
+
+@pytest.fixture(scope="module")
+def mapper():
+    return EvidenceMapper()
+
+
+class TestCompiledMatrix:
+    def test_matrix_matches_table(self, mapper):
+        m = mapper.matrix
+        assert m.weights.shape == (9, 7) and m.reliability.shape == (9,)
+        for i, source in enumerate(m.sources):
+            mapping = SIGNAL_TO_DIMENSION_MAP[source]
+            assert m.weights[i, m.dimensions.index(mapping.primary_dimension)] == float(mapping.primary_weight)
+            assert m.reliability[i] == float(mapping.reliability)
+
+    def test_mapping_matrix_rows_unchanged(self, mapper):
+        ev = [EvidenceScore(SignalSource.SEC_ITEM_7, Decimal("61"), Decimal("0.9"), 3)]
+        rows = mapper.build_mapping_matrix(ev, "JPM")
+        assert len(rows) == 9
+        row = next(r for r in rows if r["source"] == "sec_item_7")
+        assert (row["raw_score"], row["evidence_count"], row["leadership_vision"], row["ai_governance"]) == (61.0, 3, 0.5, None)
+
+
+class TestCompatibility:
+    """map_evidence_to_dimensions is unchanged, bit-for-bit."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(evidence=evidence_lists)
+    def test_dimension_scores_identical(self, mapper, evidence):
+        new, old = mapper.map_evidence_to_dimensions(evidence), ref_map_evidence_to_dimensions(evidence)
+        for dim in Dimension:
+            assert new[dim] == old[dim]
+            assert str(new[dim].score) == str(old[dim].score)
+            assert str(new[dim].total_weight) == str(old[dim].total_weight)
+
+    def test_summary_and_coverage_reuse_scores(self, mapper):
+        ev = [EvidenceScore(SignalSource.TECHNOLOGY_HIRING, Decimal("72"), Decimal("0.85"), 10)]
+        dims = mapper.map_evidence_to_dimensions(ev)
+        assert mapper.build_dimension_summary(ev, "JPM", dims) == mapper.build_dimension_summary(ev, "JPM")
+        assert mapper.get_coverage_report(ev, dims) == mapper.get_coverage_report(ev)
+
+
+class TestBatch:
+    """N companies × 9 sources in one pass."""
+
+    @settings(max_examples=100, deadline=None)
+    @given(companies=st.lists(unique_evidence, min_size=1, max_size=8))
+    def test_batch_matches_scalar(self, mapper, companies):
+        batch = mapper.map_batch(companies)
+        assert len(batch) == len(companies)
+        for n, evidence in enumerate(companies):
+            ref = ref_map_evidence_to_dimensions(evidence)
+            for j, dim in enumerate(mapper.matrix.dimensions):
+                assert batch.score[n, j] == pytest.approx(float(ref[dim].score), abs=0.01)
+                assert batch.confidence[n, j] == pytest.approx(float(ref[dim].confidence), abs=0.001)
+                assert batch.total_weight[n, j] == pytest.approx(float(ref[dim].total_weight), abs=0.0001)
+                sources = {mapper.matrix.sources[k] for k in np.flatnonzero(batch.source_mask[n, j])}
+                assert sources == set(ref[dim].contributing_sources)
+                assert batch.source_count[n, j] == len(ref[dim].contributing_sources)
+
+    def test_missing_evidence_defaults(self, mapper):
+        batch = mapper.map_batch([[]])
+        assert batch.score.tolist() == [[50.0] * 7]
+        assert batch.confidence.tolist() == [[0.0] * 7]
+        assert not batch.source_mask.any()
+
+    @settings(max_examples=100, deadline=None)
+    @given(companies=st.lists(evidence_lists, min_size=1, max_size=6))
+    def test_duplicate_sources_match_scalar(self, mapper, companies):
+        """A source listed twice counts twice, as in map_evidence_to_dimensions."""
+        _assert_batch_matches_scalar(mapper, companies)
+
+    def test_duplicate_source_example(self, mapper):
+        ev = [
+            EvidenceScore(SignalSource.SEC_ITEM_1, Decimal("50"), Decimal("0.5"), 1),
+            EvidenceScore(SignalSource.SEC_ITEM_1, Decimal("90"), Decimal("0.9"), 1),
+            EvidenceScore(SignalSource.SEC_ITEM_1, Decimal("10"), Decimal("0"), 1),
+        ]
+        _assert_batch_matches_scalar(mapper, [ev, ev[:1]])
+
+    @settings(max_examples=100, deadline=None)
+    @given(companies=st.lists(evidence_lists, min_size=1, max_size=6))
+    def test_overlapping_rows_match_scalar(self, companies):
+        """A row naming its primary dimension again as a secondary adds two contributions."""
+        mappings = dict(SIGNAL_TO_DIMENSION_MAP)
+        for source in (SignalSource.TECHNOLOGY_HIRING, SignalSource.SEC_ITEM_7):
+            m = mappings[source]
+            mappings[source] = DimensionMapping(
+                source=source, primary_dimension=m.primary_dimension, primary_weight=m.primary_weight,
+                secondary_mappings={**m.secondary_mappings, m.primary_dimension: Decimal("0.25")},
+                reliability=m.reliability,
+            )
+        mapper = EvidenceMapper()
+        mapper.mappings, mapper.matrix = mappings, compile_mapping_matrix(mappings)
+        assert mapper.matrix.multiplicity.max() == 2
+        _assert_batch_matches_scalar(mapper, companies)
+
+
+def _assert_batch_matches_scalar(mapper, companies):
+    batch = mapper.map_batch(companies)
+    for n, evidence in enumerate(companies):
+        ref = mapper.map_evidence_to_dimensions(evidence)
+        for j, dim in enumerate(mapper.matrix.dimensions):
+            assert batch.score[n, j] == pytest.approx(float(ref[dim].score), abs=0.01)
+            assert batch.confidence[n, j] == pytest.approx(float(ref[dim].confidence), abs=0.001)
+            assert batch.total_weight[n, j] == pytest.approx(float(ref[dim].total_weight), abs=0.0001)
+            sources = {mapper.matrix.sources[k] for k in np.flatnonzero(batch.source_mask[n, j])}
+            assert sources == set(ref[dim].contributing_sources)
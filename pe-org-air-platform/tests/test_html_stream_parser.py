@@ -0,0 +1,121 @@
+"""
+Streaming HTML Parser Tests - PE Org-AI-R Platform
+tests/test_html_stream_parser.py
+
+The lxml backend produces the same text, tables and section scan as the
+BeautifulSoup backend (apart from the dropped <ix:header>), in one pass
+over chunked input.
+"""
+import html
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.pipelines.document_parser import DocumentParser
+from app.pipelines.html_stream_parser import parse_html_stream
+
+
+@pytest.fixture(scope="module")
+def soup_parser():
+    return DocumentParser(html_backend="bs4")
+
+
+def soup(parser, content: bytes, filing_type: str = "10-K"):
+    return parser._parse_html_soup(content, filing_type)
+
+
+# ---- random well-formed filings ----------------------------------------
+
+texts = st.text(alphabet="abc XYZ.,$%\n\t•–é&<", max_size=12).map(html.escape)
+
+
+def _node(children):
+    tag = st.sampled_from(["div", "span", "b", "font", "ix:nonNumeric"])
+    return st.tuples(tag, texts, children, texts).map(
+        lambda t: f"<{t[0]}>{t[1]}{''.join(t[2])}</{t[0]}>{t[3]}"
+    )
+
+
+nodes = st.recursive(texts, lambda children: _node(st.lists(children, max_size=4)), max_leaves=25)
+
+
+@st.composite
+def tables(draw):
+    rows = draw(st.lists(st.lists(nodes, min_size=1, max_size=4), max_size=4))
+    body = "".join("<tr>" + "".join(f"<td>{c}</td>" for c in row) + "</tr>" for row in rows)
+    return f"<table>{body}</table>"
+
+
+@st.composite
+def documents(draw):
+    blocks = draw(st.lists(st.one_of(nodes, tables(), st.just("<!-- note -->"),
+                                     st.just("<script>var x = '<p>';</script>")), max_size=8))
+    return f"<html><head><title>t</title><style>p {{}}</style></head><body>{''.join(blocks)}</body></html>"
+
+
+class TestParity:
+    """Same output as DocumentParser._parse_html_soup."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(doc=documents(), feed=st.integers(min_value=1, max_value=64))
+    def test_text_and_tables_match_bs4(self, soup_parser, doc, feed):
+        content = doc.encode("utf-8")
+        chunks = [content[i:i + feed] for i in range(0, len(content), feed)]
+        assert parse_html_stream(chunks, "10-K") == soup(soup_parser, content)
+
+    def test_ix_header_and_scripts_dropped_inline_facts_kept(self, soup_parser):
+        content = (
+            b"<html><body><div style='display:none'><ix:header><ix:hidden>"
+            b"<ix:nonNumeric name='dei:EntityCentralIndexKey'>0000019617</ix:nonNumeric>"
+            b"</ix:hidden></ix:header></div><script>track()</script>"
+            b"<p>Revenue was $<ix:nonFraction name='us-gaap:Revenues'>1,234</ix:nonFraction> million</p>"
+            b"</body></html>"
+        )
+        text, _, _ = parse_html_stream(content, "10-K")
+        assert text == "Revenue was $\n1,234\nmillion"
+        assert soup(soup_parser, content)[0] == "0000019617\n" + text
+
+    def test_nested_tables_keep_document_order(self, soup_parser):
+        content = (b"<table><tr><td>a</td><td><table><tr><td>n1</td></tr><tr><td>n2</td></tr></table>"
+                   b"</td></tr><tr><td>b</td></tr></table>")
+        _, tables, _ = parse_html_stream(content, "10-K")
+        assert [t.table_index for t in tables] == [0, 1]
+        assert tables == soup(soup_parser, content)[1]
+
+    def test_invalid_utf8_and_empty_input(self, soup_parser):
+        content = "<p>café \xff</p>".encode("utf-8").replace(b"\xc3\xbf", b"\xff")
+        assert parse_html_stream(content, "10-K") == soup(soup_parser, content)
+        text, tables, scan = parse_html_stream(b"", "10-K")
+        assert (text, tables, scan.sections(text)) == ("", [], {})
+
+
+# ---- sections ----------------------------------------------------------
+
+class TestSections:
+    """Section headings are collected while streaming."""
+
+    def test_sections_through_full_parse(self, soup_parser):
+        lines = ["Table of Contents", "ITEM 1. BUSINESS 3", "ITEM 1A. RISK FACTORS 9", "ITEM 1B. 20",
+                 "ITEM 7. MANAGEMENT 30", "ITEM 8. 50"]
+        for heading in ["ITEM 1.", "BUSINESS", "ITEM 1A. RISK FACTORS", "ITEM 1B.", "ITEM 7. MANAGEMENT'S", "ITEM 8."]:
+            lines += [heading] + [f"cloud data revenue risk {i}" for i in range(3000)]
+        content = ("<html><body>" + "".join(f"<p>{line}</p>" for line in lines) + "</body></html>").encode()
+        text, tables, scan = parse_html_stream(content, "10-K")
+        assert (text, tables, scan) == soup(soup_parser, content)
+        assert set(scan.sections(text)) == {"business", "risk_factors", "mda"}
+        assert all(span.start_in_toc for span in scan.spans)
+
+
+class TestBackendSelection:
+    """HTML_PARSER_BACKEND / html_backend picks the parser."""
+
+    def test_lxml_backend_parses_document(self):
+        doc = DocumentParser(html_backend="lxml").parse(
+            b"<html><body><p>Hello filing</p></body></html>", "doc-1", "NVDA", "10-K", "2025-01-01", "x.htm",
+        )
+        assert (doc.source_format, doc.text_content, doc.word_count, doc.parse_errors) == ("html", "Hello filing", 2, [])
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            DocumentParser(html_backend="html5lib")
@@ -0,0 +1,213 @@
+"""
+Incremental Scoring Tests - PE Org-AI-R Platform
+tests/test_incremental_scoring.py
+
+Evidence fingerprints decide which sources are re-read and which
+dimensions are rewritten; an incremental run must produce exactly the
+dimension scores of a full run.
+"""
+import json
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.scoring.evidence_mapper import (
+    DIMENSION_SOURCES, SIGNAL_TO_DIMENSION_MAP, Dimension, EvidenceMapper, EvidenceScore, SignalSource,
+    compile_mapping_matrix, dimensions_for_sources,
+)
+from app.services import s3_storage
+from app.services import scoring_service as scoring_module
+from app.services.evidence_fingerprints import CONSTANTS_SOURCE, StoredSource, diff_fingerprints
+from app.services.scoring_cache import ScoringStageCache
+from app.services.scoring_service import ScoringService
+
+TICKER = "NVDA"
+
+
+class TestReverseIndex:
+    def test_matches_compiled_matrix(self):
+        matrix = compile_mapping_matrix(SIGNAL_TO_DIMENSION_MAP)
+        for j, dim in enumerate(matrix.dimensions):
+            mapped = {matrix.sources[i] for i in range(len(matrix.sources)) if matrix.mapped[i, j]}
+            assert set(DIMENSION_SOURCES[dim]) == mapped
+
+    def test_dimensions_for_sources(self):
+        assert dimensions_for_sources([SignalSource.GLASSDOOR_REVIEWS]) == [
+            Dimension.TALENT_SKILLS, Dimension.LEADERSHIP_VISION, Dimension.CULTURE_CHANGE]
+        assert dimensions_for_sources([]) == []
+
+
+class TestDiff:
+    CURRENT = {**{s.value: "a" for s in SignalSource}, CONSTANTS_SOURCE: "c"}
+
+    def _stored(self, **overrides):
+        stored = {k: StoredSource(v) for k, v in self.CURRENT.items()}
+        stored.update({k: StoredSource(v) for k, v in overrides.items()})
+        return stored
+
+    def test_nothing_stored_is_full(self):
+        report = diff_fingerprints(TICKER, {}, self.CURRENT)
+        assert report.full and len(report.stale_dimensions) == 7
+
+    def test_constants_change_is_full(self):
+        assert diff_fingerprints(TICKER, self._stored(**{CONSTANTS_SOURCE: "old"}), self.CURRENT).full
+
+    def test_unchanged(self):
+        report = diff_fingerprints(TICKER, self._stored(), self.CURRENT)
+        assert report.up_to_date and report.to_dict()["stale_dimensions"] == []
+
+    def test_one_source(self):
+        report = diff_fingerprints(TICKER, self._stored(board_composition="old"), self.CURRENT)
+        assert report.changed_sources == [SignalSource.BOARD_COMPOSITION]
+        assert report.stale_dimensions == [Dimension.AI_GOVERNANCE, Dimension.LEADERSHIP_VISION]
+
+
+def _ev(source, score):
+    return EvidenceScore(source=source, raw_score=Decimal(score), confidence=Decimal("0.800"),
+                         evidence_count=2, metadata={"word_count": 4000, "rubric_level": "x"})
+
+
+class FakeScoringRepo:
+    """Keeps what the service writes, keyed like the Snowflake MERGEs."""
+
+    def __init__(self):
+        self.mapping, self.dimensions, self.fingerprints = {}, {}, {}
+        self.writes = []
+
+    def upsert_scoring_outputs(self, mapping_rows, dimension_rows):
+        self.writes.append(([r["source"] for r in mapping_rows], [r["dimension"] for r in dimension_rows]))
+        self.mapping.update({(r["ticker"], r["source"]): r for r in mapping_rows})
+        self.dimensions.update({(r["ticker"], r["dimension"]): r for r in dimension_rows})
+        return SimpleNamespace(total_rows=len(mapping_rows) + len(dimension_rows), statements=2, seconds=0.0)
+
+    def get_evidence_fingerprints(self, ticker):
+        return {s: dict(row) for (t, s), row in self.fingerprints.items() if t == ticker}
+
+    def upsert_evidence_fingerprints(self, rows):
+        for r in rows:
+            self.fingerprints[(r["ticker"], r["source"])] = {"fingerprint": r["fingerprint"], "evidence": r.get("evidence")}
+        return len(rows)
+
+
+class TestIncrementalScoring:
+    @pytest.fixture
+    def svc(self, monkeypatch):
+        cache = ScoringStageCache(redis_getter=lambda: None)
+        monkeypatch.setattr(scoring_module, "get_scoring_stage_cache", lambda: cache)
+
+        svc = ScoringService.__new__(ScoringService)
+        svc._local = threading.local()
+        svc.mapper = EvidenceMapper()
+        svc.scoring_repo = FakeScoringRepo()
+        svc.company_repo = SimpleNamespace(get_by_ticker=lambda t: {"id": "c-1"})
+        svc.versions = {**{s.value: "v1" for s in SignalSource}, CONSTANTS_SOURCE: "k1"}
+        svc.evidence = {s: _ev(s, "60") for s in SignalSource}
+        svc.calls = []
+
+        def fetcher(name, sources):
+            def fetch(*args):
+                svc.calls.append(name)
+                found = [svc.evidence[s] for s in sources if svc.evidence.get(s)]
+                return found if len(sources) > 1 else (found[0] if found else None)
+            return fetch
+
+        svc._sec_stage_inputs = lambda ticker: {}
+        svc._source_fingerprints = lambda ticker, company_id, sec_inputs: dict(svc.versions)
+        svc._fetch_cs2_signals = fetcher("cs2", scoring_module.CS2_SOURCES)
+        sec = fetcher("sec", scoring_module.SEC_SOURCES)
+        svc._score_sec_sections_cached = lambda ticker, inputs=None: (sec(), {})
+        svc._fetch_board_governance = fetcher("board", [SignalSource.BOARD_COMPOSITION])
+        svc._fetch_culture_signal = fetcher("culture", [SignalSource.GLASSDOOR_REVIEWS])
+        return svc
+
+    def _stored_dimensions(self, svc):
+        return {dim: row["score"] for (_, dim), row in svc.scoring_repo.dimensions.items()}
+
+    def test_first_run_is_full(self, svc):
+        result = svc.score_company(TICKER)
+        assert sorted(svc.calls) == ["board", "cs2", "culture", "sec"]
+        assert result["persisted"] and result["staleness"]["full"]
+        mapping, dims = svc.scoring_repo.writes[0]
+        assert len(mapping) == 9 and len(dims) == 7
+        assert len(svc.scoring_repo.fingerprints) == 10
+
+    def test_unchanged_run_reads_and_writes_nothing(self, svc):
+        first = svc.score_company(TICKER)
+        svc.calls.clear()
+        second = svc.score_company(TICKER)
+        assert svc.calls == [] and len(svc.scoring_repo.writes) == 1
+        assert second["staleness"]["up_to_date"] and second["persisted"]
+        assert second["dimension_scores"] == first["dimension_scores"]
+
+    def test_changed_source_rewrites_only_its_dimensions(self, svc):
+        svc.score_company(TICKER)
+        svc.calls.clear()
+        svc.versions[SignalSource.GLASSDOOR_REVIEWS.value] = "v2"
+        svc.evidence[SignalSource.GLASSDOOR_REVIEWS] = _ev(SignalSource.GLASSDOOR_REVIEWS, "95")
+
+        assert svc.check_staleness(TICKER).stale_dimensions == [
+            Dimension.TALENT_SKILLS, Dimension.LEADERSHIP_VISION, Dimension.CULTURE_CHANGE]
+        result = svc.score_company(TICKER)
+        assert svc.calls == ["culture"]
+        assert svc.scoring_repo.writes[-1] == (
+            ["glassdoor_reviews"], ["talent_skills", "leadership_vision", "culture_change"])
+
+        incremental = self._stored_dimensions(svc)
+        svc.score_company(TICKER, force=True)
+        assert self._stored_dimensions(svc) == incremental
+        assert {r["dimension"]: r["score"] for r in result["dimension_scores"]} == incremental
+
+    def test_source_that_disappears(self, svc):
+        svc.score_company(TICKER)
+        svc.versions[SignalSource.BOARD_COMPOSITION.value] = "gone"
+        svc.evidence[SignalSource.BOARD_COMPOSITION] = None
+        result = svc.score_company(TICKER)
+        assert result["evidence_sources"]["board_composition"] is False
+        assert svc.scoring_repo.fingerprints[(TICKER, "board_composition")]["evidence"] is None
+        svc.calls.clear()
+        assert svc.score_company(TICKER)["evidence_sources"]["total"] == 8 and svc.calls == []
+
+    def test_failed_read_is_retried_next_run(self, svc, monkeypatch):
+        """A source whose fetch raised is scored without evidence but not fingerprinted."""
+        class FlakyS3:
+            calls = 0
+
+            def get_latest(self, prefix):
+                FlakyS3.calls += 1
+                if FlakyS3.calls == 1:
+                    raise ConnectionError("S3 timeout")
+                return prefix + "latest.json", json.dumps({"governance_score": 80, "confidence": 0.9}).encode()
+
+        monkeypatch.setattr(s3_storage, "get_s3_service", FlakyS3)
+        del svc._fetch_board_governance                    # the real fetcher, on the flaky S3
+
+        first = svc.score_company(TICKER)
+        assert first["fetch_errors"] == ["board_composition"]
+        assert first["evidence_sources"]["board_composition"] is False
+        assert (TICKER, "board_composition") not in svc.scoring_repo.fingerprints
+        assert len(svc.scoring_repo.fingerprints) == 9
+
+        svc.calls.clear()
+        second = svc.score_company(TICKER)
+        assert second["staleness"]["changed_sources"] == ["board_composition"] and svc.calls == []
+        assert second["fetch_errors"] == [] and second["evidence_sources"]["board_composition"] is True
+        assert svc.scoring_repo.fingerprints[(TICKER, "board_composition")]["evidence"]["raw_score"] == "80.0"
+        assert svc.score_company(TICKER)["staleness"]["up_to_date"]
+
+    def test_failed_chunk_download_not_memoized(self, monkeypatch):
+        class DownS3:
+            def get_file(self, key, etag=None):
+                raise ConnectionError("S3 timeout")
+
+        cache = ScoringStageCache(redis_getter=lambda: None)
+        monkeypatch.setattr(scoring_module, "get_scoring_stage_cache", lambda: cache)
+        monkeypatch.setattr(s3_storage, "get_s3_service", DownS3)
+        svc = ScoringService.__new__(ScoringService)
+        svc._local = threading.local()
+        svc._fetch_and_score_sec_sections = lambda ticker: (svc._load_chunks_from_s3("k.parquet"), ([], {}))[1]
+
+        assert svc._score_sec_sections_cached(TICKER, {"chunks": []}) == ([], {})
+        assert svc._fetch_errors == set(scoring_module.SEC_SOURCES)
+        assert cache.stats()["writes"] == 0
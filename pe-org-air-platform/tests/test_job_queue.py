@@ -0,0 +1,333 @@
+"""
+Job Queue Tests - PE Org-AI-R Platform
+tests/test_job_queue.py
+
+Durable jobs on both stores (Redis and SQLite): concurrent items,
+checkpoint-based resume after a lost worker, cancellation, shutdown
+hand-off and progress events; plus the per-host rate limiters.
+"""
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.services.job_queue import (
+    JOB_CANCELLED, JOB_COMPLETED, JOB_COMPLETED_WITH_ERRORS, JOB_QUEUED,
+    JobWorker, RedisJobStore, SQLiteJobStore, enqueue_job, job_results,
+)
+from app.services.rate_limiter import HostLimiter, TokenBucket
+
+TICKERS = ["CAT", "DE", "UNH", "HCA", "ADP", "PAYX"]
+
+
+class FakeRedis:
+    """The subset of redis-py the job store uses (no TTLs); its Lua scripts run as Python."""
+
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        run = LUA_SCRIPTS[script]
+        return lambda keys=(), args=(): run(self, list(keys), list(args))
+
+    def set(self, key, value, ex=None, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def delete(self, *keys):
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def expire(self, key, seconds):
+        return key in self.data
+
+    pexpire = expire
+
+    def sadd(self, key, member):
+        self.data.setdefault(key, set()).add(member)
+
+    def srem(self, key, member):
+        self.data.get(key, set()).discard(member)
+
+    def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+
+    def zrem(self, key, member):
+        self.data.get(key, {}).pop(member, None)
+
+    def zrevrange(self, key, start, end):
+        return [m for m, _ in sorted(self.data.get(key, {}).items(), key=lambda kv: -kv[1])]
+
+    def hset(self, key, field, value):
+        self.data.setdefault(key, {})[field] = value
+
+    def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    def rpush(self, key, value):
+        self.data.setdefault(key, []).append(value)
+        return len(self.data[key])
+
+    def lrange(self, key, start, end):
+        return self.data.get(key, [])[start:]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client, self.calls = client, []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.client, name)(*args, **kwargs) for name, args, kwargs in self.calls]
+
+
+def _fenced(write):
+    """A RedisJobStore script: `write` runs only while ARGV[1] holds the lease (KEYS[1])."""
+    return lambda r, keys, args: int(r.get(keys[0]) == args[0] and (write(r, keys, args) or 1))
+
+
+def _save_script(r, keys, args):
+    lease, job, *others, active = keys
+    r.set(job, args[1])
+    if args[2] != "":
+        r.srem(active, args[3])
+
+
+LUA_SCRIPTS = {
+    RedisJobStore.RENEW_SCRIPT: _fenced(lambda r, keys, args: None),
+    RedisJobStore.RELEASE_SCRIPT: _fenced(lambda r, keys, args: r.delete(keys[0])),
+    RedisJobStore.SAVE_SCRIPT: _fenced(_save_script),
+    RedisJobStore.CHECKPOINT_SCRIPT: _fenced(lambda r, keys, args: r.hset(keys[1], args[1], args[2])),
+}
+
+
+@pytest.fixture(params=["redis", "sqlite"])
+def store(request):
+    if request.param == "redis":
+        return RedisJobStore(FakeRedis())
+    return SQLiteJobStore(":memory:")
+
+
+class Recorder:
+    """Job handler that records calls and peak concurrency."""
+
+    def __init__(self, delay=0.02, fail=()):
+        self.calls, self.active, self.peak = [], 0, 0
+        self.delay, self.fail = delay, set(fail)
+        self.lock = threading.Lock()
+        self.on_call = None
+
+    def __call__(self, item, params):
+        with self.lock:
+            self.calls.append(item)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        if self.on_call:
+            self.on_call(item)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        if item in self.fail:
+            raise RuntimeError(f"{item} exploded")
+        return {"ticker": item, "status": "success", "params": params}
+
+
+def _worker(store, handler, concurrency=3, worker_id="w1"):
+    return JobWorker(store, concurrency=concurrency, lease_seconds=30, poll_seconds=0.01,
+                     worker_id=worker_id, handlers={"test": handler})
+
+
+class TestRun:
+    def test_items_run_concurrently_and_in_order(self, store):
+        handler = Recorder()
+        job = enqueue_job("test", TICKERS, params={"force": True}, store=store)
+        assert _worker(store, handler).run_next()
+
+        done = store.get(job["job_id"])
+        assert done["status"] == JOB_COMPLETED and done["progress"]["completed"] == 6
+        assert 1 < handler.peak <= 3
+        results = job_results(done, store.checkpoints(job["job_id"]))
+        assert [r["ticker"] for r in results] == TICKERS and results[0]["params"] == {"force": True}
+
+        events = store.events(job["job_id"])
+        assert [e["type"] for e in (events[0], events[1], events[-1])] == ["queued", "started", "finished"]
+        assert sum(e["type"] == "item_finished" for e in events) == 6
+        assert [e["seq"] for e in store.events(job["job_id"], after=events[-2]["seq"])] == [events[-1]["seq"]]
+        assert store.claim("w2", 30) is None
+
+    def test_failures_are_isolated(self, store):
+        job = enqueue_job("test", TICKERS, store=store)
+        _worker(store, Recorder(fail={"DE"})).run_next()
+        assert store.get(job["job_id"])["status"] == JOB_COMPLETED_WITH_ERRORS
+        assert store.checkpoints(job["job_id"])["DE"] == {"status": "failed", "error": "DE exploded"}
+
+    def test_empty_job_is_complete_at_once(self, store):
+        job = enqueue_job("test", [], store=store)
+        assert job["status"] == JOB_COMPLETED and store.claim("w1", 30) is None
+
+
+class TestResume:
+    def test_lost_worker_is_resumed_from_checkpoints(self, store):
+        job = enqueue_job("test", TICKERS, store=store)
+        claimed = store.claim("dead-worker", 30)
+        store.save_checkpoint(job["job_id"], "CAT", {"ticker": "CAT", "status": "success"})
+        store.save_checkpoint(job["job_id"], "DE", {"ticker": "DE", "status": "success"})
+        assert claimed["job_id"] == job["job_id"] and store.claim("w1", 30) is None   # lease held
+
+        store.release(job["job_id"], "dead-worker")                                    # lease lapses
+        handler = Recorder()
+        assert _worker(store, handler).run_next()
+        assert sorted(handler.calls) == sorted(TICKERS[2:])
+        done = store.get(job["job_id"])
+        assert done["status"] == JOB_COMPLETED and done["attempts"] == 1
+        assert [r["ticker"] for r in job_results(done, store.checkpoints(job["job_id"]))] == TICKERS
+
+    def test_sqlite_lease_expires(self):
+        clock = [1000.0]
+        store = SQLiteJobStore(":memory:", clock=lambda: clock[0])
+        job = enqueue_job("test", TICKERS, store=store)
+        assert store.claim("dead-worker", 30)["job_id"] == job["job_id"]
+        clock[0] += 29
+        assert store.claim("w1", 30) is None
+        clock[0] += 2
+        assert store.claim("w1", 30)["job_id"] == job["job_id"]
+        assert not store.renew(job["job_id"], "dead-worker", 30)
+
+    def test_lapsed_worker_leaves_the_new_owner_result(self, store):
+        job = enqueue_job("test", TICKERS, store=store)
+        job_id = job["job_id"]
+        successor = Recorder(delay=0)
+        slow = Recorder(delay=0.05)
+
+        def lapse_and_take_over(item):
+            if item != "CAT":
+                return
+            # w1's lease lapses mid-item; w2 claims the job and finishes it
+            if isinstance(store, RedisJobStore):
+                store.client.delete(f"jobs:{job_id}:lease")
+            else:
+                store._execute("UPDATE jobs SET lease_expires = 0 WHERE job_id = ?", (job_id,))
+            assert _worker(store, successor, worker_id="w2").run_next()
+
+        slow.on_call = lapse_and_take_over
+        first = _worker(store, slow, concurrency=1)
+        assert first.run_job(store.claim(first.worker_id, 30)) == JOB_QUEUED
+        assert slow.calls == ["CAT"]
+        assert sorted(successor.calls) == sorted(TICKERS)
+
+        done = store.get(job_id)
+        assert done["status"] == JOB_COMPLETED and done["progress"]["completed"] == 6
+        assert store.claim("w3", 30) is None
+        assert not store.renew(job_id, "w1", 30)
+        assert not store.save_checkpoint(job_id, "CAT", {"status": "failed"}, "w1")
+        assert store.checkpoints(job_id)["CAT"]["status"] == "success"
+
+    def test_stopping_worker_hands_the_job_back(self, store):
+        job = enqueue_job("test", TICKERS, store=store)
+        handler = Recorder()
+        worker = _worker(store, handler, concurrency=1)
+        handler.on_call = lambda item: worker._stop.set() if item == "DE" else None
+        assert worker.run_job(store.claim(worker.worker_id, 30)) == JOB_QUEUED
+        assert handler.calls == ["CAT", "DE"]                              # DE in flight finished
+        assert store.get(job["job_id"])["status"] == JOB_QUEUED
+
+        _worker(store, handler, worker_id="w2").run_next()
+        assert sorted(handler.calls[2:]) == sorted(TICKERS[2:])
+        assert store.get(job["job_id"])["status"] == JOB_COMPLETED
+
+
+class TestCancel:
+    def test_cancel_stops_new_items(self, store):
+        job = enqueue_job("test", TICKERS, store=store)
+        handler = Recorder()
+        handler.on_call = lambda item: store.request_cancel(job["job_id"]) if item == "DE" else None
+        _worker(store, handler, concurrency=1).run_next()
+
+        done = store.get(job["job_id"])
+        assert done["status"] == JOB_CANCELLED and done["cancel_requested"]
+        checkpoints = store.checkpoints(job["job_id"])
+        assert [checkpoints[t]["status"] for t in TICKERS] == ["success", "success"] + ["cancelled"] * 4
+        assert [r["ticker"] for r in job_results(done, checkpoints, key="ticker")] == TICKERS
+
+    def test_backfill_status_after_cancel(self, monkeypatch):
+        """GET /evidence/backfill/tasks/{id} lists cancelled and failed companies by ticker."""
+        from app.routers import evidence
+        from app.services.evidence_backfill import BACKFILL_JOB
+
+        store = SQLiteJobStore(":memory:")
+        monkeypatch.setattr(evidence, "get_job_store", lambda: store)
+        job = enqueue_job(BACKFILL_JOB, TICKERS, params={"skipped": [], "skip_recent_hours": 24}, store=store)
+        handler = Recorder(fail={"CAT"})
+        handler.on_call = lambda item: store.request_cancel(job["job_id"])
+        worker = JobWorker(store, concurrency=1, lease_seconds=30, poll_seconds=0.01,
+                           handlers={BACKFILL_JOB: handler})
+        assert worker.run_next()
+
+        from app.main import app
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.get(f"/api/v1/evidence/backfill/tasks/{job['job_id']}")
+
+        resp = asyncio.run(scenario())
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == JOB_CANCELLED
+        assert [(r["ticker"], r["status"]) for r in body["company_results"]] == (
+            [("CAT", "failed")] + [(t, "cancelled") for t in TICKERS[1:]])
+
+
+class TestHostLimiter:
+    def test_token_bucket(self):
+        clock = [0.0]
+        slept = []
+
+        def sleep(seconds):
+            slept.append(seconds)
+            clock[0] += seconds
+
+        bucket = TokenBucket(rate=10, burst=2, clock=lambda: clock[0], sleep=sleep)
+        assert bucket.acquire() == 0 and bucket.acquire() == 0          # burst
+        assert bucket.try_acquire() == pytest.approx(0.1)
+        assert bucket.acquire() == pytest.approx(0.1) and slept == [pytest.approx(0.1)]
+        clock[0] += 10
+        assert bucket.try_acquire() == 0 and bucket.try_acquire() == 0 and bucket.try_acquire() > 0
+
+    def test_slots_cap_concurrent_work(self):
+        limiter = HostLimiter("jobspy", rate=1000, slots=1)
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def work():
+            with limiter.slot():
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.02)
+                with lock:
+                    active[0] -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        assert peak[0] == 1 and limiter.stats()["slot_waits"] >= 1
@@ -0,0 +1,122 @@
+"""
+Keyword Matcher Tests - PE Org-AI-R Platform
+tests/test_keyword_matcher.py
+
+Parity of the shared multi-keyword matcher with the substring, str.count
+and `\\b` regex logic it replaced, on both backends.
+"""
+import re
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.pipelines.keyword_matcher import AHOCORASICK_AVAILABLE, KeywordMatcher
+from app.pipelines.keywords import (
+    AI_KEYWORDS_CONTEXTUAL,
+    AI_KEYWORDS_STRONG,
+    AI_SKILLS,
+    AI_TECHSTACK_KEYWORDS,
+)
+from app.pipelines.section_analyzer import SectionAnalyzer
+from app.pipelines.signal_pipeline_state import SignalPipelineState
+from app.scoring.rubric_scorer import DIMENSION_RUBRICS, RubricScorer
+
+BACKENDS = ["regex"] + (["ahocorasick"] if AHOCORASICK_AVAILABLE else [])
+
+SAMPLE_10K = (
+    "We use artificial intelligence and machine learning across our platform. "
+    "Our AI-powered, cloud-based software maintains data analytics pipelines; "
+    "ai-driven automation and digital transformation remain priorities. "
+    "Machine learning models (ML/AI) and large language models (LLMs) support the api."
+).lower()
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+class TestOccurrences:
+    """Presence, counts and positions match the original string logic."""
+
+    def test_overlapping_prefixes_are_all_found(self, backend):
+        scan = KeywordMatcher(["ai", "ai/ml", "ml"], backend=backend).scan("ai/ml team")
+        assert scan.positions == {"ai": [0], "ai/ml": [0], "ml": [3]}
+
+    def test_count_is_non_overlapping_like_str_count(self, backend):
+        scan = KeywordMatcher(["aa"], backend=backend).scan("aaaaa")
+        assert scan.positions["aa"] == [0, 1, 2, 3]
+        assert scan.count("aa") == "aaaaa".count("aa") == 2
+
+    def test_ranges_match_slicing(self, backend):
+        title, desc = "ml engineer", "ml ops and ml infra"
+        full = f"{title} {desc}"
+        scan = KeywordMatcher(["ml"], backend=backend).scan(full)
+        assert scan.contains("ml", end=len(title)) == ("ml" in title)
+        assert scan.count("ml", start=len(title) + 1) == desc.count("ml")
+
+    def test_word_boundary_matches_regex(self, backend):
+        keywords = SectionAnalyzer.AI_KEYWORDS + SectionAnalyzer.TECH_KEYWORDS
+        scan = KeywordMatcher(keywords, backend=backend).scan(SAMPLE_10K, word_boundary=True)
+        for kw in keywords:
+            expected = len(re.findall(r"\b" + re.escape(kw) + r"\b", SAMPLE_10K))
+            assert scan.count(kw) == expected, kw
+
+    def test_empty_inputs(self, backend):
+        assert KeywordMatcher([], backend=backend).scan("anything").positions == {}
+        assert KeywordMatcher(["ai"], backend=backend).scan("").positions == {}
+
+    @settings(max_examples=200, deadline=None)
+    @given(
+        text=st.text(alphabet="ab -_", max_size=40),
+        keywords=st.lists(st.text(alphabet="ab -", min_size=1, max_size=4), min_size=1, max_size=6),
+    )
+    def test_random_parity(self, keywords, text):
+        for backend in BACKENDS:
+            matcher = KeywordMatcher(keywords, backend=backend)
+            plain = matcher.scan(text)
+            bounded = matcher.scan(text, word_boundary=True)
+            for kw in keywords:
+                assert (kw in plain) == (kw in text)
+                assert plain.count(kw) == text.count(kw)
+                assert bounded.count(kw) == len(re.findall(r"\b" + re.escape(kw) + r"\b", text))
+
+
+class TestConsumers:
+    """Consumers produce the same results as their per-keyword loops."""
+
+    def test_rubric_matches_substring_loop(self):
+        scorer = RubricScorer()
+        text = SAMPLE_10K + " enterprise data platform with real-time pipelines and mlops"
+        for dim, rubric in DIMENSION_RUBRICS.items():
+            result = scorer.score_dimension(dim, text)
+            expected = [kw for kw in rubric[result.level].keywords if kw in text]
+            assert result.matched_keywords == expected
+
+    def test_section_counts_match_regex_loop(self):
+        analyzer = SectionAnalyzer()
+        expected = {}
+        for kw in analyzer.AI_KEYWORDS + analyzer.TECH_KEYWORDS:
+            n = len(re.findall(r"\b" + re.escape(kw) + r"\b", SAMPLE_10K))
+            if n:
+                expected[kw] = n
+        assert analyzer.count_keywords(SAMPLE_10K) == expected
+
+    def test_job_classification_matches_per_table_passes(self):
+        from app.pipelines.job_signals import step3_classify_ai_jobs
+
+        title = "Senior Data Scientist"
+        desc = "Build machine learning models in PyTorch. Data scientist peers review analytics with data scientists."
+        state = SignalPipelineState(job_postings=[{"title": title, "description": desc}])
+        posting = step3_classify_ai_jobs(state).job_postings[0]
+
+        title_lower, desc_lower = title.lower(), desc.lower()
+        full_text = f"{title_lower} {desc_lower}"
+        expected_kw = [kw for kw in AI_KEYWORDS_STRONG if kw in full_text] + [
+            kw for kw in AI_KEYWORDS_CONTEXTUAL
+            if kw in title_lower or desc_lower.count(kw) >= 2
+        ]
+        assert posting["ai_keywords_found"] == expected_kw
+        assert posting["ai_skills_found"] == [sk for sk in AI_SKILLS if sk in full_text]
+        assert posting["techstack_keywords_found"] == [kw for kw in AI_TECHSTACK_KEYWORDS if kw in full_text]
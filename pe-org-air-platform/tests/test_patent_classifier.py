@@ -0,0 +1,127 @@
+"""
+Patent Classifier Tests - PE Org-AI-R Platform
+tests/test_patent_classifier.py
+
+The single-pass PatentClassifier against the per-patent regex / substring
+logic PatentSignalCollector.classify_patent used to run: identical
+is_ai_related and ai_categories for single patents, batches and pages
+classified as they stream in.
+"""
+import asyncio
+import re
+from datetime import datetime, timezone
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.pipelines.patent_classifier import PatentClassifier
+from app.pipelines.patent_signals import Patent, PatentSignalCollector, get_patent_classifier
+
+PHRASES = sorted(
+    set(PatentSignalCollector.AI_PATENT_KEYWORDS)
+    | {p for ps in PatentSignalCollector.AI_CATEGORY_RULES.values() for p in ps}
+    | {p for ps in PatentSignalCollector.AI_CATEGORY_FALLBACK.values() for p in ps}
+)
+
+
+def legacy_classify(title, abstract):
+    text = f"{title} {abstract}".lower()
+    is_ai = any(
+        re.search(r"\b" + re.escape(kw) + r"\b", text, re.IGNORECASE)
+        for kw in PatentSignalCollector.AI_PATENT_KEYWORDS
+    )
+    categories = []
+    if "neural network" in text or "deep learning" in text:
+        categories.append("deep_learning")
+    if "natural language" in text:
+        categories.append("nlp")
+    cv_phrases = [
+        "computer vision", "image recognition", "image classification",
+        "image segmentation", "image processing", "image analysis",
+        "object detection", "visual recognition", "convolutional neural",
+    ]
+    if any(phrase in text for phrase in cv_phrases):
+        categories.append("computer_vision")
+    if "predictive" in text or "classification algorithm" in text:
+        categories.append("predictive_analytics")
+    if is_ai and not categories:
+        if "reinforcement learning" in text:
+            categories.append("deep_learning")
+        if "machine learning" in text or "artificial intelligence" in text:
+            categories.append("predictive_analytics")
+    return is_ai or len(categories) > 0, sorted(set(categories))
+
+
+def _patent(i, title, abstract):
+    return Patent(str(i), title, abstract, datetime(2024, 1, 1, tzinfo=timezone.utc), None, [], "Acme")
+
+
+CASES = [
+    ("Machine Learning system", "A method for training models."),
+    ("Engine", "Reinforcement learning controller for valves."),
+    ("Engine", "Reinforcement-learning based, no category; deep-learning too."),
+    ("Camera", "Image processing pipeline with object detection."),
+    ("Sensor", "Predictive maintenance of bearings."),
+    ("Sensor", "Unpredictive classification algorithms"),          # substring-only hits
+    ("Sensor", "machine learningbased artificial intelligence_x"), # no whole-word keyword
+    ("NLP", "Natural language processing of claims; neural networks."),
+    ("Gear", "Mechanical gear assembly."),
+    ("", ""),
+    ("Maſchine", "deep learning in Kelvin units"),       # non-ASCII: long s / Kelvin sign
+    ("émachine learning", "artificial intelligenceé"),   # non-ASCII word chars at the edges
+]
+
+
+class TestParity:
+    def test_classify_patent_matches_legacy(self):
+        collector = PatentSignalCollector()
+        for i, (title, abstract) in enumerate(CASES):
+            p = collector.classify_patent(_patent(i, title, abstract))
+            assert (p.is_ai_related, sorted(p.ai_categories)) == legacy_classify(title, abstract), (title, abstract)
+
+    def test_batch_matches_single(self):
+        collector = PatentSignalCollector()
+        batch = collector.classify_patents([_patent(i, t, a) for i, (t, a) in enumerate(CASES)])
+        assert [(p.is_ai_related, sorted(p.ai_categories)) for p in batch] == [legacy_classify(t, a) for t, a in CASES]
+
+    @settings(max_examples=300, deadline=None)
+    @given(st.lists(
+        st.lists(
+            st.one_of(
+                st.sampled_from(PHRASES),
+                st.sampled_from(PHRASES).map(str.upper),
+                st.sampled_from(["a", "the", "-", "_", "s", "ing", "2", "", ".", "ſ", "é"]),
+                st.text(alphabet="abcdeilmnprstv _-", max_size=8),
+            ),
+            max_size=12,
+        ).map("".join),
+        min_size=1, max_size=8,
+    ))
+    def test_random_batches(self, abstracts):
+        patents = get_patent_classifier().classify([_patent(i, "", a) for i, a in enumerate(abstracts)])
+        assert [(p.is_ai_related, sorted(p.ai_categories)) for p in patents] == [legacy_classify("", a) for a in abstracts]
+
+    def test_empty_tables(self):
+        assert PatentClassifier([], {}, {}).classify_texts(["machine learning", ""]) == [(False, []), (False, [])]
+        assert get_patent_classifier().classify_texts([]) == []
+
+
+class TestStream:
+    def test_pages_classified_as_they_arrive(self):
+        collector = PatentSignalCollector()
+        pages = [[_patent(0, *CASES[0])], [_patent(1, *CASES[8]), _patent(2, *CASES[3])]]
+        seen = []
+
+        async def source():
+            for page in pages:
+                seen.append(len(page))
+                yield page
+
+        async def consume():
+            out = []
+            async for page in collector.classify_stream(source()):
+                out.append((len(seen), [p.is_ai_related for p in page]))
+            return out
+
+        # each page comes back classified before the next one is pulled
+        assert asyncio.run(consume()) == [(1, [True]), (2, [False, True])]
@@ -0,0 +1,250 @@
+"""
+PatentsView Client Tests - PE Org-AI-R Platform
+tests/test_patentsview_client.py
+
+The pooled PatentsView client against a local stub of the search API:
+cursor pagination, the shared rate limiter, 429 retries, the on-disk
+response cache, concurrent assignee-name queries with patent_id dedup, and
+the incremental run from the latest stored patents snapshot.
+"""
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
+
+import pytest
+
+from app.pipelines import patent_signals
+from app.pipelines.patent_signals import PatentSignalCollector, run_patent_signals
+from app.pipelines.patentsview_client import PatentsViewClient, PatentsViewResponseCache, date_window
+from app.pipelines.signal_pipeline_state import SignalPipelineState
+from app.services.rate_limiter import HostLimiter
+
+TODAY = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _record(pid, date, org, title="Gear assembly", abstract=""):
+    return {
+        "patent_id": pid, "patent_title": title, "patent_abstract": abstract, "patent_date": date,
+        "patent_type": "utility", "assignees": [{"assignee_organization": org}],
+        "inventors": [{"inventor_first_name": "Ada", "inventor_last_name": "L"}],
+    }
+
+
+RECORDS = [
+    _record("11000005", "2025-06-03", "Acme Corp", "Neural network controller"),
+    _record("11000004", "2025-03-11", "Acme Corp"),
+    _record("11000003", "2025-03-11", "Acme Corp", abstract="machine learning for valves"),
+    _record("11000002", "2024-09-17", "Acme Corp"),
+    _record("11000001", "2023-01-10", "Acme Corp"),
+    _record("11000004", "2025-03-11", "Acme Holdings"),           # same patent under a legacy name
+    _record("11000010", "2024-05-07", "Acme Holdings", "Object detection camera"),
+]
+
+
+class StubPatentsView(BaseHTTPRequestHandler):
+    """Just enough of GET /api/v1/patent/: assignee phrase, patent_date bounds, sort + cursor."""
+
+    server_version = "StubPatentsView/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        params = {k: json.loads(v[0]) for k, v in parse_qs(urlparse(self.path).query).items()}
+        with server.lock:
+            server.calls.append({**params, "api_key": self.headers.get("X-Api-Key")})
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            status = server.fail.pop(0) if server.fail else 200
+        try:
+            time.sleep(server.delay)
+            if status != 200:
+                self._send(status, {"error": True}, {"Retry-After": "0"})
+                return
+            self._send(200, self._search(params))
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _search(self, params):
+        clauses = params["q"]["_and"]
+        org = next(c["_text_phrase"]["assignees.assignee_organization"] for c in clauses if "_text_phrase" in c)
+        lo = next((c["_gte"]["patent_date"] for c in clauses if "_gte" in c), "")
+        hi = next((c["_lte"]["patent_date"] for c in clauses if "_lte" in c), "9999")
+        rows = [r for r in RECORDS
+                if r["assignees"][0]["assignee_organization"] == org and lo <= r["patent_date"] <= hi]
+        rows.sort(key=lambda r: (r["patent_date"], r["patent_id"]), reverse=True)
+        after = params["o"].get("after")
+        if after:
+            rows = [r for r in rows if (r["patent_date"], r["patent_id"]) < tuple(after)]
+        page = rows[:params["o"]["size"]]
+        return {"error": False, "count": len(page), "total_hits": len(rows), "patents": page}
+
+    def _send(self, status, body, headers=None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPatentsView)
+    server.lock = threading.Lock()
+    server.calls, server.fail = [], []
+    server.delay, server.in_flight, server.max_in_flight = 0.0, 0, 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/api/v1/patent/"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(stub, tmp_path=None, page_size=2, rate=1000.0, **kwargs):
+    cache = PatentsViewResponseCache(str(tmp_path), 3600) if tmp_path is not None else None
+    return PatentsViewClient(
+        api_url=stub.url, api_key="k", page_size=page_size, cache=cache,
+        limiter=HostLimiter("patentsview", rate=rate, burst=1), **kwargs,
+    )
+
+
+def _query(org, since="2020-01-01"):
+    return PatentSignalCollector._assignee_query(org, 5, datetime.fromisoformat(since).replace(tzinfo=timezone.utc))
+
+
+async def _collect(client, query, max_results=100):
+    try:
+        return [[r["patent_id"] for r in page]
+                async for page in client.iter_pages(query, patent_signals.PATENT_FIELDS, max_results)]
+    finally:
+        await client.aclose()
+
+
+class TestPagination:
+    def test_cursor_pages_newest_first(self, stub):
+        client = _client(stub)
+        pages = asyncio.run(_collect(client, _query("Acme Corp")))
+        assert pages == [["11000005", "11000004"], ["11000003", "11000002"], ["11000001"]]
+        assert [c["o"] for c in stub.calls] == [
+            {"size": 2}, {"size": 2, "after": ["2025-03-11", "11000004"]}, {"size": 2, "after": ["2024-09-17", "11000002"]},
+        ]
+        assert {c["api_key"] for c in stub.calls} == {"k"}
+
+    def test_max_results_caps_the_last_page(self, stub):
+        pages = asyncio.run(_collect(_client(stub), _query("Acme Corp"), max_results=3))
+        assert pages == [["11000005", "11000004"], ["11000003"]]
+        assert stub.calls[-1]["o"]["size"] == 1
+
+    def test_every_request_takes_a_rate_limit_token(self, stub):
+        client = _client(stub, rate=20.0)
+        start = time.perf_counter()
+        asyncio.run(_collect(client, _query("Acme Corp")))
+        assert client.limiter.stats()["requests"] == 3
+        assert time.perf_counter() - start >= 0.09       # 2 waits of 1/20 s
+
+    def test_retries_429_after_retry_after(self, stub):
+        stub.fail = [429, 503]
+        client = _client(stub, max_retries=2)
+        assert asyncio.run(_collect(client, _query("Acme Corp"), max_results=2)) == [["11000005", "11000004"]]
+        assert (client.requests, client.retries) == (3, 2)
+
+    def test_gives_up_after_max_retries(self, stub):
+        stub.fail = [429, 429]
+        collector = PatentSignalCollector()
+        collector.client = _client(stub, max_retries=1)
+        assert asyncio.run(collector.fetch_patents("Acme Corp")) == []
+
+
+class TestResponseCache:
+    def test_pages_served_from_disk(self, stub, tmp_path):
+        first = asyncio.run(_collect(_client(stub, tmp_path), _query("Acme Corp")))
+        calls = len(stub.calls)
+        client = _client(stub, tmp_path)
+        assert asyncio.run(_collect(client, _query("Acme Corp"))) == first
+        assert len(stub.calls) == calls and client.cache.stats() == {"hits": 3, "misses": 0}
+        assert client.limiter.stats()["requests"] == 0
+        (window,) = tmp_path.iterdir()                      # one date-window directory
+        assert window.name.endswith(f"_{TODAY}")
+
+    def test_new_window_and_stale_pages_refetched(self, stub, tmp_path):
+        asyncio.run(_collect(_client(stub, tmp_path), _query("Acme Corp", since="2025-01-01")))
+        calls = len(stub.calls)
+        asyncio.run(_collect(_client(stub, tmp_path), _query("Acme Corp", since="2025-03-11")))
+        assert len(stub.calls) > calls                      # different date window → different key
+        calls = len(stub.calls)
+        for path in tmp_path.rglob("*.json"):
+            os.utime(path, (0, 0))
+        asyncio.run(_collect(_client(stub, tmp_path), _query("Acme Corp", since="2025-03-11")))
+        assert len(stub.calls) > calls                      # past the TTL
+
+    def test_date_window(self):
+        assert date_window(_query("Acme Corp", since="2025-03-11")) == f"2025-03-11_{TODAY}"
+        assert date_window({"_text_phrase": {"x": "y"}}) == ""
+
+
+class TestCollector:
+    def test_alias_queries_run_concurrently_and_dedup(self, stub):
+        stub.delay = 0.05
+        collector = PatentSignalCollector()
+        collector.client = _client(stub, page_size=10)
+
+        async def pages():
+            try:
+                return [[p.patent_number for p in page]
+                        async for page in collector.iter_patent_pages(["Acme Corp", "Acme Holdings"])]
+            finally:
+                await collector.client.aclose()
+
+        got = asyncio.run(pages())
+        assert stub.max_in_flight == 2
+        ids = [pid for page in got for pid in page]
+        assert sorted(ids) == ["11000001", "11000002", "11000003", "11000004", "11000005", "11000010"]
+
+    def test_incremental_run_fetches_only_newer_patents(self, stub, monkeypatch):
+        class FakeS3:
+            stored = []
+
+            def get_latest(self, prefix):
+                assert prefix == "signals/patents/ACME/"
+                snapshot = {"patents": [{
+                    "patent_number": "11000004", "title": "Gear assembly", "abstract": "",
+                    "filing_date": "2025-03-11 00:00:00+00:00", "grant_date": None,
+                    "inventors": ["Ada L"], "assignee": "Acme Corp",
+                    "is_ai_related": False, "ai_categories": [],
+                }, {
+                    "patent_number": "10000000", "title": "Old neural network", "abstract": "",
+                    "filing_date": "2010-01-01 00:00:00+00:00", "grant_date": None,
+                    "inventors": [], "assignee": "Acme Corp", "is_ai_related": True, "ai_categories": [],
+                }]}
+                return prefix + "20250312_000000.json", json.dumps(snapshot).encode()
+
+            def store_signal_data(self, signal_type, ticker, data):
+                self.stored.append(data)
+
+        client = _client(stub, page_size=10)
+        monkeypatch.setattr(patent_signals, "get_s3_service", FakeS3)
+        monkeypatch.setattr(patent_signals, "get_patentsview_client", lambda: client)
+        state = SignalPipelineState(companies=[{"id": str(uuid4()), "name": "Acme Corp", "ticker": "ACME"}])
+
+        state = asyncio.run(run_patent_signals(state, incremental=True))
+        asyncio.run(client.aclose())
+
+        assert [c["q"]["_and"][1] for c in stub.calls] == [{"_gte": {"patent_date": "2025-03-11"}}]
+        numbers = [p["patent_number"] for p in state.patents]
+        assert numbers == ["11000005", "11000004", "11000003"]     # stored 2010 patent is outside the window
+        assert FakeS3.stored[0]["total_patents"] == 3
+        assert {p["patent_number"]: p["is_ai_related"] for p in state.patents} == {
+            "11000005": True, "11000004": False, "11000003": True,
+        }
@@ -0,0 +1,149 @@
+"""
+Portfolio Executor Tests - PE Org-AI-R Platform
+tests/test_portfolio_executor.py
+
+Tests for bounded parallelism, per-ticker timeouts, failure isolation,
+progress reporting and per-stage timings.
+"""
+import asyncio
+import threading
+import time
+
+from app.services.portfolio_executor import PortfolioExecutor, stage_timer
+
+TICKERS = ["NVDA", "JPM", "WMT", "GE", "DG"]
+
+
+class TestConcurrency:
+    """Wall-clock approaches the slowest ticker, not the sum."""
+
+    def test_tickers_run_in_parallel(self):
+        executor = PortfolioExecutor(max_workers=5, ticker_timeout=10)
+        start = time.perf_counter()
+        run = executor.run(TICKERS, lambda t: time.sleep(0.2) or t)
+        assert time.perf_counter() - start < 0.6
+        assert [o.result for o in run.outcomes] == TICKERS
+
+    def test_max_workers_is_respected(self):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def work(ticker):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return ticker
+
+        run = PortfolioExecutor(max_workers=2, ticker_timeout=10).run(TICKERS, work)
+        assert active["peak"] == 2
+        assert run.max_workers == 2
+        assert all(o.status == "success" for o in run.outcomes)
+
+    def test_max_workers_is_shared_by_concurrent_runs(self):
+        active = {"now": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def work(ticker):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.05)
+            with lock:
+                active["now"] -= 1
+            return ticker
+
+        executor = PortfolioExecutor(max_workers=2, ticker_timeout=10)
+        runs = []
+        threads = [threading.Thread(target=lambda: runs.append(executor.run(TICKERS, work))) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        assert active["peak"] == 2
+        assert len(runs) == 3 and all(o.status == "success" for r in runs for o in r.outcomes)
+        assert executor.threads_in_use == 0
+
+
+class TestIsolation:
+    """One bad ticker never sinks the portfolio."""
+
+    def test_exception_becomes_failed_outcome(self):
+        def work(ticker):
+            if ticker == "GE":
+                raise ValueError("no filings")
+            return ticker
+
+        run = PortfolioExecutor(max_workers=3).run(TICKERS, work)
+        statuses = {o.ticker: o.status for o in run.outcomes}
+        assert statuses["GE"] == "failed"
+        assert sum(s == "success" for s in statuses.values()) == 4
+        assert run.outcomes[3].error == "no filings"
+
+    def test_timed_out_ticker_keeps_its_slot_until_it_returns(self):
+        finished = {}
+
+        def work(ticker):
+            if ticker == "NVDA":
+                time.sleep(0.4)
+            finished[ticker] = time.perf_counter()
+            return ticker
+
+        progress = {}
+        executor = PortfolioExecutor(max_workers=1, ticker_timeout=0.1)
+        run = executor.run(TICKERS, work, lambda o, done, total: progress.setdefault(o.ticker, time.perf_counter()))
+        assert run.outcomes[0].status == "timeout"
+        assert [o.status for o in run.outcomes[1:]] == ["success"] * 4
+        # reported at the timeout, but JPM only ran once NVDA's thread returned
+        assert progress["NVDA"] < finished["NVDA"] <= finished["JPM"]
+        assert executor.threads_in_use == 0
+
+    def test_base_exception_is_not_a_run_failure(self):
+        def work(ticker):
+            if ticker == "GE":
+                raise SystemExit(1)
+            return ticker
+
+        executor = PortfolioExecutor(max_workers=2, ticker_timeout=0.2)
+        run = executor.run(TICKERS, work)
+        statuses = {o.ticker: o.status for o in run.outcomes}
+        assert statuses.pop("GE") == "timeout"
+        assert set(statuses.values()) == {"success"}
+        assert executor.threads_in_use == 0
+
+    def test_failed_results_are_mapped(self):
+        run = PortfolioExecutor().run(["DG"], lambda t: 1 / 0)
+        assert run.results(lambda o: f"failed:{o.ticker}") == ["failed:DG"]
+
+
+class TestProgressAndTimings:
+    """Progress callbacks, async streaming and stage timings."""
+
+    def test_progress_called_per_ticker(self):
+        seen = []
+        PortfolioExecutor(max_workers=2).run(TICKERS, lambda t: t, lambda o, done, total: seen.append((done, total)))
+        assert sorted(seen) == [(i, 5) for i in range(1, 6)]
+
+    def test_stage_timings_are_per_ticker(self):
+        def work(ticker):
+            with stage_timer("sec_rubric"):
+                time.sleep(0.01)
+            return ticker
+
+        run = PortfolioExecutor(max_workers=5).run(TICKERS, work)
+        for outcome in run.outcomes:
+            assert set(outcome.stage_timings) == {"sec_rubric"}
+        assert run.timings["NVDA"]["total"] >= run.timings["NVDA"]["sec_rubric"]
+
+    def test_stage_timer_is_noop_outside_executor(self):
+        with stage_timer("anything"):
+            pass
+
+    def test_astream_yields_every_ticker(self):
+        async def collect():
+            executor = PortfolioExecutor(max_workers=5)
+            return [o.ticker async for o in executor.astream(TICKERS, lambda t: t)]
+
+        assert sorted(asyncio.run(collect())) == sorted(TICKERS)
@@ -81,13 +81,16 @@ class TestRedisCache:
         with patch('app.services.redis_cache.redis.Redis') as mock_redis:
             mock_client = MagicMock()
             mock_client.scan_iter.return_value = ["key:1", "key:2", "key:3"]
+            mock_client.pipeline.return_value.execute.return_value = [3]
             mock_redis.return_value = mock_client
 
             cache = RedisCache()
-            cache.delete_pattern("key:*")
+            assert cache.delete_pattern("key:*") == 3
 
-            mock_client.scan_iter.assert_called_once_with(match="key:*")
-            assert mock_client.delete.call_count == 3
+            # One pipelined UNLINK per SCAN batch instead of a DELETE per key
+            mock_client.scan_iter.assert_called_once_with(match="key:*", count=500)
+            mock_client.pipeline.return_value.unlink.assert_called_once_with("key:1", "key:2", "key:3")
+            mock_client.delete.assert_not_called()
 
 
 class TestCacheSingleton:
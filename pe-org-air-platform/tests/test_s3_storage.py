@@ -0,0 +1,143 @@
+"""
+S3 Storage Tests - PE Org-AI-R Platform
+tests/test_s3_storage.py
+
+Against a moto bucket: listings page past 1000 keys, many keys download
+concurrently, and the on-disk cache serves unchanged objects (no request
+when the ETag is known, a 304 revalidation otherwise) within its size cap.
+"""
+import json
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.scoring.talent_concentration import TalentConcentrationCalculator
+from app.services.s3_cache import S3DiskCache
+from app.services.s3_storage import S3StorageService
+
+BUCKET = "orgair-test"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        c = boto3.client("s3", region_name="us-east-1")
+        c.create_bucket(Bucket=BUCKET)
+        yield c
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return S3DiskCache(str(tmp_path / "s3"), 1024 * 1024)
+
+
+@pytest.fixture
+def svc(client, cache):
+    return S3StorageService(client, BUCKET, cache, max_concurrency=8)
+
+
+def _gets(client):
+    """Record the parameters of every GetObject call made from now on."""
+    calls = []
+    client.meta.events.register("provide-client-params.s3.GetObject", lambda params, **kw: calls.append(dict(params)))
+    return calls
+
+
+class TestListing:
+    def test_paginates_past_1000_keys(self, client, svc):
+        for i in range(1005):
+            client.put_object(Bucket=BUCKET, Key=f"signals/jobs/NVDA/{i:05d}.json", Body=b"{}")
+        assert len(svc.list_files("signals/jobs/NVDA/")) == 1005
+        assert len(svc.list_etags("signals/jobs/NVDA/")) == 1005
+        assert svc.latest_object("signals/jobs/NVDA/").key == "signals/jobs/NVDA/01004.json"
+
+    def test_get_latest(self, client, svc):
+        for ts in ["20250101_000000", "20250301_000000", "20250201_000000"]:
+            client.put_object(Bucket=BUCKET, Key=f"board/JPM/{ts}.json", Body=ts.encode())
+        assert svc.get_latest("board/JPM/") == ("board/JPM/20250301_000000.json", b"20250301_000000")
+        assert svc.get_latest("board/NONE/") == (None, None)
+
+
+class TestCachedReads:
+    def test_known_etag_served_without_request(self, client, svc):
+        client.put_object(Bucket=BUCKET, Key="k.json", Body=b"v1")
+        etag = svc.get_etag("k.json")
+        assert svc.get_file("k.json") == b"v1"
+        calls = _gets(client)
+        assert svc.get_file("k.json", etag) == b"v1"
+        assert calls == []
+
+    def test_revalidation_and_change(self, client, svc, cache):
+        client.put_object(Bucket=BUCKET, Key="k.json", Body=b"v1")
+        assert svc.get_file("k.json") == b"v1"
+        calls = _gets(client)
+        assert svc.get_file("k.json") == b"v1"
+        assert calls[-1]["IfNoneMatch"] == f'"{svc.get_etag("k.json")}"'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        client.put_object(Bucket=BUCKET, Key="k.json", Body=b"v2")
+        assert svc.get_file("k.json") == b"v2"
+        assert svc.get_file("k.json", svc.get_etag("k.json")) == b"v2"
+
+    def test_deleted_object_not_served(self, client, svc):
+        client.put_object(Bucket=BUCKET, Key="k.json", Body=b"v1")
+        svc.get_file("k.json")
+        client.delete_object(Bucket=BUCKET, Key="k.json")
+        assert svc.get_file("k.json") is None
+
+    def test_get_files_concurrent(self, client, svc):
+        keys = [f"sec/chunks/{i}.json" for i in range(40)]
+        for key in keys:
+            client.put_object(Bucket=BUCKET, Key=key, Body=key.encode())
+        bodies = svc.get_files(keys + ["missing.json"])
+        assert bodies == {**{key: key.encode() for key in keys}, "missing.json": None}
+        assert svc.get_files(keys, etags=svc.list_etags("sec/chunks/")) == {key: key.encode() for key in keys}
+
+    def test_download_json(self, client, svc):
+        client.put_object(Bucket=BUCKET, Key="board/NVDA/latest.json", Body=b'{"score": 70}')
+        client.put_object(Bucket=BUCKET, Key="bad.json", Body=b"{not json")
+        assert svc.download_json("board/NVDA/latest.json") == {"score": 70}
+        assert svc.download_json("bad.json") is None and svc.download_json("nope.json") is None
+
+
+class TestDiskCache:
+    def test_lru_eviction_by_size(self, tmp_path):
+        cache = S3DiskCache(str(tmp_path), 250)
+        cache.put("bkt", "a", "e0", b"a" * 100)
+        cache.put("bkt", "b", "e1", b"b" * 100)
+        os.utime(cache._blob_path(cache.lookup("bkt", "a").digest), (2000, 2000))
+        os.utime(cache._blob_path(cache.lookup("bkt", "b").digest), (1000, 1000))   # least recently used
+        cache.put("bkt", "c", "e2", b"c" * 100)
+        assert cache.get("bkt", "b", "e1") is None
+        assert cache.get("bkt", "a", "e0") == b"a" * 100 and cache.get("bkt", "c", "e2") == b"c" * 100
+        assert cache.evictions == 1 and cache.size_bytes == 200
+
+    def test_identical_bodies_share_one_blob(self, tmp_path):
+        cache = S3DiskCache(str(tmp_path), 10_000)
+        cache.put("bkt", "x", "e", b"same")
+        cache.put("bkt", "y", "e", b"same")
+        assert cache.size_bytes == 4
+        assert cache.lookup("bkt", "x").digest == cache.lookup("bkt", "y").digest
+
+    def test_corrupt_blob_discarded(self, tmp_path):
+        cache = S3DiskCache(str(tmp_path), 10_000)
+        cache.put("bkt", "x", "e", b"body")
+        cache._blob_path(cache.lookup("bkt", "x").digest).write_bytes(b"tampered")
+        assert cache.get("bkt", "x", "e") is None
+        assert cache.lookup("bkt", "x") is None
+
+
+class TestCallers:
+    def test_glassdoor_reviews_from_latest_snapshot(self, client, svc):
+        for ts, rating in [("20250101", 2.0), ("20250601", 4.0)]:
+            body = {"reviews": [{"review_id": ts, "rating": rating, "title": "ok"}]}
+            client.put_object(Bucket=BUCKET, Key=f"glassdoor_signals/raw/NVDA/{ts}_raw.json", Body=json.dumps(body))
+        reviews = TalentConcentrationCalculator.load_glassdoor_reviews("nvda", s3_service=svc)
+        assert [(r.review_id, r.rating) for r in reviews] == [("20250601", 4.0)]
+        calls = _gets(client)
+        TalentConcentrationCalculator.load_glassdoor_reviews("NVDA", s3_service=svc)
+        assert [c["Key"] for c in calls] == ["manifests/glassdoor_signals/raw/NVDA/latest.json"]
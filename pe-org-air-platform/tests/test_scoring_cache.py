@@ -0,0 +1,102 @@
+"""
+Scoring Stage Cache Tests - PE Org-AI-R Platform
+tests/test_scoring_cache.py
+
+Tests for content-addressed stage keys, the two-tier (LRU + Redis)
+store and per-ticker generation invalidation.
+"""
+from decimal import Decimal
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+
+from app.services.scoring_cache import (
+    ScoringStageCache,
+    canonicalize,
+    constants_fingerprint,
+    stage_digest,
+)
+
+
+@pytest.fixture
+def redis_client():
+    return fakeredis.FakeRedis()
+
+
+def make_cache(client=None, **kwargs):
+    wrapper = SimpleNamespace(client=client) if client is not None else None
+    return ScoringStageCache(redis_getter=lambda: wrapper, **kwargs)
+
+
+class TestStageDigest:
+    """Stage keys are deterministic hashes of the stage inputs."""
+
+    def test_digest_ignores_dict_and_set_order(self):
+        a = stage_digest("tc_vr", {"etags": {"a": "1", "b": "2"}, "skills": {"pytorch", "spark"}})
+        b = stage_digest("tc_vr", {"skills": {"spark", "pytorch"}, "etags": {"b": "2", "a": "1"}})
+        assert a == b
+
+    def test_digest_changes_with_etag(self):
+        before = stage_digest("sec_rubric", {"etags": {"chunks.json": "abc"}})
+        after = stage_digest("sec_rubric", {"etags": {"chunks.json": "def"}})
+        assert before != after
+
+    def test_digest_is_scoped_by_stage(self):
+        assert stage_digest("dimensions", {"x": 1}) != stage_digest("tc_vr", {"x": 1})
+
+    def test_constants_fingerprint_tracks_weight_changes(self):
+        assert constants_fingerprint({"w": Decimal("0.18")}) != constants_fingerprint({"w": Decimal("0.17")})
+        assert canonicalize(Decimal("0.18")) == "0.18"
+
+
+class TestTwoTierStore:
+    """L1 LRU in front of the shared Redis tier."""
+
+    def test_put_then_get_hits_l1(self):
+        cache = make_cache()
+        cache.put("tc_vr", "nvda", "d1", {"vr_score": 81.2})
+        assert cache.get("tc_vr", "NVDA", "d1") == {"vr_score": 81.2}
+        assert cache.stats()["l1_hits"] == 1
+
+    def test_results_are_not_shared_between_callers(self):
+        cache = make_cache()
+        cache.put("dimensions", "JPM", "d1", {"rows": [1, 2]})
+        first = cache.get("dimensions", "JPM", "d1")
+        first["rows"].append(3)
+        assert cache.get("dimensions", "JPM", "d1") == {"rows": [1, 2]}
+
+    def test_lru_evicts_oldest_entry(self):
+        cache = make_cache(max_entries=2)
+        for digest in ("d1", "d2", "d3"):
+            cache.put("tc_vr", "WMT", digest, {"d": digest})
+        assert cache.get("tc_vr", "WMT", "d1") is None
+        assert cache.get("tc_vr", "WMT", "d3") == {"d": "d3"}
+
+    def test_second_worker_reads_from_redis(self, redis_client):
+        writer = make_cache(redis_client)
+        reader = make_cache(redis_client)
+        writer.put("sec_rubric", "GE", "d1", {"evidence": []})
+        assert reader.get("sec_rubric", "GE", "d1") == {"evidence": []}
+        assert reader.stats()["l2_hits"] == 1
+        assert redis_client.ttl(next(iter(redis_client.scan_iter("scoring:stage:GE:*")))) > 0
+
+
+class TestInvalidation:
+    """Generation bumps drop every stage for a ticker."""
+
+    def test_invalidate_without_redis(self):
+        cache = make_cache()
+        cache.put("tc_vr", "DG", "d1", {"vr_score": 40})
+        cache.put("tc_vr", "NVDA", "d1", {"vr_score": 90})
+        cache.invalidate_ticker("dg")
+        assert cache.get("tc_vr", "DG", "d1") is None
+        assert cache.get("tc_vr", "NVDA", "d1") == {"vr_score": 90}
+
+    def test_invalidation_reaches_other_workers(self, redis_client):
+        a = make_cache(redis_client)
+        b = make_cache(redis_client)
+        a.put("dimensions", "JPM", "d1", {"score": 70})
+        assert b.get("dimensions", "JPM", "d1") is not None  # warms b's L1
+        a.invalidate_ticker("JPM")
+        assert b.get("dimensions", "JPM", "d1") is None
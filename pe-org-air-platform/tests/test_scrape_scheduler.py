@@ -0,0 +1,122 @@
+"""
+Scrape Scheduler Tests - PE Org-AI-R Platform
+tests/test_scrape_scheduler.py
+
+Concurrent jobspy requests under per-site token buckets: per-site
+spacing, back-off on rate-limit errors, and step2_fetch_job_postings
+producing the postings of the sequential loop, in the same order.
+"""
+import asyncio
+import threading
+import time
+from collections import defaultdict
+
+import pandas as pd
+import pytest
+
+from app.config import settings
+from app.pipelines.job_signals import step2_fetch_job_postings
+from app.pipelines.scrape_scheduler import ScrapeRequest, ScrapeScheduler, is_rate_limited
+from app.pipelines.signal_pipeline_state import SignalPipelineState
+
+SITES = ["linkedin", "indeed", "glassdoor"]
+COMPANIES = [
+    {"id": "c-cat", "name": "Caterpillar Inc.", "ticker": "CAT"},
+    {"id": "c-de", "name": "Deere & Company", "ticker": "DE"},          # 2 search names
+    {"id": "c-jpm", "name": "JPMorgan Chase & Co.", "ticker": "JPM"},
+]
+
+
+class FakeJobSpy:
+    """scrape_jobs stand-in: two matching rows and one foreign row per call."""
+
+    def __init__(self, latency=0.05, fail=None):
+        self.latency, self.fail = latency, fail or {}
+        self.calls = defaultdict(list)                   # site -> call start times
+        self.lock = threading.Lock()
+
+    def __call__(self, site_name, search_term, **kwargs):
+        (site,) = site_name
+        with self.lock:
+            self.calls[site].append(time.perf_counter())
+            failures = self.fail.get((site, search_term), [])
+            error = failures.pop(0) if failures else None
+        time.sleep(self.latency)
+        if error:
+            raise error
+        return pd.DataFrame([
+            {"company": search_term, "title": f"ML Engineer {i}", "description": "pytorch", "site": site,
+             "location": "Remote", "job_url": f"https://{site}/{search_term}/{i}", "date_posted": None}
+            for i in range(2)
+        ] + [{"company": "Unrelated Bakery", "title": "Baker", "description": "", "site": site,
+              "location": None, "job_url": None, "date_posted": None}])
+
+
+@pytest.fixture
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(settings, "JOBSPY_REQUEST_DELAY", 0.1)
+    monkeypatch.setattr(settings, "JOBSPY_SITE_REQUEST_DELAYS", {})
+    monkeypatch.setattr(settings, "JOBSPY_SITE_CONCURRENCY", 2)
+
+
+def _fetch(fake, request_delay=0.1):
+    state = SignalPipelineState(request_delay=request_delay, companies=[dict(c) for c in COMPANIES])
+    return asyncio.run(step2_fetch_job_postings(state, sites=SITES, scrape_fn=fake))
+
+
+class TestStep2:
+    def test_postings_in_company_search_site_order(self, fast_settings):
+        state = _fetch(FakeJobSpy())
+        expected_searches = [("c-cat", "Caterpillar"), ("c-de", "John Deere"), ("c-de", "Blue River Technology"),
+                             ("c-jpm", "JPMorgan Chase")]
+        expected = [(cid, f"https://{site}/{name}/{i}") for cid, name in expected_searches for site in SITES
+                    for i in range(2)]
+        assert [(p["company_id"], p["url"]) for p in state.job_postings] == expected
+        assert state.summary["job_postings_collected"] == len(expected)
+
+        sites = state.summary["jobspy_sites"]
+        assert set(sites) == set(SITES)
+        assert all(s["requests"] == 4 and s["rows"] == 12 and s["backoffs"] == 0 for s in sites.values())
+
+    def test_concurrent_but_polite_per_site(self, fast_settings):
+        fake = FakeJobSpy(latency=0.15)
+        start = time.perf_counter()
+        _fetch(fake)
+        elapsed = time.perf_counter() - start
+        # Sequential: 12 calls × (0.1 s delay + 0.15 s scrape) = 3.0 s
+        assert elapsed < 1.5
+        for starts in fake.calls.values():
+            gaps = [b - a for a, b in zip(starts, starts[1:])]
+            assert min(gaps) >= 0.09                     # one request per JOBSPY_REQUEST_DELAY per site
+
+    def test_failed_site_does_not_sink_the_search(self, fast_settings):
+        fake = FakeJobSpy(fail={("indeed", "Caterpillar"): [ValueError("bad html")]})
+        state = _fetch(fake)
+        cat_urls = {p["url"] for p in state.job_postings if p["company_id"] == "c-cat"}
+        assert len(cat_urls) == 4 and not any("indeed" in u for u in cat_urls)
+        assert state.summary["errors"][0]["error"] == "indeed: bad html"
+        assert state.summary["jobspy_sites"]["indeed"]["errors"] == 1
+
+
+class TestBackoff:
+    def test_rate_limited_requests_are_retried(self):
+        fake = FakeJobSpy(latency=0, fail={("linkedin", "Walmart"): [RuntimeError("429 Too Many Requests")] * 2})
+        slept = []
+        scheduler = ScrapeScheduler(["linkedin"], min_interval=0.001, max_retries=2, backoff_seconds=5,
+                                    sleep=slept.append)
+        (result,) = scheduler.run(fake, [ScrapeRequest("c-wmt", "WMT", "Walmart", "linkedin")])
+        assert result.error is None and result.attempts == 3 and len(result.frame) == 3
+        assert slept == [5, 10]
+        assert scheduler.summary()["linkedin"]["backoffs"] == 2
+
+    def test_gives_up_after_max_retries(self):
+        fake = FakeJobSpy(latency=0, fail={("indeed", "Walmart"): [RuntimeError("HTTP 429")] * 3})
+        scheduler = ScrapeScheduler(["indeed"], min_interval=0.001, max_retries=1, sleep=lambda s: None)
+        (result,) = scheduler.run(fake, [ScrapeRequest("c-wmt", "WMT", "Walmart", "indeed")])
+        assert result.error == "HTTP 429" and result.attempts == 2
+        assert scheduler.summary()["indeed"]["errors"] == 1
+
+    def test_rate_limit_detection(self):
+        assert is_rate_limited(RuntimeError("Response 429"))
+        assert is_rate_limited(RuntimeError("blocked by LinkedIn"))
+        assert not is_rate_limited(RuntimeError("4290 rows"))
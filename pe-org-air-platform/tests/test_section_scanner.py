@@ -0,0 +1,119 @@
+"""
+Section Scanner Tests - PE Org-AI-R Platform
+tests/test_section_scanner.py
+
+The single-pass scanner finds the same sections as the per-pattern search
+it replaced, for every filing type, whole or fed in pieces, and flags
+table-of-contents entries.
+"""
+import glob
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from app.pipelines.document_parser import DocumentParser
+from app.pipelines.section_scanner import SectionScanner, scan_sections
+from app.scripts.bench_sections import FILING_TYPES, legacy_extract_sections, load_corpus
+
+HEADINGS = [
+    "ITEM 1. BUSINESS", "Item 1A. Risk Factors", "ITEM 1B.", "ITEM 1C", "Item 2.", "ITEM 2. MANAGEMENT",
+    "ITEM 3", "ITEM 4", "ITEM 7. MANAGEMENT'S", "ITEM 7A", "Item 8.", "ITEM 8.01 OTHER EVENTS", "ITEM 9",
+    "SIGNATURES", "EXHIBIT 99", "Executive Compensation", "DIRECTOR COMPENSATION", "Security Ownership",
+    "CERTAIN RELATIONSHIPS", "EQUITY COMPENSATION", "AUDIT", "AUDITEM 1A RISK FACTORS",
+]
+filler = st.text(alphabet="abc XYZ.\nßſıK", max_size=40)
+
+
+@st.composite
+def filings(draw):
+    parts = draw(st.lists(st.tuples(st.sampled_from(HEADINGS), filler,
+                                     st.integers(min_value=0, max_value=400)), max_size=12))
+    return "".join(f"{h}{f}" + " word" * n + "\n" for h, f, n in parts)
+
+
+def _scan_in_pieces(text, filing_type, size):
+    scanner = SectionScanner(filing_type)
+    for i in range(0, len(text), size):
+        scanner.feed(text[i:i + size])
+    return scanner.finish(text)
+
+
+class TestParity:
+    """Same sections as the legacy _extract_sections."""
+
+    @settings(max_examples=300, deadline=None)
+    @given(text=filings(), filing_type=st.sampled_from(FILING_TYPES), size=st.integers(min_value=1, max_value=3000))
+    def test_matches_legacy(self, text, filing_type, size):
+        expected = legacy_extract_sections(text, filing_type)
+        assert scan_sections(text, filing_type).sections(text) == expected
+        assert _scan_in_pieces(text, filing_type, size).sections(text) == expected
+
+    @pytest.mark.parametrize("path", sorted(glob.glob("data/parsed/*/*_content.txt") + glob.glob("data/parsed/*/*.json")))
+    def test_regression_corpus(self, path):
+        for text in load_corpus([path]).values():
+            for filing_type in FILING_TYPES:
+                assert scan_sections(text, filing_type).sections(text) == legacy_extract_sections(text, filing_type)
+
+    @pytest.mark.parametrize("size", [1, 7, 10, 999, 1000, 1001])
+    def test_small_pieces_match_whole_scan(self, size):
+        text = "x" * 100 + "ITEM 1. BUSINESS" + "y" * 700 + "ITEM 1A. RISK FACTORS" + " word" * 300 + "\n"
+        expected = scan_sections(text, "10-K")
+        scan = _scan_in_pieces(text, "10-K", size)
+        assert scan.headings == expected.headings
+        assert scan.spans == expected.spans
+
+    def test_short_feeds_record_heading_once(self):
+        text = "x" * 100 + "ITEM 1. BUSINESS" + "y" * 700
+        scanner = SectionScanner("10-K")
+        scanner.feed(text)
+        scanner.feed("z" * 10)
+        scan = scanner.finish(text + "z" * 10)
+        assert [(h.pos, h.label) for h in scan.headings] == [(100, "ITEM 1")]
+
+    def test_unknown_filing_type(self):
+        scan = scan_sections("ITEM 1. BUSINESS " + "word " * 200, "S-1")
+        assert (scan.spans, scan.headings) == ([], [])
+
+
+class TestSpans:
+    """Word counts and TOC classification."""
+
+    def _filing(self):
+        toc = "Table of Contents\n" + "".join(f"ITEM {i}. page {n}\n" for i, n in
+                                              [("1", 3), ("1A", 9), ("1B", 20), ("2", 21), ("7", 30), ("8", 50)])
+        body = "".join(f"{h}\n" + "revenue risk " * 300 for h in
+                       ["ITEM 1. BUSINESS", "ITEM 1A. RISK FACTORS", "ITEM 1B.", "ITEM 7. MANAGEMENT", "ITEM 8."])
+        return toc + body
+
+    def test_word_counts_match_section_text(self):
+        text = self._filing()
+        scan = scan_sections(text, "10-K")
+        sections = scan.sections(text)
+        assert set(sections) == {"business", "risk_factors", "mda"}
+        assert scan.word_counts() == {name: len(s.split()) for name, s in sections.items()}
+
+    def test_toc_entries_flagged(self):
+        text = self._filing()
+        scan = scan_sections(text, "10-K")
+        toc_end = text.index("ITEM 1. BUSINESS")
+        assert all(h.in_toc == (h.pos < toc_end) for h in scan.headings)
+        assert [h.label for h in scan.headings if h.in_toc][:3] == ["ITEM 1", "ITEM 1A", "ITEM 1B"]
+        assert not any(span.start_in_toc for span in scan.spans)
+
+    def test_toc_only_filing_flags_spans(self):
+        text = "INDEX\n" + "".join(f"ITEM {i}. {t} {n}\n" for i, t, n in
+                                   [("1", "BUSINESS", 3), ("1A", "RISK FACTORS", 9), ("2", "PROPERTIES", 20),
+                                    ("7", "MANAGEMENT", 30), ("8", "FINANCIAL", 50)]) + "revenue " * 5000
+        scan = scan_sections(text, "10-K")
+        assert {s.name for s in scan.spans} == {"business", "risk_factors", "mda"}
+        assert all(s.start_in_toc for s in scan.spans)
+        assert "starts at TOC entries: business" in DocumentParser()._toc_note(scan)
+
+
+class TestFallbackSplit:
+    def test_counts_without_resplitting(self):
+        text = " ".join(f"w{i}" for i in range(5000))
+        sections, counts = DocumentParser()._fallback_section_split(text, 5000)
+        assert set(sections) == {"business", "risk_factors", "mda"}
+        assert counts == {name: len(s.split()) for name, s in sections.items()}
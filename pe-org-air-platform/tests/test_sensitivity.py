@@ -0,0 +1,149 @@
+"""
+Sensitivity Analysis Tests - PE Org-AI-R Platform
+tests/test_sensitivity.py
+
+Tests for parameter sampling within the Settings bounds, baseline parity
+with the scalar calculators, rank-stability / tornado outputs and the
+/api/v1/scoring/sensitivity endpoint.
+"""
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from app.scoring.batch_scoring import DIMENSIONS
+from app.scoring.sensitivity import ParameterSpace, PortfolioInputs, run_sensitivity
+
+TICKERS = ["NVDA", "JPM", "WMT", "GE", "DG"]
+DIMS = np.array([
+    [85, 80, 75, 88, 82, 79, 70],
+    [70, 68, 72, 66, 65, 64, 60],
+    [60, 62, 58, 61, 57, 55, 52],
+    [50, 48, 52, 47, 49, 45, 44],
+    [40, 38, 42, 37, 39, 35, 34],
+], dtype=float)
+TC = [0.12, 0.18, 0.20, 0.25, 0.30]
+SECTORS = ["technology", "financial_services", "retail", "manufacturing", "retail"]
+MCAP = [0.95, 0.85, 0.60, 0.50, 0.30]
+TIMING = [1.20, 1.05, 1.00, 1.00, 1.00]
+
+
+@pytest.fixture(scope="module")
+def inputs():
+    return PortfolioInputs(TICKERS, DIMS, np.array(TC), SECTORS, np.array(MCAP), np.array(TIMING))
+
+
+@pytest.fixture(scope="module")
+def space():
+    return ParameterSpace.from_settings()
+
+
+class TestParameterSpace:
+    """Samples stay inside the configured ranges."""
+
+    def test_bounds_come_from_settings(self, space):
+        ranges = {p.name: (p.low, p.high) for p in space.scalars}
+        assert ranges["ALPHA_VR_WEIGHT"] == (0.55, 0.70)
+        assert ranges["DELTA_POSITION"] == (0.10, 0.20)
+
+    def test_samples_within_bounds_and_weights_sum_to_one(self, space):
+        params = space.sample(5000, np.random.default_rng(0))
+        for p in space.scalars:
+            assert params[p.kwarg].min() >= p.low and params[p.kwarg].max() <= p.high
+        np.testing.assert_allclose(params["weights"].sum(axis=1), 1.0)
+
+    def test_tornado_weights_still_sum_to_one(self, space):
+        for name, low, high, low_params, high_params in space.tornado_cases():
+            assert low <= high
+            if name.startswith("W_"):
+                assert low_params["weights"].sum() == pytest.approx(1.0)
+                assert high_params["weights"].sum() == pytest.approx(1.0)
+
+
+class TestRunSensitivity:
+    """Distributions, rank stability and tornado data."""
+
+    def test_baseline_matches_scalar_calculators(self, inputs, space):
+        from app.scoring.hr_calculator import HRCalculator
+        from app.scoring.orgair_calculator import OrgAIRCalculator
+        from app.scoring.position_factor import PositionFactorCalculator
+        from app.scoring.synergy_calculator import SynergyCalculator
+        from app.scoring.vr_calculator import VRCalculator
+
+        result = run_sensitivity(inputs, space, samples=50, seed=0, tornado=False)
+        for k, ticker in enumerate(TICKERS):
+            vr = float(VRCalculator().calculate(dict(zip(DIMENSIONS, DIMS[k])), TC[k]).vr_score)
+            pf = PositionFactorCalculator().calculate_position_factor(vr, SECTORS[k], MCAP[k])
+            hr = float(HRCalculator().calculate(SECTORS[k], float(pf)).hr_score)
+            syn = float(SynergyCalculator().calculate(vr, hr, timing_factor=TIMING[k]).synergy_score)
+            org = float(OrgAIRCalculator().calculate(vr, hr, syn).org_air_score)
+            assert result.distributions[ticker]["org_air"]["baseline"] == org
+            assert result.distributions[ticker]["vr"]["baseline"] == vr
+
+    def test_seed_is_reproducible(self, inputs, space):
+        a = run_sensitivity(inputs, space, samples=500, seed=7)
+        b = run_sensitivity(inputs, space, samples=500, seed=7)
+        assert a.distributions == b.distributions
+        assert a.tornado == b.tornado
+
+    def test_rank_stability_is_consistent(self, inputs, space):
+        result = run_sensitivity(inputs, space, samples=1000, seed=1)
+        stability = result.rank_stability
+        assert stability["baseline_order"] == TICKERS
+        for company in stability["companies"].values():
+            assert sum(company["rank_probabilities"].values()) == pytest.approx(1.0, abs=1e-3)
+        assert -1.0 <= stability["kendall_tau_mean"] <= 1.0
+
+    def test_tornado_sorted_by_swing(self, inputs, space):
+        result = run_sensitivity(inputs, space, samples=100, seed=1)
+        rows = result.tornado["GE"]
+        assert len(rows) == len(space.scalars) + len(DIMENSIONS)
+        swings = [r["swing"] for r in rows]
+        assert swings == sorted(swings, reverse=True)
+
+
+class TestEndpoint:
+    """POST /api/v1/scoring/sensitivity on stored dimension scores and TC."""
+
+    def test_budget_cap_and_skipped_tickers(self, monkeypatch):
+        from app.repositories import scoring_repository
+        from app.routers import sensitivity, tc_vr_scoring
+
+        class FakeRepo:
+            def get_all_dimension_scores(self):
+                rows = [{"ticker": t, "dimension": d, "score": DIMS[k][j]}
+                        for k, t in enumerate(TICKERS) for j, d in enumerate(DIMENSIONS)]
+                return rows + [{"ticker": "NOTC", "dimension": "ai_governance", "score": 50.0}]
+
+        def fake_scoring_row(ticker):
+            if ticker not in TICKERS:
+                return None
+            return tc_vr_scoring.ScoringRecord(ticker=ticker, tc=TC[TICKERS.index(ticker)])
+
+        def no_rescoring(ticker):
+            raise AssertionError(f"{ticker} re-scored")
+
+        monkeypatch.setattr(scoring_repository, "get_scoring_repository", FakeRepo)
+        monkeypatch.setattr(tc_vr_scoring, "_fetch_scoring_row", fake_scoring_row)
+        monkeypatch.setattr(tc_vr_scoring, "_compute_tc_vr", no_rescoring)
+        monkeypatch.setattr(sensitivity.settings, "SENSITIVITY_MAX_SAMPLES", 300)
+
+        # The full app: "sensitivity" must not be captured by /api/v1/scoring/{ticker}
+        from app.main import app
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                return await client.post(
+                    "/api/v1/scoring/sensitivity",
+                    json={"tickers": TICKERS + ["XYZ", "NOTC"], "samples": 5000, "seed": 3},
+                )
+
+        resp = asyncio.run(scenario())
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["status"] == "partial"
+        assert body["samples_used"] == 300 and body["budget_capped"] is True
+        assert body["skipped"] == {"XYZ": "no stored dimension scores", "NOTC": "no stored talent concentration"}
+        assert set(body["distributions"]) == set(TICKERS)
@@ -0,0 +1,128 @@
+"""
+Skill Extractor Tests - PE Org-AI-R Platform
+tests/test_skill_extractor.py
+
+SkillExtractor against the per-skill loop it replaced in
+TalentConcentrationCalculator.analyze_job_postings: the same skill set per
+description (whole-word, substring and fuzzy hits, including fuzzy hits at
+the very start / end of a description) and the same JobAnalysis.
+"""
+import re
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+from rapidfuzz import fuzz
+
+from app.scoring.skill_extractor import SkillExtractor
+from app.scoring.talent_concentration import (
+    _EXPANDED_AI_SKILLS,
+    _FUZZY_SKILL_MIN_LEN,
+    _SKILL_FUZZY_THRESHOLD,
+    _WHOLE_WORD_SKILLS,
+    JobAnalysis,
+    TalentConcentrationCalculator,
+    _fuzzy_word_match,
+    _skill_extractor,
+)
+
+SKILLS = sorted(_EXPANDED_AI_SKILLS)
+
+
+def legacy_skills(desc):
+    found = set()
+    for skill in _EXPANDED_AI_SKILLS:
+        if skill in _WHOLE_WORD_SKILLS:
+            if re.search(r"\b" + re.escape(skill) + r"\b", desc):
+                found.add(skill)
+        elif skill in desc:
+            found.add(skill)
+        elif len(skill) >= _FUZZY_SKILL_MIN_LEN:
+            if fuzz.partial_ratio(skill, desc) >= _SKILL_FUZZY_THRESHOLD:
+                found.add(skill)
+    return found
+
+
+def legacy_analysis(postings):
+    senior, mid, entry = {"principal", "staff", "director", "vp", "head", "chief"}, \
+        {"senior", "lead", "manager"}, {"junior", "associate", "entry", "intern"}
+    counts = {"total": 0, "senior": 0, "mid": 0, "entry": 0}
+    skills = set()
+    for posting in postings:
+        if not posting.get("is_ai_role", False):
+            continue
+        counts["total"] += 1
+        words = set(posting.get("title", "").lower().split())
+        for level, keywords in (("senior", senior), ("mid", mid), ("entry", entry)):
+            if words & keywords:
+                counts[level] += 1
+                break
+        else:
+            for level, keywords in (("senior", senior), ("mid", mid), ("entry", entry)):
+                if _fuzzy_word_match(words, keywords):
+                    counts[level] += 1
+                    break
+        skills.update(posting.get("ai_skills_found", []))
+        desc = posting.get("description", "").lower()
+        if desc:
+            skills |= legacy_skills(desc)
+    return JobAnalysis(counts["total"], counts["senior"], counts["mid"], counts["entry"], skills)
+
+
+POSTINGS = [
+    {"title": "Senior Machine Learning Engineer", "is_ai_role": True, "ai_skills_found": ["pytorch"],
+     "description": "Build models in PyTorch and TensorFlow on Kubernetes; Spark, Kafka and SQL. C++17 a plus, R/Go."},
+    {"title": "Director, AI Platform", "is_ai_role": True, "ai_skills_found": [],
+     "description": "Lead our Pytoch / Tensor Flow stack on AWS Sagemkaer and Data bricks with Hugging Face."},
+    {"title": "Pricipal Data Scientist", "is_ai_role": True, "ai_skills_found": ["mlflow"],
+     "description": "Predictve maintenance and condition monitorng for turbines; digital-twin models in Matlab/Simulink."},
+    {"title": "Junior Analyst", "is_ai_role": True, "ai_skills_found": [],
+     "description": "Tableau, Power BI, SQL; c++ and c# exposure. Demand forcasting with Prophet."},
+    {"title": "Data Engineer", "is_ai_role": True, "ai_skills_found": [],
+     "description": "elasticserch"},                                  # short: whole description is the window
+    {"title": "Intern", "is_ai_role": True, "ai_skills_found": [],
+     "description": "kubernets clusters. " + "Benefits include medical, dental and vision. " * 20 + "terrafrm"},
+    {"title": "Software Engineer", "is_ai_role": False, "ai_skills_found": ["rust"],
+     "description": "Rust and Go services."},
+    {"title": "ML Engineer", "is_ai_role": True, "ai_skills_found": [], "description": ""},
+]
+
+
+class TestParity:
+    def test_job_analysis_identical(self):
+        assert TalentConcentrationCalculator().analyze_job_postings(POSTINGS) == legacy_analysis(POSTINGS)
+
+    def test_skill_sets_identical(self):
+        descriptions = [p["description"].lower() for p in POSTINGS if p["description"]]
+        extractor = SkillExtractor(_EXPANDED_AI_SKILLS, _WHOLE_WORD_SKILLS,
+                                   _SKILL_FUZZY_THRESHOLD, _FUZZY_SKILL_MIN_LEN, workers=2)
+        assert [set(s) for s in extractor.extract_many(descriptions)] == [legacy_skills(d) for d in descriptions]
+
+    def test_whole_word_prefixes(self):
+        # "c" and "c++" start at the same offset; `c\+\+\b` needs a word char after it
+        assert _skill_extractor().extract("c++17 and r") == {"c", "c++", "r"} == legacy_skills("c++17 and r")
+        assert _skill_extractor().extract("c++ array") == {"c"} == legacy_skills("c++ array")
+
+    @settings(max_examples=300, deadline=None)
+    @given(st.lists(
+        st.one_of(
+            st.sampled_from(SKILLS),
+            st.sampled_from(SKILLS).flatmap(lambda s: st.integers(0, len(s) - 1).map(lambda i: s[:i] + s[i + 1:])),
+            st.sampled_from(SKILLS).flatmap(lambda s: st.integers(0, len(s)).map(lambda i: s[:i] + "x" + s[i:])),
+            st.sampled_from(["and", "experience with", "ing", "data", "", ",", "(", "++", "team", "  "]),
+            st.text(alphabet="abcdefghijklmnopqrstuvwxyz +&-.", max_size=12),
+        ),
+        max_size=25,
+    ))
+    def test_random_descriptions(self, parts):
+        desc = " ".join(parts)
+        assert set(_skill_extractor().extract(desc)) == legacy_skills(desc)
+
+
+class TestCache:
+    def test_repeated_descriptions_are_cached(self):
+        extractor = SkillExtractor(["pytorch", "go"], ["go"], 88, 6, cache_size=2)
+        first = extractor.extract_many(["pytoch and go", "pytoch and go", "nothing"])
+        assert first[0] is first[1] and first[0] == {"pytorch", "go"} and first[2] == frozenset()
+        assert extractor.extract("pytoch and go") is first[0]
+        extractor.extract_many(["a", "b"])
+        assert len(extractor._cache) == 2
@@ -0,0 +1,164 @@
+"""
+Snapshot Manifest Tests - PE Org-AI-R Platform
+tests/test_snapshot_manifest.py
+
+Latest-snapshot pointers: writers advance them on upload, readers resolve
+the newest object without listing, and repair rebuilds them from a full
+listing — always agreeing with sorted(keys)[-1].
+"""
+import hashlib
+import json
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from app.services.s3_cache import S3DiskCache
+from app.services.s3_storage import S3StorageService
+from app.services.snapshot_manifest import SnapshotPointer, is_snapshot_prefix, manifest_key, snapshot_prefix
+
+BUCKET = "orgair-test"
+JOBS = "signals/jobs/NVDA/"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with mock_aws():
+        c = boto3.client("s3", region_name="us-east-1")
+        c.create_bucket(Bucket=BUCKET)
+        yield c
+
+
+@pytest.fixture
+def svc(client, tmp_path):
+    return S3StorageService(client, BUCKET, S3DiskCache(str(tmp_path / "s3"), 1024 * 1024))
+
+
+def _calls(client):
+    """Record (operation, key/prefix) of every S3 call made from now on."""
+    calls = []
+
+    def before(model, params, **kwargs):
+        calls.append((model.name, params.get("Key") or params.get("Prefix")))
+
+    client.meta.events.register("before-parameter-build.s3.*", before)
+    return calls
+
+
+def _manifest(client, prefix):
+    return json.loads(client.get_object(Bucket=BUCKET, Key=manifest_key(prefix))["Body"].read())
+
+
+class TestPrefixes:
+    @pytest.mark.parametrize("key,prefix", [
+        ("signals/jobs/NVDA/20250101_120000.json", "signals/jobs/NVDA/"),
+        ("signals/board_composition/JPM/20250101_120000.json", "signals/board_composition/JPM/"),
+        ("glassdoor_signals/raw/WMT/20250101_raw.json", "glassdoor_signals/raw/WMT/"),
+        ("glassdoor_signals/raw/WMT_raw.json", None),
+        ("sec/parsed/NVDA/10-K/x.json", None),
+        ("manifests/signals/jobs/NVDA/latest.json", None),
+    ])
+    def test_snapshot_prefix(self, key, prefix):
+        assert snapshot_prefix(key) == prefix
+        if prefix:
+            assert is_snapshot_prefix(prefix)
+
+
+class TestWriters:
+    def test_upload_advances_manifest(self, client, svc):
+        svc.store_signal_data("jobs", "nvda", {"n": 1}, timestamp="20250101_000000")
+        key = svc.store_signal_data("jobs", "nvda", {"n": 2}, timestamp="20250201_000000")
+        body = client.get_object(Bucket=BUCKET, Key=key)["Body"].read()
+        manifest = _manifest(client, JOBS)
+        assert manifest["key"] == key and manifest["size"] == len(body)
+        assert manifest["sha256"] == hashlib.sha256(body).hexdigest()
+        assert manifest["etag"] == svc.get_etag(key)
+
+    def test_late_writer_does_not_move_pointer_back(self, client, svc):
+        svc.store_signal_data("jobs", "NVDA", {"n": 2}, timestamp="20250201_000000")
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        assert _manifest(client, JOBS)["key"] == f"{JOBS}20250201_000000.json"
+
+    def test_concurrent_update_retries(self, client, svc):
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        pointer = SnapshotPointer.for_body(f"{JOBS}20250301_000000.json", b"x", "e")
+        real_fetch = svc.manifest._fetch
+        raced = []
+
+        def fetch_then_race(prefix):
+            current = real_fetch(prefix)
+            if not raced:   # another writer lands between our read and our PUT
+                raced.append(True)
+                svc.store_signal_data("jobs", "NVDA", {"n": 2}, timestamp="20250201_000000")
+            return current
+
+        svc.manifest._fetch = fetch_then_race
+        assert svc.manifest.publish(pointer) == pointer
+        assert _manifest(client, JOBS)["key"] == pointer.key
+
+
+class TestReaders:
+    def test_resolves_without_listing(self, client, svc):
+        for ts in ["20250101_000000", "20250301_000000", "20250201_000000"]:
+            svc.store_signal_data("jobs", "NVDA", {"ts": ts}, timestamp=ts)
+        calls = _calls(client)
+        key, body = svc.get_latest(JOBS)
+        assert key == f"{JOBS}20250301_000000.json" and json.loads(body) == {"ts": "20250301_000000"}
+        assert [op for op, _ in calls] == ["GetObject", "GetObject"]   # manifest, snapshot revalidation
+
+    def test_missing_manifest_rebuilt_from_listing(self, client, svc):
+        for ts in ["20250101", "20250102"]:
+            client.put_object(Bucket=BUCKET, Key=f"{JOBS}{ts}.json", Body=ts.encode())   # bypasses the service
+        assert svc.latest_object(JOBS).key == f"{JOBS}20250102.json"
+        assert _manifest(client, JOBS)["key"] == f"{JOBS}20250102.json"
+        assert svc.latest_object("signals/jobs/NONE/") is None
+
+    def test_delete_drops_pointer(self, client, svc):
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        svc.store_signal_data("jobs", "NVDA", {"n": 2}, timestamp="20250201_000000")
+        assert svc.delete_file(f"{JOBS}20250201_000000.json")
+        assert svc.get_latest(JOBS)[0] == f"{JOBS}20250101_000000.json"
+
+    def test_stale_pointer_self_heals(self, client, svc):
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        svc.store_signal_data("jobs", "NVDA", {"n": 2}, timestamp="20250201_000000")
+        client.delete_object(Bucket=BUCKET, Key=f"{JOBS}20250201_000000.json")   # behind the service's back
+        assert svc.get_latest(JOBS) == (f"{JOBS}20250101_000000.json", b'{\n  "n": 1\n}')
+
+    def test_iter_newest_lists_only_when_needed(self, client, svc):
+        for ts in ["20250101_000000", "20250201_000000"]:
+            svc.store_signal_data("jobs", "NVDA", {"ts": ts}, timestamp=ts)
+        calls = _calls(client)
+        newest = svc.iter_newest(JOBS)
+        assert next(newest).key == f"{JOBS}20250201_000000.json"
+        assert "ListObjectsV2" not in [op for op, _ in calls]
+        assert [obj.key for obj in newest] == [f"{JOBS}20250101_000000.json"]
+
+    def test_ttl_serves_in_process_copy(self, client, svc):
+        svc.manifest.ttl = 60
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        calls = _calls(client)
+        assert svc.latest_object(JOBS).key == f"{JOBS}20250101_000000.json"
+        assert calls == []
+
+
+class TestRepair:
+    def test_repair_rebuilds_from_listing(self, client, svc):
+        svc.store_signal_data("jobs", "NVDA", {"n": 1}, timestamp="20250101_000000")
+        client.put_object(Bucket=BUCKET, Key=f"{JOBS}20250301_000000.json", Body=b"{}")        # stale pointer
+        client.put_object(Bucket=BUCKET, Key="glassdoor_signals/raw/JPM/20250101_raw.json", Body=b"{}")  # no pointer
+        svc.store_signal_data("jobs", "WMT", {"n": 1}, timestamp="20250101_000000")
+        client.delete_object(Bucket=BUCKET, Key="signals/jobs/WMT/20250101_000000.json")      # orphan pointer
+
+        dry = svc.manifest.repair(dry_run=True)
+        assert (dry.created, dry.updated, dry.removed) == (
+            ["glassdoor_signals/raw/JPM/"], [JOBS], ["signals/jobs/WMT/"])
+        assert _manifest(client, JOBS)["key"] == f"{JOBS}20250101_000000.json"
+
+        report = svc.manifest.repair()
+        assert report.changed == 3
+        assert _manifest(client, JOBS)["key"] == f"{JOBS}20250301_000000.json"
+        assert _manifest(client, "glassdoor_signals/raw/JPM/")["key"] == "glassdoor_signals/raw/JPM/20250101_raw.json"
+        assert svc.manifest.repair().changed == 0
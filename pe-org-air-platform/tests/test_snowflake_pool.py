@@ -0,0 +1,212 @@
+"""
+Snowflake Connection Pool Tests - PE Org-AI-R Platform
+tests/test_snowflake_pool.py
+
+Tests for connection reuse, bounded size, recycling, health checks and
+the per-cursor PooledConnectionHandle used by repositories.
+"""
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.snowflake_pool import (
+    PooledConnectionHandle,
+    PoolTimeoutError,
+    SnowflakeConnectionPool,
+)
+
+
+class FakeConnection:
+    """Minimal stand-in for a snowflake.connector connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.commits = 0
+        self.healthy = True
+
+    def cursor(self, *args, **kwargs):
+        cur = MagicMock()
+        if not self.healthy:
+            cur.execute.side_effect = Exception("session expired")
+        return cur
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def connect():
+        conn = FakeConnection()
+        created.append(conn)
+        return conn
+
+    pool = SnowflakeConnectionPool(connect=connect, **kwargs)
+    return pool, created
+
+
+class TestPoolReuse:
+    """Connections are reused instead of reconnecting per query."""
+
+    def test_close_returns_connection_to_pool(self):
+        pool, created = make_pool(max_size=2)
+        conn = pool.acquire()
+        conn.close()
+        conn2 = pool.acquire()
+        assert conn2.raw is created[0]
+        assert len(created) == 1
+        assert created[0].closed is False
+
+    def test_close_is_idempotent(self):
+        pool, _ = make_pool(max_size=2)
+        conn = pool.acquire()
+        conn.close()
+        conn.close()
+        assert pool.stats()["idle"] == 1
+
+    def test_stats_report_in_use_and_idle(self):
+        pool, _ = make_pool(max_size=3)
+        a = pool.acquire()
+        b = pool.acquire()
+        a.close()
+        stats = pool.stats()
+        assert stats["in_use"] == 1
+        assert stats["idle"] == 1
+        assert stats["total_connects"] == 2
+        assert stats["connects_per_sec"] > 0
+        b.close()
+
+
+class TestPoolBounds:
+    """The pool never exceeds max_size."""
+
+    def test_acquire_times_out_when_exhausted(self):
+        pool, _ = make_pool(max_size=1)
+        held = pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire(timeout=0.05)
+        assert pool.stats()["timeouts"] == 1
+        held.close()
+
+    def test_waiter_gets_released_connection(self):
+        pool, created = make_pool(max_size=1)
+        held = pool.acquire()
+        threading.Timer(0.05, held.close).start()
+        conn = pool.acquire(timeout=2)
+        assert conn.raw is created[0]
+        assert pool.stats()["max_wait_ms"] > 0
+        conn.close()
+
+    def test_failed_connect_frees_slot(self):
+        calls = {"n": 0}
+
+        def connect():
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RuntimeError("login failed")
+            return FakeConnection()
+
+        pool = SnowflakeConnectionPool(connect=connect, max_size=1)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        conn = pool.acquire(timeout=0.1)
+        assert pool.stats()["connect_failures"] == 1
+        conn.close()
+
+
+class TestPoolRecycling:
+    """Idle eviction, max lifetime and health checks."""
+
+    def test_max_lifetime_recycles_on_release(self):
+        pool, created = make_pool(max_size=1, max_lifetime_seconds=0.01)
+        conn = pool.acquire()
+        time.sleep(0.02)
+        conn.close()
+        assert created[0].closed is True
+        assert pool.stats()["evictions"]["lifetime"] == 1
+
+    def test_idle_connections_are_evicted(self):
+        pool, created = make_pool(max_size=2, max_idle_seconds=0.01)
+        pool.acquire().close()
+        time.sleep(0.02)
+        pool.acquire().close()
+        assert created[0].closed is True
+        assert len(created) == 2
+        assert pool.stats()["evictions"]["idle"] == 1
+
+    def test_unhealthy_idle_connection_is_replaced(self):
+        pool, created = make_pool(max_size=1, validate_after_seconds=0)
+        pool.acquire().close()
+        created[0].healthy = False
+        conn = pool.acquire()
+        assert conn.raw is created[1]
+        assert pool.stats()["evictions"]["health_check"] == 1
+        conn.close()
+
+    def test_discard_drops_connection(self):
+        pool, created = make_pool(max_size=1)
+        conn = pool.acquire()
+        conn.discard()
+        assert created[0].closed is True
+        assert pool.stats()["size"] == 0
+
+
+class TestPooledConnectionHandle:
+    """Long-lived handle used as `self.conn` by repositories."""
+
+    def test_cursor_borrows_and_close_releases(self):
+        pool, _ = make_pool(max_size=1)
+        handle = PooledConnectionHandle(lambda: pool)
+        cur = handle.cursor()
+        assert pool.stats()["in_use"] == 1
+        cur.close()
+        assert pool.stats()["in_use"] == 0
+
+    def test_commit_targets_borrowed_connection(self):
+        pool, created = make_pool(max_size=1)
+        handle = PooledConnectionHandle(lambda: pool)
+        cur = handle.cursor()
+        handle.commit()
+        cur.close()
+        assert created[0].commits == 1
+
+    def test_nested_cursors_share_one_connection(self):
+        pool, created = make_pool(max_size=1)
+        handle = PooledConnectionHandle(lambda: pool)
+        outer = handle.cursor()
+        inner = handle.cursor(timeout=0)
+        inner.close()
+        assert pool.stats()["in_use"] == 1
+        outer.close()
+        assert pool.stats()["in_use"] == 0
+        assert len(created) == 1
+
+    def test_threads_get_separate_connections(self):
+        pool, created = make_pool(max_size=2)
+        handle = PooledConnectionHandle(lambda: pool)
+        barrier = threading.Barrier(2)
+
+        def worker():
+            cur = handle.cursor()
+            barrier.wait(timeout=2)
+            cur.close()
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(created) == 2
+        assert pool.stats()["idle"] == 2
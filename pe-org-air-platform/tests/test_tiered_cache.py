@@ -0,0 +1,320 @@
+"""
+Tiered Cache Tests - PE Org-AI-R Platform
+tests/test_tiered_cache.py
+
+Circuit breaker, L1 tier, single-flight loads and probabilistic early
+expiry of the Redis response cache.
+"""
+import fnmatch
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import redis
+from pydantic import BaseModel
+
+from app.services.cache import get_cache, reset_cache
+from app.services.cache_codecs import ZSTD_AVAILABLE, get_codec
+from app.services.tiered_cache import ENVELOPE_PREFIX, CircuitBreaker, SingleFlight, TieredCache
+
+
+class Item(BaseModel):
+    name: str
+    cache: str = ""
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the redis client; `down` makes every call fail."""
+
+    def __init__(self):
+        self.data, self.calls, self.down = {}, 0, False
+
+    def _op(self):
+        self.calls += 1
+        if self.down:
+            raise redis.ConnectionError("connection refused")
+
+    def ping(self):
+        self._op()
+        return True
+
+    def get(self, key):
+        self._op()
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self._op()
+        self.data[key] = value
+
+    def unlink(self, key):
+        self._op()
+        return int(self.data.pop(key, None) is not None)
+
+    def incr(self, key):
+        self._op()
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    def flushdb(self):
+        self._op()
+        self.data.clear()
+
+
+class FakeBackend:
+    def __init__(self, client=None):
+        self.client = client or FakeRedis()
+        self.scans = 0
+
+    @property
+    def binary_client(self):
+        return self.client
+
+    def delete_pattern(self, pattern):
+        self.scans += 1
+        self.client._op()
+        keys = [k for k in self.client.data if fnmatch.fnmatchcase(k, pattern)]
+        for key in keys:
+            del self.client.data[key]
+        return len(keys)
+
+
+class DecodingBackend(FakeBackend):
+    """`client` decodes responses like redis-py with decode_responses=True; `binary_client` does not."""
+
+    class _Decoding:
+        def __init__(self, raw):
+            self._raw = raw
+
+        def __getattr__(self, name):
+            return getattr(self._raw, name)
+
+        def get(self, key):
+            value = self._raw.get(key)
+            return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def __init__(self, client=None):
+        super().__init__(client)
+        self.raw = self.client
+        self.client = self._Decoding(self.raw)
+
+    @property
+    def binary_client(self):
+        return self.raw
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+def _tiered(clock, backend=None):
+    return TieredCache(
+        backend or FakeBackend(), l1_max_entries=16, l1_ttl_seconds=10, early_expiry_beta=1.0,
+        breaker=CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock), clock=clock,
+    )
+
+
+@pytest.fixture
+def cache(clock):
+    return _tiered(clock)
+
+
+class TestCircuitBreaker:
+    def test_opens_then_probes_then_closes(self, cache, clock):
+        redis_client = cache.backend.client
+        redis_client.down = True
+        assert cache.get("k", Item) is None and cache.get("k", Item) is None
+        assert cache.breaker.state == "open"
+
+        calls = redis_client.calls
+        assert cache.get("k", Item) is None and cache.client is None
+        assert redis_client.calls == calls                      # skipped, no connect attempt
+
+        clock.now += 30
+        assert cache.breaker.state == "half_open"
+        assert cache.get("k", Item) is None                     # failed probe re-opens
+        assert cache.breaker.state == "open"
+
+        redis_client.down = False
+        clock.now += 30
+        assert cache.ping()
+        assert cache.breaker.snapshot()["state"] == "closed"
+        assert cache.stats()["tiers"]["redis"]["skipped"] == 1
+
+    def test_single_probe_in_half_open(self, clock):
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=5, clock=clock)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow() and not breaker.allow()
+
+    def test_raw_client_errors_count(self, cache):
+        cache.backend.client.down = True
+        for _ in range(2):
+            with pytest.raises(redis.ConnectionError):
+                cache.client.get("x")
+        assert cache.client is None
+
+
+class TestTiers:
+    def test_l1_serves_while_redis_is_down(self, cache):
+        cache.set("company:1", Item(name="a"), 300)
+        cache.backend.client.down = True
+        assert cache.get_or_load("company:1", Item, 300, lambda: pytest.fail("loaded")) == (Item(name="a"), "l1")
+
+    def test_l1_lifetime_is_capped(self, cache, clock):
+        cache.set("k", Item(name="a"), 300)
+        clock.now += 11
+        assert cache.get_or_load("k", Item, 300, lambda: Item(name="b"))[1] == "redis"
+        assert cache.stats()["tiers"]["l1"]["stale"] == 1
+
+    def test_l1_returns_independent_copies(self, cache):
+        cache.set("k", Item(name="a"), 300)
+        first, _ = cache.get_or_load("k", Item, 300, lambda: Item(name="b"))
+        first.cache = "mutated"
+        assert cache.get("k", Item).cache == ""
+
+    def test_invalidation_clears_both_tiers(self, cache):
+        cache.set("companies:list:1", Item(name="a"), 300)
+        cache.set("companies:all", Item(name="b"), 300)
+        removed = cache.delete_pattern("companies:list:*")
+        cache.delete("companies:all")
+        assert cache.get("companies:list:1", Item) is None and cache.get("companies:all", Item) is None
+        assert removed.result(5) == 1 and cache.backend.client.data == {}
+
+    def test_legacy_plain_values(self, cache):
+        cache.backend.client.data["k"] = Item(name="old").model_dump_json()
+        assert cache.get("k", Item) == Item(name="old")
+        cache.set("k", Item(name="new"), 60)
+        assert cache.backend.client.data["k"].startswith(ENVELOPE_PREFIX)
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstd codec not available")
+    def test_text_reader_accepts_compressed_binary_entries(self, clock):
+        shared = FakeRedis()
+        writer = TieredCache(DecodingBackend(shared), l1_ttl_seconds=0, codec=get_codec("orjson"),
+                             compress_min_bytes=1, clock=clock)
+        reader = TieredCache(DecodingBackend(shared), l1_ttl_seconds=0, clock=clock)
+        writer.set("k", Item(name="a" * 200), 60)
+        assert shared.data["k"].split(b"|")[5] != b"0"                    # zstd-compressed
+        assert reader.get("k", Item) == Item(name="a" * 200)
+        assert reader.get_or_load("k", Item, 60, lambda: Item(name="loaded"))[1] == "redis"
+
+        reader.set("t", Item(name="text"), 60)
+        assert writer.get("t", Item) == Item(name="text")
+
+    def test_stats_rates(self, cache):
+        cache.get("missing", Item)
+        cache.set("k", Item(name="a"), 60)
+        cache.get("k", Item)
+        tiers = cache.stats()["tiers"]
+        assert tiers["l1"]["hits"] == 1 and tiers["l1"]["hit_rate"] == 0.5
+        assert tiers["redis"]["misses"] == 1 and tiers["redis"]["miss_rate"] == 1.0
+
+
+class TestStampedeProtection:
+    def test_concurrent_misses_load_once(self, cache):
+        release = threading.Event()
+        entered, lock = [], threading.Lock()
+        loads = []
+        do = cache._flight.do
+
+        def counting_do(key, fn):
+            with lock:
+                entered.append(key)
+            return do(key, fn)
+
+        def loader():
+            loads.append(1)
+            release.wait(5)
+            return Item(name="db")
+
+        cache._flight.do = counting_do
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_or_load("hot", Item, 60, loader)))
+                   for _ in range(8)]
+        for t in threads:
+            t.start()
+        while len(entered) < 8:
+            time.sleep(0.001)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join(5)
+
+        assert len(loads) == 1 and len(results) == 8
+        assert all(value == Item(name="db") and tier is None for value, tier in results)
+        assert len({id(value) for value, _ in results}) == 8
+        assert cache.stats()["loads"] == {"loads": 1, "coalesced": 7, "load_errors": 0}
+
+    def test_loader_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+        with pytest.raises(KeyError):
+            flight.do("k", lambda: {}["x"])
+        assert flight.do("k", lambda: 1) == (1, False)
+
+    def test_early_expiry(self, cache, clock):
+        cache._store("k", Item(name="v1"), 60, 5.0)   # the load took 5 s
+        clock.now += 59                                                  # L1 gone, 1 s left in Redis
+        with patch("app.services.tiered_cache.random.random", return_value=0.5):   # -5·ln(0.5) ≈ 3.5 s ≥ 1 s
+            assert cache.get_or_load("k", Item, 60, lambda: Item(name="v2")) == (Item(name="v2"), None)
+        assert cache.stats()["tiers"]["redis"]["stale"] == 1
+
+    def test_no_early_expiry_far_from_deadline(self, cache, clock):
+        cache._store("k", Item(name="v1"), 60, 0.01)
+        clock.now += 11
+        with patch("app.services.tiered_cache.random.random", return_value=0.5):
+            assert cache.get_or_load("k", Item, 60, lambda: Item(name="v2"))[1] == "redis"
+
+
+class TestSingleton:
+    def teardown_method(self):
+        reset_cache()
+
+    def test_unreachable_redis_is_not_retried_per_call(self):
+        with patch("app.services.cache.RedisCache") as redis_cache:
+            redis_cache.return_value.client.ping.side_effect = redis.ConnectionError("down")
+            reset_cache()
+            first, second = get_cache(), get_cache()
+            assert first is second and first is not None
+            assert redis_cache.call_count == 1
+
+
+class TestNamespaces:
+    def test_invalidation_is_a_generation_bump(self, cache):
+        cache.set("companies:list:page:1", Item(name="a"), 300, namespace="companies:lists")
+        assert cache.get("companies:list:page:1", Item, namespace="companies:lists") == Item(name="a")
+
+        cache.invalidate_namespace("companies:lists")
+        assert cache.get("companies:list:page:1", Item, namespace="companies:lists") is None
+        assert cache.backend.scans == 0                                  # no keyspace walk
+        assert "companies:lists:g0:companies:list:page:1" in cache.backend.client.data   # ages out via TTL
+        assert cache.generation("companies:lists") == 1
+
+    def test_other_processes_see_the_bump(self, clock):
+        shared = FakeRedis()
+        a, b = _tiered(clock, FakeBackend(shared)), _tiered(clock, FakeBackend(shared))
+        a.set("k", Item(name="v1"), 300, namespace="ns")
+        assert b.get("k", Item, namespace="ns") == Item(name="v1")
+
+        a.invalidate_namespace("ns")
+        clock.now += 1.0                                                 # GENERATION_REFRESH_SECONDS
+        assert b.get("k", Item, namespace="ns") is None
+
+    def test_bump_while_redis_is_down_is_replayed(self, cache):
+        cache.set("k", Item(name="v1"), 300, namespace="ns")
+        cache.backend.client.down = True
+        cache.invalidate_namespace("ns")
+        assert cache.get("k", Item, namespace="ns") is None              # L1 purged right away
+
+        cache.backend.client.down = False
+        cache.breaker.record_success()
+        assert cache.generation("ns") == 1
+        assert cache.backend.client.data["cache:gen:ns"] == "1"